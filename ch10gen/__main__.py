@@ -62,8 +62,8 @@ def cli():
               help='    ')
 @click.option('--out', '-o', type=click.Path(), required=True,
               help='Output CH10 file path')
-@click.option('--writer', type=click.Choice(['irig106', 'pyc10']), default='irig106',
-              help='Writer backend: irig106 (spec-compliant) or pyc10 (compatibility)')
+@click.option('--writer', type=click.Choice(['irig106', 'pyc10', 'native']), default='irig106',
+              help='Writer backend: irig106 (spec-compliant), pyc10 (compatibility) or native (fast)')
 @click.option('--start', type=str, default=None,
               help='Start time (ISO format, default: now)')
 @click.option('--duration', type=float, default=None,
@@ -82,16 +82,30 @@ def cli():
               help='No response percentage')
 @click.option('--jitter-ms', type=float, default=0.0,
               help='Timestamp jitter in milliseconds')
+@click.option('--streaming', is_flag=True,
+              help='Generate lazily with bounded memory (for long recordings)')
+@click.option('--workers', type=click.IntRange(min=1), default=None,
+              help='Generate time shards in N parallel processes (output independent of N)')
+@click.option('--io-thread', is_flag=True,
+              help='Write batched output from a background I/O thread')
+@click.option('--fsync', type=click.Choice(['none', 'batch', 'close']), default='none',
+              help='fsync policy for the I/O thread output (requires --io-thread)')
 @click.option('--dry-run', is_flag=True,
               help='Preview without writing file')
 @click.option('--zero-jitter', is_flag=True,
               help='Disable all timing jitter (for tests)')
+@click.option('--pyramid', is_flag=True,
+              help='Also write a .ch10pyr min/max/mean preview pyramid of all ICD parameters')
 @click.option('--verbose', '-v', is_flag=True,
               help='Verbose output')
 def build(scenario, icd, out, writer, start, duration, rate_hz, packet_bytes, seed,
-         err_parity, err_late, err_no_response, jitter_ms, dry_run, zero_jitter, verbose):
+         err_parity, err_late, err_no_response, jitter_ms, streaming, workers, io_thread, fsync, dry_run, zero_jitter,
+         pyramid, verbose):
     """Build CH10 file from scenario and ICD."""
     
+    if fsync != 'none' and not io_thread:
+        raise click.UsageError("--fsync requires --io-thread")
+    
     try:
         # Get merged config
         cli_args = {
@@ -151,6 +165,22 @@ def build(scenario, icd, out, writer, start, duration, rate_hz, packet_bytes, se
                 scenario_data['bus'] = {}
             scenario_data['bus']['packet_bytes_target'] = packet_bytes
         
+        if streaming:
+            if 'bus' not in scenario_data:
+                scenario_data['bus'] = {}
+            scenario_data['bus']['streaming'] = True
+        
+        if workers:
+            if 'bus' not in scenario_data:
+                scenario_data['bus'] = {}
+            scenario_data['bus']['workers'] = workers
+        
+        if io_thread:
+            if 'bus' not in scenario_data:
+                scenario_data['bus'] = {}
+            scenario_data['bus']['io_thread'] = True
+            scenario_data['bus']['fsync'] = fsync
+        
         # Dry run - just show what would be done
         if dry_run:
             click.echo("\nDry run mode - no file will be written")
@@ -224,11 +254,28 @@ def build(scenario, icd, out, writer, start, duration, rate_hz, packet_bytes, se
         click.echo(f"  Total messages: {stats['total_messages']:,}")
         click.echo(f"  Duration: {stats['duration_s']:.1f} seconds")
         
+        if 'io' in stats:
+            io_stats = stats['io']
+            click.echo(f"  Encoding: {io_stats['encode_s']:.2f}s, blocked on I/O: {io_stats['io_blocked_s']:.2f}s "
+                       f"({io_stats['batches']} batched writes)")
+        
+        if verbose and stats.get('payload_cache', {}).get('misses'):
+            cache_stats = stats['payload_cache']
+            click.echo(f"  Payload cache: {cache_stats['hits']:,} hits, {cache_stats['misses']:,} misses "
+                       f"({cache_stats['hit_rate']:.1%})")
+        
         if 'errors' in stats:
             error_stats = stats['errors']
             if error_stats['total_errors'] > 0:
                 click.echo(f"  Errors injected: {error_stats['total_errors']}")
         
+        if pyramid:
+            try:
+                from .pyramid import build_pyramid
+            except ImportError:
+                from pyramid import build_pyramid
+            click.echo(f"  Preview pyramid: {build_pyramid(output_path, icd_def)}")
+        
         click.echo(f"\nFile is ready for use at: {output_path.absolute()}")
         
     except Exception as e:
@@ -249,7 +296,11 @@ def build(scenario, icd, out, writer, start, duration, rate_hz, packet_bytes, se
               help='Run external c10-tools validation if available')
 @click.option('--no-c10-tools', is_flag=True,
               help='Skip external c10-tools validation')
-def validate(file, verbose, external, no_c10_tools):
+@click.option('--workers', type=click.IntRange(min=1), default=1,
+              help='Validate chunks of the file in N processes')
+@click.option('--fast', is_flag=True,
+              help='Check raw packet headers; decode only failing and sampled packets')
+def validate(file, verbose, external, no_c10_tools, workers, fast):
     """Validate a CH10 file."""
     
     try:
@@ -259,7 +310,9 @@ def validate(file, verbose, external, no_c10_tools):
         results = validate_file(
             filepath=filepath,
             verbose=verbose,
-            use_c10_tools=external and not no_c10_tools
+            use_c10_tools=external and not no_c10_tools,
+            workers=workers,
+            fast=fast
         )
         
         # Summary output if not verbose
@@ -495,6 +548,110 @@ def export_pcap(file, channel, out, max_messages):
 
 
 
+@cli.command()
+@click.argument('file', type=click.Path(exists=True))
+def index(file):
+    """Write a .ch10idx packet index next to a CH10 file.
+
+    inspect, validate and the exporters use a fresh index automatically.
+    """
+    try:
+        try:
+            from .packet_index import write_index, index_path
+        except ImportError:
+            from packet_index import write_index, index_path
+        
+        filepath = Path(file)
+        packet_index = write_index(filepath)
+        stats = packet_index.get_statistics()
+        
+        click.echo(f"[SUCCESS] Index written: {index_path(filepath)}")
+        click.echo(f"  Packets: {stats['packets']:,}")
+        click.echo(f"  1553 messages: {stats['messages_1553']:,}")
+        click.echo(f"  Channels: {', '.join(f'0x{c:03X}' for c in stats['channels'])}")
+        if stats['first_ipts'] is not None:
+            span_s = (stats['last_ipts'] - stats['first_ipts']) / 1e9
+            click.echo(f"  IPTS span: {span_s:.3f} s")
+        
+    except Exception as e:
+        click.echo(f"ERROR Error: {e}", err=True)
+        sys.exit(1)
+
+
+
+@cli.command()
+@click.argument('file', type=click.Path(exists=True))
+@click.option('--icd', '-i', type=click.Path(exists=True), required=True,
+              help='ICD YAML file')
+@click.option('--param', '-p', 'params', multiple=True, required=True,
+              help='Parameter (ICD word name) to extract; repeat for several')
+@click.option('--out', '-o', type=click.Path(), required=True,
+              help='Output directory for the PARAM.npy files')
+def extract(file, icd, params, out):
+    """Extract ICD parameters as memory-mappable .npy time series.
+
+    Each PARAM.npy holds (ipts, value) records; open it with
+    numpy.load(path, mmap_mode='r').
+    """
+    try:
+        try:
+            from .extract import extract_parameters, load_parameter
+        except ImportError:
+            from extract import extract_parameters, load_parameter
+        
+        paths = extract_parameters(Path(file), load_icd(Path(icd)), params, Path(out))
+        
+        click.echo(f"[SUCCESS] Extracted {len(paths)} parameters to {out}")
+        for name, path in paths.items():
+            samples = load_parameter(path)
+            click.echo(f"  {name}: {len(samples):,} samples")
+        
+    except Exception as e:
+        click.echo(f"ERROR Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument('file', type=click.Path(exists=True))
+@click.option('--icd', '-i', type=click.Path(exists=True), required=True,
+              help='ICD YAML file')
+@click.option('--param', '-p', 'params', multiple=True,
+              help='Parameter (ICD word name) to include; repeat for several (default: all)')
+@click.option('--bucket-samples', type=click.IntRange(min=1), default=16,
+              help='Samples per finest bucket')
+@click.option('--fanout', type=click.IntRange(min=2), default=8,
+              help='Buckets merged into one per coarser level')
+def pyramid(file, icd, params, bucket_samples, fanout):
+    """Write a .ch10pyr min/max/mean preview pyramid next to a CH10 file.
+
+    Viewers read the coarse levels for zoomed-out traces and finer levels
+    only for the range in view.
+    """
+    try:
+        try:
+            from .pyramid import build_pyramid, Pyramid
+        except ImportError:
+            from pyramid import build_pyramid, Pyramid
+        
+        path = build_pyramid(Path(file), load_icd(Path(icd)), list(params) or None,
+                             bucket_samples=bucket_samples, fanout=fanout)
+        
+        click.echo(f"[SUCCESS] Pyramid written: {path}")
+        click.echo(f"  Size: {path.stat().st_size:,} bytes")
+        with Pyramid(path) as result:
+            for name in result.parameters:
+                levels = result.level_count(name)
+                samples = int(result.level(name, levels - 1)['count'].sum()) if levels else 0
+                click.echo(f"  {name}: {samples:,} finite samples, {levels} levels")
+        
+    except Exception as e:
+        click.echo(f"ERROR Error: {e}", err=True)
+        sys.exit(1)
+
+
+
+
+
 @cli.command()
 def selftest():
     """Run self-test to verify installation."""
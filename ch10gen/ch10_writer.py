@@ -8,18 +8,24 @@ This module is the core of the CH10 file generation system. It handles:
 - Packet packing and timing coordination
 - Error injection and validation
 
-The writer supports two backends:
+The writer supports three backends:
 - irig106: Uses PyChapter10 library for spec-compliant output
 - pyc10: Alternative backend for compatibility testing
+- native: Packs packets directly with struct (same bytes, much faster)
 """
 
 import struct
 import math
+import time
+from collections import deque
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any, Optional, BinaryIO
 from dataclasses import dataclass
 
+import numpy as np
+
 # PyChapter10 is the primary library for CH10 file generation
 # It provides the low-level packet structures and encoding
 try:
@@ -35,25 +41,33 @@ except ImportError:
 try:
     # Package execution (python -m ch10gen)
     from .utils.util_time import datetime_to_rtc, datetime_to_ipts
-    from .schedule import BusSchedule, ScheduledMessage
+    from .schedule import (
+        BusSchedule, ScheduledMessage, ScheduleStream, ArraySchedule, PeriodicSchedule
+    )
     from .flight_profile import FlightProfile, FlightState
     from .icd import ICDDefinition, MessageDefinition, WordDefinition
-    from .core.encode1553 import (
-        build_command_word, build_status_word, bnr16, u16, i16, bcd, float32_split
-    )
+    from .core.encode1553 import encode_array, float32_split_array
     from .utils.errors import MessageErrorInjector, ErrorType
     from .core.tmats import create_default_tmats
+    from .core.packet_serializer import PacketSerializer
+    from .message_plan import MessagePlan, PayloadCache, resolve_source
+    from .utils.batched_writer import BatchedFileWriter
+    from .utils.rng import RNGService
 except ImportError:
     # Direct execution fallback
     from utils.util_time import datetime_to_rtc, datetime_to_ipts
-    from schedule import BusSchedule, ScheduledMessage
+    from schedule import (
+        BusSchedule, ScheduledMessage, ScheduleStream, ArraySchedule, PeriodicSchedule
+    )
     from flight_profile import FlightProfile, FlightState
     from icd import ICDDefinition, MessageDefinition, WordDefinition
-    from core.encode1553 import (
-        build_command_word, build_status_word, bnr16, u16, i16, bcd, float32_split
-    )
+    from core.encode1553 import encode_array, float32_split_array
     from utils.errors import MessageErrorInjector, ErrorType
     from core.tmats import create_default_tmats
+    from core.packet_serializer import PacketSerializer
+    from message_plan import MessagePlan, PayloadCache, resolve_source
+    from utils.batched_writer import BatchedFileWriter
+    from utils.rng import RNGService
 
 
 @dataclass
@@ -66,6 +80,12 @@ class Ch10WriterConfig:
     target_packet_bytes: int = 65536  # Standard packet size target
     time_packet_interval_s: float = 1.0  # 1 Hz time packets (required by standard)
     include_filler: bool = False
+    streaming: bool = False  # Merge schedule and time packets lazily (bounded memory)
+    io_thread: bool = False  # Write coalesced batches from a background thread
+    io_batch_bytes: int = 4 << 20  # Batch size handed to the I/O thread
+    io_queue_depth: int = 2  # Batches queued before encoding blocks (double buffering)
+    fsync: str = 'none'  # fsync policy: none, batch or close
+    payload_cache_entries: int = 64  # Packed payloads cached per message (0 disables)
 
 
 class Ch10Writer:
@@ -76,14 +96,22 @@ class Ch10Writer:
         
         Args:
             config: Writer configuration
-            writer_backend: Backend to use ('irig106' or 'pyc10')
+            writer_backend: Backend to use ('irig106', 'pyc10' or 'native')
         """
         self.config = config or Ch10WriterConfig()
         self.writer_backend_name = writer_backend
+        # Native backend packs packets into a reusable buffer instead of
+        # building PyChapter10 objects
+        self.serializer = PacketSerializer() if writer_backend == 'native' else None
         self.c10 = None
         self.start_time = None
         self.message_count = 0
         self.packet_count = 0
+        self._plans = {}  # Compiled MessagePlan per MessageDefinition (by id)
+        self.payload_cache = (PayloadCache(self.config.payload_cache_entries)
+                              if self.config.payload_cache_entries > 0 else None)
+        # Random streams for scenario data (None: seeded from the scenario)
+        self.rng_service: Optional[RNGService] = None
         
     def write_file(self, filepath: Path, schedule: BusSchedule,
                   flight_profile: FlightProfile,
@@ -122,24 +150,16 @@ class Ch10Writer:
         self.message_count = 0
         self.packet_count = 0
         self.last_ipts = 0  # Track last IPTS value for monotonicity
+        if self.payload_cache is not None:
+            self.payload_cache.reset_statistics()
         
-        # Initialize scenario manager if scenario provided with data generation config
-        # This handles dynamic data generation based on flight profiles
-        self.scenario_manager = None
-        if scenario_config and (
-            scenario_config.get('data_mode') == 'random' or 
-            scenario_config.get('defaults', {}).get('data_mode') == 'random' or
-            scenario_config.get('config', {}).get('default_mode') == 'random' or
-            scenario_config.get('defaults', {}).get('data_mode') != 'flight'
-        ):
-            # Use scenario manager for random or non-flight data modes
-            from .scenario_manager import ScenarioManager
-            self.scenario_manager = ScenarioManager(scenario_config, icd)
+        self._init_scenario_manager(scenario_config, icd)
         
         # Open file for binary writing
         filepath = Path(filepath)
         self.filepath = filepath
-        self.file = open(filepath, 'wb')
+        build_start = time.perf_counter()
+        self.file = self._open_output(filepath)
         
         try:
             # Write TMATS as first packet
@@ -149,11 +169,12 @@ class Ch10Writer:
             self._write_time_packet(start_time)
             
             # Group messages into packets and write with continuous time packets
-            self._write_1553_packets_with_time(schedule, flight_profile, icd, error_injector)
+            last_time_relative_s = self._write_1553_packets_with_time(
+                schedule, flight_profile, icd, error_injector
+            )
             
             # Write final time packet
-            if schedule.messages:
-                last_time_relative_s = schedule.messages[-1].time_s
+            if last_time_relative_s is not None:
                 last_time_abs = datetime.fromtimestamp(start_time.timestamp() + last_time_relative_s, tz=start_time.tzinfo)
                 self._write_time_packet(last_time_abs)
             
@@ -162,12 +183,110 @@ class Ch10Writer:
             if hasattr(self, 'file') and self.file:
                 self.file.close()
         
-        return {
+        stats = {
             'total_packets': self.packet_count,
             'total_messages': self.message_count,
             'file_size_bytes': self.filepath.stat().st_size if self.filepath.exists() else 0,
-            'duration_s': schedule.messages[-1].time_s if schedule.messages else 0
+            'duration_s': last_time_relative_s if last_time_relative_s is not None else 0
         }
+        if self.payload_cache is not None:
+            stats['payload_cache'] = self.payload_cache.get_statistics()
+        self._add_io_statistics(stats, time.perf_counter() - build_start)
+        return stats
+    
+    def _open_output(self, filepath: Path):
+        """Open the output file, through the batched I/O stage if configured."""
+        if self.config.io_thread:
+            return BatchedFileWriter(filepath, batch_bytes=self.config.io_batch_bytes,
+                                     queue_depth=self.config.io_queue_depth,
+                                     fsync=self.config.fsync)
+        return open(filepath, 'wb')
+    
+    def _add_io_statistics(self, stats: Dict[str, Any], elapsed_s: float) -> None:
+        """Add encode vs I/O timing to stats when the batched stage was used."""
+        if isinstance(self.file, BatchedFileWriter):
+            io_stats = self.file.get_statistics()
+            io_stats['elapsed_s'] = elapsed_s
+            io_stats['encode_s'] = max(0.0, elapsed_s - io_stats['io_blocked_s'])
+            stats['io'] = io_stats
+    
+    def write_shard(self, stream: BinaryIO, schedule: ScheduleStream,
+                    flight_profile: FlightProfile,
+                    icd: ICDDefinition,
+                    error_injector: Optional[MessageErrorInjector] = None,
+                    start_time: datetime = None,
+                    scenario_config: Optional[Dict[str, Any]] = None,
+                    last_message_time_s: Optional[float] = None,
+                    last_ipts: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Write the time and 1553 packets of one schedule window.
+        
+        Used for time-sharded builds: the window's packets are written to
+        stream exactly as write_file would order them, except that packing
+        restarts at the window start and the last packet is flushed at the
+        window end. TMATS and the initial/final time packets are left to the
+        caller.
+        
+        Args:
+            stream: Binary stream to write packets to
+            schedule: Schedule window (from ScheduleStream.split)
+            flight_profile: Flight profile generator
+            icd: ICD definition
+            error_injector: Optional error injector
+            start_time: Recording start time (time packets are relative to it)
+            scenario_config: Scenario configuration for data generation
+            last_message_time_s: Time of the last message in the whole
+                recording; later time packets are not written
+            last_ipts: IPTS of the previous window's last message (defaults
+                to just before the window start)
+        
+        Returns:
+            Statistics dictionary with packet/message counts, the first
+            message time and the last IPTS written
+        """
+        self.start_time = start_time
+        self.message_count = 0
+        self.packet_count = 0
+        if last_ipts is None:
+            last_ipts = max(0, int(schedule.window_start_s * 1_000_000_000) - 1)
+        self.last_ipts = last_ipts
+        if self.payload_cache is not None:
+            self.payload_cache.reset_statistics()
+        self._init_scenario_manager(scenario_config, icd)
+        self.file = stream
+        
+        state = {'first_time_s': None}
+        if last_message_time_s is not None:
+            events = self._iter_window_events(iter(schedule), schedule.window_start_s,
+                                              schedule.window_end_s, last_message_time_s, state)
+            self._write_events(events, flight_profile, icd, error_injector,
+                               last_time_packet_s=schedule.window_start_s)
+        
+        stats = {
+            'total_packets': self.packet_count,
+            'total_messages': self.message_count,
+            'first_time_s': state['first_time_s'],
+            'last_ipts': self.last_ipts
+        }
+        if self.payload_cache is not None:
+            stats['payload_cache'] = self.payload_cache.get_statistics()
+        return stats
+    
+    def _init_scenario_manager(self, scenario_config: Optional[Dict[str, Any]],
+                               icd: ICDDefinition) -> None:
+        """Create the scenario manager used for non-flight data generation."""
+        # Initialize scenario manager if scenario provided with data generation config
+        # This handles dynamic data generation based on flight profiles
+        self.scenario_manager = None
+        if scenario_config and (
+            scenario_config.get('data_mode') == 'random' or 
+            scenario_config.get('defaults', {}).get('data_mode') == 'random' or
+            scenario_config.get('config', {}).get('default_mode') == 'random' or
+            scenario_config.get('defaults', {}).get('data_mode') != 'flight'
+        ):
+            # Use scenario manager for random or non-flight data modes
+            from .scenario_manager import ScenarioManager
+            self.scenario_manager = ScenarioManager(scenario_config, icd, rng=self.rng_service)
     
     def _write_tmats_packet(self, scenario_name: str, icd: ICDDefinition,
                            schedule: BusSchedule) -> None:
@@ -186,6 +305,14 @@ class Ch10Writer:
             total_messages=stats.get('total_messages', 0)
         )
         
+        if self.serializer:
+            # PyChapter10's MessageF0 serializes only its (empty) message list,
+            # so the TMATS body is emitted empty to keep backends byte-identical
+            length = self.serializer.tmats_packet(b'', self.config.tmats_channel_id, rtc=0)
+            self.serializer.write_to(self.file, length)
+            self.packet_count += 1
+            return
+        
         # Create TMATS packet using MessageF0
         tmats_packet = MessageF0()
         tmats_packet.channel_id = self.config.tmats_channel_id
@@ -199,6 +326,17 @@ class Ch10Writer:
     
     def _write_time_packet(self, timestamp: datetime) -> None:
         """Write Time Data, Format 1 packet (data_type = 0x11) with proper CSDW fields."""
+        if self.serializer:
+            # Same CSDW as below: external source, IRIG-B, leap flag clear
+            rtc_value = max(0, datetime_to_rtc(timestamp, self.start_time))
+            length = self.serializer.time_packet(
+                timestamp, self.config.time_channel_id, rtc_value,
+                time_source=1, time_format=0
+            )
+            self.serializer.write_to(self.file, length)
+            self.packet_count += 1
+            return
+        
         # Create TimeF1 packet with correct data type
         time_packet = TimeF1()
         time_packet.channel_id = self.config.time_channel_id
@@ -219,6 +357,9 @@ class Ch10Writer:
         time_packet.leap_year = timestamp.year % 4 == 0
         
         # Set time values (IRIG-B format)
+        # PyChapter10 encodes the payload from .time (defaulting to now()),
+        # so set it explicitly to keep output deterministic
+        time_packet.time = timestamp
         time_packet.seconds = timestamp.second
         time_packet.minutes = timestamp.minute
         time_packet.hours = timestamp.hour
@@ -231,7 +372,7 @@ class Ch10Writer:
     def _write_1553_packets_with_time(self, schedule: BusSchedule,
                                      flight_profile: FlightProfile,
                                      icd: ICDDefinition,
-                                     error_injector: Optional[MessageErrorInjector]) -> None:
+                                     error_injector: Optional[MessageErrorInjector]) -> Optional[float]:
         """
         Write 1553 packets from schedule with continuous time packets at 1 Hz.
         
@@ -243,22 +384,28 @@ class Ch10Writer:
         
         The method ensures proper packet structure similar to real flight test data
         where multiple messages are packed together for efficiency.
+        
+        In streaming mode (config.streaming, or a ScheduleStream,
+        ArraySchedule or PeriodicSchedule schedule) the
+        events are merged lazily instead of being collected and sorted, so
+        memory stays bounded regardless of recording length. Both modes emit
+        the same packet sequence.
+        
+        Returns:
+            Relative time of the last 1553 message, or None if there were none
         """
+        if self.config.streaming or isinstance(schedule, (ScheduleStream, ArraySchedule, PeriodicSchedule)):
+            state = {'last_time_s': None}
+            self._write_events(self._iter_timed_events(iter(schedule), state),
+                               flight_profile, icd, error_injector)
+            return state['last_time_s']
+        
         if not schedule.messages:
-            return
+            return None
             
         # Calculate total duration and time packet intervals
         # IRIG-106 standard requires 1 Hz time packets for synchronization
         total_duration_s = schedule.messages[-1].time_s
-        time_interval_s = self.config.time_packet_interval_s
-        
-        # Generate time packet timestamps (1 Hz)
-        # These provide IRIG-B time synchronization throughout the file
-        time_timestamps = []
-        current_time_s = 0.0
-        while current_time_s <= total_duration_s:
-            time_timestamps.append(current_time_s)
-            current_time_s += time_interval_s
         
         # Merge 1553 messages and time packets in chronological order
         all_events = []
@@ -268,21 +415,119 @@ class Ch10Writer:
             all_events.append(('1553', sched_msg))
         
         # Add time packets
-        for time_s in time_timestamps:
-            if time_s > 0:  # Skip initial time packet (already written)
-                timestamp = datetime.fromtimestamp(self.start_time.timestamp() + time_s, tz=self.start_time.tzinfo)
-                all_events.append(('time', timestamp))
+        for time_s, timestamp, _ in self._iter_time_packet_times():
+            if time_s > total_duration_s:
+                break
+            all_events.append(('time', timestamp))
         
         # Sort by time
         all_events.sort(key=lambda x: x[1].time_s if x[0] == '1553' else (x[1] - self.start_time).total_seconds())
         
+        self._write_events(all_events, flight_profile, icd, error_injector)
+        return total_duration_s
+    
+    def _iter_time_packet_times(self):
+        """Yield (relative_s, timestamp, sort_key_s) for each periodic time packet.
+        
+        The initial time packet at t=0 is written separately and skipped here.
+        The sort key is the timestamp's offset from the start time, which can
+        differ from relative_s by float rounding.
+        """
+        time_interval_s = self.config.time_packet_interval_s
+        current_time_s = 0.0
+        while True:
+            if current_time_s > 0:
+                timestamp = datetime.fromtimestamp(self.start_time.timestamp() + current_time_s, tz=self.start_time.tzinfo)
+                yield current_time_s, timestamp, (timestamp - self.start_time).total_seconds()
+            current_time_s += time_interval_s
+    
+    def _iter_timed_events(self, messages, state: Dict[str, Any]):
+        """Lazily merge scheduled messages (in time order) with time packets.
+        
+        Yields the same ('1553', msg) / ('time', timestamp) sequence as the
+        sort in _write_1553_packets_with_time: messages win ties, and a time
+        packet is only included if it falls at or before the last message.
+        Because that last time is unknown while streaming, messages that sort
+        after an undecided time packet are held until a later message (or the
+        end of the stream) settles it; this window is at most one message
+        interval wide.
+        
+        Args:
+            messages: Iterator of ScheduledMessage in time order
+            state: Dict updated with 'last_time_s' as messages are consumed
+        """
+        time_packets = self._iter_time_packet_times()
+        pending_s, pending_ts, pending_key = next(time_packets)
+        held = deque()
+        
+        for sched_msg in messages:
+            held.append(sched_msg)
+            state['last_time_s'] = sched_msg.time_s
+            while held:
+                if pending_key < held[0].time_s:
+                    if pending_s > state['last_time_s']:
+                        break  # Wait for a later message to decide
+                    yield ('time', pending_ts)
+                    pending_s, pending_ts, pending_key = next(time_packets)
+                else:
+                    yield ('1553', held.popleft())
+        
+        last_time_s = state['last_time_s']
+        if last_time_s is None:
+            return
+        # Pending time packets past the last message are dropped, so the
+        # remaining held messages follow directly
+        while pending_s <= last_time_s:
+            while held and held[0].time_s <= pending_key:
+                yield ('1553', held.popleft())
+            yield ('time', pending_ts)
+            pending_s, pending_ts, pending_key = next(time_packets)
+        while held:
+            yield ('1553', held.popleft())
+    
+    def _iter_window_events(self, messages, start_s: float, end_s: float,
+                            last_time_s: float, state: Dict[str, Any]):
+        """Merge one schedule window's messages with its time packets.
+        
+        A window owns the time packets whose sort key falls in
+        [start_s, end_s), so concatenating consecutive windows reproduces
+        the event order of _iter_timed_events for the whole recording.
+        
+        Args:
+            messages: Iterator of the window's ScheduledMessage in time order
+            start_s: Window start (seconds from recording start)
+            end_s: Window end (exclusive)
+            last_time_s: Time of the last message in the whole recording
+            state: Dict updated with 'first_time_s' of the window
+        """
+        time_packets = self._iter_time_packet_times()
+        pending_s, pending_ts, pending_key = next(time_packets)
+        while pending_key < start_s:
+            pending_s, pending_ts, pending_key = next(time_packets)
+        
+        for sched_msg in messages:
+            if state['first_time_s'] is None:
+                state['first_time_s'] = sched_msg.time_s
+            while pending_key < sched_msg.time_s and pending_key < end_s and pending_s <= last_time_s:
+                yield ('time', pending_ts)
+                pending_s, pending_ts, pending_key = next(time_packets)
+            yield ('1553', sched_msg)
+        
+        while pending_key < end_s and pending_s <= last_time_s:
+            yield ('time', pending_ts)
+            pending_s, pending_ts, pending_key = next(time_packets)
+    
+    def _write_events(self, events, flight_profile: FlightProfile,
+                      icd: ICDDefinition,
+                      error_injector: Optional[MessageErrorInjector],
+                      last_time_packet_s: float = 0.0) -> None:
+        """Pack and write a chronological stream of 1553 and time events."""
         # Process events in chronological order
         # This ensures proper timing coordination between time and data packets
         packet_messages = []
         packet_size = 0
-        last_time_packet_s = 0.0
         
-        for event_type, event_data in all_events:
+        for event_type, event_data in events:
             if event_type == 'time':
                 # Write IRIG-B time packet immediately
                 # These provide time synchronization and are written individually
@@ -359,81 +604,123 @@ class Ch10Writer:
         if not messages:
             return
         
-        # Create 1553 F1 packet with messages
-        packet = MS1553F1()
-        
-        # Set channel ID based on bus from ICD
-        packet.channel_id = self.config.bus_a_channel_id if icd.bus == 'A' else self.config.bus_b_channel_id
-        packet.data_type = 0x19  # MS1553 data type - required for proper packet identification
+        # Create 1553 F1 packet with messages (native backend packs tuples instead)
+        channel_id = self.config.bus_a_channel_id if icd.bus == 'A' else self.config.bus_b_channel_id
+        native_messages = [] if self.serializer else None
+        if not self.serializer:
+            packet = MS1553F1()
+            
+            # Set channel ID based on bus from ICD
+            packet.channel_id = channel_id
+            packet.data_type = 0x19  # MS1553 data type - required for proper packet identification
         
         # Set packet timestamp to first message time (relative to start)
-        packet.rtc = int(messages[0].time_s * 1_000_000)  # Convert seconds to microseconds
+        rtc = int(messages[0].time_s * 1_000_000)  # Convert seconds to microseconds
         
-        # Process each message
-        for sched_msg in messages:
+        # Set bus (0 for A, 1 for B)
+        bus = 0 if icd.bus == 'A' else 1
+        
+        plans = [self._get_plan(sched_msg.message) for sched_msg in messages]
+        
+        # Sample flight state for all dynamic messages of the packet at once
+        if not self.scenario_manager:
+            flight_states = iter(flight_profile.get_states_at_times(
+                [sched_msg.time_s for sched_msg, plan in zip(messages, plans) if plan.dynamic_words]
+            ))
+        
+        # Errors are applied to the packed payloads afterwards, so errors and
+        # scenario data use the cache as well
+        payload_cache = self.payload_cache
+        
+        # Without the cache, dynamic messages are encoded per definition for
+        # all their instances in the packet at once
+        block_words = {}
+        if not self.scenario_manager and payload_cache is None:
+            instances = {}
+            for row, plan in enumerate(plans):
+                if plan.dynamic_words:
+                    instances.setdefault(id(plan), []).append((row, next(flight_states)))
+            for members in instances.values():
+                msg_def = messages[members[0][0]].message
+                block = self._encode_data_words_block(msg_def, [state for _, state in members])
+                for (row, _), data_words in zip(members, block.tolist()):
+                    block_words[row] = data_words
+        
+        if self.scenario_manager:
+            scenario_words = self._generate_scenario_words(messages)
+        
+        # Generate every message's words
+        packet_words = []
+        for row, (sched_msg, plan) in enumerate(zip(messages, plans)):
             msg_def = sched_msg.message
-            msg_time_relative_s = sched_msg.time_s  # Already relative to start
             
-            # Get flight state at message time
-            flight_state = flight_profile.get_state_at_time(sched_msg.time_s)
-            
-            # Build message words
-            command_word = build_command_word(
-                rt=msg_def.rt,
-                tr=msg_def.is_receive(),
-                sa=msg_def.sa,
-                wc=msg_def.wc
-            )
-            
-            status_word = build_status_word(
-                rt=msg_def.rt,
-                message_error=False,
-                instrumentation=False,
-                service_request=False,
-                broadcast_received=False,
-                busy=False,
-                subsystem_flag=False,
-                dynamic_bus_control=False,
-                terminal_flag=False
-            )
-            
-            # Encode data words
+            # Encode data words (static messages reuse their prepacked payload)
+            payload = None
             if self.scenario_manager:
-                # Use scenario manager for data generation
-                data_words = self.scenario_manager.generate_message_data(msg_def.name, msg_def)
-            else:
-                # Use traditional encoding
-                data_words = self._encode_data_words(msg_def, flight_state)
-            
-            # Apply error injection if configured
-            if error_injector:
-                command_word, status_word, data_words, error_type = error_injector.inject_errors(
-                    sched_msg.time_s, command_word, status_word, data_words
+                # Scenario data at the message's schedule time (packed once per
+                # distinct set of words when caching)
+                data_words = scenario_words[row]
+                if payload_cache is not None:
+                    payload = payload_cache.packed(plan, data_words)
+            elif payload_cache is not None:
+                # Reuse the packed payload while the message inputs are unchanged
+                payload = payload_cache.payload(
+                    plan, next(flight_states) if plan.dynamic_words else None
                 )
+            elif plan.dynamic_words:
+                # Only dynamic words depend on the flight state at message time
+                data_words = block_words[row]
+            else:
+                data_words = None
             
-            # Construct message data: command word, status word, then data words
-            message_words = [command_word, status_word] + data_words
-            # Convert words to bytes (little-endian 16-bit words)
-            message_data = b''.join(struct.pack('<H', word) for word in message_words)
-            
-            # Create 1553 message and set data
-            msg = packet.Message()
-            msg.data = message_data
-            msg.length = len(message_data)  # PyChapter10 doesn't calculate this automatically
-            
+            if payload is not None:
+                message_words = payload
+            elif data_words is None:
+                message_words = plan.static_payload
+            else:
+                # Construct message data: command word, status word, then data words
+                message_words = [plan.command_word, plan.status_word] + data_words
+            packet_words.append(message_words)
+        
+        # Apply error injection to the whole packet at once
+        if error_injector:
+            packet_words = self._inject_packet_errors(messages, packet_words, error_injector)
+        
+        for sched_msg, message_words in zip(messages, packet_words):
             # Set message attributes (IPTS in nanoseconds from start)
             # Ensure IPTS is always strictly increasing to maintain monotonicity
-            base_ipts = int(msg_time_relative_s * 1_000_000_000)
-            msg.ipts = max(self.last_ipts + 1, base_ipts)
-            self.last_ipts = msg.ipts
+            base_ipts = int(sched_msg.time_s * 1_000_000_000)
+            ipts = max(self.last_ipts + 1, base_ipts)
+            self.last_ipts = ipts
             
-            # Set bus (0 for A, 1 for B)
-            msg.bus = 0 if icd.bus == 'A' else 1
-            
-            # Add message to packet
-            packet.append(msg)
+            if self.serializer:
+                native_messages.append((ipts, bus, message_words))
+            else:
+                # Convert words to bytes (little-endian 16-bit words)
+                if isinstance(message_words, bytes):
+                    message_data = message_words
+                else:
+                    message_data = struct.pack(f'<{len(message_words)}H', *message_words)
+                
+                # Create 1553 message and set data
+                msg = packet.Message()
+                msg.data = message_data
+                msg.length = len(message_data)  # PyChapter10 doesn't calculate this automatically
+                msg.ipts = ipts
+                msg.bus = bus
+                
+                # Add message to packet
+                packet.append(msg)
             self.message_count += 1
         
+        if self.serializer:
+            length = self.serializer.ms1553_packet(native_messages, channel_id, rtc)
+            self.serializer.write_to(self.file, length)
+            self.packet_count += 1
+            return
+        
+        packet.rtc = rtc
+        
         # Fix PyChapter10 bug: manually set CSDW message count
         packet.count = len(messages)
         
@@ -443,88 +730,128 @@ class Ch10Writer:
     
     
     
+    def _generate_scenario_words(self, messages: List[ScheduledMessage]) -> List[List[int]]:
+        """Scenario data words of a packet's messages.
+        
+        Each message definition's instances are generated as one block unless
+        fields read other messages, whose values then depend on the order of
+        the messages within the packet.
+        """
+        manager = self.scenario_manager
+        if manager.cross_message_references:
+            return [manager.generate_message_data(sched_msg.message.name, sched_msg.message,
+                                                  sched_msg.time_s, sched_msg.instance)
+                    for sched_msg in messages]
+        
+        rows_by_message = {}
+        for row, sched_msg in enumerate(messages):
+            rows_by_message.setdefault(id(sched_msg.message), []).append(row)
+        scenario_words = [None] * len(messages)
+        for rows in rows_by_message.values():
+            msg_def = messages[rows[0]].message
+            instances = [messages[row].instance for row in rows]
+            block = manager.generate_message_block(
+                msg_def.name, msg_def, [messages[row].time_s for row in rows],
+                instances=None if None in instances else instances
+            )
+            for row, data_words in zip(rows, block.tolist()):
+                scenario_words[row] = data_words
+        return scenario_words
+    
+    def _inject_packet_errors(self, messages: List[ScheduledMessage], packet_words: List[Any],
+                              error_injector: MessageErrorInjector) -> List[Any]:
+        """Inject errors into a packet's messages (words or packed payloads)."""
+        error_types = error_injector.select_errors([sched_msg.time_s for sched_msg in messages])
+        rows = np.flatnonzero(error_types).tolist()
+        if not rows:
+            return packet_words
+        
+        # Only messages with an error are unpacked into word arrays
+        words = [
+            np.frombuffer(packet_words[row], dtype='<u2') if isinstance(packet_words[row], bytes)
+            else np.asarray(packet_words[row], dtype=np.uint16)
+            for row in rows
+        ]
+        word_counts = np.array([len(message_words) - 2 for message_words in words], dtype=np.int64)
+        data_words = np.zeros((len(rows), word_counts.max()), dtype=np.uint16)
+        for index, message_words in enumerate(words):
+            data_words[index, :word_counts[index]] = message_words[2:]
+        batch = error_injector.apply_errors(
+            error_types[rows],
+            [message_words[0] for message_words in words],
+            [message_words[1] for message_words in words],
+            data_words, word_counts
+        )
+        for row, command_word, status_word, data, count in zip(
+                rows, batch.command_words.tolist(), batch.status_words.tolist(),
+                batch.data_words.tolist(), batch.word_counts.tolist()):
+            packet_words[row] = [command_word, status_word] + data[:count]
+        return packet_words
+    
+    def _get_plan(self, msg_def: MessageDefinition) -> MessagePlan:
+        """Get the compiled encoding plan for a message (compiled on first use)."""
+        plan = self._plans.get(id(msg_def))
+        if plan is None:
+            plan = self._plans[id(msg_def)] = MessagePlan(msg_def)
+        return plan
+    
     def _encode_data_words(self, msg_def: MessageDefinition, 
                           flight_state: Optional[FlightState]) -> List[int]:
         """Encode data words from flight state using ICD."""
-        data_words = []
+        return self._get_plan(msg_def).encode(flight_state)
+    
+    def _encode_data_words_block(self, msg_def: MessageDefinition,
+                                 flight_states: List[Optional[FlightState]]) -> np.ndarray:
+        """Encode data words for a block of instances of one message.
+        
+        Array counterpart of _encode_data_words: row i equals
+        _encode_data_words(msg_def, flight_states[i]), but each word is
+        encoded for all instances with a single NumPy call.
+        
+        Args:
+            msg_def: Message definition shared by all instances
+            flight_states: Flight state for each instance (None for no state)
+        
+        Returns:
+            uint16 array of shape (len(flight_states), data word count)
+        """
+        count = len(flight_states)
+        has_state = np.fromiter((state is not None for state in flight_states),
+                                dtype=bool, count=count)
+        columns = []
         
         for word_def in msg_def.words:
             if word_def.const is not None:
-                # Constant value
+                # Constant value, same for every instance
                 if word_def.encode == 'float32_split':
-                    w1, w2 = float32_split(float(word_def.const), word_def.word_order or 'lsw_msw')
-                    data_words.extend([w1, w2])
+                    const_words = float32_split_array([float(word_def.const)], word_def.word_order or 'lsw_msw')
                 else:
-                    data_words.append(int(word_def.const) & 0xFFFF)
-                    
-            elif word_def.src and flight_state:
-                # Get value from flight state
-                value = self._get_value_from_source(word_def.src, flight_state)
+                    const_words = np.array([[int(word_def.const) & 0xFFFF]], dtype=np.uint16)
+                columns.append(np.repeat(const_words, count, axis=0))
                 
-                # Apply encoding
-                if word_def.encode == 'bnr16':
-                    encoded = bnr16(value, word_def.scale, word_def.offset,
-                                   rounding=word_def.rounding)
-                    data_words.append(encoded)
-                    
-                elif word_def.encode == 'u16':
-                    encoded = u16(value, word_def.scale, word_def.offset)
-                    data_words.append(encoded)
-                    
-                elif word_def.encode == 'i16':
-                    encoded = i16(value, word_def.scale, word_def.offset)
-                    data_words.append(encoded)
-                    
-                elif word_def.encode == 'bcd':
-                    encoded = bcd(int(value))
-                    data_words.append(encoded)
-                    
-                elif word_def.encode == 'float32_split':
-                    w1, w2 = float32_split(value, word_def.word_order or 'lsw_msw')
-                    data_words.extend([w1, w2])
-                    
-                else:
-                    # Default to u16
-                    data_words.append(int(value) & 0xFFFF)
+            elif word_def.src and has_state.any():
+                # Get values from flight states (zero where there is no state)
+                values = np.fromiter(
+                    (self._get_value_from_source(word_def.src, state) if state is not None else 0.0
+                     for state in flight_states),
+                    dtype=np.float64, count=count
+                )
+                encoded = encode_array(values, word_def.encode, word_def.scale, word_def.offset,
+                                       rounding=word_def.rounding, word_order=word_def.word_order)
+                encoded[~has_state] = 0
+                columns.append(encoded)
             else:
                 # No source or flight state, use zero
-                if word_def.encode == 'float32_split':
-                    data_words.extend([0, 0])
-                else:
-                    data_words.append(0)
+                width = 2 if word_def.encode == 'float32_split' else 1
+                columns.append(np.zeros((count, width), dtype=np.uint16))
         
-        return data_words
+        if not columns:
+            return np.zeros((count, 0), dtype=np.uint16)
+        return np.hstack(columns)
     
     def _get_value_from_source(self, source: str, flight_state: FlightState) -> float:
         """Get value from source string (e.g., 'flight.altitude_ft')."""
-        parts = source.split('.')
-        
-        if len(parts) >= 2:
-            if parts[0] == 'flight':
-                # Get from flight state
-                attr_name = parts[1]
-                if attr_name == 'airspeed_kt':
-                    attr_name = 'airspeed_kts'  # Map kt -> kts
-                return getattr(flight_state, attr_name, 0)
-            elif parts[0] == 'derived':
-                # Compute derived values
-                if parts[1] == 'mach_x1000':
-                    # Approximate mach from airspeed and altitude
-                    # At sea level, mach 1 ≈ 661 knots
-                    # Simple approximation, not accounting for temperature variations
-                    mach = flight_state.airspeed_kts / 661.0
-                    return mach * 1000
-                elif parts[1] == 'status':
-                    # Create status bits (example)
-                    status = 0
-                    if flight_state.altitude_ft > 10000:
-                        status |= 1  # High altitude bit
-                    if flight_state.airspeed_kts > 300:
-                        status |= 2  # High speed bit
-                    return status
-        
-        # Default to zero if source not recognized
-        return 0.0
+        return resolve_source(source)(flight_state)
     
     def _build_test_schedule(self, icd: ICDDefinition, duration_s: float):
         """Build a test schedule for testing purposes."""
@@ -565,7 +892,7 @@ def write_ch10_file(output_path: Path,
         scenario: Scenario configuration dictionary
         icd: ICD definition
         seed: Random seed for reproducibility
-        writer_backend: Writer backend ('irig106' or 'pyc10')
+        writer_backend: Writer backend ('irig106', 'pyc10' or 'native')
     
     Returns:
         Statistics dictionary
@@ -575,11 +902,15 @@ def write_ch10_file(output_path: Path,
     duration_s = scenario.get('duration_s', 600)
     profile_config = scenario.get('profile', {})
     bus_config = scenario.get('bus', {})
+    if seed is None:
+        seed = scenario.get('seed')
     
     # Pass scenario config to writer
     
     # Create flight profile
     flight_gen = FlightProfile()
+    flight_gen.interpolation = profile_config.get('interpolation', 'hold')
+    flight_gen.grid_s = profile_config.get('grid_s')
     
     # Create simple waypoints for the duration
     num_waypoints = min(10, int(duration_s / 60) + 2)  # Waypoint every minute
@@ -592,9 +923,25 @@ def write_ch10_file(output_path: Path,
         heading = (i * 30) % 360
         flight_gen.add_waypoint(t, altitude, airspeed, heading, 37.7749, -122.4194)
     
-    # Build schedule
-    from .schedule import build_schedule_from_icd
-    schedule = build_schedule_from_icd(
+    # Build schedule (lazily for streaming and sharded builds)
+    from .schedule import (
+        build_schedule_from_icd, stream_schedule_from_icd, build_array_schedule_from_icd,
+        build_periodic_schedule_from_icd
+    )
+    workers = bus_config.get('workers')
+    streaming = bus_config.get('streaming', False) or workers is not None
+    schedule_backend = bus_config.get('schedule_backend', 'objects')
+    if streaming:
+        schedule_builder = stream_schedule_from_icd
+    elif schedule_backend == 'array':
+        schedule_builder = partial(build_array_schedule_from_icd,
+                                   rng=np.random.default_rng(seed))
+    elif schedule_backend == 'periodic':
+        schedule_builder = partial(build_periodic_schedule_from_icd,
+                                   seed=seed)
+    else:
+        schedule_builder = build_schedule_from_icd
+    schedule = schedule_builder(
         icd=icd,
         duration_s=duration_s,
         jitter_ms=bus_config.get('jitter_ms', 0)
@@ -605,14 +952,30 @@ def write_ch10_file(output_path: Path,
     if 'errors' in bus_config:
         from .utils.errors import create_error_config_from_dict
         error_config = create_error_config_from_dict(bus_config['errors'])
-        error_injector = MessageErrorInjector(error_config)
+        error_injector = MessageErrorInjector(error_config, seed=seed)
     
     # Configure writer
     writer_config = Ch10WriterConfig()
     writer_config.target_packet_bytes = bus_config.get('packet_bytes_target', 65536)
+    writer_config.streaming = streaming
+    writer_config.io_thread = bus_config.get('io_thread', False)
+    writer_config.io_batch_bytes = bus_config.get('io_batch_bytes', writer_config.io_batch_bytes)
+    writer_config.fsync = bus_config.get('fsync', 'none')
+    writer_config.payload_cache_entries = bus_config.get('payload_cache_entries',
+                                                         writer_config.payload_cache_entries)
     
-    # Write file
-    writer = Ch10Writer(writer_config, writer_backend=writer_backend)
+    # Write file (time shards in parallel when workers are configured)
+    if workers is not None:
+        from .sharded_build import ShardedCh10Writer, DEFAULT_SHARD_MAJOR_FRAMES
+        writer = ShardedCh10Writer(
+            writer_config, writer_backend=writer_backend, workers=workers,
+            shard_major_frames=bus_config.get('shard_major_frames', DEFAULT_SHARD_MAJOR_FRAMES),
+            seed=seed
+        )
+    else:
+        writer = Ch10Writer(writer_config, writer_backend=writer_backend)
+        if seed is not None:
+            writer.rng_service = RNGService(seed)
     
     stats = writer.write_file(
         filepath=output_path,
@@ -0,0 +1,219 @@
+"""
+Columnar bulk decoding of MS1553F1 messages.
+
+Instead of one dict per message, whole packets (or files) are decoded
+into a NumPy structured array with one row per message, plus one shared
+uint16 array holding every message's data words (each row has its
+offset and count into it).
+
+Only the walk along each packet's message length fields runs in Python;
+IPTS, block status, command and status words are gathered from the
+memory-mapped file with fancy indexing, and RT/TR/SA/WC are split out of
+the command words with vectorized shifts and masks.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+
+try:
+    from .wire_reader import WireFile, PacketView, MESSAGE_HEADER_SIZE, _WORD
+    from .core.packet_serializer import (
+        HEADER_SIZE, DATA_TYPE_MS1553_F1, BLOCK_STATUS_BUS_B, BLOCK_STATUS_MESSAGE_ERROR,
+        BLOCK_STATUS_FORMAT_ERROR, BLOCK_STATUS_TIMEOUT, BLOCK_STATUS_LENGTH_ERROR,
+        BLOCK_STATUS_SYNC_ERROR, BLOCK_STATUS_WORD_ERROR
+    )
+except ImportError:
+    from wire_reader import WireFile, PacketView, MESSAGE_HEADER_SIZE, _WORD
+    from core.packet_serializer import (
+        HEADER_SIZE, DATA_TYPE_MS1553_F1, BLOCK_STATUS_BUS_B, BLOCK_STATUS_MESSAGE_ERROR,
+        BLOCK_STATUS_FORMAT_ERROR, BLOCK_STATUS_TIMEOUT, BLOCK_STATUS_LENGTH_ERROR,
+        BLOCK_STATUS_SYNC_ERROR, BLOCK_STATUS_WORD_ERROR
+    )
+
+# Block status bits reporting a bus error
+ERROR_BITS = (BLOCK_STATUS_MESSAGE_ERROR | BLOCK_STATUS_FORMAT_ERROR | BLOCK_STATUS_TIMEOUT
+              | BLOCK_STATUS_LENGTH_ERROR | BLOCK_STATUS_SYNC_ERROR | BLOCK_STATUS_WORD_ERROR)
+
+MESSAGE_DTYPE = np.dtype([
+    ('ipts', '<u8'),
+    ('rtc', '<u8'),             # RTC of the containing packet
+    ('channel_id', '<u2'),
+    ('bus', 'u1'),              # 0 = A, 1 = B
+    ('rt', 'u1'),
+    ('tr', 'u1'),               # 0 = BC2RT, 1 = RT2BC
+    ('sa', 'u1'),
+    ('wc', 'u1'),               # From the command word (0 means 32)
+    ('command', '<u2'),
+    ('status', '<u2'),
+    ('block_status', '<u2'),
+    ('errors', '<u2'),          # Block status error bits (see ERROR_BITS)
+    ('length', '<u2'),          # Message bytes (command, status and data words)
+    ('data_offset', '<u8'),     # Offset and count of the data words in MessageTable.words
+    ('data_count', '<u2'),
+])
+
+DEFAULT_BATCH_PACKETS = 4096
+
+
+@dataclass
+class MessageTable:
+    """Decoded messages: one MESSAGE_DTYPE row each, data words in a shared buffer."""
+    messages: np.ndarray
+    words: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def data_words(self, row: int) -> np.ndarray:
+        """Data words of one message (a view of the shared buffer)."""
+        start = int(self.messages['data_offset'][row])
+        return self.words[start:start + int(self.messages['data_count'][row])]
+
+    def select(self, mask) -> 'MessageTable':
+        """Rows matching a mask or index array (the word buffer is shared)."""
+        return MessageTable(self.messages[mask], self.words)
+
+
+def _empty_table() -> MessageTable:
+    return MessageTable(np.zeros(0, dtype=MESSAGE_DTYPE), np.zeros(0, dtype=np.uint16))
+
+
+def _u16(raw: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Little-endian 16-bit words at byte positions."""
+    return raw[positions].astype(np.uint16) | (raw[positions + 1].astype(np.uint16) << 8)
+
+
+def command_keys(commands) -> np.ndarray:
+    """Message keys of command words: RT, T/R bit and subaddress as one 11-bit value."""
+    return np.asarray(commands) >> 5
+
+
+def decode_1553_packets(buffer: memoryview, packets: Iterable[PacketView],
+                        keys: Optional[np.ndarray] = None) -> MessageTable:
+    """
+    Decode the messages of MS1553F1 packets of one mapped file.
+
+    Messages are located like PacketView.messages() does (stopping at a
+    truncated message); command and status words of shorter messages
+    are 0.
+
+    Args:
+        buffer: Buffer of the WireFile the packets come from
+        packets: MS1553F1 packet views
+        keys: Boolean lookup of the command_keys() to keep (2048 entries);
+            other messages, and messages without a command word, are
+            dropped after reading their command word, before anything
+            else is gathered
+    """
+    unpack_word = _WORD.unpack_from
+    offsets: List[int] = []
+    packet_rows = []
+    for packet in packets:
+        first = len(offsets)
+        offset = packet.offset + HEADER_SIZE + 4
+        end = packet.offset + HEADER_SIZE + packet.data_len
+        for _ in range(packet.message_count):
+            if offset + MESSAGE_HEADER_SIZE > end:
+                break
+            length = unpack_word(buffer, offset + 12)[0]
+            if offset + MESSAGE_HEADER_SIZE + length > end:
+                break
+            offsets.append(offset)
+            offset += MESSAGE_HEADER_SIZE + length + (length & 1)
+        packet_rows.append((len(offsets) - first, packet.channel_id, packet.rtc))
+
+    if not offsets:
+        return _empty_table()
+
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    last = len(raw) - 2
+    off = np.array(offsets, dtype=np.int64)
+    counts, channels, rtcs = (np.array(column, dtype=np.int64) for column in zip(*packet_rows))
+    channels = np.repeat(channels, counts)
+    rtcs = np.repeat(rtcs, counts)
+
+    if keys is not None:
+        has_command = _u16(raw, off + 12) >= 2
+        commands = _u16(raw, np.minimum(off + MESSAGE_HEADER_SIZE, last))
+        keep = has_command & keys[command_keys(commands)]
+        off, channels, rtcs = off[keep], channels[keep], rtcs[keep]
+        if not len(off):
+            return _empty_table()
+
+    messages = np.zeros(len(off), dtype=MESSAGE_DTYPE)
+    messages['channel_id'] = channels
+    messages['rtc'] = rtcs
+
+    messages['ipts'] = raw[off[:, None] + np.arange(8)].view('<u8')[:, 0]
+    block_status = _u16(raw, off + 8)
+    length = _u16(raw, off + 12)
+    command = np.where(length >= 2, _u16(raw, np.minimum(off + 14, last)), 0)
+    status = np.where(length >= 4, _u16(raw, np.minimum(off + 16, last)), 0)
+
+    messages['block_status'] = block_status
+    messages['errors'] = block_status & ERROR_BITS
+    messages['bus'] = (block_status & BLOCK_STATUS_BUS_B) != 0
+    messages['length'] = length
+    messages['command'] = command
+    messages['status'] = status
+    messages['rt'] = (command >> 11) & 0x1F
+    messages['tr'] = (command >> 10) & 0x01
+    messages['sa'] = (command >> 5) & 0x1F
+    messages['wc'] = command & 0x1F
+
+    # Data words of all messages, gathered into one buffer
+    data_count = np.maximum(length.astype(np.int64) // 2 - 2, 0)
+    data_offset = np.cumsum(data_count) - data_count
+    total = int(data_count.sum())
+    positions = np.repeat(off + MESSAGE_HEADER_SIZE + 4 - 2 * data_offset, data_count) \
+        + 2 * np.arange(total)
+    messages['data_offset'] = data_offset
+    messages['data_count'] = data_count
+    return MessageTable(messages, _u16(raw, positions))
+
+
+def iter_1553_tables(wire: WireFile, channel_id: Optional[int] = None,
+                     start_ipts: Optional[int] = None, end_ipts: Optional[int] = None,
+                     batch_packets: int = DEFAULT_BATCH_PACKETS,
+                     keys: Optional[np.ndarray] = None) -> Iterator[MessageTable]:
+    """
+    Decode a file's MS1553F1 messages in batches of packets (bounded memory).
+
+    Packets are selected like WireFile.packets(); the IPTS range selects
+    packets, not individual messages. Messages are filtered by command
+    word key as in decode_1553_packets().
+    """
+    batch = []
+    for packet in wire.packets(DATA_TYPE_MS1553_F1, channel_id, start_ipts, end_ipts):
+        batch.append(packet)
+        if len(batch) >= batch_packets:
+            yield decode_1553_packets(wire.buffer, batch, keys)
+            batch = []
+    if batch:
+        yield decode_1553_packets(wire.buffer, batch, keys)
+
+
+def concat_tables(tables: Iterable[MessageTable]) -> MessageTable:
+    """One table from several (data offsets are rebased onto the joined buffer)."""
+    messages, words = [], []
+    base = 0
+    for table in tables:
+        rows = table.messages.copy()
+        rows['data_offset'] += base
+        messages.append(rows)
+        words.append(table.words)
+        base += len(table.words)
+    if not messages:
+        return _empty_table()
+    return MessageTable(np.concatenate(messages), np.concatenate(words))
+
+
+def decode_1553_file(filepath: Path, channel_id: Optional[int] = None,
+                     start_ipts: Optional[int] = None,
+                     end_ipts: Optional[int] = None) -> MessageTable:
+    """All MS1553F1 messages of a file as one table (uses a .ch10idx index if fresh)."""
+    with WireFile(filepath) as wire:
+        return concat_tables(iter_1553_tables(wire, channel_id, start_ipts, end_ipts))
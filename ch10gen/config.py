@@ -102,7 +102,7 @@ class WriterConfig:
     for the Chapter 10 file generation process.
     
     Attributes:
-        backend: Writer backend selection ('irig106' or 'pyc10')
+        backend: Writer backend selection ('irig106', 'pyc10' or 'native')
         packet_bytes_target: Maximum packet size in bytes
         flush_ms: Force flush interval in milliseconds
         timeout_s: Build timeout in seconds (None = no timeout)
@@ -116,7 +116,7 @@ class WriterConfig:
         default='irig106',
         metadata={
             'description': 'Writer backend selection',
-            'choices': ['irig106', 'pyc10'],
+            'choices': ['irig106', 'pyc10', 'native'],
             'example': 'irig106'
         }
     )
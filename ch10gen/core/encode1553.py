@@ -9,6 +9,8 @@ It implements various encoding formats commonly used in avionics systems:
 - Float32 Split: 32-bit floats split across two 16-bit words
 - Bitfield Packing: Multiple fields packed into single words
 - Command/Status Word Building: Standard 1553 protocol words
+- Array Encoders: NumPy counterparts (``*_array``) that encode a whole block
+  of values per call with the same rounding, saturation and word order
 
 These encoders ensure data is properly formatted according to IRIG-106
 and MIL-STD-1553 standards for Chapter 10 file generation.
@@ -17,6 +19,8 @@ and MIL-STD-1553 standards for Chapter 10 file generation.
 import struct
 from typing import Tuple, Optional, Union, Dict
 
+import numpy as np
+
 
 def bnr16(value: float, scale: float = 1.0, offset: float = 0.0, 
           clamp: bool = True, rounding: str = 'nearest') -> int:
@@ -167,6 +171,21 @@ def float32_combine(word1: int, word2: int, word_order: str = "lsw_msw") -> floa
     return struct.unpack("<f", b)[0]
 
 
+def _validate_bitfield(mask: int, shift: int) -> None:
+    """Validate that a mask/shift pair fits in a 16-bit word."""
+    if not (0 <= mask <= 0xFFFF):
+        raise ValueError(f"Mask must be 0-65535 (16 bits), got {mask}")
+    if not (0 <= shift <= 15):
+        raise ValueError(f"Shift must be 0-15 bits, got {shift}")
+    
+    # Check that shifted mask doesn't overflow
+    if mask != 0:
+        # Find the highest bit set in mask
+        highest_bit = mask.bit_length()
+        if highest_bit + shift > 16:
+            raise ValueError(f"Mask 0x{mask:04X} with shift {shift} exceeds 16 bits. The shifted value would be 0x{(mask << shift):08X} which is too large for a 16-bit word.")
+
+
 def encode_bitfield(value: Union[int, float], mask: int, shift: int, 
                     scale: float = 1.0, offset: float = 0.0) -> int:
     """
@@ -186,17 +205,7 @@ def encode_bitfield(value: Union[int, float], mask: int, shift: int,
         ValueError: If scaled value doesn't fit in the available bits
     """
     # Validate mask and shift
-    if not (0 <= mask <= 0xFFFF):
-        raise ValueError(f"Mask must be 0-65535 (16 bits), got {mask}")
-    if not (0 <= shift <= 15):
-        raise ValueError(f"Shift must be 0-15 bits, got {shift}")
-    
-    # Check that shifted mask doesn't overflow
-    if mask != 0:
-        # Find the highest bit set in mask
-        highest_bit = mask.bit_length()
-        if highest_bit + shift > 16:
-            raise ValueError(f"Mask 0x{mask:04X} with shift {shift} exceeds 16 bits. The shifted value would be 0x{(mask << shift):08X} which is too large for a 16-bit word.")
+    _validate_bitfield(mask, shift)
     
     # Scale the value
     scaled_value = int(round((value - offset) / scale))
@@ -419,3 +428,389 @@ def add_parity(word: int, odd: bool = True) -> int:
             word |= (1 << 16)
     
     return word
+
+
+# ---------------------------------------------------------------------------
+# Array encoders
+#
+# Each *_array function mirrors its scalar counterpart element-wise and
+# returns uint16 words (uint32 for add_parity_array). Python's round() rounds
+# half to even, which is exactly np.rint, so results are bit-identical.
+# ---------------------------------------------------------------------------
+
+def _round_array(scaled: np.ndarray, rounding: str = 'nearest') -> np.ndarray:
+    """Round scaled values like the scalar encoders (float result)."""
+    if not np.all(np.isfinite(scaled)):
+        raise ValueError("Cannot encode non-finite values (NaN or infinity)")
+    
+    if rounding == 'truncate':
+        return np.trunc(scaled)
+    elif rounding == 'away_from_zero':
+        return np.where(scaled >= 0, np.trunc(scaled + 0.5), np.trunc(scaled - 0.5))
+    else:  # 'nearest' (default)
+        return np.rint(scaled)
+
+
+def bnr16_array(values, scale: float = 1.0, offset: float = 0.0,
+                clamp: bool = True, rounding: str = 'nearest') -> np.ndarray:
+    """
+    Encode an array of values as BNR 16-bit words.
+    
+    Args:
+        values: Engineering values to encode (array-like)
+        scale: Scale factor
+        offset: Offset value
+        clamp: Whether to clamp to 16-bit signed range
+        rounding: Rounding mode ('nearest', 'truncate', 'away_from_zero')
+    
+    Returns:
+        uint16 array, element-wise equal to bnr16()
+    """
+    scaled = (np.asarray(values, dtype=np.float64) - offset) / scale
+    val = _round_array(scaled, rounding)
+    
+    if clamp:
+        val = np.clip(val, -0x8000, 0x7FFF)
+    
+    return (val.astype(np.int64) & 0xFFFF).astype(np.uint16)
+
+
+def u16_array(values, scale: float = 1.0, offset: float = 0.0) -> np.ndarray:
+    """
+    Encode an array of values as unsigned 16-bit words.
+    
+    Args:
+        values: Values to encode (array-like)
+        scale: Scale factor
+        offset: Offset value
+    
+    Returns:
+        uint16 array, element-wise equal to u16()
+    """
+    val = _round_array((np.asarray(values, dtype=np.float64) - offset) / scale)
+    return np.clip(val, 0, 0xFFFF).astype(np.uint16)
+
+
+def i16_array(values, scale: float = 1.0, offset: float = 0.0) -> np.ndarray:
+    """
+    Encode an array of values as signed 16-bit words (two's complement).
+    
+    Args:
+        values: Values to encode (array-like)
+        scale: Scale factor
+        offset: Offset value
+    
+    Returns:
+        uint16 array, element-wise equal to i16()
+    """
+    val = _round_array((np.asarray(values, dtype=np.float64) - offset) / scale)
+    return np.clip(val, -32768, 32767).astype(np.int16).view(np.uint16)
+
+
+def bcd_array(values) -> np.ndarray:
+    """
+    Encode an array of integers as BCD words.
+    
+    Args:
+        values: Decimal values (0-9999); floats are truncated like int()
+    
+    Returns:
+        uint16 array, element-wise equal to bcd()
+    
+    Raises:
+        ValueError: If any value is outside 0-9999
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Cannot encode non-finite values (NaN or infinity)")
+        values = np.trunc(values)
+    values = values.astype(np.int64)
+    
+    if values.size and (values.min() < 0 or values.max() > 9999):
+        bad = values[(values < 0) | (values > 9999)][0]
+        raise ValueError(f"BCD value must be 0-9999, got {bad}. BCD encoding only supports 4-digit decimal values.")
+    
+    result = ((values % 10)
+              | ((values // 10 % 10) << 4)
+              | ((values // 100 % 10) << 8)
+              | ((values // 1000) << 12))
+    return result.astype(np.uint16)
+
+
+def float32_split_array(values, word_order: str = "lsw_msw") -> np.ndarray:
+    """
+    Split an array of floats into pairs of 16-bit words.
+    
+    Args:
+        values: Float values to encode (array-like)
+        word_order: "lsw_msw" or "msw_lsw"
+    
+    Returns:
+        uint16 array of shape (n, 2); row i equals float32_split(values[i])
+    
+    Raises:
+        OverflowError: If a finite value is out of float32 range
+    """
+    if word_order not in ("lsw_msw", "msw_lsw"):
+        raise ValueError(f"Invalid word_order: '{word_order}'. Must be 'lsw_msw' or 'msw_lsw'")
+    
+    values = np.asarray(values, dtype=np.float64).ravel()
+    with np.errstate(over='ignore'):
+        singles = values.astype('<f4')
+    if np.any(np.isinf(singles) & np.isfinite(values)):
+        raise OverflowError("float too large to pack with f format")
+    
+    # Little-endian float32 viewed as two little-endian 16-bit words: (lsw, msw)
+    words = singles.view('<u2').reshape(-1, 2)
+    if word_order == "msw_lsw":
+        words = words[:, ::-1]
+    return np.ascontiguousarray(words, dtype=np.uint16)
+
+
+def float32_combine_array(word1, word2, word_order: str = "lsw_msw") -> np.ndarray:
+    """
+    Combine arrays of 16-bit word pairs into IEEE 754 floats.
+    
+    Args:
+        word1: First 16-bit words (array-like)
+        word2: Second 16-bit words (array-like)
+        word_order: "lsw_msw" or "msw_lsw"
+    
+    Returns:
+        float64 array, element-wise equal to float32_combine()
+    """
+    if word_order == "lsw_msw":
+        lsw, msw = word1, word2
+    elif word_order == "msw_lsw":
+        msw, lsw = word1, word2
+    else:
+        raise ValueError(f"Invalid word_order: {word_order}")
+    
+    words = np.empty((np.size(lsw), 2), dtype='<u2')
+    words[:, 0] = np.asarray(lsw).ravel() & 0xFFFF
+    words[:, 1] = np.asarray(msw).ravel() & 0xFFFF
+    # Signaling NaN bit patterns widen to quiet NaN, like struct.unpack
+    with np.errstate(invalid='ignore'):
+        return words.view('<f4').ravel().astype(np.float64)
+
+
+def encode_bitfield_array(values, mask: int, shift: int,
+                          scale: float = 1.0, offset: float = 0.0) -> np.ndarray:
+    """
+    Encode an array of values into a bitfield within 16-bit words.
+    
+    Args:
+        values: Values to encode (array-like)
+        mask: Bit mask (before shifting)
+        shift: Number of bits to shift left
+        scale: Scale factor
+        offset: Offset value
+    
+    Returns:
+        uint16 array, element-wise equal to encode_bitfield()
+    
+    Raises:
+        ValueError: If any scaled value doesn't fit in the available bits
+    """
+    _validate_bitfield(mask, shift)
+    
+    values = np.asarray(values, dtype=np.float64)
+    if mask == 0:
+        return np.zeros(values.shape, dtype=np.uint16)
+    
+    scaled = _round_array((values - offset) / scale).astype(np.int64)
+    
+    bits_available = mask.bit_length()
+    max_value = (1 << bits_available) - 1
+    bad = (scaled < 0) | (scaled > max_value)
+    if np.any(bad):
+        raise ValueError(
+            f"Value {scaled[bad].flat[0]} doesn't fit in {bits_available} bits "
+            f"(max={max_value}). Consider adjusting scale/offset or using a larger bitfield."
+        )
+    
+    return (((scaled & mask) << shift) & 0xFFFF).astype(np.uint16)
+
+
+def pack_bitfields_array(fields: Dict[str, Tuple[object, int, int, float, float]]) -> np.ndarray:
+    """
+    Pack multiple bitfields into arrays of 16-bit words.
+    
+    Args:
+        fields: Dictionary of field_name -> (values, mask, shift, scale, offset)
+            where values are array-like and share one length
+    
+    Returns:
+        uint16 array, element-wise equal to pack_bitfields()
+    
+    Raises:
+        ValueError: If fields overlap or values don't fit
+    """
+    word = None
+    used_bits = 0
+    
+    for field_name, (values, mask, shift, scale, offset) in fields.items():
+        # Encode the field
+        encoded = encode_bitfield_array(values, mask, shift, scale, offset)
+        
+        # Check for overlap
+        shifted_mask = (mask << shift) & 0xFFFF
+        if used_bits & shifted_mask:
+            raise ValueError(f"Field '{field_name}' overlaps with previously packed fields. Bit positions {shift}-{shift + mask.bit_length() - 1} are already used.")
+        
+        # Pack into word
+        word = encoded if word is None else word | encoded
+        used_bits |= shifted_mask
+    
+    if word is None:
+        return np.zeros(0, dtype=np.uint16)
+    return word
+
+
+# Number of set bits for every byte value
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def add_parity_array(words, odd: bool = True) -> np.ndarray:
+    """
+    Add parity bits to an array of 1553 words.
+    
+    Args:
+        words: 16-bit words (array-like)
+        odd: Use odd parity (default True for 1553)
+    
+    Returns:
+        uint32 array of 17-bit words, element-wise equal to add_parity()
+    """
+    words = np.asarray(words).astype(np.uint32)
+    low = words & 0xFFFF
+    ones = _POPCOUNT8[low & 0xFF] + _POPCOUNT8[low >> 8]
+    
+    # Odd parity sets bit 16 when the count is even, even parity when odd
+    needs_bit = (ones % 2 == 0) if odd else (ones % 2 == 1)
+    return words | (needs_bit.astype(np.uint32) << 16)
+
+
+def encode_array(values, encode: str, scale: float = 1.0, offset: float = 0.0,
+                 rounding: str = 'nearest', word_order: Optional[str] = None) -> np.ndarray:
+    """
+    Encode an array of values with a named ICD encoding.
+    
+    Args:
+        values: Values to encode (array-like)
+        encode: Encoding name ('bnr16', 'u16', 'i16', 'bcd', 'float32_split';
+            anything else is treated as a raw 16-bit integer)
+        scale: Scale factor
+        offset: Offset value
+        rounding: Rounding mode for BNR encoding
+        word_order: Word order for float32_split
+    
+    Returns:
+        uint16 array of shape (n, 2) for float32_split, else (n, 1)
+    """
+    if encode == 'bnr16':
+        words = bnr16_array(values, scale, offset, rounding=rounding)
+    elif encode == 'u16':
+        words = u16_array(values, scale, offset)
+    elif encode == 'i16':
+        words = i16_array(values, scale, offset)
+    elif encode == 'bcd':
+        words = bcd_array(values)
+    elif encode == 'float32_split':
+        return float32_split_array(values, word_order or 'lsw_msw')
+    else:
+        # Default to u16 raw bits, like int(value) & 0xFFFF
+        values = np.asarray(values, dtype=np.float64)
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Cannot encode non-finite values (NaN or infinity)")
+        words = (np.trunc(values).astype(np.int64) & 0xFFFF).astype(np.uint16)
+    return words.reshape(-1, 1)
+
+
+# ---------------------------------------------------------------------------
+# Array decoders
+#
+# Inverses of the array encoders: words in, engineering values out.
+# ---------------------------------------------------------------------------
+
+def bcd_decode_array(words) -> np.ndarray:
+    """
+    Decode an array of BCD words.
+    
+    Args:
+        words: 16-bit BCD words (array-like)
+    
+    Returns:
+        int64 array of decimal values (inverse of bcd_array)
+    """
+    words = np.asarray(words).astype(np.int64)
+    return ((words & 0xF)
+            + ((words >> 4) & 0xF) * 10
+            + ((words >> 8) & 0xF) * 100
+            + ((words >> 12) & 0xF) * 1000)
+
+
+def decode_bitfield_array(words, mask: int, shift: int,
+                          scale: float = 1.0, offset: float = 0.0) -> np.ndarray:
+    """
+    Decode a bitfield from an array of 16-bit words.
+    
+    Args:
+        words: 16-bit words containing the bitfield (array-like)
+        mask: Bit mask (before shifting)
+        shift: Number of bits to shift right
+        scale: Scale factor
+        offset: Offset value
+    
+    Returns:
+        Array element-wise equal to decode_bitfield() (int64 when scale is 1
+        and offset 0, else float64)
+    """
+    extracted = (np.asarray(words).astype(np.int64) >> shift) & mask
+    if scale == 1 and offset == 0:
+        return extracted
+    return extracted * scale + offset
+
+
+def decode_array(words, encode: str, scale: float = 1.0, offset: float = 0.0,
+                 word_order: Optional[str] = None, mask: Optional[int] = None,
+                 shift: Optional[int] = None) -> np.ndarray:
+    """
+    Decode arrays of words with a named ICD encoding (inverse of encode_array).
+    
+    Args:
+        words: uint16 array of shape (n, 2) for float32_split, else (n,) or (n, 1)
+        encode: Encoding name ('bnr16', 'u16', 'i16', 'bcd', 'float32_split';
+            anything else is returned as the raw 16-bit word)
+        scale: Scale factor
+        offset: Offset value
+        word_order: Word order for float32_split
+        mask: Bit mask of a bitfield (with shift; not for bnr16/float32_split)
+        shift: Bit shift of a bitfield
+    
+    Returns:
+        float64 array of n engineering values; int64 for raw and BCD words,
+        and for u16/i16 words and bitfields with scale 1 and offset 0
+    """
+    words = np.asarray(words)
+    if encode == 'float32_split':
+        words = words.reshape(-1, 2)
+        return float32_combine_array(words[:, 0], words[:, 1], word_order or 'lsw_msw')
+    
+    words = words.reshape(-1)
+    if mask is not None and shift is not None and encode != 'bnr16':
+        return decode_bitfield_array(words, mask, shift, scale, offset)
+    if encode == 'bnr16':
+        return words.astype(np.uint16).view(np.int16) * scale + offset
+    if encode in ('u16', 'i16'):
+        values = words.astype(np.uint16)
+        if encode == 'i16':
+            values = values.view(np.int16)
+        values = values.astype(np.int64)
+        if scale == 1 and offset == 0:
+            return values
+        return values * scale + offset
+    if encode == 'bcd':
+        return bcd_decode_array(words)
+    return words.astype(np.int64)
@@ -0,0 +1,200 @@
+"""Native Chapter 10 packet serializer.
+
+Packs TMATS, Time Data Format 1 and MS1553 Format 1 packets directly into a
+reusable preallocated buffer with struct.pack_into, without building
+PyChapter10 packet/message objects. Output is byte-identical to PyChapter10
+for the same field values:
+
+- 24-byte primary header (no secondary header, no data checksum)
+- Header checksum computed as the 16-bit sum of the first 11 header words
+- Body padded with zeros to a 32-bit boundary (data_length excludes filler)
+"""
+
+import struct
+from datetime import datetime
+from typing import Iterable, Sequence, Tuple, Union, BinaryIO
+
+SYNC_PATTERN = 0xEB25
+HEADER_SIZE = 24
+
+# Data types written by the generator
+DATA_TYPE_TMATS = 0x01
+DATA_TYPE_TIME_F1 = 0x11
+DATA_TYPE_MS1553_F1 = 0x19
+
+# MS1553F1 block status word bits (as laid out by PyChapter10)
+BLOCK_STATUS_BUS_B = 0x2000
+BLOCK_STATUS_MESSAGE_ERROR = 0x1000
+BLOCK_STATUS_RT2RT = 0x0800
+BLOCK_STATUS_FORMAT_ERROR = 0x0400
+BLOCK_STATUS_TIMEOUT = 0x0200
+BLOCK_STATUS_LENGTH_ERROR = 0x0020
+BLOCK_STATUS_SYNC_ERROR = 0x0010
+BLOCK_STATUS_WORD_ERROR = 0x0008
+
+_HEADER = struct.Struct('<HHIIBBBBIHH')
+_CSDW = struct.Struct('<I')
+_MS1553_IPH = struct.Struct('<QHHH')
+_TIME_BODY = struct.Struct('<6B')
+
+# A 1553 message is (ipts, bus, payload) where payload is either raw bytes
+# or a sequence of 16-bit words
+Ms1553Message = Tuple[int, int, Union[bytes, bytearray, memoryview, Sequence[int]]]
+
+
+class PacketSerializer:
+    """Serialize Chapter 10 packets into a reusable buffer.
+
+    Each *_packet method packs one packet at the start of the internal
+    buffer and returns its length. Use write_to() or getvalue() to consume
+    it before packing the next packet.
+    """
+
+    def __init__(self, initial_size: int = 65536):
+        """Initialize serializer with a preallocated buffer.
+
+        Args:
+            initial_size: Initial buffer size in bytes (grows on demand)
+        """
+        self.buffer = bytearray(initial_size)
+
+    def _reserve(self, size: int) -> None:
+        """Grow the buffer to hold at least size bytes."""
+        if size > len(self.buffer):
+            self.buffer.extend(bytes(max(size, 2 * len(self.buffer)) - len(self.buffer)))
+
+    def _finish(self, channel_id: int, data_type: int, rtc: int, data_length: int) -> int:
+        """Pad the body, pack the primary header and return the packet length."""
+        filler = -data_length % 4
+        end = HEADER_SIZE + data_length
+        if filler:
+            self.buffer[end:end + filler] = bytes(filler)
+        packet_length = end + filler
+
+        rtc &= 0xFFFFFFFFFFFF
+        rtc_low = rtc & 0xFFFFFFFF
+        rtc_high = rtc >> 32
+        checksum = (SYNC_PATTERN + channel_id
+                    + (packet_length & 0xFFFF) + (packet_length >> 16)
+                    + (data_length & 0xFFFF) + (data_length >> 16)
+                    + (data_type << 8)
+                    + (rtc_low & 0xFFFF) + (rtc_low >> 16) + rtc_high) & 0xFFFF
+
+        _HEADER.pack_into(self.buffer, 0, SYNC_PATTERN, channel_id, packet_length,
+                          data_length, 0, 0, 0, data_type, rtc_low, rtc_high, checksum)
+        return packet_length
+
+    def tmats_packet(self, content: bytes, channel_id: int = 0, rtc: int = 0,
+                     data_type: int = DATA_TYPE_TMATS) -> int:
+        """Pack a TMATS (Computer Generated Format 1) packet.
+
+        Args:
+            content: Encoded TMATS text
+            channel_id: Channel ID (0 per standard)
+            rtc: Relative time counter
+            data_type: Data type code
+
+        Returns:
+            Packet length in bytes
+        """
+        data_length = 4 + len(content)
+        self._reserve(HEADER_SIZE + data_length + 3)
+        _CSDW.pack_into(self.buffer, HEADER_SIZE, 0)
+        self.buffer[HEADER_SIZE + 4:HEADER_SIZE + data_length] = content
+        return self._finish(channel_id, data_type, rtc, data_length)
+
+    def time_packet(self, timestamp: datetime, channel_id: int, rtc: int,
+                    time_source: int = 1, time_format: int = 0,
+                    leap: bool = False, irig_source: int = 0,
+                    data_type: int = DATA_TYPE_TIME_F1) -> int:
+        """Pack a Time Data Format 1 packet in IRIG day-of-year format.
+
+        Args:
+            timestamp: Time encoded in the packet body (BCD)
+            channel_id: Time channel ID
+            rtc: Relative time counter
+            time_source: CSDW SRC field
+            time_format: CSDW FMT field (0 = IRIG-B)
+            leap: CSDW leap year flag
+            irig_source: CSDW IRIG time source field
+            data_type: Data type code
+
+        Returns:
+            Packet length in bytes
+        """
+        csdw = (time_source & 0xF) | ((time_format & 0xF) << 4) | (int(leap) << 8) \
+            | ((irig_source & 0xF) << 12)
+
+        ms = timestamp.microsecond // 1000
+        day = timestamp.timetuple().tm_yday
+        second = timestamp.second
+        minute = timestamp.minute
+        hour = timestamp.hour
+
+        self._reserve(HEADER_SIZE + 12)
+        _CSDW.pack_into(self.buffer, HEADER_SIZE, csdw)
+        _TIME_BODY.pack_into(
+            self.buffer, HEADER_SIZE + 4,
+            ((ms // 100) << 4) | ((ms % 100) // 10),
+            ((second // 10) << 4) | (second % 10),
+            ((minute // 10) << 4) | (minute % 10),
+            ((hour // 10) << 4) | (hour % 10),
+            (((day % 100) // 10) << 4) | (day % 10),
+            day // 100
+        )
+        return self._finish(channel_id, data_type, rtc, 10)
+
+    def ms1553_packet(self, messages: Iterable[Ms1553Message], channel_id: int, rtc: int,
+                      time_tag_bits: int = 0,
+                      data_type: int = DATA_TYPE_MS1553_F1) -> int:
+        """Pack an MS1553 Format 1 packet.
+
+        Args:
+            messages: (ipts, bus, payload) tuples; payload is raw bytes or a
+                sequence of 16-bit words (command, status, data...)
+            channel_id: 1553 channel ID
+            rtc: Relative time counter
+            time_tag_bits: CSDW time tag bits field
+            data_type: Data type code
+
+        Returns:
+            Packet length in bytes
+
+        Raises:
+            struct.error: If a word does not fit in 16 bits
+        """
+        offset = HEADER_SIZE + 4
+        count = 0
+        for ipts, bus, payload in messages:
+            if isinstance(payload, (bytes, bytearray, memoryview)):
+                length = len(payload)
+                self._reserve(offset + 14 + length + 4)
+                _MS1553_IPH.pack_into(self.buffer, offset, ipts,
+                                      BLOCK_STATUS_BUS_B if bus else 0, 0, length)
+                offset += 14
+                self.buffer[offset:offset + length] = payload
+                offset += length
+                if length % 2:
+                    self.buffer[offset] = 0
+                    offset += 1
+            else:
+                length = 2 * len(payload)
+                self._reserve(offset + 14 + length + 4)
+                _MS1553_IPH.pack_into(self.buffer, offset, ipts,
+                                      BLOCK_STATUS_BUS_B if bus else 0, 0, length)
+                offset += 14
+                struct.pack_into(f'<{len(payload)}H', self.buffer, offset, *payload)
+                offset += length
+            count += 1
+
+        _CSDW.pack_into(self.buffer, HEADER_SIZE, (count & 0xFFFFFF) | ((time_tag_bits & 0x3) << 24))
+        return self._finish(channel_id, data_type, rtc, offset - HEADER_SIZE)
+
+    def write_to(self, stream: BinaryIO, length: int) -> None:
+        """Write the packed packet to a binary stream without copying."""
+        with memoryview(self.buffer) as view, view[:length] as packet:
+            stream.write(packet)
+
+    def getvalue(self, length: int) -> bytes:
+        """Return a copy of the packed packet."""
+        return bytes(self.buffer[:length])
@@ -3,15 +3,15 @@ Modular data generation system for scenario-driven CH10 generation.
 Provides flexible, per-field configuration of data generation modes.
 """
 
-import random
 import math
-import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Sequence, Union
 import numpy as np
 
+from .expressions import compile_expression, expression_namespace, random_functions
+from .utils.rng import RandomStream, RNGService
+
 
 @dataclass
 class GenerationContext:
@@ -23,16 +23,62 @@ class GenerationContext:
     field_values: Dict[str, Any]  # Already computed field values in current message
     all_values: Dict[str, Dict[str, Any]]  # All computed values across messages
     icd: Any                   # Full ICD for cross-references
+    instance: Optional[int] = None  # Schedule instance of the message (k-th send)
 
 
 class DataGenerator(ABC):
     """Base class for all data generators."""
     
+    # What generate() depends on: 'time', 'instance' (the schedule instance),
+    # or 'call' (a new value on every call, e.g. random or stateful)
+    inputs = frozenset({'call'})
+    
+    # Random stream, assigned by the owner (e.g. ScenarioManager per field);
+    # random generators without one get a private stream on first use
+    rng: Optional[RandomStream] = None
+    
+    @property
+    def stream(self) -> RandomStream:
+        """The generator's random stream."""
+        if self.rng is None:
+            self.rng = RNGService().stream(type(self).__name__)
+        return self.rng
+    
     @abstractmethod
     def generate(self, context: GenerationContext) -> Union[int, float]:
         """Generate a value based on the context."""
         pass
     
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Generate values for N samples at once.
+        
+        Equivalent to N calls to generate() in order (stateful generators
+        advance by N, or derive their values from the instances if given).
+        Subclasses override this with vectorized versions; the default calls
+        generate() per sample.
+        
+        Args:
+            times: Sample times in seconds since start
+            counts: Message count per sample (default 0)
+            instances: Schedule instance per sample (default None)
+            
+        Returns:
+            Array of N values
+        """
+        times = np.asarray(times, dtype=float)
+        counts = np.zeros(len(times), dtype=np.int64) if counts is None else np.asarray(counts)
+        instances = [None] * len(times) if instances is None else np.asarray(instances).tolist()
+        return np.array([
+            self.generate(GenerationContext(
+                time_seconds=float(t), message_count=int(c), message_name='', field_name='',
+                field_values={}, all_values={}, icd=None, instance=k
+            ))
+            for t, c, k in zip(times, counts, instances)
+        ])
+    
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
         """Validate configuration and return list of errors."""
         return []
@@ -48,9 +94,18 @@ class RandomGenerator(DataGenerator):
     def generate(self, context: GenerationContext) -> Union[int, float]:
         """Generate random value in range."""
         if isinstance(self.min_val, int) and isinstance(self.max_val, int):
-            return random.randint(self.min_val, self.max_val)
+            return self.stream.integers(self.min_val, self.max_val)
         else:
-            return random.uniform(self.min_val, self.max_val)
+            return self.stream.uniform(self.min_val, self.max_val)
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate N random values (same draws as N generate() calls)."""
+        n = len(times)
+        if isinstance(self.min_val, int) and isinstance(self.max_val, int):
+            return self.stream.integers_array(n, self.min_val, self.max_val)
+        return self.stream.uniform_array(n, self.min_val, self.max_val)
 
 
 class RandomNormalGenerator(DataGenerator):
@@ -65,7 +120,7 @@ class RandomNormalGenerator(DataGenerator):
     
     def generate(self, context: GenerationContext) -> float:
         """Generate normal distribution value."""
-        value = np.random.normal(self.mean, self.std_dev)
+        value = self.stream.normal(self.mean, self.std_dev)
         
         # Clip to range if specified
         if self.min_val is not None:
@@ -74,6 +129,17 @@ class RandomNormalGenerator(DataGenerator):
             value = min(value, self.max_val)
         
         return value
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate N normal values (same draws as N generate() calls)."""
+        values = self.stream.normal_array(len(times), self.mean, self.std_dev)
+        if self.min_val is not None:
+            values = np.maximum(values, self.min_val)
+        if self.max_val is not None:
+            values = np.minimum(values, self.max_val)
+        return values
 
 
 class RandomMultimodalGenerator(DataGenerator):
@@ -93,39 +159,84 @@ class RandomMultimodalGenerator(DataGenerator):
     def generate(self, context: GenerationContext) -> float:
         """Generate multimodal value."""
         # Choose peak based on weights
-        r = random.random()
+        r = self.stream.random()
         cumulative = 0
         for peak in self.peaks:
             cumulative += peak['weight']
             if r <= cumulative:
-                return np.random.normal(peak['mean'], peak['std_dev'])
+                return self.stream.normal(peak['mean'], peak['std_dev'])
         
         # Fallback to last peak
-        return np.random.normal(self.peaks[-1]['mean'], self.peaks[-1]['std_dev'])
+        return self.stream.normal(self.peaks[-1]['mean'], self.peaks[-1]['std_dev'])
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate N multimodal values (same draws as N generate() calls)."""
+        if not self.peaks:
+            return super().generate_batch(times, counts, instances)
+        n = len(times)
+        r = self.stream.random_array(n)
+        
+        # First peak whose cumulative weight reaches r (past the end: last peak)
+        cumulative = []
+        total = 0
+        for peak in self.peaks:
+            total += peak['weight']
+            cumulative.append(total)
+        index = np.minimum(np.searchsorted(cumulative, r, side='left'), len(self.peaks) - 1)
+        
+        means = np.array([peak['mean'] for peak in self.peaks], dtype=float)
+        std_devs = np.array([peak['std_dev'] for peak in self.peaks], dtype=float)
+        return self.stream.normal_array(n, means[index], std_devs[index])
 
 
 class ConstantGenerator(DataGenerator):
     """Generate constant values."""
     
+    inputs = frozenset()
+    
     def __init__(self, value: Union[int, float]):
         self.value = value
     
     def generate(self, context: GenerationContext) -> Union[int, float]:
         """Return constant value."""
         return self.value
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Return the constant value N times."""
+        return np.full(len(times), self.value)
 
 
 class IncrementGenerator(DataGenerator):
     """Generate incrementing counter values."""
     
+    inputs = frozenset({'instance'})
+    
     def __init__(self, start: int = 0, increment: int = 1, wrap: Optional[int] = None):
         self.start = start
         self.increment = increment
         self.wrap = wrap
         self.current = start
     
+    def value_at(self, instance: int) -> int:
+        """Counter value of the given instance, without advancing the counter."""
+        if self.wrap is None:
+            return self.start + self.increment * instance
+        if self.increment > 0:
+            cycle_length = max(1, (self.wrap - self.start) // self.increment + 1)
+            return self.start + self.increment * (instance % cycle_length)
+        # A non-positive increment only wraps if the first step overshoots
+        if self.start + self.increment > self.wrap:
+            return self.start
+        return self.start + self.increment * instance
+    
     def generate(self, context: GenerationContext) -> int:
-        """Generate next counter value."""
+        """Generate next counter value (or the instance's value, if given)."""
+        if context.instance is not None:
+            return self.value_at(context.instance)
         value = self.current
         self.current += self.increment
         
@@ -133,18 +244,53 @@ class IncrementGenerator(DataGenerator):
             self.current = self.start
         
         return value
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate the next N counter values (integer counters in closed form)."""
+        if instances is not None:
+            return np.array([self.value_at(k) for k in np.asarray(instances).tolist()])
+        n = len(times)
+        integral = all(isinstance(v, int) and abs(v) < 1 << 40
+                       for v in (self.start, self.increment, self.current, self.wrap or 0))
+        if not integral:
+            return super().generate_batch(times, counts, instances)
+        
+        steps = np.arange(n, dtype=np.int64)
+        if self.wrap is None:
+            self.current += self.increment * n
+            return self.current - self.increment * n + self.increment * steps
+        
+        if self.increment <= 0:
+            return super().generate_batch(times, counts, instances)
+        
+        # Values cycle through start + increment * j for j < cycle_length
+        cycle_length = max(1, (self.wrap - self.start) // self.increment + 1)
+        offset, rem = divmod(self.current - self.start, self.increment)
+        if rem or not 0 <= offset < cycle_length:
+            return super().generate_batch(times, counts, instances)
+        
+        self.current = self.start + self.increment * ((offset + n) % cycle_length)
+        return self.start + self.increment * ((offset + steps) % cycle_length)
 
 
 class PatternGenerator(DataGenerator):
     """Generate repeating pattern values."""
     
+    inputs = frozenset({'instance'})
+    
     def __init__(self, values: List[Union[int, float]], repeat: bool = True):
         self.values = values
         self.repeat = repeat
         self.index = 0
     
     def generate(self, context: GenerationContext) -> Union[int, float]:
-        """Generate next pattern value."""
+        """Generate next pattern value (or the instance's value, if given)."""
+        if context.instance is not None and self.values:
+            if self.repeat:
+                return self.values[context.instance % len(self.values)]
+            return self.values[min(context.instance, len(self.values) - 1)]
         if self.index >= len(self.values):
             if self.repeat:
                 self.index = 0
@@ -154,11 +300,36 @@ class PatternGenerator(DataGenerator):
         value = self.values[self.index]
         self.index += 1
         return value
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate the next N pattern values."""
+        n = len(times)
+        if not self.values:
+            return super().generate_batch(times, counts, instances)
+        length = len(self.values)
+        if instances is not None:
+            instances = np.asarray(instances, dtype=np.int64)
+            indices = instances % length if self.repeat else np.minimum(instances, length - 1)
+            return np.asarray(self.values)[indices]
+        steps = np.arange(n, dtype=np.int64)
+        if self.repeat:
+            start = 0 if self.index >= length else self.index
+            indices = (start + steps) % length
+            self.index = int(indices[-1]) + 1 if n else self.index
+        else:
+            indices = np.minimum(self.index + steps, length - 1)
+            if self.index < length:
+                self.index = min(self.index + n, length)
+        return np.asarray(self.values)[indices]
 
 
 class SineGenerator(DataGenerator):
     """Generate sine wave values."""
     
+    inputs = frozenset({'time'})
+    
     def __init__(self, center: float = 0, amplitude: float = 1, 
                  frequency: float = 1, phase: float = 0):
         self.center = center
@@ -170,11 +341,20 @@ class SineGenerator(DataGenerator):
         """Generate sine wave value."""
         t = context.time_seconds
         return self.center + self.amplitude * math.sin(2 * math.pi * self.frequency * t + self.phase)
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate sine wave values at N times."""
+        t = np.asarray(times, dtype=float)
+        return self.center + self.amplitude * np.sin(2 * math.pi * self.frequency * t + self.phase)
 
 
 class CosineGenerator(DataGenerator):
     """Generate cosine wave values."""
     
+    inputs = frozenset({'time'})
+    
     def __init__(self, center: float = 0, amplitude: float = 1, 
                  frequency: float = 1, phase: float = 0):
         self.center = center
@@ -186,11 +366,20 @@ class CosineGenerator(DataGenerator):
         """Generate cosine wave value."""
         t = context.time_seconds
         return self.center + self.amplitude * math.cos(2 * math.pi * self.frequency * t + self.phase)
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate cosine wave values at N times."""
+        t = np.asarray(times, dtype=float)
+        return self.center + self.amplitude * np.cos(2 * math.pi * self.frequency * t + self.phase)
 
 
 class SawtoothGenerator(DataGenerator):
     """Generate sawtooth wave values."""
     
+    inputs = frozenset({'time'})
+    
     def __init__(self, min_val: float = 0, max_val: float = 100, period: float = 1):
         self.min_val = min_val
         self.max_val = max_val
@@ -202,11 +391,21 @@ class SawtoothGenerator(DataGenerator):
         t = context.time_seconds
         phase = (t % self.period) / self.period
         return self.min_val + self.range * phase
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate sawtooth wave values at N times."""
+        t = np.asarray(times, dtype=float)
+        phase = (t % self.period) / self.period
+        return self.min_val + self.range * phase
 
 
 class SquareGenerator(DataGenerator):
     """Generate square wave values."""
     
+    inputs = frozenset({'time'})
+    
     def __init__(self, low: float = 0, high: float = 1, 
                  period: float = 1, duty_cycle: float = 0.5):
         self.low = low
@@ -219,11 +418,21 @@ class SquareGenerator(DataGenerator):
         t = context.time_seconds
         phase = (t % self.period) / self.period
         return self.high if phase < self.duty_cycle else self.low
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate square wave values at N times."""
+        t = np.asarray(times, dtype=float)
+        phase = (t % self.period) / self.period
+        return np.where(phase < self.duty_cycle, self.high, self.low)
 
 
 class RampGenerator(DataGenerator):
     """Generate linear ramp values."""
     
+    inputs = frozenset({'time'})
+    
     def __init__(self, start: float = 0, end: float = 100, 
                  duration: float = 10, repeat: bool = False):
         self.start = start
@@ -244,6 +453,15 @@ class RampGenerator(DataGenerator):
         
         progress = t / self.duration
         return self.start + self.range * progress
+    
+    def generate_batch(self, times: Sequence[float],
+                       counts: Optional[Sequence[int]] = None,
+                       instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Generate ramp values at N times."""
+        t = np.asarray(times, dtype=float)
+        if self.repeat:
+            t = t % self.duration
+        return np.where(t >= self.duration, self.end, self.start + self.range * (t / self.duration))
 
 
 class ExpressionGenerator(DataGenerator):
@@ -252,54 +470,39 @@ class ExpressionGenerator(DataGenerator):
     def __init__(self, formula: str):
         self.formula = formula
         self.compiled = None
+        # Persistent namespace: functions are added once, time and message
+        # count are updated per evaluation
+        self.namespace = {'time': 0.0, 'message_count': 0}
+        self.namespace.update(expression_namespace())
+        # random() and random_int() draw from this generator's stream
+        self.random_functions = random_functions(lambda: self.stream)
+        self.namespace.update(self.random_functions)
         self._compile_expression()
     
     def _compile_expression(self):
-        """Compile the expression for evaluation."""
-        # This is a simplified version - full implementation would parse properly
+        """Compile the expression for evaluation (parsed once, cached by formula)."""
         try:
-            self.compiled = compile(self.formula, '<expression>', 'eval')
+            self.compiled = compile_expression(self.formula)
         except SyntaxError as e:
             raise ValueError(f"Invalid expression syntax in '{self.formula}': {e}. Check for missing operators, parentheses, or invalid function names.")
     
     def generate(self, context: GenerationContext) -> Union[int, float]:
         """Evaluate expression with context."""
-        # Build evaluation context
-        eval_context = {
-            'time': context.time_seconds,
-            'message_count': context.message_count,
-            'random': lambda min_val=0, max_val=1: random.uniform(min_val, max_val),
-            'sin': math.sin,
-            'cos': math.cos,
-            'tan': math.tan,
-            'abs': abs,
-            'min': min,
-            'max': max,
-            'sqrt': math.sqrt,
-            'pow': pow,
-            'exp': math.exp,
-            'log': math.log,
-            'floor': math.floor,
-            'ceil': math.ceil,
-            'round': round,
-            'int': int,
-            'float': float,
-        }
-        
-        # Add field values from current message
-        eval_context.update(context.field_values)
-        
-        # Add cross-message references
+        self.namespace['time'] = context.time_seconds
+        self.namespace['message_count'] = context.message_count
+        
+        # Field values from current message, then cross-message references
+        names = dict(context.field_values)
         for msg_name, msg_values in context.all_values.items():
             # Handle spaces in names by replacing with underscores for eval
-            safe_name = msg_name.replace(' ', '_')
-            eval_context[safe_name] = msg_values
+            names[msg_name.replace(' ', '_')] = msg_values
         
         try:
-            return eval(self.compiled, {"__builtins__": {}}, eval_context)
+            return eval(self.compiled, self.namespace, names)
         except Exception as e:
             # Provide more context about what went wrong
-            available_vars = list(eval_context.keys())
+            available_vars = [name for name in self.namespace if name != '__builtins__']
+            available_vars += [name for name in names if name not in self.namespace]
             raise ValueError(f"Error evaluating expression '{self.formula}' for field '{context.field_name}' in message '{context.message_name}': {e}. Available variables: {', '.join(available_vars[:10])}{'...' if len(available_vars) > 10 else ''}")
 
 
@@ -414,13 +617,25 @@ class DataGeneratorManager:
     
     def __init__(self):
         self.generators: Dict[str, DataGenerator] = {}
-        self.start_time = time.time()
+        self.time_s = 0.0  # Simulation time of the message being generated
         self.message_counts: Dict[str, int] = {}
         self.all_values: Dict[str, Dict[str, Any]] = {}
     
     def get_elapsed_time(self) -> float:
-        """Get elapsed time since start in seconds."""
-        return time.time() - self.start_time
+        """Get simulation time of the current message in seconds."""
+        return self.time_s
+    
+    def set_message_context(self, message_name: str, time_s: float,
+                            instance: Optional[int] = None):
+        """
+        Set the simulation time (and schedule instance) of the next message.
+        
+        Values then depend only on the schedule, not on when or in which
+        order messages are generated.
+        """
+        self.time_s = time_s
+        if instance is not None:
+            self.message_counts[message_name] = instance
     
     def get_message_count(self, message_name: str) -> int:
         """Get count of messages generated for a specific message type."""
@@ -478,7 +693,7 @@ class DataGeneratorManager:
         
         # Create context
         context = GenerationContext(
-            time_seconds=time.time() - self.start_time,
+            time_seconds=self.time_s,
             message_count=self.message_counts[message_name],
             message_name=message_name,
             field_name=field_name,
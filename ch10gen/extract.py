@@ -0,0 +1,150 @@
+"""
+Per-parameter time series extraction.
+
+Writes selected ICD parameters as NumPy .npy files of (ipts, value)
+records that can be opened with np.load(path, mmap_mode='r'), instead of
+exporting the whole decoded CSV.
+
+Only messages whose command word (RT, T/R, SA) belongs to an ICD message
+holding a requested parameter are gathered: the filter runs on the raw
+command words while packets are walked (see columnar.decode_1553_packets),
+and only the requested fields of the remaining messages are decoded.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .columnar import iter_1553_tables
+    from .icd import ICDDefinition
+    from .icd_decoder import FieldDecoder, ICDDecoder
+    from .wire_reader import WireFile
+except ImportError:
+    from columnar import iter_1553_tables
+    from icd import ICDDefinition
+    from icd_decoder import FieldDecoder, ICDDecoder
+    from wire_reader import WireFile
+
+# One sample of a parameter: message IPTS (ns) and engineering value
+PARAMETER_DTYPE = np.dtype([('ipts', '<u8'), ('value', '<f8')])
+
+
+def parameter_path(output_dir: Path, name: str) -> Path:
+    """Path of the .npy file of a parameter."""
+    return Path(output_dir) / f"{name}.npy"
+
+
+def parameter_fields(decoder: ICDDecoder,
+                     names: Sequence[str]) -> Dict[str, List[Tuple[int, FieldDecoder]]]:
+    """
+    ICD fields of each parameter name.
+
+    Raises:
+        ValueError: If a name is not a field of any ICD message
+    """
+    targets = {name: decoder.fields_named(name) for name in names}
+    unknown = [name for name, fields in targets.items() if not fields]
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(unknown)}")
+    return targets
+
+
+def iter_parameter_samples(wire: WireFile, decoder: ICDDecoder, names: Sequence[str],
+                           channel_id: Optional[int] = None, start_ipts: Optional[int] = None,
+                           end_ipts: Optional[int] = None) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Decode parameters of an open file in batches of packets.
+
+    Yields:
+        PARAMETER_DTYPE samples of each parameter per batch, in file order
+        (parameters without samples in the batch are left out)
+
+    Raises:
+        ValueError: If a name is not a field of any ICD message
+    """
+    targets = parameter_fields(decoder, names)
+    message_indices = {index for fields in targets.values() for index, _ in fields}
+
+    for table in iter_1553_tables(wire, channel_id, start_ipts, end_ipts,
+                                  keys=decoder.key_mask(message_indices)):
+        index = decoder.match(table)
+        gathered = {}
+        for message_index in message_indices:
+            rows = np.flatnonzero(index == message_index)
+            if len(rows):
+                members = table.select(rows)
+                gathered[message_index] = (rows, members.messages['ipts'],
+                                           *decoder.messages[message_index].gather(members))
+
+        batch = {}
+        for name, fields in targets.items():
+            parts = []
+            for message_index, field in fields:
+                if message_index not in gathered:
+                    continue
+                rows, ipts, words, counts = gathered[message_index]
+                present = counts >= field.position + field.width
+                samples = np.empty(int(present.sum()), dtype=PARAMETER_DTYPE)
+                samples['ipts'] = ipts[present]
+                samples['value'] = field.decode(words[present])
+                parts.append((rows[present], samples))
+            if len(parts) == 1:
+                batch[name] = parts[0][1]
+            elif parts:
+                rows = np.concatenate([part[0] for part in parts])
+                samples = np.concatenate([part[1] for part in parts])
+                batch[name] = samples[np.argsort(rows, kind='stable')]
+        yield batch
+
+
+def extract_parameters(ch10_file: Path, icd: ICDDefinition, names: Sequence[str],
+                       output_dir: Path, channel_id: Optional[int] = None,
+                       start_ipts: Optional[int] = None, end_ipts: Optional[int] = None,
+                       decoder: Optional[ICDDecoder] = None) -> Dict[str, Path]:
+    """
+    Extract ICD parameters of a CH10 file as time series.
+
+    A parameter defined in several messages gets the samples of all of
+    them, in file order. Messages too short to hold a parameter's words
+    contribute no sample.
+
+    Args:
+        ch10_file: Input CH10 file (uses a .ch10idx index if fresh)
+        icd: ICD definition for decoding
+        names: Parameter (ICD word) names
+        output_dir: Directory for the NAME.npy files (created if missing)
+        channel_id: Only read packets of this channel
+        start_ipts: Only read packets overlapping this IPTS range
+        end_ipts: End of the IPTS range
+        decoder: Decoder compiled from the ICD (compiled if None)
+
+    Returns:
+        Path of the PARAMETER_DTYPE .npy file of each parameter
+
+    Raises:
+        ValueError: If a name is not a field of any ICD message
+    """
+    if decoder is None:
+        decoder = ICDDecoder(icd)
+    chunks: Dict[str, List[np.ndarray]] = {name: [] for name in parameter_fields(decoder, names)}
+
+    with WireFile(ch10_file) as wire:
+        for batch in iter_parameter_samples(wire, decoder, names, channel_id, start_ipts, end_ipts):
+            for name, samples in batch.items():
+                chunks[name].append(samples)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for name, parts in chunks.items():
+        series = np.concatenate(parts) if parts else np.zeros(0, dtype=PARAMETER_DTYPE)
+        paths[name] = parameter_path(output_dir, name)
+        np.save(paths[name], series)
+    return paths
+
+
+def load_parameter(path: Path) -> np.ndarray:
+    """Memory-map a parameter written by extract_parameters (fields 'ipts' and 'value')."""
+    return np.load(path, mmap_mode='r')
@@ -0,0 +1,312 @@
+"""
+Compiled field dependency graphs for scenario data generation.
+
+Each message of a scenario is compiled once into a FieldGraph:
+
+- One node per field with its generator, word position and bit layout
+- The same-message fields and other messages each expression reads,
+  taken from the formula's syntax tree
+- A topological evaluation order (circular references are reported when
+  the scenario is loaded)
+
+Per message the graph then only recomputes fields whose inputs changed:
+random and stateful generators every message, waveforms when the time
+changes, counters and patterns when the schedule instance changes, and
+expressions when one of the fields or messages they read changed. Values
+are written into persistent per-message dicts and words are repacked only
+when one of their fields changed.
+"""
+
+import ast
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .data_generators import DataGenerator, GenerationContext, GeneratorFactory
+from .expressions import RANDOM_FUNCTIONS
+
+
+@dataclass
+class FieldNode:
+    """One field of a message in the dependency graph."""
+    name: str
+    word_idx: int
+    path: str                   # Generator path: "<message>.word<idx>.<field>"
+    generator: DataGenerator
+    max_val: Optional[int]      # Value mask for bitfields, None for whole-word fields
+    shift: int
+    expression: bool
+    fields: Tuple[int, ...] = ()    # Same-message nodes this field reads
+    messages: Tuple[str, ...] = ()  # Other messages this field reads
+    uses_time: bool = False
+    uses_instance: bool = False     # Reads the instance or 'message_count'
+    volatile: bool = False          # New value on every call (random or stateful)
+
+
+def _formula_references(formula: str) -> Tuple[List[Tuple[str, Optional[str]]], bool]:
+    """
+    Names read by a formula.
+
+    Returns:
+        (name, key) pairs, where key is the constant string subscript of the
+        name (word0["alt"]) or None, and whether the formula calls a random
+        function
+    """
+    tree = ast.parse(formula, '<expression>', 'eval')
+    subscripted = {}
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name)
+                and isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, str)):
+            subscripted.setdefault(id(node.value), node.slice.value)
+    references = []
+    calls_random = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            calls_random |= node.func.id in RANDOM_FUNCTIONS
+        elif isinstance(node, ast.Name):
+            references.append((node.id, subscripted.get(id(node))))
+    return references, calls_random
+
+
+class FieldGraph:
+    """Evaluation order and incremental state of one message's fields."""
+
+    def __init__(self, message_name: str, nodes: List[FieldNode], order: List[int],
+                 word_count: int):
+        self.message_name = message_name
+        self.nodes = nodes
+        self.order = order
+        self.word_count = word_count
+        self.has_expressions = any(node.expression for node in nodes)
+
+        # Persistent values: word<idx> dicts and bare field names, as read by formulas
+        self.word_values: List[Dict[str, Any]] = [{} for _ in range(word_count)]
+        self.values: Dict[str, Any] = {
+            f"word{word_idx}": values for word_idx, values in enumerate(self.word_values)
+        }
+        self.words = [0] * word_count
+        self._word_nodes: List[List[int]] = [[] for _ in range(word_count)]
+        for index, node in enumerate(nodes):
+            self._word_nodes[node.word_idx].append(index)
+        self._current: List[Any] = [None] * len(nodes)
+        self._valid = False
+        self._time_s: Optional[float] = None
+        self._instance: Optional[int] = None
+        self._seen_versions: List[Dict[str, int]] = [{} for _ in nodes]
+
+    def invalidate(self):
+        """Recompute every field on the next evaluation."""
+        self._valid = False
+
+    def evaluate(self, time_s: float, message_count: int, instance: Optional[int],
+                 message_versions: Dict[str, int], all_values: Dict[str, Any], icd: Any,
+                 evaluate_expression: Callable[[FieldNode, Dict[str, Any]], float]) -> bool:
+        """
+        Recompute the fields whose inputs changed, in dependency order.
+
+        Args:
+            time_s: Simulation time of the message
+            message_count: Value of 'message_count' for formulas and generators
+            instance: Schedule instance of the message (None: counters and
+                patterns advance per call)
+            message_versions: Update count of every message, to detect
+                changed cross-message inputs
+            all_values: Values of all messages (generator context)
+            icd: ICD definition (generator context)
+            evaluate_expression: Evaluates an expression node against the
+                message's values
+
+        Returns:
+            Whether any field value changed
+        """
+        full = not self._valid
+        time_changed = full or time_s != self._time_s
+        instance_changed = full or instance is None or message_count != self._instance
+        self._time_s = time_s
+        self._instance = message_count
+        self._valid = True
+
+        changed = [False] * len(self.nodes)
+        dirty_words = set()
+        for index in self.order:
+            node = self.nodes[index]
+            seen = self._seen_versions[index]
+            if not (full or node.volatile
+                    or (node.uses_time and time_changed)
+                    or (node.uses_instance and instance_changed)
+                    or any(changed[upstream] for upstream in node.fields)
+                    or any(message_versions.get(name, 0) != seen.get(name)
+                           for name in node.messages)):
+                continue
+            for name in node.messages:
+                seen[name] = message_versions.get(name, 0)
+
+            if node.expression:
+                value = evaluate_expression(node, self.values)
+            else:
+                value = node.generator.generate(GenerationContext(
+                    time_seconds=time_s,
+                    message_count=message_count,
+                    message_name=self.message_name,
+                    field_name=node.name,
+                    field_values=self.values,
+                    all_values=all_values,
+                    icd=icd,
+                    instance=instance
+                ))
+            if full or value != self._current[index]:
+                self._current[index] = value
+                self.values[node.name] = value
+                self.word_values[node.word_idx][node.name] = value
+                changed[index] = True
+                dirty_words.add(node.word_idx)
+
+        for word_idx in dirty_words:
+            self.words[word_idx] = self._pack_word(word_idx, self._current)
+        return bool(dirty_words)
+
+    def store(self, values: Sequence[Any]):
+        """Set the current values of all nodes (e.g. the last row of a block)."""
+        for index, node in enumerate(self.nodes):
+            self._current[index] = values[index]
+            self.values[node.name] = values[index]
+            self.word_values[node.word_idx][node.name] = values[index]
+        for word_idx in range(self.word_count):
+            self.words[word_idx] = self._pack_word(word_idx, self._current)
+        self._valid = False
+
+    def _pack_word(self, word_idx: int, values: Sequence[Any]) -> int:
+        word_value = 0
+        for index in self._word_nodes[word_idx]:
+            node = self.nodes[index]
+            if node.max_val is not None:
+                word_value |= (int(values[index]) & node.max_val) << node.shift
+            else:
+                word_value = int(values[index]) & 0xFFFF
+        return word_value
+
+
+def _word_fields(word_idx: int, word_def: Any) -> List[Tuple[str, Optional[int], int]]:
+    """Fields of a word as (name, value mask, shift); the mask is None for whole-word fields."""
+    if hasattr(word_def, 'fields') and word_def.fields:
+        fields = []
+        for field_def in word_def.fields:
+            if hasattr(field_def, 'mask') and hasattr(field_def, 'shift'):
+                max_val = (1 << bin(field_def.mask).count('1')) - 1
+                fields.append((field_def.name, max_val, field_def.shift))
+            else:
+                fields.append((field_def.name, None, 0))
+        return fields
+    field_name = word_def.name if hasattr(word_def, 'name') else f"word{word_idx}"
+    return [(field_name, None, 0)]
+
+
+def compile_field_graph(message_name: str, message_def: Any,
+                        generators: Dict[str, DataGenerator],
+                        message_names: Dict[str, str]) -> FieldGraph:
+    """
+    Compile a message's fields into a dependency graph.
+
+    Fields without a generator get the default random generator. Formula
+    names resolve like they do at evaluation: message names (spaces as
+    underscores) first, then word<idx> and field names of this message.
+    A reference to the message's own name reads the subscripted field or
+    word (NAV["alt"]), or all its other fields without a constant subscript.
+
+    Args:
+        message_name: Name of the message
+        message_def: Message definition from ICD
+        generators: Generators by path (missing ones are added)
+        message_names: Message name by formula name, for all ICD messages
+
+    Returns:
+        FieldGraph for the message
+
+    Raises:
+        ValueError: If fields reference each other in a cycle
+    """
+    nodes = []
+    for word_idx, word_def in enumerate(message_def.words):
+        for field_name, max_val, shift in _word_fields(word_idx, word_def):
+            path = f"{message_name}.word{word_idx}.{field_name}"
+            if path not in generators:
+                generators[path] = GeneratorFactory.create({'mode': 'random'})
+            generator = generators[path]
+            inputs = getattr(generator, 'inputs', DataGenerator.inputs)
+            nodes.append(FieldNode(
+                name=field_name, word_idx=word_idx, path=path, generator=generator,
+                max_val=max_val, shift=shift, expression=hasattr(generator, 'formula'),
+                uses_time='time' in inputs, uses_instance='instance' in inputs,
+                volatile='call' in inputs
+            ))
+
+    by_name: Dict[str, List[int]] = {}
+    by_word: Dict[str, List[int]] = {}
+    for index, node in enumerate(nodes):
+        by_name.setdefault(node.name, []).append(index)
+        by_word.setdefault(f"word{node.word_idx}", []).append(index)
+
+    for index, node in enumerate(nodes):
+        if not node.expression:
+            continue
+        references, calls_random = _formula_references(node.generator.formula)
+        upstream = set()
+        messages = set()
+        node.volatile = calls_random
+        for name, key in references:
+            if name == 'time':
+                node.uses_time = True
+            elif name == 'message_count':
+                node.uses_instance = True
+            elif name in message_names and message_names[name] != message_name:
+                messages.add(message_names[name])
+            elif name in message_names:
+                # The message's own values: the subscripted field or word, else all other fields
+                if key in by_name:
+                    others = [other for other in by_name[key] if other != index]
+                    upstream.update(others or [index])
+                elif key in by_word:
+                    upstream.update(other for other in by_word[key] if other != index)
+                else:
+                    upstream.update(other for other in range(len(nodes)) if other != index)
+            elif name in by_word:
+                upstream.update(other for other in by_word[name]
+                                if nodes[other].name == key or (key is None and other != index))
+            elif name in by_name:
+                # A field reading only its own name is a cycle
+                others = [other for other in by_name[name] if other != index]
+                upstream.update(others or [index])
+        node.fields = tuple(sorted(upstream))
+        node.messages = tuple(sorted(messages))
+
+    order = _topological_order(message_name, nodes)
+    return FieldGraph(message_name, nodes, order, len(message_def.words))
+
+
+def _topological_order(message_name: str, nodes: List[FieldNode]) -> List[int]:
+    """Order nodes so each comes after the fields it reads (ICD order otherwise)."""
+    order = []
+    state = [0] * len(nodes)  # 0: new, 1: on the current path, 2: done
+    for root in range(len(nodes)):
+        if state[root]:
+            continue
+        path = [root]
+        stack = [iter(nodes[root].fields)]
+        state[root] = 1
+        while stack:
+            upstream = next(stack[-1], None)
+            if upstream is None:
+                stack.pop()
+                done = path.pop()
+                state[done] = 2
+                order.append(done)
+            elif state[upstream] == 1:
+                cycle = path[path.index(upstream):] + [upstream]
+                raise ValueError(
+                    f"Circular dependency in message '{message_name}': "
+                    + ' → '.join(nodes[i].name for i in cycle)
+                )
+            elif state[upstream] == 0:
+                state[upstream] = 1
+                path.append(upstream)
+                stack.append(iter(nodes[upstream].fields))
+    return order
@@ -8,6 +8,8 @@ implements various flight phases and atmospheric calculations.
 Key components:
 - FlightState: Represents current aircraft state (altitude, speed, attitude, etc.)
 - FlightProfile: Generates flight profiles with different phases
+- FlightTrajectory: Waypoint profile compiled into NumPy arrays for fast
+  scalar (bisect) and bulk (states_at) sampling
 - ISA Atmosphere: International Standard Atmosphere calculations
 - Flight Phases: Climb, cruise, turn, descent with realistic parameters
 
@@ -17,10 +19,13 @@ enabling generation of consistent test data or varied scenarios.
 
 import math
 import random
-from typing import Dict, Any, Optional, List, Tuple
+from bisect import bisect_right
+from typing import Dict, Any, Optional, List, Tuple, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
+
 
 @dataclass
 class FlightState:
@@ -71,6 +76,135 @@ class FlightState:
         return f"FlightState(alt={self.altitude_ft:.0f}ft, speed={self.airspeed_kts:.0f}kts, hdg={self.heading_deg:.0f}°)"
 
 
+class FlightTrajectory:
+    """
+    Flight profile compiled into per-field NumPy arrays.
+    
+    The table holds one row per knot (waypoints, or a uniform time grid) for
+    every FlightState field. Lookups between knots either hold the previous
+    knot ('hold', the waypoint behaviour of FlightProfile) or interpolate
+    linearly ('linear'; heading takes the shortest way round).
+    
+    Scalar lookups bisect the knot times (O(log n)), or index directly into a
+    uniform grid (O(1)). states_at() samples a whole array of times in one
+    vectorized call.
+    """
+    
+    FIELDS = ('altitude_ft', 'airspeed_kts', 'heading_deg', 'pitch_deg', 'roll_deg',
+              'g_force', 'latitude_deg', 'longitude_deg')
+    
+    def __init__(self, times: Sequence[float], columns: Dict[str, Sequence[float]],
+                 interpolation: str = 'hold', grid_s: Optional[float] = None):
+        """
+        Initialize trajectory table.
+        
+        Args:
+            times: Knot times in seconds (non-decreasing)
+            columns: Values at each knot per field (missing fields use
+                FlightState defaults)
+            interpolation: 'hold' or 'linear'
+            grid_s: Knot spacing if the knots form a uniform grid
+        """
+        if interpolation not in ('hold', 'linear'):
+            raise ValueError(f"Unknown interpolation: {interpolation}")
+        self.interpolation = interpolation
+        self.grid_s = grid_s
+        self.times = np.asarray(times, dtype=np.float64)
+        defaults = {'g_force': 1.0}
+        self.columns = {
+            name: np.asarray(columns[name], dtype=np.float64) if name in columns
+            else np.full(len(self.times), defaults.get(name, 0.0))
+            for name in self.FIELDS
+        }
+        # Heading interpolates through the shortest turn
+        self._heading_unwrapped = np.rad2deg(np.unwrap(np.deg2rad(self.columns['heading_deg'])))
+        # Python lists for fast scalar hold lookups
+        self._time_list = self.times.tolist()
+        self._rows = list(zip(*(self.columns[name].tolist() for name in self.FIELDS)))
+    
+    @classmethod
+    def from_waypoints(cls, waypoints: List[Dict[str, float]], interpolation: str = 'hold',
+                       grid_s: Optional[float] = None) -> 'FlightTrajectory':
+        """
+        Compile FlightProfile waypoints into a trajectory.
+        
+        Args:
+            waypoints: Waypoint dictionaries sorted by time
+            interpolation: 'hold' or 'linear'
+            grid_s: Resample onto a uniform grid with this spacing
+        
+        Returns:
+            FlightTrajectory
+        """
+        times = [wp['time_s'] for wp in waypoints]
+        columns = {name: [wp[name] for wp in waypoints] for name in cls.FIELDS
+                   if waypoints and name in waypoints[0]}
+        trajectory = cls(times, columns, interpolation)
+        if grid_s is None or len(times) < 2:
+            return trajectory
+        
+        count = int(math.floor((times[-1] - times[0]) / grid_s)) + 1
+        grid = times[0] + np.arange(count) * grid_s
+        return cls(grid, trajectory.states_at(grid), interpolation, grid_s=grid_s)
+    
+    def __len__(self) -> int:
+        return len(self.times)
+    
+    def _hold_index(self, time_s: float) -> int:
+        """Index of the knot a hold lookup uses at time_s."""
+        if time_s <= self._time_list[0]:
+            return 0
+        if self.grid_s is not None:
+            return min(int((time_s - self._time_list[0]) / self.grid_s), len(self._time_list) - 1)
+        return bisect_right(self._time_list, time_s) - 1
+    
+    def _hold_indices(self, times: np.ndarray) -> np.ndarray:
+        """Vectorized _hold_index."""
+        if self.grid_s is not None:
+            indices = np.floor((times - self.times[0]) / self.grid_s)
+            indices = np.clip(indices, 0, len(self.times) - 1).astype(np.intp)
+        else:
+            indices = np.searchsorted(self.times, times, side='right') - 1
+        indices[times <= self.times[0]] = 0
+        return indices
+    
+    def values_at(self, time_s: float) -> Tuple[float, ...]:
+        """Field values at a single time, in FIELDS order."""
+        if self.interpolation == 'hold':
+            return self._rows[self._hold_index(time_s)]
+        columns = self.states_at([time_s])
+        return tuple(float(columns[name][0]) for name in self.FIELDS)
+    
+    def states_at(self, times) -> Dict[str, np.ndarray]:
+        """
+        Sample the trajectory at many times.
+        
+        Args:
+            times: Array-like of times in seconds
+        
+        Returns:
+            Dictionary of float64 arrays keyed by FlightState field name,
+            plus 'time_s'
+        """
+        times = np.asarray(times, dtype=np.float64)
+        result = {'time_s': times}
+        if len(self.times) == 0:
+            raise ValueError("Trajectory has no knots")
+        
+        if self.interpolation == 'hold':
+            indices = self._hold_indices(times)
+            for name in self.FIELDS:
+                result[name] = self.columns[name][indices]
+            return result
+        
+        for name in self.FIELDS:
+            if name == 'heading_deg':
+                result[name] = np.interp(times, self.times, self._heading_unwrapped) % 360
+            else:
+                result[name] = np.interp(times, self.times, self.columns[name])
+        return result
+
+
 class FlightProfile:
     """Generate realistic flight profiles for test data."""
     
@@ -98,6 +232,15 @@ class FlightProfile:
         
         # Waypoint-based navigation
         self.waypoints = []
+        
+        # Waypoint lookup table (compiled on demand, see compile())
+        self.interpolation = 'hold'  # 'hold' previous waypoint or 'linear'
+        self.grid_s = None  # Optional uniform resampling grid (seconds)
+        self._trajectory = None
+        self._trajectory_key = None
+        
+        # Flight plan cache for get_flight_state (keyed by duration and plan settings)
+        self._flight_plan_cache = {}
     
     def generate_flight_plan(self, duration_s: float) -> Dict[str, Any]:
         """Generate a complete flight plan.
@@ -144,7 +287,10 @@ class FlightProfile:
         Returns:
             FlightState object
         """
-        flight_plan = self.generate_flight_plan(duration_s)
+        plan_key = (duration_s, self.cruise_altitude_ft, self.climb_rate_fpm, self.descent_rate_fpm)
+        flight_plan = self._flight_plan_cache.get(plan_key)
+        if flight_plan is None:
+            flight_plan = self._flight_plan_cache[plan_key] = self.generate_flight_plan(duration_s)
         
         # Determine current phase
         current_phase = 'cruise'  # Default
@@ -283,6 +429,34 @@ class FlightProfile:
         
         # Sort waypoints by time
         self.waypoints.sort(key=lambda w: w['time_s'])
+        self.invalidate()
+    
+    def invalidate(self):
+        """Drop the compiled lookup table and cached flight plans (call after edits)."""
+        self._trajectory = None
+        self._flight_plan_cache.clear()
+    
+    def compile(self) -> Optional[FlightTrajectory]:
+        """Compile the waypoints into a lookup table.
+        
+        The table is cached and rebuilt when waypoints are added, the
+        waypoint list is replaced or resized, or the interpolation settings
+        change. Edits to existing waypoints need invalidate().
+        
+        Returns:
+            FlightTrajectory, or None if there are no waypoints
+        """
+        if not self.waypoints:
+            return None
+        # The compiled list itself is kept, so a replaced list is never mistaken for it
+        key = (self.waypoints, len(self.waypoints), self.interpolation, self.grid_s)
+        if (self._trajectory is None or self._trajectory_key[0] is not key[0]
+                or self._trajectory_key[1:] != key[1:]):
+            self._trajectory = FlightTrajectory.from_waypoints(
+                self.waypoints, self.interpolation, self.grid_s
+            )
+            self._trajectory_key = key
+        return self._trajectory
     
     def get_state_at_time(self, time_s: float) -> Optional[FlightState]:
         """Get flight state at a specific time using waypoints.
@@ -293,39 +467,61 @@ class FlightProfile:
         Returns:
             FlightState object or None if no waypoints
         """
-        if not self.waypoints:
+        trajectory = self.compile()
+        if trajectory is None:
             return None
         
-        # Find the appropriate waypoint
-        if time_s <= self.waypoints[0]['time_s']:
-            # Before first waypoint
-            wp = self.waypoints[0]
-        elif time_s >= self.waypoints[-1]['time_s']:
-            # After last waypoint
-            wp = self.waypoints[-1]
-        else:
-            # Between waypoints - find the one before current time
-            for i, wp in enumerate(self.waypoints):
-                if wp['time_s'] > time_s:
-                    if i > 0:
-                        wp = self.waypoints[i-1]
-                    break
+        altitude, airspeed, heading, pitch, roll, g_force, latitude, longitude = \
+            trajectory.values_at(time_s)
         
-        # Create timestamp
-        timestamp = datetime.utcnow() + timedelta(seconds=time_s)
-        
-        # Return FlightState object
         return FlightState(
-            timestamp=timestamp,
-            altitude_ft=wp['altitude_ft'],
-            airspeed_kts=wp['airspeed_kts'],
-            heading_deg=wp['heading_deg'],
-            pitch_deg=0.0,  # Default values
-            roll_deg=0.0,
-            g_force=1.0,
-            latitude_deg=wp['latitude_deg'],
-            longitude_deg=wp['longitude_deg']
+            timestamp=datetime.utcnow() + timedelta(seconds=time_s),
+            altitude_ft=altitude,
+            airspeed_kts=airspeed,
+            heading_deg=heading,
+            pitch_deg=pitch,
+            roll_deg=roll,
+            g_force=g_force,
+            latitude_deg=latitude,
+            longitude_deg=longitude
         )
+    
+    def states_at(self, times) -> Optional[Dict[str, np.ndarray]]:
+        """Sample the waypoint profile at many times in one call.
+        
+        Args:
+            times: Array-like of times since start in seconds
+            
+        Returns:
+            Dictionary of arrays keyed by FlightState field name (plus
+            'time_s'), or None if no waypoints
+        """
+        trajectory = self.compile()
+        if trajectory is None:
+            return None
+        return trajectory.states_at(times)
+    
+    def get_states_at_times(self, times: Sequence[float]) -> List[Optional[FlightState]]:
+        """Get FlightState objects for many times with one vectorized lookup.
+        
+        Equivalent to [get_state_at_time(t) for t in times].
+        
+        Args:
+            times: Times since start in seconds
+            
+        Returns:
+            List of FlightState objects (None entries if no waypoints)
+        """
+        columns = self.states_at(times)
+        if columns is None:
+            return [None] * len(times)
+        
+        now = datetime.utcnow()
+        return [
+            FlightState(now + timedelta(seconds=t), *values)
+            for t, *values in zip(columns['time_s'].tolist(),
+                                  *(columns[name].tolist() for name in FlightTrajectory.FIELDS))
+        ]
 
 
 class FlightProfileGenerator:
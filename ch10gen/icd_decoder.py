@@ -0,0 +1,201 @@
+"""
+Compiled ICD decoders for bulk engineering-unit decoding.
+
+The decoding counterpart of message_plan.py: an ICD is compiled once into
+an ICDDecoder holding, for every message definition, the word position,
+width and decoding parameters of each field, plus a lookup table from
+command word keys (RT, T/R, SA) to message definitions.
+
+Decoding then works on columnar MessageTables (see columnar.py): messages
+are grouped per definition with one vectorized lookup, each definition's
+data words are gathered into a (messages x words) matrix, and every field
+is decoded for all its messages with one array decoder call.
+
+Words are laid out in ICD order, with float32_split taking two words; a
+field with a word_index sits at that word instead (bitfields sharing a
+word). For ICDs without word_index this is the writer's layout. The
+writer (message_plan.py) ignores word_index, mask and shift and gives
+every field its own word, so bitfield ICDs decode recordings whose words
+were packed elsewhere, not files generated by ch10gen.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .core.encode1553 import build_command_word, decode_array
+    from .icd import ICDDefinition, MessageDefinition, WordDefinition
+    from .columnar import MessageTable, command_keys
+except ImportError:
+    from core.encode1553 import build_command_word, decode_array
+    from icd import ICDDefinition, MessageDefinition, WordDefinition
+    from columnar import MessageTable, command_keys
+
+
+class FieldDecoder:
+    """Position and decoding parameters of one ICD word or bitfield."""
+
+    __slots__ = ('name', 'position', 'width', 'encode', 'scale', 'offset',
+                 'word_order', 'mask', 'shift')
+
+    def __init__(self, word_def: WordDefinition, position: int):
+        self.name = word_def.name
+        self.position = position
+        self.width = word_def.get_word_count()
+        self.encode = word_def.encode
+        self.scale = word_def.scale
+        self.offset = word_def.offset
+        self.word_order = word_def.word_order
+        self.mask = word_def.mask
+        self.shift = word_def.shift
+
+    def decode(self, words: np.ndarray) -> np.ndarray:
+        """Decode this field from a (messages x words) matrix."""
+        return decode_array(words[:, self.position:self.position + self.width], self.encode,
+                            self.scale, self.offset, self.word_order, self.mask, self.shift)
+
+
+class MessageDecoder:
+    """Compiled decoder for one ICD message definition."""
+
+    __slots__ = ('message', 'fields', 'word_count')
+
+    def __init__(self, message: MessageDefinition):
+        """
+        Compile a message definition.
+
+        Args:
+            message: ICD message definition
+        """
+        self.message = message
+        self.fields: List[FieldDecoder] = []
+        position = 0
+        for word_def in message.words:
+            if word_def.word_index is not None:
+                position = word_def.word_index
+            field = FieldDecoder(word_def, position)
+            self.fields.append(field)
+            position += field.width
+        self.word_count = max((field.position + field.width for field in self.fields), default=0)
+
+    def gather(self, table: MessageTable) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Data words of the table's messages as a (messages x word_count) matrix.
+
+        Returns:
+            Word matrix (words past a message's end are filler) and the
+            data word count of each message
+        """
+        counts = table.messages['data_count'].astype(np.int64)
+        positions = table.messages['data_offset'].astype(np.int64)[:, None] + np.arange(self.word_count)
+        positions = np.minimum(positions, max(len(table.words) - 1, 0))
+        words = table.words[positions] if len(table.words) else \
+            np.zeros(positions.shape, dtype=np.uint16)
+        return words, counts
+
+    def decode(self, table: MessageTable) -> List[Tuple[FieldDecoder, np.ndarray, np.ndarray]]:
+        """
+        Decode all fields of the table's messages.
+
+        Args:
+            table: Messages of this definition
+
+        Returns:
+            (field, values, present) per field; present is False for
+            messages too short to hold the field's words
+        """
+        words, counts = self.gather(table)
+        return [(field, field.decode(words), counts >= field.position + field.width)
+                for field in self.fields]
+
+
+@dataclass
+class DecodedMessages:
+    """Messages of a table matched to ICD definitions, with decoded field columns."""
+    messages: np.ndarray            # MESSAGE_DTYPE rows of the matched messages
+    names: List[str]                # ICD message name per row
+    values: Dict[str, np.ndarray]   # Field name -> object array (None where absent)
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+
+class ICDDecoder:
+    """Compiled decoder for all messages of an ICD."""
+
+    def __init__(self, icd: ICDDefinition):
+        """
+        Compile an ICD.
+
+        Args:
+            icd: ICD definition (a later definition of the same RT/T-R/SA
+                key takes precedence)
+        
+        Messages are keyed on the command word the writer builds for them
+        (see build_command_word), so files written from the ICD decode
+        with it.
+        """
+        self.icd = icd
+        self.messages = [MessageDecoder(message) for message in icd.messages]
+        self.lookup = np.full(1 << 11, -1, dtype=np.int32)
+        for index, message in enumerate(icd.messages):
+            command = build_command_word(rt=message.rt, tr=message.is_receive(),
+                                         sa=message.sa, wc=message.wc)
+            self.lookup[command_keys(command)] = index
+        self.field_names = sorted({field.name for decoder in self.messages
+                                   for field in decoder.fields})
+
+    def key_mask(self, message_indices: Optional[Iterable[int]] = None) -> np.ndarray:
+        """
+        Boolean lookup of the command word keys of ICD messages.
+
+        Args:
+            message_indices: Messages to include (default: all)
+
+        Returns:
+            Mask usable as the keys filter of iter_1553_tables()
+        """
+        if message_indices is None:
+            return self.lookup >= 0
+        return np.isin(self.lookup, list(message_indices))
+
+    def fields_named(self, name: str) -> List[Tuple[int, FieldDecoder]]:
+        """(message index, field) of every ICD field with a name."""
+        return [(index, field) for index, decoder in enumerate(self.messages)
+                for field in decoder.fields if field.name == name]
+
+    def match(self, table: MessageTable) -> np.ndarray:
+        """ICD message index per table row (-1 for unknown keys and messages without a status word)."""
+        messages = table.messages
+        return np.where(messages['length'] >= 4, self.lookup[command_keys(messages['command'])], -1)
+
+    def decode(self, table: MessageTable) -> DecodedMessages:
+        """
+        Decode the fields of every message with an ICD definition.
+
+        Args:
+            table: Columnar messages
+
+        Returns:
+            Matched messages in table order with their field values
+        """
+        index = self.match(table)
+        rows = np.flatnonzero(index >= 0)
+        index = index[rows]
+        matched = table.select(rows)
+        values: Dict[str, np.ndarray] = {}
+        names = np.empty(len(rows), dtype=object)
+
+        for message_index in np.unique(index).tolist():
+            decoder = self.messages[message_index]
+            members = np.flatnonzero(index == message_index)
+            names[members] = decoder.message.name
+            for field, decoded, present in decoder.decode(matched.select(members)):
+                column = values.get(field.name)
+                if column is None:
+                    column = values[field.name] = np.full(len(rows), None, dtype=object)
+                column[members[present]] = decoded[present].astype(object)
+
+        return DecodedMessages(matched.messages, names.tolist(), values)
@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Dict, Any, Generator, Optional, Set, List
 
 try:
-    from chapter10 import C10
     from chapter10.ms1553 import MS1553F1
     PYCHAPTER10_AVAILABLE = True
 except ImportError:
@@ -14,8 +13,10 @@ except ImportError:
 
 try:
     from .wire_reader import read_1553_wire
+    from .packet_index import iter_c10_packets
 except ImportError:
     from wire_reader import read_1553_wire
+    from packet_index import iter_c10_packets
 
 
 def _parse_1553_status_errors(status_word: int) -> List[str]:
@@ -70,13 +71,15 @@ def inspect_1553_timeline_pyc10(
     if target_channel is None and channel != 'auto':
         raise ValueError(f"Invalid channel: '{channel}'. Must be 'A' or 'B'")
     
-    c10 = C10(str(filepath))
+    # An explicit channel lets a packet index skip the other channel's packets
+    packets = iter_c10_packets(filepath, data_type=0x19,
+                               channel_id=None if channel == 'auto' else target_channel)
     msg_count = 0
     start_time_ns = None
     detected_channels = {}
     
     try:
-        for packet in c10:
+        for packet in packets:
             if not isinstance(packet, MS1553F1):
                 continue
                 
@@ -168,8 +171,8 @@ def inspect_1553_timeline_pyc10(
                     return
                     
     finally:
-        # PyChapter10 C10 object doesn't have close()
-        pass
+        # Close the file when the caller stops early
+        packets.close()
     
     # Print channel detection info if auto mode
     if channel == 'auto' and detected_channels:
@@ -0,0 +1,191 @@
+"""
+Vectorized packet checksum verification.
+
+All primary headers of a file are gathered into one (packets x 12)
+uint16 matrix and their checksums (16-bit sum of the first 11 words)
+verified with a single reduction. Optional data checksums (packet flags
+bits 0-1: 8, 16 or 32-bit sums of the packet body, stored in the last
+bytes of the packet) are verified per chunk of consecutive packets with
+np.add.reduceat over a zero-copy view of the memory-mapped file.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+try:
+    from .wire_reader import WireFile, _PACKET_HEADER
+    from .packet_index import load_index
+    from .core.packet_serializer import SYNC_PATTERN, HEADER_SIZE
+except ImportError:
+    from wire_reader import WireFile, _PACKET_HEADER
+    from packet_index import load_index
+    from core.packet_serializer import SYNC_PATTERN, HEADER_SIZE
+
+HEADER_WORDS = HEADER_SIZE // 2
+SECONDARY_HEADER_FLAG = 0x80
+SECONDARY_HEADER_SIZE = 12
+DATA_CHECKSUM_MASK = 0x03
+# Data checksum type (flags bits 0-1) -> checksum width in bytes
+DATA_CHECKSUM_WIDTHS = {1: 1, 2: 2, 3: 4}
+
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+DEFAULT_CHUNK_PACKETS = 64 * 1024
+
+
+@dataclass
+class PacketScan:
+    """Packet offsets of a file and the damage found while locating them."""
+    offsets: np.ndarray
+    invalid_offsets: List[int] = field(default_factory=list)
+    trailing_bytes: int = 0
+
+
+def scan_packets(wire: WireFile) -> PacketScan:
+    """
+    Locate all packets by following packet lengths.
+
+    Bad headers are skipped by resynchronizing on the next plausible
+    sync pattern (WireFile.find_packet).
+    """
+    buffer = wire.buffer
+    size = wire.size
+    offsets = []
+    invalid = []
+    offset = 0
+    while offset + HEADER_SIZE <= size:
+        sync, _, packet_len = _PACKET_HEADER.unpack_from(buffer, offset)[:3]
+        if sync != SYNC_PATTERN or packet_len < HEADER_SIZE or offset + packet_len > size:
+            invalid.append(offset)
+            offset = wire.find_packet(offset + 1)
+            continue
+        offsets.append(offset)
+        offset += packet_len
+    return PacketScan(np.array(offsets, dtype=np.int64), invalid, size - offset)
+
+
+def packet_offsets(wire: WireFile, filepath: Path) -> PacketScan:
+    """Packet offsets from a fresh packet index (which covers the whole file), else a scan."""
+    index = load_index(filepath)
+    if index is not None and len(index):
+        return PacketScan(index.records['offset'].astype(np.int64))
+    return scan_packets(wire)
+
+
+def gather_headers(raw: np.ndarray, offsets: np.ndarray,
+                   chunk_packets: int = DEFAULT_CHUNK_PACKETS) -> np.ndarray:
+    """
+    Primary headers at offsets as a (packets x 12) uint16 matrix.
+
+    Headers are gathered chunk_packets at a time, so the byte index
+    matrix stays small for files with millions of packets.
+    """
+    headers = np.empty((len(offsets), HEADER_SIZE), dtype=np.uint8)
+    columns = np.arange(HEADER_SIZE)
+    for start in range(0, len(offsets), chunk_packets):
+        chunk = offsets[start:start + chunk_packets]
+        headers[start:start + len(chunk)] = raw[chunk[:, None] + columns]
+    return headers.view('<u2')
+
+
+def header_checksum_failures(header_words: np.ndarray) -> np.ndarray:
+    """Mask of headers whose checksum is not the 16-bit sum of the first 11 words."""
+    sums = header_words[:, :HEADER_WORDS - 1].sum(axis=1, dtype=np.uint64) & 0xFFFF
+    return sums != header_words[:, HEADER_WORDS - 1]
+
+
+def data_checksum_failures(raw: np.ndarray, offsets: np.ndarray, header_words: np.ndarray,
+                           chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> np.ndarray:
+    """
+    Mask of packets whose data checksum does not match their body.
+
+    Returns:
+        Array of -1 (no data checksum), 0 (matches) or 1 (mismatch) per packet
+    """
+    result = np.full(len(offsets), -1, dtype=np.int8)
+    flags = header_words[:, 7] & 0xFF
+    checksum_type = flags & DATA_CHECKSUM_MASK
+    if not checksum_type.any():
+        return result
+
+    packet_len = header_words[:, 2].astype(np.int64) | (header_words[:, 3].astype(np.int64) << 16)
+    body_start = offsets + HEADER_SIZE + np.where(flags & SECONDARY_HEADER_FLAG, SECONDARY_HEADER_SIZE, 0)
+    ends = offsets + packet_len
+
+    # Chunks of consecutive packets of about chunk_bytes
+    chunk_ids = (offsets - offsets[0]) // chunk_bytes
+    boundaries = np.flatnonzero(np.diff(chunk_ids)) + 1
+    for rows in np.split(np.arange(len(offsets)), boundaries):
+        base = int(offsets[rows[0]])
+        region = raw[base:int(ends[rows[-1]])]
+        for checksum, width in DATA_CHECKSUM_WIDTHS.items():
+            selected = rows[checksum_type[rows] == checksum]
+            if len(selected):
+                result[selected] = _verify_sums(region, base, body_start[selected],
+                                                ends[selected] - width, width)
+    return result
+
+
+def _verify_sums(region: np.ndarray, base: int, starts: np.ndarray, checksum_offsets: np.ndarray,
+                 width: int) -> np.ndarray:
+    """0/1 per packet: whether the width-byte sum of [start, checksum) differs from the checksum."""
+    dtype = np.dtype(f'<u{width}')
+    mask = (1 << (8 * width)) - 1
+    failures = np.zeros(len(starts), dtype=np.int8)
+    starts = starts - base
+    checksum_offsets = checksum_offsets - base
+
+    # Bodies not aligned to the width with the chunk (non-standard packing) are summed one by one
+    aligned = ((starts % width) == 0) & ((checksum_offsets % width) == 0) & (checksum_offsets >= starts)
+    for row in np.flatnonzero(~aligned):
+        start, stop = int(starts[row]), int(checksum_offsets[row])
+        if stop < start:
+            failures[row] = 1
+            continue
+        body = region[start:stop]
+        total = int(body[:len(body) // width * width].view(dtype).sum(dtype=np.uint64))
+        stored = int(region[stop:stop + width].view(dtype)[0])
+        failures[row] = (total & mask) != stored
+
+    rows = np.flatnonzero(aligned)
+    if len(rows):
+        words = region[:len(region) // width * width].view(dtype)
+        first = starts[rows] // width
+        last = checksum_offsets[rows] // width
+        bounds = np.empty(2 * len(rows), dtype=np.int64)
+        bounds[0::2] = first
+        bounds[1::2] = last
+        sums = np.add.reduceat(words, bounds, dtype=np.uint64)[0::2]
+        sums[first == last] = 0
+        failures[rows] = (sums & mask) != words[last]
+    return failures
+
+
+def verify_checksums(filepath: Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Dict[str, Any]:
+    """
+    Verify all header and data checksums of a file.
+
+    Returns:
+        Packet count, offsets of packets failing each check, number of
+        packets carrying a data checksum, and the damage found while
+        locating packets (bad header offsets, trailing bytes)
+    """
+    with WireFile(filepath, use_index=False) as wire:
+        scan = packet_offsets(wire, Path(filepath))
+        offsets = scan.offsets
+        raw = np.frombuffer(wire.buffer, dtype=np.uint8)
+        header_words = gather_headers(raw, offsets)
+        header_failures = header_checksum_failures(header_words)
+        data_results = data_checksum_failures(raw, offsets, header_words, chunk_bytes)
+        del raw
+
+    return {
+        'packets': len(offsets),
+        'header_failures': offsets[header_failures].tolist(),
+        'data_checked': int((data_results >= 0).sum()),
+        'data_failures': offsets[data_results == 1].tolist(),
+        'invalid_offsets': scan.invalid_offsets,
+        'trailing_bytes': scan.trailing_bytes,
+    }
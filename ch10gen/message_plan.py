@@ -0,0 +1,343 @@
+"""
+Compiled per-message encoding plans.
+
+An ICD message definition is compiled once into a MessagePlan that holds
+everything the writer would otherwise recompute for every scheduled
+instance:
+
+- Command and status words
+- Data word template with constant words already filled in
+- Resolved source accessors and pre-bound encoders for dynamic words
+- The full payload packed to bytes when the message has no dynamic words
+
+The writer's hot loop then only evaluates the dynamic words. Encoded
+output is identical to Ch10Writer._encode_data_words.
+
+A PayloadCache additionally keeps the packed bytes of recent instances
+keyed on their input values, so messages driven by slowly-changing
+sources are only re-encoded when an input actually changes. Scenario
+data, generated outside the plan, is cached keyed on its data words.
+"""
+
+import math
+import struct
+from collections import OrderedDict
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from .core.encode1553 import (
+        build_command_word, build_status_word, bnr16, u16, i16, bcd, float32_split
+    )
+    from .flight_profile import FlightState
+    from .icd import ICDDefinition, MessageDefinition, WordDefinition
+except ImportError:
+    from core.encode1553 import (
+        build_command_word, build_status_word, bnr16, u16, i16, bcd, float32_split
+    )
+    from flight_profile import FlightState
+    from icd import ICDDefinition, MessageDefinition, WordDefinition
+
+
+Accessor = Callable[[FlightState], float]
+
+# Source attribute aliases (ICD name -> FlightState attribute)
+_FLIGHT_ALIASES = {'airspeed_kt': 'airspeed_kts'}
+
+
+def _zero(flight_state: FlightState) -> float:
+    return 0.0
+
+
+def _mach_x1000(flight_state: FlightState) -> float:
+    # Approximate mach from airspeed (mach 1 ≈ 661 knots at sea level)
+    return flight_state.airspeed_kts / 661.0 * 1000
+
+
+def _status_bits(flight_state: FlightState) -> float:
+    status = 0
+    if flight_state.altitude_ft > 10000:
+        status |= 1  # High altitude bit
+    if flight_state.airspeed_kts > 300:
+        status |= 2  # High speed bit
+    return status
+
+
+_DERIVED_SOURCES = {
+    'mach_x1000': _mach_x1000,
+    'status': _status_bits,
+}
+
+
+@lru_cache(maxsize=None)
+def resolve_source(source: str) -> Accessor:
+    """
+    Resolve a source string (e.g. 'flight.altitude_ft') to an accessor.
+
+    Args:
+        source: Source path from the ICD
+
+    Returns:
+        Callable taking a FlightState and returning the source value
+        (unrecognized sources read as zero)
+    """
+    parts = source.split('.')
+    if len(parts) >= 2:
+        if parts[0] == 'flight':
+            attr_name = _FLIGHT_ALIASES.get(parts[1], parts[1])
+            getter = attrgetter(attr_name)
+
+            def accessor(flight_state, _getter=getter):
+                try:
+                    return _getter(flight_state)
+                except AttributeError:
+                    return 0
+            return accessor
+        if parts[0] == 'derived':
+            return _DERIVED_SOURCES.get(parts[1], _zero)
+    return _zero
+
+
+def _masked_int(value: float) -> int:
+    return int(value) & 0xFFFF
+
+
+def _bcd_int(value: float) -> int:
+    return bcd(int(value))
+
+
+def _bind_encoder(word_def: WordDefinition) -> Callable[[float], object]:
+    """Bind a word's encoding parameters into a single-argument encoder."""
+    encode = word_def.encode
+    if encode == 'bnr16':
+        return partial(bnr16, scale=word_def.scale, offset=word_def.offset,
+                       rounding=word_def.rounding)
+    if encode == 'u16':
+        return partial(u16, scale=word_def.scale, offset=word_def.offset)
+    if encode == 'i16':
+        return partial(i16, scale=word_def.scale, offset=word_def.offset)
+    if encode == 'bcd':
+        return _bcd_int
+    if encode == 'float32_split':
+        return partial(float32_split, word_order=word_def.word_order or 'lsw_msw')
+    # Default to u16
+    return _masked_int
+
+
+class MessagePlan:
+    """Precompiled encoding plan for one ICD message."""
+
+    __slots__ = ('message', 'command_word', 'status_word', 'template',
+                 'dynamic_words', 'static_words', 'static_payload', 'float_inputs')
+
+    def __init__(self, message: MessageDefinition):
+        """
+        Compile a message definition.
+
+        Args:
+            message: ICD message definition
+        """
+        self.message = message
+        self.command_word = build_command_word(
+            rt=message.rt, tr=message.is_receive(), sa=message.sa, wc=message.wc
+        )
+        self.status_word = build_status_word(rt=message.rt)
+
+        # Data word template: constants filled in, dynamic words left at zero
+        self.template: List[int] = []
+        # (word index, accessor, encoder, width) for each dynamic word
+        self.dynamic_words: List[Tuple[int, Accessor, Callable, int]] = []
+        # Inputs encoded as IEEE floats (where -0.0 and 0.0 differ)
+        self.float_inputs: List[int] = []
+
+        for word_def in message.words:
+            index = len(self.template)
+            width = 2 if word_def.encode == 'float32_split' else 1
+            if word_def.const is not None:
+                if width == 2:
+                    self.template.extend(float32_split(float(word_def.const),
+                                                       word_def.word_order or 'lsw_msw'))
+                else:
+                    self.template.append(int(word_def.const) & 0xFFFF)
+            else:
+                self.template.extend([0] * width)
+                if word_def.src:
+                    if width == 2:
+                        self.float_inputs.append(len(self.dynamic_words))
+                    self.dynamic_words.append(
+                        (index, resolve_source(word_def.src), _bind_encoder(word_def), width)
+                    )
+
+        # Full message (command, status, data) without any dynamic words
+        self.static_words = [self.command_word, self.status_word] + self.template
+        self.static_payload = struct.pack(f'<{len(self.static_words)}H', *self.static_words)
+
+    @property
+    def is_static(self) -> bool:
+        """True if the message payload never depends on flight state."""
+        return not self.dynamic_words
+
+    def encode(self, flight_state: Optional[FlightState]) -> List[int]:
+        """
+        Encode the data words for one instance.
+
+        Args:
+            flight_state: Flight state at the message time (None encodes
+                dynamic words as zero)
+
+        Returns:
+            New list of data words
+        """
+        if flight_state is None:
+            return self.template.copy()
+        return self.encode_inputs(self.read_inputs(flight_state))
+
+    def read_inputs(self, flight_state: FlightState) -> Tuple[float, ...]:
+        """Read the source value of every dynamic word."""
+        return tuple(accessor(flight_state) for _, accessor, _, _ in self.dynamic_words)
+
+    def encode_inputs(self, values: Sequence[float]) -> List[int]:
+        """
+        Encode the data words from source values.
+
+        Args:
+            values: Source values in dynamic word order (from read_inputs)
+
+        Returns:
+            New list of data words
+        """
+        data_words = self.template.copy()
+        for (index, _, encoder, width), value in zip(self.dynamic_words, values):
+            if width == 1:
+                data_words[index] = encoder(value)
+            else:
+                data_words[index:index + 2] = encoder(value)
+        return data_words
+
+    def cache_key(self, values: Tuple[float, ...]) -> Tuple:
+        """Key identifying the encoded output of a set of source values."""
+        if not self.float_inputs:
+            return values
+        # -0.0 == 0.0 but packs to different float32 bits
+        return values + tuple(math.copysign(1.0, values[i]) for i in self.float_inputs)
+
+
+class PayloadCache:
+    """
+    Bounded per-message cache of packed payloads keyed on input values.
+
+    Each message keeps its most recently used payloads (command, status
+    and data words packed little-endian) up to max_entries, so memory is
+    bounded by max_entries per ICD message (and per kind of key: flight
+    inputs or scenario data words). Static messages always reuse their
+    prepacked payload and count as hits.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries: Payloads kept per message (least recently used
+                payloads are evicted first)
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: Dict[int, OrderedDict] = {}
+        self._word_entries: Dict[int, OrderedDict] = {}
+        self.reset_statistics()
+
+    def reset_statistics(self) -> None:
+        """Zero the hit, miss and eviction counts (cached payloads are kept)."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def payload(self, plan: MessagePlan, flight_state: Optional[FlightState]) -> bytes:
+        """
+        Get the packed payload for one instance, encoding it on a miss.
+
+        Args:
+            plan: Compiled message plan
+            flight_state: Flight state at the message time (None encodes
+                dynamic words as zero)
+
+        Returns:
+            Packed command, status and data words
+        """
+        if flight_state is None or not plan.dynamic_words:
+            self.hits += 1
+            return plan.static_payload
+
+        values = plan.read_inputs(flight_state)
+        return self._lookup(self._entries, plan, plan.cache_key(values),
+                            lambda: plan.encode_inputs(values))
+
+    def packed(self, plan: MessagePlan, data_words: Sequence[int]) -> bytes:
+        """
+        Get the packed payload for data words generated outside the plan.
+
+        Used for scenario data: messages whose generated words repeat
+        (constant fields, slowly changing values) are packed once.
+
+        Args:
+            plan: Compiled message plan (command and status words)
+            data_words: Data words of the instance
+
+        Returns:
+            Packed command, status and data words
+        """
+        data_words = tuple(data_words)
+        return self._lookup(self._word_entries, plan, data_words, lambda: list(data_words))
+
+    def _lookup(self, table: Dict[int, OrderedDict], plan: MessagePlan, key: Tuple,
+                encode: Callable[[], List[int]]) -> bytes:
+        """Cached payload of a plan for a key, packing encode()'s data words on a miss."""
+        entries = table.get(id(plan))
+        if entries is None:
+            entries = table[id(plan)] = OrderedDict()
+        payload = entries.get(key)
+        if payload is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+        self.misses += 1
+        words = plan.static_words[:2] + encode()
+        payload = struct.pack(f'<{len(words)}H', *words)
+        entries[key] = payload
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return payload
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': sum(len(entries) for table in (self._entries, self._word_entries)
+                           for entries in table.values()),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+def compile_icd(icd: ICDDefinition) -> Dict[int, MessagePlan]:
+    """
+    Compile every message of an ICD into a plan.
+
+    Args:
+        icd: ICD definition
+
+    Returns:
+        Plans keyed by id() of the MessageDefinition (definitions are not
+        hashable; the plan keeps a reference so the id stays valid)
+    """
+    return {id(message): MessagePlan(message) for message in icd.messages}
@@ -0,0 +1,262 @@
+"""
+Sidecar packet index for Chapter 10 files.
+
+`ch10gen index FILE` writes FILE's packet table next to it (same name
+with a .ch10idx suffix): one fixed-size record per packet with its
+offset, length, channel, data type, RTC, 1553 message count and first
+and last message IPTS. The sidecar is a short header followed by the raw
+records, so loading it is a single read into a NumPy array.
+
+Readers load the sidecar automatically when it matches the file's size
+and modification time and its packets cover the file up to its end, and
+then seek straight to the packets of a channel, data type or IPTS range
+instead of scanning from byte 0. Damaged files (bad headers, truncated
+or trailing bytes) are not indexed, so validation always scans them.
+"""
+
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+import numpy as np
+
+try:
+    from chapter10 import C10
+    from chapter10.ms1553 import MS1553F1
+    PYCHAPTER10_AVAILABLE = True
+except ImportError:
+    PYCHAPTER10_AVAILABLE = False
+
+try:
+    from .wire_reader import WireFile
+    from .core.packet_serializer import DATA_TYPE_MS1553_F1
+except ImportError:
+    from wire_reader import WireFile
+    from core.packet_serializer import DATA_TYPE_MS1553_F1
+
+INDEX_SUFFIX = '.ch10idx'
+INDEX_MAGIC = b'CH10IDX\x01'
+
+INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),          # Byte offset of the packet header
+    ('length', '<u4'),          # Packet length in bytes
+    ('channel_id', '<u2'),
+    ('data_type', 'u1'),
+    ('rtc', '<u8'),             # 48-bit relative time counter
+    ('message_count', '<u4'),   # 1553 messages (0 for other packets)
+    ('first_ipts', '<u8'),      # IPTS of the first and last 1553 message
+    ('last_ipts', '<u8'),
+])
+
+# Magic, then source size, source mtime (ns) and record count
+_INDEX_HEADER = struct.Struct('<8sQqQ')
+
+
+def index_path(filepath: Union[str, Path]) -> Path:
+    """Sidecar path of a Chapter 10 file."""
+    return Path(filepath).with_suffix(INDEX_SUFFIX)
+
+
+class PacketIndex:
+    """Packet table of one Chapter 10 file."""
+
+    def __init__(self, records: np.ndarray, source_size: int, source_mtime_ns: int):
+        """
+        Args:
+            records: INDEX_DTYPE records in file order
+            source_size: Size of the indexed file in bytes
+            source_mtime_ns: Modification time of the indexed file
+        """
+        self.records = records
+        self.source_size = source_size
+        self.source_mtime_ns = source_mtime_ns
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def is_fresh(self, filepath: Union[str, Path]) -> bool:
+        """Whether the index still describes the file."""
+        stat = os.stat(filepath)
+        return stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+
+    def covered_bytes(self) -> int:
+        """End of the last indexed packet."""
+        if not len(self.records):
+            return 0
+        last = self.records[-1]
+        return int(last['offset']) + int(last['length'])
+
+    def covers_file(self) -> bool:
+        """Whether the packets run back to back up to the end of the indexed file."""
+        return self.covered_bytes() == self.source_size
+
+    def select(self, data_type: Optional[int] = None, channel_id: Optional[int] = None,
+               start_ipts: Optional[int] = None, end_ipts: Optional[int] = None) -> np.ndarray:
+        """
+        Records matching all given filters.
+
+        An IPTS range [start_ipts, end_ipts) keeps the packets with 1553
+        messages in it; other packets carry no IPTS and are left out.
+        """
+        records = self.records
+        mask = np.ones(len(records), dtype=bool)
+        if data_type is not None:
+            mask &= records['data_type'] == data_type
+        if channel_id is not None:
+            mask &= records['channel_id'] == channel_id
+        if start_ipts is not None or end_ipts is not None:
+            mask &= records['message_count'] > 0
+            if start_ipts is not None:
+                mask &= records['last_ipts'] >= start_ipts
+            if end_ipts is not None:
+                mask &= records['first_ipts'] < end_ipts
+        return records[mask]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the sidecar (atomically replacing an existing one)."""
+        path = Path(path)
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(_INDEX_HEADER.pack(INDEX_MAGIC, self.source_size, self.source_mtime_ns,
+                                       len(self.records)))
+            f.write(self.records.tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'PacketIndex':
+        """
+        Read a sidecar.
+
+        Raises:
+            ValueError: If the file is not a complete packet index
+        """
+        with open(path, 'rb') as f:
+            header = f.read(_INDEX_HEADER.size)
+            if len(header) < _INDEX_HEADER.size:
+                raise ValueError(f"Truncated packet index: {path}")
+            magic, source_size, source_mtime_ns, count = _INDEX_HEADER.unpack(header)
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"Not a packet index: {path}")
+            records = np.fromfile(f, dtype=INDEX_DTYPE, count=count)
+        if len(records) != count:
+            raise ValueError(f"Truncated packet index: {path}")
+        return cls(records, source_size, source_mtime_ns)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Packet and message counts, channels and IPTS span."""
+        records = self.records
+        with_messages = records[records['message_count'] > 0]
+        data_types, counts = np.unique(records['data_type'], return_counts=True)
+        return {
+            'packets': len(records),
+            'packets_by_type': {f"0x{int(t):02X}": int(c) for t, c in zip(data_types, counts)},
+            'channels': sorted(int(c) for c in np.unique(records['channel_id'])),
+            'messages_1553': int(records['message_count'].sum()),
+            'first_ipts': int(with_messages['first_ipts'].min()) if len(with_messages) else None,
+            'last_ipts': int(with_messages['last_ipts'].max()) if len(with_messages) else None,
+        }
+
+
+def build_index(filepath: Union[str, Path]) -> PacketIndex:
+    """
+    Scan a Chapter 10 file into a packet index.
+
+    Raises:
+        ValueError: If the packets do not run back to back to the end of
+            the file (bad headers, truncated packets or trailing bytes)
+    """
+    stat = os.stat(filepath)
+    rows = []
+    with WireFile(filepath, use_index=False) as wire:
+        for packet in wire.packets():
+            message_count = first_ipts = last_ipts = 0
+            if packet.data_type == DATA_TYPE_MS1553_F1:
+                for message in packet.messages():
+                    ipts = message.ipts
+                    if not message_count:
+                        first_ipts = ipts
+                    last_ipts = ipts
+                    message_count += 1
+            rows.append((packet.offset, packet.packet_len, packet.channel_id, packet.data_type,
+                         packet.rtc, message_count, first_ipts, last_ipts))
+        index = PacketIndex(np.array(rows, dtype=INDEX_DTYPE), stat.st_size, stat.st_mtime_ns)
+        if not index.covers_file():
+            try:
+                from .integrity import scan_packets
+            except ImportError:
+                from integrity import scan_packets
+            scan = scan_packets(wire)
+            raise ValueError(
+                f"Not indexing damaged file {filepath}: packets end at byte "
+                f"{index.covered_bytes():,} of {stat.st_size:,} "
+                f"({len(scan.invalid_offsets)} bad headers, {scan.trailing_bytes} trailing bytes)")
+    return index
+
+
+def write_index(filepath: Union[str, Path]) -> PacketIndex:
+    """
+    Build a file's packet index and write its sidecar.
+
+    Raises:
+        ValueError: If the file is damaged (see build_index)
+    """
+    index = build_index(filepath)
+    index.save(index_path(filepath))
+    return index
+
+
+def load_index(filepath: Union[str, Path]) -> Optional[PacketIndex]:
+    """The file's packet index, or None if there is no fresh, readable sidecar covering the file."""
+    path = index_path(filepath)
+    if not path.exists():
+        return None
+    try:
+        index = PacketIndex.load(path)
+        return index if index.is_fresh(filepath) and index.covers_file() else None
+    except (OSError, ValueError):
+        return None
+
+
+def iter_c10_packets(filepath: Union[str, Path], data_type: Optional[int] = None,
+                     channel_id: Optional[int] = None, start_ipts: Optional[int] = None,
+                     end_ipts: Optional[int] = None) -> Iterator[Any]:
+    """
+    PyChapter10 packets matching the filters, in file order.
+
+    With a fresh sidecar PyChapter10 is positioned on each selected
+    packet directly; otherwise the whole file is scanned and filtered.
+
+    Args:
+        filepath: Path to the Chapter 10 file
+        data_type: Only packets of this data type
+        channel_id: Only packets of this channel
+        start_ipts: Only 1553 packets with messages at or after this IPTS
+        end_ipts: Only 1553 packets with messages before this IPTS
+    """
+    index = load_index(filepath)
+    with open(filepath, 'rb') as f:
+        c10 = C10(f)
+        if index is not None:
+            for offset in index.select(data_type, channel_id, start_ipts, end_ipts)['offset'].tolist():
+                c10.file.seek(offset)
+                packet = next(c10, None)
+                if packet is None:
+                    return
+                yield packet
+            return
+
+        time_range = start_ipts is not None or end_ipts is not None
+        for packet in c10:
+            if data_type is not None and packet.data_type != data_type:
+                continue
+            if channel_id is not None and packet.channel_id != channel_id:
+                continue
+            if time_range:
+                if not isinstance(packet, MS1553F1):
+                    continue
+                ipts = [msg.ipts for msg in packet]
+                if not ipts or (start_ipts is not None and ipts[-1] < start_ipts) \
+                        or (end_ipts is not None and ipts[0] >= end_ipts):
+                    continue
+            yield packet
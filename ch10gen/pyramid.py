@@ -0,0 +1,283 @@
+"""
+Min/max/mean downsampling pyramids for parameter previews.
+
+`ch10gen pyramid FILE --icd ICD` (or `build --pyramid`) decodes the ICD
+parameters of a file once and writes multi-resolution summaries next to
+it (same name with a .ch10pyr suffix). Level 0 summarizes every
+bucket_samples consecutive samples of a parameter in one bucket (first
+and last IPTS, min, max, mean and count); each further level merges
+fanout buckets of the level below, up to a single bucket.
+
+The sidecar is a short header, a JSON directory of level offsets (from
+the end of the directory) and the raw bucket records. Readers memory-map
+single levels on demand, so a zoomed-out view only touches the few
+top-level buckets, and finer levels are paged in as a view narrows.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    from .extract import iter_parameter_samples
+    from .icd import ICDDefinition
+    from .icd_decoder import ICDDecoder
+    from .wire_reader import WireFile
+except ImportError:
+    from extract import iter_parameter_samples
+    from icd import ICDDefinition
+    from icd_decoder import ICDDecoder
+    from wire_reader import WireFile
+
+PYRAMID_SUFFIX = '.ch10pyr'
+PYRAMID_MAGIC = b'CH10PYR\x01'
+
+BUCKET_DTYPE = np.dtype([
+    ('first_ipts', '<u8'),      # IPTS of the first and last sample in the bucket
+    ('last_ipts', '<u8'),
+    ('min', '<f8'),             # Over finite values (NaN if there are none)
+    ('max', '<f8'),
+    ('mean', '<f8'),
+    ('count', '<u4'),           # Finite values in the bucket
+])
+
+DEFAULT_BUCKET_SAMPLES = 16
+DEFAULT_FANOUT = 8
+DEFAULT_MAX_BUCKETS = 2000
+
+# Magic, source size, source mtime (ns), bucket samples, fanout and directory length
+_PYRAMID_HEADER = struct.Struct('<8sQqIIQ')
+
+
+def pyramid_path(filepath: Union[str, Path]) -> Path:
+    """Sidecar path of a Chapter 10 file."""
+    return Path(filepath).with_suffix(PYRAMID_SUFFIX)
+
+
+def _buckets(first: np.ndarray, last: np.ndarray, mins: np.ndarray, maxs: np.ndarray,
+             sums: np.ndarray, counts: np.ndarray, size: int) -> np.ndarray:
+    """Merge every size consecutive entries into one bucket (the last may be partial)."""
+    starts = np.arange(0, len(first), size)
+    ends = np.minimum(starts + size, len(first))
+    buckets = np.empty(len(starts), dtype=BUCKET_DTYPE)
+    buckets['first_ipts'] = first[starts]
+    buckets['last_ipts'] = last[ends - 1]
+    buckets['min'] = np.fmin.reduceat(mins, starts)
+    buckets['max'] = np.fmax.reduceat(maxs, starts)
+    total = np.add.reduceat(counts, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        buckets['mean'] = np.add.reduceat(sums, starts) / total
+    buckets['count'] = total
+    return buckets
+
+
+def _sample_buckets(samples: np.ndarray, size: int) -> np.ndarray:
+    """Level 0 buckets of PARAMETER_DTYPE samples."""
+    values = samples['value']
+    finite = np.isfinite(values)
+    masked = np.where(finite, values, np.nan)
+    return _buckets(samples['ipts'], samples['ipts'], masked, masked,
+                    np.where(finite, values, 0.0), finite.astype(np.int64), size)
+
+
+def merge_level(buckets: np.ndarray, fanout: int) -> np.ndarray:
+    """The next coarser level: every fanout buckets merged into one."""
+    counts = buckets['count'].astype(np.int64)
+    sums = np.where(counts > 0, buckets['mean'] * counts, 0.0)
+    return _buckets(buckets['first_ipts'], buckets['last_ipts'], buckets['min'], buckets['max'],
+                    sums, counts, fanout)
+
+
+def build_levels(level0: np.ndarray, fanout: int = DEFAULT_FANOUT) -> List[np.ndarray]:
+    """All levels from level 0 up to a single bucket."""
+    levels = [level0]
+    while len(levels[-1]) > 1:
+        levels.append(merge_level(levels[-1], fanout))
+    return levels
+
+
+class Pyramid:
+    """Downsampling pyramid of one Chapter 10 file, read lazily from its sidecar."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a sidecar (levels are memory-mapped when first used).
+
+        Raises:
+            ValueError: If the file is not a complete pyramid sidecar
+        """
+        self.path = Path(path)
+        size = self.path.stat().st_size
+        with open(self.path, 'rb') as f:
+            header = f.read(_PYRAMID_HEADER.size)
+            if len(header) < _PYRAMID_HEADER.size:
+                raise ValueError(f"Truncated pyramid: {path}")
+            (magic, self.source_size, self.source_mtime_ns, self.bucket_samples,
+             self.fanout, directory_len) = _PYRAMID_HEADER.unpack(header)
+            if magic != PYRAMID_MAGIC:
+                raise ValueError(f"Not a pyramid: {path}")
+            directory = f.read(directory_len)
+        data_start = _PYRAMID_HEADER.size + directory_len
+        try:
+            self._directory: Dict[str, List[Tuple[int, int]]] = {
+                name: [(data_start + offset, count) for offset, count in levels]
+                for name, levels in json.loads(directory)['parameters'].items()
+            }
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Corrupt pyramid directory: {path}") from e
+        for levels in self._directory.values():
+            for offset, count in levels:
+                if offset + count * BUCKET_DTYPE.itemsize > size:
+                    raise ValueError(f"Truncated pyramid: {path}")
+        self._levels: Dict[Tuple[str, int], np.ndarray] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Drop the mapped levels (so the sidecar can be replaced)."""
+        self._levels.clear()
+
+    @property
+    def parameters(self) -> List[str]:
+        """Parameter names in the pyramid."""
+        return list(self._directory)
+
+    def is_fresh(self, filepath: Union[str, Path]) -> bool:
+        """True if the pyramid was built from the file as it is now."""
+        stat = os.stat(filepath)
+        return stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+
+    def level_count(self, name: str) -> int:
+        """Number of levels of a parameter (0 if it has no samples)."""
+        return len(self._directory[name])
+
+    def level(self, name: str, level: int) -> np.ndarray:
+        """BUCKET_DTYPE buckets of one level (0 is the finest), memory-mapped."""
+        key = (name, level)
+        if key not in self._levels:
+            offset, count = self._directory[name][level]
+            self._levels[key] = np.memmap(self.path, dtype=BUCKET_DTYPE, mode='r',
+                                          offset=offset, shape=(count,)) if count else \
+                np.zeros(0, dtype=BUCKET_DTYPE)
+        return self._levels[key]
+
+    def query(self, name: str, start_ipts: Optional[int] = None, end_ipts: Optional[int] = None,
+              max_buckets: int = DEFAULT_MAX_BUCKETS) -> Tuple[int, np.ndarray]:
+        """
+        Buckets for a view of a parameter.
+
+        Levels are tried from the top down; the finest level with at most
+        max_buckets buckets overlapping [start_ipts, end_ipts] is used, so
+        only levels above it and the selected range are read.
+
+        Returns:
+            (level, buckets overlapping the range)
+        """
+        selected = (0, np.zeros(0, dtype=BUCKET_DTYPE))
+        for level in range(self.level_count(name) - 1, -1, -1):
+            buckets = self.level(name, level)
+            first = 0 if start_ipts is None else \
+                int(np.searchsorted(buckets['last_ipts'], start_ipts, side='left'))
+            last = len(buckets) if end_ipts is None else \
+                int(np.searchsorted(buckets['first_ipts'], end_ipts, side='right'))
+            if last - first > max_buckets and level != self.level_count(name) - 1:
+                break
+            selected = (level, buckets[first:last])
+        return selected
+
+
+def build_pyramid(ch10_file: Union[str, Path], icd: ICDDefinition,
+                  names: Optional[Sequence[str]] = None,
+                  bucket_samples: int = DEFAULT_BUCKET_SAMPLES, fanout: int = DEFAULT_FANOUT,
+                  decoder: Optional[ICDDecoder] = None) -> Path:
+    """
+    Decode parameters of a file once and write its pyramid sidecar.
+
+    Args:
+        ch10_file: Input CH10 file
+        icd: ICD definition for decoding
+        names: Parameter names (default: every ICD field)
+        bucket_samples: Samples per level 0 bucket
+        fanout: Buckets of a level merged into one of the next
+        decoder: Decoder compiled from the ICD (compiled if None)
+
+    Returns:
+        Path of the written sidecar
+
+    Raises:
+        ValueError: If a name is not a field of any ICD message
+    """
+    if bucket_samples < 1 or fanout < 2:
+        raise ValueError("bucket_samples must be >= 1 and fanout >= 2")
+    if decoder is None:
+        decoder = ICDDecoder(icd)
+    if names is None:
+        names = decoder.field_names
+    stat = os.stat(ch10_file)
+
+    # Level 0 is built while streaming; samples of an incomplete bucket carry over
+    level0: Dict[str, List[np.ndarray]] = {name: [] for name in names}
+    carry: Dict[str, np.ndarray] = {}
+    with WireFile(ch10_file) as wire:
+        for batch in iter_parameter_samples(wire, decoder, names):
+            for name, samples in batch.items():
+                if name in carry:
+                    samples = np.concatenate([carry.pop(name), samples])
+                complete = len(samples) // bucket_samples * bucket_samples
+                if complete:
+                    level0[name].append(_sample_buckets(samples[:complete], bucket_samples))
+                if complete < len(samples):
+                    carry[name] = samples[complete:]
+    for name, samples in carry.items():
+        level0[name].append(_sample_buckets(samples, bucket_samples))
+
+    levels = {name: build_levels(np.concatenate(parts), fanout) if parts else []
+              for name, parts in level0.items()}
+    return write_pyramid(pyramid_path(ch10_file), levels, stat.st_size, stat.st_mtime_ns,
+                         bucket_samples, fanout)
+
+
+def write_pyramid(path: Union[str, Path], levels: Dict[str, List[np.ndarray]], source_size: int,
+                  source_mtime_ns: int, bucket_samples: int, fanout: int) -> Path:
+    """Write a sidecar (atomically replacing an existing one)."""
+    path = Path(path)
+    directory = {}
+    offset = 0
+    for name, name_levels in levels.items():
+        directory[name] = []
+        for buckets in name_levels:
+            directory[name].append([offset, len(buckets)])
+            offset += len(buckets) * BUCKET_DTYPE.itemsize
+    directory = json.dumps({'parameters': directory}).encode()
+
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(_PYRAMID_HEADER.pack(PYRAMID_MAGIC, source_size, source_mtime_ns,
+                                     bucket_samples, fanout, len(directory)))
+        f.write(directory)
+        for name_levels in levels.values():
+            for buckets in name_levels:
+                f.write(buckets.tobytes())
+    os.replace(temp_path, path)
+    return path
+
+
+def load_pyramid(filepath: Union[str, Path]) -> Optional[Pyramid]:
+    """Pyramid of a Chapter 10 file, or None if its sidecar is missing, stale or unreadable."""
+    path = pyramid_path(filepath)
+    if not path.exists():
+        return None
+    try:
+        pyramid = Pyramid(path)
+    except (OSError, ValueError):
+        return None
+    return pyramid if pyramid.is_fresh(filepath) else None
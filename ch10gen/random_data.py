@@ -3,24 +3,28 @@ Random data generation for CH10 messages.
 Populates all fields with appropriate random values for testing.
 """
 
-import random
 import struct
 import math
 from typing import Dict, Any, List, Optional, Union
-from datetime import datetime, timedelta
+
+from .utils.rng import RNGService, RandomStream
 
 
 class RandomDataGenerator:
     """Generate random data for all message fields."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 rng: Optional[RandomStream] = None):
         """
         Initialize random data generator.
         
         Args:
             config: Random data configuration from scenario
+            rng: Random stream to draw from (default: seeded from the
+                scenario's 'seed', if any)
         """
         self.config = config or {}
+        self.rng = rng if rng is not None else RNGService(self.config.get('seed')).stream('random_data')
         self.random_config = self.config.get('random_config', {})
         self.ranges = self.random_config.get('ranges', {})
         
@@ -43,9 +47,6 @@ class RandomDataGenerator:
         # Track values for increment patterns
         self.increment_values = {}
         
-        # Track time for sine patterns
-        self.start_time = datetime.now()
-        
     def generate_value(self, field: Dict[str, Any], message_name: str = None) -> Union[int, float]:
         """
         Generate a random value for a field.
@@ -94,11 +95,11 @@ class RandomDataGenerator:
         # Generate random value that fits in the bits
         if num_bits == 1:
             # Single bit - 0 or 1
-            value = random.randint(0, 1)
+            value = self.rng.integers(0, 1)
         else:
             # Multi-bit field
             max_value = (1 << num_bits) - 1
-            value = random.randint(0, max_value)
+            value = self.rng.integers(0, max_value)
         
         return value
     
@@ -114,7 +115,7 @@ class RandomDataGenerator:
             # Limit to mask range
             max_val = min(max_val, mask) if mask > 0 else max_val
         
-        return random.randint(int(min_val), int(max_val))
+        return self.rng.integers(int(min_val), int(max_val))
     
     def _generate_i16(self, field: Dict[str, Any]) -> int:
         """Generate signed 16-bit value."""
@@ -122,7 +123,7 @@ class RandomDataGenerator:
         min_val = field.get('min', range_config.get('min', -32768))
         max_val = field.get('max', range_config.get('max', 32767))
         
-        value = random.randint(int(min_val), int(max_val))
+        value = self.rng.integers(int(min_val), int(max_val))
         
         # Ensure it fits in 16 bits signed
         if value < 0:
@@ -137,7 +138,7 @@ class RandomDataGenerator:
         max_val = field.get('max', range_config.get('max', 180.0))
         
         # Generate random float value
-        value = random.uniform(min_val, max_val)
+        value = self.rng.uniform(min_val, max_val)
         
         # Apply scale if present
         scale = field.get('scale', 1.0)
@@ -171,7 +172,7 @@ class RandomDataGenerator:
         max_val = field.get('max', range_config.get('max', 9999))
         
         # Generate decimal value
-        value = random.randint(min_val, max_val)
+        value = self.rng.integers(min_val, max_val)
         
         # Convert to BCD
         bcd_value = 0
@@ -195,7 +196,7 @@ class RandomDataGenerator:
         else:
             values = [0, 1, 2, 3, 4, 5, 6, 7]
         
-        return random.choice(values)
+        return self.rng.choice(values)
     
     def _generate_status(self, field: Dict[str, Any]) -> int:
         """Generate status bit value."""
@@ -208,7 +209,7 @@ class RandomDataGenerator:
         else:
             values = [0, 1]
         
-        return random.choice(values)
+        return self.rng.choice(values)
     
     def _generate_float32(self, field: Dict[str, Any]) -> float:
         """Generate 32-bit float value."""
@@ -216,7 +217,7 @@ class RandomDataGenerator:
         min_val = field.get('min', range_config.get('min', -1000000.0))
         max_val = field.get('max', range_config.get('max', 1000000.0))
         
-        return random.uniform(min_val, max_val)
+        return self.rng.uniform(min_val, max_val)
     
     def generate_message_data(self, message: Dict[str, Any]) -> List[int]:
         """
@@ -260,7 +261,7 @@ class RandomDataGenerator:
                 words.append(word_value)
             else:
                 # Simple word value
-                words.append(random.randint(0, 65535))
+                words.append(self.rng.integers(0, 65535))
         
         return words
     
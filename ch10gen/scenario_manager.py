@@ -4,8 +4,16 @@ Supports references within word, across words, and across messages.
 """
 
 import re
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Sequence, Tuple, List
+
+import numpy as np
+
 from .data_generators import DataGeneratorManager, GeneratorFactory
+from .field_graph import FieldGraph, FieldNode, compile_field_graph
+from .expressions import (
+    EXPRESSION_FUNCTIONS, RANDOM_FUNCTIONS, compile_expression, expression_namespace
+)
+from .utils.rng import RNGService
 
 
 class FieldReferenceResolver:
@@ -114,22 +122,61 @@ class FieldReferenceResolver:
 class ScenarioManager:
     """Manages scenario-based data generation with field references."""
     
-    def __init__(self, scenario: Dict[str, Any], icd: Any):
+    def __init__(self, scenario: Dict[str, Any], icd: Any,
+                 rng: Optional[RNGService] = None):
         """
         Initialize scenario manager.
         
         Args:
             scenario: Scenario configuration
             icd: ICD definition
+            rng: Random streams (default: seeded from the scenario's 'seed'
+                or 'config.random_seed')
         """
         self.scenario = scenario
         self.icd = icd
         self.generator_manager = DataGeneratorManager()
         self.resolver = FieldReferenceResolver()
         self.computed_values = {}
+        if rng is None:
+            rng = RNGService(scenario.get('seed', scenario.get('config', {}).get('random_seed')))
+        self.rng = rng
+        
+        # Persistent expression namespace: functions are added once, time,
+        # message count and the field's random functions (drawing from the
+        # field's stream) per evaluation, and each message's values as computed
+        self._expression_namespace = {'time': 0.0, 'message_count': 0}
+        self._expression_namespace.update(expression_namespace())
+        self._expression_namespace.update(dict.fromkeys(RANDOM_FUNCTIONS))
         
         # Load generators from scenario
         self._load_generators()
+        
+        # Message values take precedence over field and function names in
+        # formulas; if any names collide, evaluate with a merged context
+        message_names = {message.name.replace(' ', '_') for message in self.icd.messages}
+        field_names = set(self._expression_namespace)
+        for message in self.icd.messages:
+            for word_idx, word in enumerate(message.words):
+                field_names.add(f"word{word_idx}")
+                field_names.add(word.name if hasattr(word, 'name') else f"word{word_idx}")
+                for field in getattr(word, 'fields', None) or []:
+                    field_names.add(field.name)
+        self._merged_expression_context = not message_names.isdisjoint(field_names)
+        
+        # Compile each message's fields into a dependency graph (reports
+        # circular references now rather than while generating)
+        self._message_names = {message.name.replace(' ', '_'): message.name
+                               for message in self.icd.messages}
+        self._message_versions: Dict[str, int] = {}
+        self._field_graphs: Dict[str, FieldGraph] = {}
+        for message in self.icd.messages:
+            self._field_graph(message.name, message)
+        # Without cross-message references, messages can be generated per
+        # definition in blocks regardless of how their instances interleave
+        self.cross_message_references = any(
+            node.messages for graph in self._field_graphs.values() for node in graph.nodes
+        )
     
     def _load_generators(self):
         """Load all generators from scenario configuration."""
@@ -193,154 +240,165 @@ class ScenarioManager:
         generator = GeneratorFactory.create(config)
         self.generator_manager.generators[field_path] = generator
     
-    def generate_message_data(self, message_name: str, message_def: Any) -> List[int]:
+    def generate_message_data(self, message_name: str, message_def: Any,
+                              time_s: Optional[float] = None,
+                              instance: Optional[int] = None) -> List[int]:
         """
         Generate data for all fields in a message.
         
+        Fields are evaluated in the message's compiled dependency order and
+        only recomputed when one of their inputs changed. With the schedule
+        time and instance, time-based fields, counters, patterns and
+        'message_count' depend only on the scheduled message, so any window
+        of a schedule can be generated on its own.
+        
         Args:
             message_name: Name of the message
             message_def: Message definition from ICD
+            time_s: Simulation time of the message (default: the last time set)
+            instance: Schedule instance of the message (default: stateful
+                counters advance per call)
             
         Returns:
             List of 16-bit words with generated data
         """
-        # First pass: collect all field values (non-expressions)
-        message_values = {}
-        for word_idx, word_def in enumerate(message_def.words):
-            if hasattr(word_def, 'fields') and word_def.fields:
-                for field in word_def.fields:
-                    field_path = f"{message_name}.word{word_idx}.{field.name}"
-                    if field_path in self.generator_manager.generators:
-                        gen = self.generator_manager.generators[field_path]
-                        if not hasattr(gen, 'formula'):  # Not an expression
-                            value = self._generate_field_value(message_name, word_idx, field.name, {})
-                            if f"word{word_idx}" not in message_values:
-                                message_values[f"word{word_idx}"] = {}
-                            message_values[f"word{word_idx}"][field.name] = value
-                            message_values[field.name] = value  # Also store at message level
-            else:
-                field_name = word_def.name if hasattr(word_def, 'name') else f"word{word_idx}"
-                field_path = f"{message_name}.word{word_idx}.{field_name}"
-                if field_path in self.generator_manager.generators:
-                    gen = self.generator_manager.generators[field_path]
-                    if not hasattr(gen, 'formula'):  # Not an expression
-                        value = self._generate_field_value(message_name, word_idx, field_name, {})
-                        if f"word{word_idx}" not in message_values:
-                            message_values[f"word{word_idx}"] = {}
-                        message_values[f"word{word_idx}"][field_name] = value
-                        message_values[field_name] = value  # Also store at message level
-        
-        # Second pass: generate actual word data with expressions
-        words_data = []
-        for word_idx, word_def in enumerate(message_def.words):
-            word_value = 0
-            word_values = {}
+        if time_s is not None:
+            self.generator_manager.set_message_context(message_name, time_s, instance)
+        graph = self._field_graph(message_name, message_def)
+        # Published first: formulas may read the message's own values by name
+        self._publish_values(message_name, graph)
+        time_s = self.generator_manager.get_elapsed_time()
+        message_count = self.generator_manager.get_message_count(message_name)
+        
+        def evaluate_expression(node, message_values):
+            return self._evaluate_node(message_name, node, message_values, time_s, message_count)
+        
+        if graph.evaluate(time_s, message_count, instance, self._message_versions,
+                          self.computed_values, self.icd, evaluate_expression):
+            self._message_versions[message_name] = self._message_versions.get(message_name, 0) + 1
+        
+        return list(graph.words)
+    
+    def generate_message_block(self, message_name: str, message_def: Any,
+                               times: Sequence[float],
+                               counts: Optional[Sequence[int]] = None,
+                               instances: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Generate data for N instances of a message at once.
+        
+        Equivalent to N calls to generate_message_data at the given times:
+        each generator is called once per instance (stateful generators
+        advance identically), but all values of a field are drawn with one
+        generate_batch call from the field's own random stream. Expression
+        fields are evaluated per instance in dependency order. Other
+        messages referencing this one see the last instance's values.
+        
+        Args:
+            message_name: Name of the message
+            message_def: Message definition from ICD
+            times: Time of each instance in seconds since start
+            counts: Message count of each instance (default: the instances,
+                or the manager's count)
+            instances: Schedule instance of each message (default: stateful
+                counters advance per message)
             
-            # Check if word has multiple fields (bitfields)
-            if hasattr(word_def, 'fields') and word_def.fields:
-                # Process each bitfield
-                for field in word_def.fields:
-                    # Generate value for this field
-                    field_value = self._generate_field_value(
-                        message_name, word_idx, field.name, message_values
-                    )
-                    
-                    # Apply mask and shift if present
-                    if hasattr(field, 'mask') and hasattr(field, 'shift'):
-                        # Ensure value fits in mask
-                        mask_bits = bin(field.mask).count('1')
-                        max_val = (1 << mask_bits) - 1
-                        field_value = int(field_value) & max_val
-                        
-                        # Apply to word
-                        word_value |= (field_value << field.shift)
-                    else:
-                        word_value = int(field_value) & 0xFFFF
-                    
-                    word_values[field.name] = field_value
+        Returns:
+            Array of shape (N, words) with the 16-bit data words
+        """
+        times = np.asarray(times, dtype=float)
+        n = len(times)
+        if counts is None and instances is not None:
+            counts = instances
+        if counts is None:
+            counts = np.full(n, self.generator_manager.get_message_count(message_name))
+        counts = np.asarray(counts)
+        graph = self._field_graph(message_name, message_def)
+        if n == 0:
+            return np.zeros((0, graph.word_count), dtype=np.uint16)
+        
+        columns = [
+            None if node.expression
+            else node.generator.generate_batch(times, counts, instances).tolist()
+            for node in graph.nodes
+        ]
+        
+        if graph.has_expressions:
+            # Each instance's values go into the message's persistent dicts, as
+            # formulas read them (also through the message's own name)
+            self._publish_values(message_name, graph)
+            values = graph.values
+            word_values = graph.word_values
+            expression_nodes = [index for index in graph.order if graph.nodes[index].expression]
+            for index in expression_nodes:
+                columns[index] = [0.0] * n
+            for k in range(n):
+                for index, node in enumerate(graph.nodes):
+                    if not node.expression:
+                        values[node.name] = word_values[node.word_idx][node.name] = columns[index][k]
+                for index in expression_nodes:
+                    node = graph.nodes[index]
+                    value = self._evaluate_node(message_name, node, values, float(times[k]), int(counts[k]))
+                    values[node.name] = word_values[node.word_idx][node.name] = value
+                    columns[index][k] = value
+        
+        # Pack fields into words
+        words = np.zeros((n, graph.word_count), dtype=np.int64)
+        for index, node in enumerate(graph.nodes):
+            field_values = np.asarray(columns[index]).astype(np.int64)
+            if node.max_val is not None:
+                words[:, node.word_idx] |= (field_values & node.max_val) << node.shift
             else:
-                # Single field word
-                field_name = word_def.name if hasattr(word_def, 'name') else f"word{word_idx}"
-                field_value = self._generate_field_value(
-                    message_name, word_idx, field_name, message_values
-                )
-                word_value = int(field_value) & 0xFFFF
-                word_values[field_name] = field_value
-            
-            words_data.append(word_value)
-            message_values[f"word{word_idx}"] = word_values
+                words[:, node.word_idx] = field_values & 0xFFFF
         
-        # Store computed values for cross-references
-        self.computed_values[message_name] = message_values
+        # Keep the last instance's values and context for cross-references
+        graph.store([column[-1] for column in columns])
+        self.generator_manager.set_message_context(
+            message_name, float(times[-1]), None if instances is None else int(instances[-1])
+        )
+        self._message_versions[message_name] = self._message_versions.get(message_name, 0) + 1
+        self._publish_values(message_name, graph)
         
-        return words_data
+        return (words & 0xFFFF).astype(np.uint16)
     
-    def _generate_field_value(self, message_name: str, word_idx: int, 
-                             field_name: str, current_message_values: Dict) -> float:
-        """Generate value for a specific field."""
-        field_path = f"{message_name}.word{word_idx}.{field_name}"
-        
-        # Check if we have a generator for this field
-        if field_path not in self.generator_manager.generators:
-            # Use default random generator
-            self.generator_manager.generators[field_path] = GeneratorFactory.create({'mode': 'random'})
-        
-        # Get generator
-        generator = self.generator_manager.generators[field_path]
-        
-        # Handle expression generators specially
-        if hasattr(generator, 'formula'):
-            # Build context for expression evaluation
-            context = self._build_expression_context(
-                message_name, word_idx, field_name, current_message_values
-            )
-            return self._evaluate_expression(generator.formula, context)
-        else:
-            # Use standard generator
-            from .data_generators import GenerationContext
-            context = GenerationContext(
-                time_seconds=self.generator_manager.get_elapsed_time(),
-                message_count=self.generator_manager.get_message_count(message_name),
-                message_name=message_name,
-                field_name=field_name,
-                field_values=current_message_values,
-                all_values=self.computed_values,
-                icd=self.icd
-            )
-            return generator.generate(context)
+    def _field_graph(self, message_name: str, message_def: Any) -> FieldGraph:
+        """Compiled dependency graph of a message (compiled on first use)."""
+        graph = self._field_graphs.get(message_name)
+        if graph is None:
+            graph = compile_field_graph(message_name, message_def,
+                                        self.generator_manager.generators, self._message_names)
+            # One random stream per field, so values do not depend on the
+            # order in which fields or messages are generated
+            for node in graph.nodes:
+                node.generator.rng = self.rng.stream(node.path)
+            self._field_graphs[message_name] = graph
+        return graph
+    
+    def _publish_values(self, message_name: str, graph: FieldGraph):
+        """Make a message's values visible to cross-message references."""
+        if message_name not in self.computed_values:
+            self.computed_values[message_name] = graph.values
+            self._expression_namespace[message_name.replace(' ', '_')] = graph.values
+    
+    def _evaluate_node(self, message_name: str, node: FieldNode, message_values: Dict,
+                       time_s: float, message_count: int) -> float:
+        """Evaluate an expression node against a message's values."""
+        if not self._merged_expression_context:
+            return self._evaluate_compiled(node.generator, message_values, time_s, message_count)
+        context = self._build_expression_context(
+            message_name, node.word_idx, node.name, message_values, time_s, message_count
+        )
+        context.update(node.generator.random_functions)
+        return self._evaluate_expression(node.generator.formula, context)
     
     def _build_expression_context(self, message_name: str, word_idx: int,
-                                 field_name: str, current_message_values: Dict) -> Dict:
-        """Build context for expression evaluation."""
-        import math
-        import random
-        
-        context = {
-            # Math functions
-            'sin': math.sin,
-            'cos': math.cos,
-            'tan': math.tan,
-            'abs': abs,
-            'min': min,
-            'max': max,
-            'sqrt': math.sqrt,
-            'pow': pow,
-            'exp': math.exp,
-            'log': math.log,
-            'floor': math.floor,
-            'ceil': math.ceil,
-            'round': round,
-            'int': int,
-            'float': float,
-            
-            # Random functions
-            'random': lambda min_val=0, max_val=1: random.uniform(min_val, max_val),
-            'random_int': lambda min_val=0, max_val=100: random.randint(min_val, max_val),
-            
-            # Time and counters
-            'time': self.generator_manager.get_elapsed_time(),
-            'message_count': self.generator_manager.get_message_count(message_name),
-        }
+                                 field_name: str, current_message_values: Dict,
+                                 time_s: Optional[float] = None,
+                                 message_count: Optional[int] = None) -> Dict:
+        """Build context for expression evaluation (time and count default to the manager's)."""
+        context = dict(EXPRESSION_FUNCTIONS)
+        context['time'] = self.generator_manager.get_elapsed_time() if time_s is None else time_s
+        context['message_count'] = (self.generator_manager.get_message_count(message_name)
+                                    if message_count is None else message_count)
         
         # Add current message values
         context.update(current_message_values)
@@ -367,13 +425,39 @@ class ScenarioManager:
         # First, resolve field references in the formula
         resolved_formula = self._resolve_references_in_formula(formula, context)
         
-        # Now evaluate the resolved formula
+        # Now evaluate the resolved formula (parsed once, cached by formula)
         try:
-            result = eval(resolved_formula, {"__builtins__": {}}, context)
+            result = eval(compile_expression(resolved_formula), {"__builtins__": {}}, context)
             return float(result)
         except Exception as e:
             raise ValueError(f"Error evaluating expression '{formula}': {e}")
     
+    def _evaluate_compiled(self, generator: Any, current_message_values: Dict,
+                           time_s: float, message_count: int) -> float:
+        """
+        Evaluate an expression generator's compiled formula.
+        
+        Uses the persistent namespace, with the current message's values
+        as locals, instead of building a context per call.
+        
+        Args:
+            generator: ExpressionGenerator
+            current_message_values: Values already computed for this message
+            time_s: Value of 'time' in the formula
+            message_count: Value of 'message_count' in the formula
+            
+        Returns:
+            Evaluated value
+        """
+        namespace = self._expression_namespace
+        namespace['time'] = time_s
+        namespace['message_count'] = message_count
+        namespace.update(generator.random_functions)
+        try:
+            return float(eval(generator.compiled, namespace, current_message_values))
+        except Exception as e:
+            raise ValueError(f"Error evaluating expression '{generator.formula}': {e}")
+    
     def _resolve_references_in_formula(self, formula: str, context: Dict) -> str:
         """Resolve field references in formula to actual values."""
         # This is a simplified version - a full implementation would
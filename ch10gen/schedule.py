@@ -10,14 +10,22 @@ Key components:
 - MinorFrame: 20ms frame containing multiple messages
 - MajorFrame: 1 second frame containing 50 minor frames
 - BusSchedule: Complete schedule for a 1553 bus
+- ScheduleStream: Lazily merged schedule for long, constant-memory builds,
+  splittable into independent time windows
+- ArraySchedule: Compact NumPy structured-array schedule with integer
+  nanosecond times
 
 The scheduling system ensures proper timing coordination and realistic
 message distribution patterns similar to actual flight test data.
 """
 
+import heapq
 import math
 import random
-from typing import List, Dict, Any, Optional
+from fractions import Fraction
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+import numpy as np
 from dataclasses import dataclass, field
 
 # Import ICD definitions with fallback for different execution contexts
@@ -26,6 +34,8 @@ try:
 except ImportError:
     from icd import ICDDefinition, MessageDefinition
 
+NS_PER_S = 1_000_000_000
+
 
 @dataclass
 class ScheduledMessage:
@@ -39,8 +49,9 @@ class ScheduledMessage:
     time_s: float  # Time relative to start (seconds)
     minor_frame: int  # Which minor frame this belongs to (0-49)
     major_frame: int  # Which major frame this belongs to (0+)
+    instance: int = 0  # Transmission number of this message (k-th send, from 0)
     
-    def __init__(self, message, time_s, major_frame, minor_frame, **kwargs):
+    def __init__(self, message, time_s, major_frame, minor_frame, instance=0, **kwargs):
         """Initialize ScheduledMessage with optional legacy parameters."""
         # Handle legacy parameter names
         if 'slot_in_minor' in kwargs:
@@ -50,6 +61,7 @@ class ScheduledMessage:
         self.time_s = time_s
         self.major_frame = major_frame
         self.minor_frame = minor_frame
+        self.instance = instance
     
     def __repr__(self):
         return f"{self.message.name}@{self.time_s:.3f}s (MF{self.major_frame}:{self.minor_frame})"
@@ -112,6 +124,10 @@ class BusSchedule:
         """Add a scheduled message to the schedule."""
         self.messages.append(message)
     
+    def __iter__(self) -> Iterator[ScheduledMessage]:
+        """Iterate over scheduled messages in schedule order."""
+        return iter(self.messages)
+    
     def add_major_frame(self, major_frame: MajorFrame):
         """Add a major frame to the schedule."""
         self.major_frames.append(major_frame)
@@ -198,7 +214,8 @@ class BusSchedule:
                     message=msg_def,
                     time_s=time_s,
                     major_frame=int(time_s / self.major_frame_duration_s),
-                    minor_frame=int((time_s % self.major_frame_duration_s) / self.minor_frame_duration_s)
+                    minor_frame=int((time_s % self.major_frame_duration_s) / self.minor_frame_duration_s),
+                    instance=i
                 )
                 self.messages.append(scheduled_msg)
                 message_index += 1
@@ -326,6 +343,7 @@ def build_schedule_from_icd(
         
         # Schedule messages throughout the duration
         current_time = 0.0
+        instance = 0
         while current_time < duration_s:
             # Determine which minor frame this message belongs to
             minor_frame_idx = int(current_time / minor_frame_s)
@@ -337,7 +355,8 @@ def build_schedule_from_icd(
                     message=message_def,
                     time_s=current_time,
                     minor_frame=minor_frame_idx,
-                    major_frame=major_frame_idx
+                    major_frame=major_frame_idx,
+                    instance=instance
                 )
                 
                 # Add to schedule
@@ -349,8 +368,651 @@ def build_schedule_from_icd(
             
             # Move to next message time
             current_time += interval_s
+            instance += 1
     
     # Sort messages by time
     schedule.sort_messages()
     
     return schedule
+
+
+def _count_message_times(interval_s: float, duration_s: float,
+                         minor_frame_s: float, num_minor_frames: int,
+                         chunk_size: int = 1 << 16):
+    """Count the schedulable times of one message without a Python loop.
+    
+    np.add.accumulate adds strictly left to right, so each chunk reproduces
+    the scalar accumulation of build_schedule_from_icd exactly while using
+    bounded memory.
+    
+    Returns:
+        Tuple of (count, last scheduled time or None)
+    """
+    count = 0
+    last_time = None
+    current_time = 0.0
+    steps = np.full(chunk_size, interval_s, dtype=np.float64)
+    while current_time < duration_s:
+        steps[0] = current_time
+        times = np.add.accumulate(steps)
+        below = int(np.searchsorted(times, duration_s, side='left'))
+        in_frames = times[:below][times[:below] / minor_frame_s < num_minor_frames]
+        if len(in_frames):
+            count += len(in_frames)
+            last_time = float(in_frames[-1])
+        if below < chunk_size:
+            break
+        current_time = float(times[-1]) + interval_s
+    return count, last_time
+
+
+def _first_times_at_or_after(interval_s: float, duration_s: float,
+                             boundaries: List[float],
+                             chunk_size: int = 1 << 16) -> List[Optional[Tuple[float, int]]]:
+    """Find the first accumulated send time at or after each boundary.
+    
+    Uses the same chunked accumulation as _count_message_times, so the
+    returned times continue the scalar accumulation exactly.
+    
+    Returns:
+        One (time, instance) per boundary, where instance is the number of
+        earlier sends, or None if no send time before duration_s reaches it
+    """
+    result = []
+    current_time = 0.0
+    first_instance = 0
+    steps = np.full(chunk_size, interval_s, dtype=np.float64)
+    while current_time < duration_s and len(result) < len(boundaries):
+        steps[0] = current_time
+        times = np.add.accumulate(steps)
+        while len(result) < len(boundaries) and boundaries[len(result)] <= times[-1]:
+            idx = int(np.searchsorted(times, boundaries[len(result)], side='left'))
+            result.append((float(times[idx]), first_instance + idx) if times[idx] < duration_s else None)
+        current_time = float(times[-1]) + interval_s
+        first_instance += chunk_size
+    return result + [None] * (len(boundaries) - len(result))
+
+
+class ScheduleStream:
+    """Lazily generated schedule for a 1553 bus.
+    
+    Produces the same ScheduledMessage sequence as build_schedule_from_icd,
+    but merges the per-message rate generators on demand instead of
+    materializing the whole flight. Memory use is proportional to the number
+    of ICD messages rather than the recording length, so multi-hour builds
+    can start writing immediately.
+    """
+    
+    def __init__(self, icd: ICDDefinition, duration_s: float,
+                 major_frame_s: float = 1.0, minor_frame_s: float = 0.02,
+                 jitter_ms: float = 0.0):
+        """
+        Initialize the stream.
+        
+        Args:
+            icd: ICD definition containing message specifications
+            duration_s: Total duration of the schedule (seconds)
+            major_frame_s: Duration of each major frame (default 1.0s)
+            minor_frame_s: Duration of each minor frame (default 0.02s = 20ms)
+            jitter_ms: Random timing jitter (accepted for API parity, unused
+                like in build_schedule_from_icd)
+        """
+        self.icd = icd
+        self.duration_s = duration_s
+        self.major_frame_duration_s = major_frame_s
+        self.minor_frame_duration_s = minor_frame_s
+        self.minor_frames_per_major = int(major_frame_s / minor_frame_s)
+        self.jitter_ms = jitter_ms
+        self.num_major_frames = math.ceil(duration_s / major_frame_s)
+        self.num_minor_frames = self.num_major_frames * self.minor_frames_per_major
+        
+        # Time window covered by this stream (see split())
+        self.window_start_s = 0.0
+        self.window_end_s = duration_s
+        self.start_times = [0.0] * len(icd.messages)
+        self.start_instances = [0] * len(icd.messages)
+    
+    def _iter_message(self, message_def: MessageDefinition,
+                      start_time: Optional[float] = 0.0,
+                      instance: int = 0) -> Iterator[ScheduledMessage]:
+        """Yield scheduled instances of a single message in time order."""
+        if start_time is None:
+            return
+        minor_frame_s = self.minor_frame_duration_s
+        major_frame_s = self.major_frame_duration_s
+        interval_s = 1.0 / message_def.rate_hz
+        end_s = min(self.window_end_s, self.duration_s)
+        current_time = start_time
+        while current_time < end_s:
+            minor_frame_idx = int(current_time / minor_frame_s)
+            if minor_frame_idx < self.num_minor_frames:
+                yield ScheduledMessage(
+                    message=message_def,
+                    time_s=current_time,
+                    minor_frame=minor_frame_idx,
+                    major_frame=int(current_time / major_frame_s),
+                    instance=instance
+                )
+            current_time += interval_s
+            instance += 1
+    
+    def __iter__(self) -> Iterator[ScheduledMessage]:
+        """Iterate over all scheduled messages in time order.
+        
+        heapq.merge breaks ties by input order, which matches the stable
+        sort applied by build_schedule_from_icd.
+        """
+        return heapq.merge(
+            *(self._iter_message(message_def, start_time, instance)
+              for message_def, start_time, instance
+              in zip(self.icd.messages, self.start_times, self.start_instances)),
+            key=lambda msg: msg.time_s
+        )
+    
+    def split(self, shard_major_frames: int) -> List['ScheduleStream']:
+        """
+        Split the stream into consecutive windows on major-frame boundaries.
+        
+        Each window yields exactly the messages of the full stream whose
+        times fall inside it, with the same accumulated float times, so the
+        windows can be generated independently (e.g. in separate processes).
+        
+        Args:
+            shard_major_frames: Number of major frames per window
+        
+        Returns:
+            List of ScheduleStream windows covering the whole duration
+        """
+        if shard_major_frames < 1:
+            raise ValueError(f"shard_major_frames must be >= 1, got {shard_major_frames}")
+        
+        shard_s = shard_major_frames * self.major_frame_duration_s
+        boundaries = [k * shard_s for k in range(1, math.ceil(self.duration_s / shard_s))]
+        
+        # First accumulated (time, instance) at or after each boundary, per message
+        starts = [
+            [(0.0, 0)] + _first_times_at_or_after(1.0 / message_def.rate_hz, self.duration_s, boundaries)
+            for message_def in self.icd.messages
+        ]
+        
+        windows = []
+        edges = [0.0] + boundaries + [self.duration_s]
+        for k in range(len(edges) - 1):
+            window = ScheduleStream(self.icd, self.duration_s, self.major_frame_duration_s,
+                                    self.minor_frame_duration_s, self.jitter_ms)
+            window.window_start_s = edges[k]
+            window.window_end_s = edges[k + 1]
+            window.start_times = [None if first[k] is None else first[k][0] for first in starts]
+            window.start_instances = [0 if first[k] is None else first[k][1] for first in starts]
+            windows.append(window)
+        return windows
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about the schedule without materializing it."""
+        total_messages = 0
+        unique_messages = 0
+        total_duration = 0.0
+        for message_def in self.icd.messages:
+            count, last_time = _count_message_times(
+                1.0 / message_def.rate_hz, self.duration_s,
+                self.minor_frame_duration_s, self.num_minor_frames
+            )
+            if count:
+                unique_messages += 1
+                total_duration = max(total_duration, last_time)
+            total_messages += count
+        
+        if total_messages == 0:
+            return BusSchedule().get_statistics()
+        
+        if total_duration > 0:
+            average_rate_hz = total_messages / total_duration
+            bus_utilization_percent = (total_messages * 0.001 / total_duration) * 100
+        else:
+            average_rate_hz = 0.0
+            bus_utilization_percent = 0.0
+        
+        return {
+            'total_messages': total_messages,
+            'total_duration_s': total_duration,
+            'major_frames': self.num_major_frames,
+            'minor_frames': self.num_minor_frames,
+            'unique_messages': unique_messages,
+            'average_rate_hz': average_rate_hz,
+            'bus_utilization_percent': bus_utilization_percent
+        }
+
+
+def stream_schedule_from_icd(
+    icd: ICDDefinition,
+    duration_s: float,
+    major_frame_s: float = 1.0,
+    minor_frame_s: float = 0.02,
+    jitter_ms: float = 0.0
+) -> ScheduleStream:
+    """
+    Build a lazily evaluated schedule from ICD definition.
+    
+    Streaming counterpart of build_schedule_from_icd: iterating the result
+    yields the identical message sequence, but messages are generated as
+    they are consumed.
+    
+    Args:
+        icd: ICD definition containing message specifications
+        duration_s: Total duration of the schedule (seconds)
+        major_frame_s: Duration of each major frame (default 1.0s)
+        minor_frame_s: Duration of each minor frame (default 0.02s = 20ms)
+        jitter_ms: Random timing jitter to add (milliseconds)
+    
+    Returns:
+        ScheduleStream: Iterable schedule
+    """
+    return ScheduleStream(icd, duration_s, major_frame_s, minor_frame_s, jitter_ms)
+
+
+# Structured array layout of one scheduled transmission
+SCHEDULE_DTYPE = np.dtype([
+    ('message_index', np.int32),  # Index into the ICD message list
+    ('time_ns', np.int64),  # Time relative to start (integer nanoseconds)
+    ('major_frame', np.int32),
+    ('minor_frame', np.int32),
+    ('instance', np.int32),  # Transmission number of the message (k-th send)
+])
+
+
+def _records_to_messages(messages: List[MessageDefinition],
+                         entries: np.ndarray) -> Iterator[ScheduledMessage]:
+    """Yield a ScheduledMessage per SCHEDULE_DTYPE record."""
+    for index, time_ns, major_frame, minor_frame, instance in zip(
+        entries['message_index'].tolist(), entries['time_ns'].tolist(),
+        entries['major_frame'].tolist(), entries['minor_frame'].tolist(),
+        entries['instance'].tolist()
+    ):
+        yield ScheduledMessage(
+            message=messages[index],
+            time_s=time_ns / NS_PER_S,
+            major_frame=major_frame,
+            minor_frame=minor_frame,
+            instance=instance
+        )
+
+
+def _rate_period_ns(rate_hz: float) -> Fraction:
+    """Exact message period in nanoseconds as a fraction."""
+    if rate_hz <= 0:
+        raise ValueError(f"Message rate must be positive, got {rate_hz}")
+    return Fraction(NS_PER_S) / Fraction(str(rate_hz))
+
+
+def _message_times_ns(period_ns: Fraction, start: int, stop: int) -> np.ndarray:
+    """Times floor(k * period_ns) for k in [start, stop) without drift.
+    
+    The period is split into integer and fractional parts so the products
+    stay within int64 for any realistic recording length.
+    """
+    k = np.arange(start, stop, dtype=np.int64)
+    whole, remainder = divmod(period_ns.numerator, period_ns.denominator)
+    return k * whole + (k * remainder) // period_ns.denominator
+
+
+class ArraySchedule:
+    """Schedule stored as a NumPy structured array.
+    
+    Each transmission takes one SCHEDULE_DTYPE record (24 bytes) instead of
+    a ScheduledMessage object, and times are integer nanoseconds computed as
+    exact multiples of each message period, so they do not drift. Iterating
+    yields ScheduledMessage objects lazily for code that expects them.
+    """
+    
+    def __init__(self, icd: ICDDefinition, entries: np.ndarray, duration_s: float,
+                 major_frame_s: float = 1.0, minor_frame_s: float = 0.02):
+        """
+        Initialize the schedule.
+        
+        Args:
+            icd: ICD definition (message_index refers to icd.messages)
+            entries: SCHEDULE_DTYPE array sorted by time
+            duration_s: Total duration of the schedule (seconds)
+            major_frame_s: Duration of each major frame
+            minor_frame_s: Duration of each minor frame
+        """
+        self.icd = icd
+        self.entries = entries
+        self.duration_s = duration_s
+        self.major_frame_duration_s = major_frame_s
+        self.minor_frame_duration_s = minor_frame_s
+        self.minor_frames_per_major = int(major_frame_s / minor_frame_s)
+        self.num_major_frames = math.ceil(duration_s / major_frame_s)
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the schedule records."""
+        return self.entries.nbytes
+    
+    @property
+    def times_s(self) -> np.ndarray:
+        """Message times in seconds."""
+        return self.entries['time_ns'] / NS_PER_S
+    
+    def _to_messages(self, entries: np.ndarray) -> Iterator[ScheduledMessage]:
+        return _records_to_messages(self.icd.messages, entries)
+    
+    def __iter__(self) -> Iterator[ScheduledMessage]:
+        """Lazily yield ScheduledMessage objects in time order."""
+        for start in range(0, len(self.entries), 1 << 14):
+            yield from self._to_messages(self.entries[start:start + (1 << 14)])
+    
+    def get_messages_in_window(self, start_time_s: float, end_time_s: float) -> List[ScheduledMessage]:
+        """Get messages within a time window."""
+        times = self.entries['time_ns']
+        lo = np.searchsorted(times, int(math.ceil(start_time_s * NS_PER_S)), side='left')
+        hi = np.searchsorted(times, int(math.ceil(end_time_s * NS_PER_S)), side='left')
+        return list(self._to_messages(self.entries[lo:hi]))
+    
+    def to_bus_schedule(self) -> BusSchedule:
+        """Materialize as a BusSchedule of ScheduledMessage objects."""
+        schedule = BusSchedule(
+            messages=list(self),
+            major_frame_duration_s=self.major_frame_duration_s,
+            minor_frame_duration_s=self.minor_frame_duration_s,
+            minor_frames_per_major=self.minor_frames_per_major
+        )
+        schedule._build_frames()
+        return schedule
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about the schedule."""
+        if not len(self.entries):
+            return BusSchedule().get_statistics()
+        
+        total_messages = len(self.entries)
+        total_duration = int(self.entries['time_ns'].max()) / NS_PER_S
+        if total_duration > 0:
+            average_rate_hz = total_messages / total_duration
+            bus_utilization_percent = (total_messages * 0.001 / total_duration) * 100
+        else:
+            average_rate_hz = 0.0
+            bus_utilization_percent = 0.0
+        
+        return {
+            'total_messages': total_messages,
+            'total_duration_s': total_duration,
+            'major_frames': self.num_major_frames,
+            'minor_frames': self.num_major_frames * self.minor_frames_per_major,
+            'unique_messages': len(np.unique(self.entries['message_index'])),
+            'average_rate_hz': average_rate_hz,
+            'bus_utilization_percent': bus_utilization_percent
+        }
+
+
+def build_array_schedule_from_icd(
+    icd: ICDDefinition,
+    duration_s: float,
+    major_frame_s: float = 1.0,
+    minor_frame_s: float = 0.02,
+    jitter_ms: float = 0.0,
+    rng=None
+) -> ArraySchedule:
+    """
+    Build an array-backed schedule from ICD definition.
+    
+    Message k of a rate is sent at floor(k * 1e9 / rate_hz) ns, computed
+    with exact integer arithmetic per message (np.arange, no accumulation).
+    Jitter is drawn for all transmissions at once.
+    
+    Args:
+        icd: ICD definition containing message specifications
+        duration_s: Total duration of the schedule (seconds)
+        major_frame_s: Duration of each major frame (default 1.0s)
+        minor_frame_s: Duration of each minor frame (default 0.02s = 20ms)
+        jitter_ms: Uniform random timing jitter (+/- milliseconds)
+        rng: Object with a uniform(low, high, size) method (default: the
+            global np.random state)
+    
+    Returns:
+        ArraySchedule sorted by time (ties keep ICD order)
+    """
+    duration_ns = int(round(duration_s * NS_PER_S))
+    major_ns = int(round(major_frame_s * NS_PER_S))
+    minor_ns = int(round(minor_frame_s * NS_PER_S))
+    
+    indices = []
+    times = []
+    instances = []
+    for message_index, message_def in enumerate(icd.messages):
+        period_ns = _rate_period_ns(message_def.rate_hz)
+        # floor(k * period) < duration  <=>  k < duration / period
+        count = math.ceil(duration_ns / period_ns)
+        times.append(_message_times_ns(period_ns, 0, count))
+        indices.append(np.full(count, message_index, dtype=np.int32))
+        instances.append(np.arange(count, dtype=np.int32))
+    
+    entries = np.empty(sum(len(t) for t in times), dtype=SCHEDULE_DTYPE)
+    if len(entries):
+        time_ns = np.concatenate(times)
+        if jitter_ms > 0:
+            rng = rng if rng is not None else np.random
+            jitter_ns = rng.uniform(-jitter_ms * 1e6, jitter_ms * 1e6, len(time_ns))
+            time_ns = np.clip(time_ns + np.rint(jitter_ns).astype(np.int64), 0, duration_ns - 1)
+        order = np.argsort(time_ns, kind='stable')
+        entries['message_index'] = np.concatenate(indices)[order]
+        entries['time_ns'] = time_ns[order]
+        entries['major_frame'] = entries['time_ns'] // major_ns
+        entries['minor_frame'] = entries['time_ns'] // minor_ns
+        entries['instance'] = np.concatenate(instances)[order]
+    
+    return ArraySchedule(icd, entries, duration_s, major_frame_s, minor_frame_s)
+
+
+def _fraction_lcm(a: Fraction, b: Fraction) -> Fraction:
+    """Least common multiple of two positive fractions."""
+    return Fraction(math.lcm(a.numerator, b.numerator), math.gcd(a.denominator, b.denominator))
+
+
+class PeriodicSchedule:
+    """Schedule stored as one hyperperiod tiled on demand.
+    
+    The hyperperiod is the least common multiple of all message periods and
+    the major frame, so the transmission pattern repeats exactly every
+    hyperperiod. Only one hyperperiod of SCHEDULE_DTYPE records is kept;
+    later tiles are the same records offset by a multiple of the
+    hyperperiod. Build cost and memory depend on the ICD, not the recording
+    length, and times are identical to build_array_schedule_from_icd.
+    
+    Jitter is drawn per tile from a generator seeded by the tile index, so
+    any tile can be generated independently and in any order.
+    """
+    
+    def __init__(self, icd: ICDDefinition, duration_s: float,
+                 major_frame_s: float = 1.0, minor_frame_s: float = 0.02,
+                 jitter_ms: float = 0.0, seed: Optional[int] = None):
+        """
+        Initialize the schedule.
+        
+        Args:
+            icd: ICD definition containing message specifications
+            duration_s: Total duration of the schedule (seconds)
+            major_frame_s: Duration of each major frame (default 1.0s)
+            minor_frame_s: Duration of each minor frame (default 0.02s = 20ms)
+            jitter_ms: Uniform random timing jitter (+/- milliseconds)
+            seed: Seed for the per-tile jitter generators (random if None)
+        """
+        self.icd = icd
+        self.duration_s = duration_s
+        self.major_frame_duration_s = major_frame_s
+        self.minor_frame_duration_s = minor_frame_s
+        self.minor_frames_per_major = int(major_frame_s / minor_frame_s)
+        self.num_major_frames = math.ceil(duration_s / major_frame_s)
+        self.jitter_ms = jitter_ms
+        self.entropy = np.random.SeedSequence(seed).entropy
+        
+        self.duration_ns = int(round(duration_s * NS_PER_S))
+        self.major_frame_ns = int(round(major_frame_s * NS_PER_S))
+        self.minor_frame_ns = int(round(minor_frame_s * NS_PER_S))
+        
+        periods = [_rate_period_ns(message_def.rate_hz) for message_def in icd.messages]
+        hyperperiod = Fraction(self.major_frame_ns)
+        for period in periods:
+            hyperperiod = _fraction_lcm(hyperperiod, period)
+        # Irregular rates can make the hyperperiod longer than the recording;
+        # then a single (truncated) tile covers everything
+        self.hyperperiod_ns = min(int(hyperperiod), max(self.duration_ns, 1))
+        self.num_tiles = math.ceil(self.duration_ns / self.hyperperiod_ns) if self.duration_ns > 0 else 0
+        
+        # One hyperperiod of records, sorted by time (ties keep ICD order)
+        indices = []
+        times = []
+        instances = []
+        for message_index, period in enumerate(periods):
+            count = math.ceil(min(self.hyperperiod_ns, self.duration_ns) / period)
+            times.append(_message_times_ns(period, 0, count))
+            indices.append(np.full(count, message_index, dtype=np.int32))
+            instances.append(np.arange(count, dtype=np.int32))
+        base_times = np.concatenate(times) if times else np.empty(0, dtype=np.int64)
+        order = np.argsort(base_times, kind='stable')
+        self.base_time_ns = base_times[order]
+        self.base_message_index = (np.concatenate(indices)[order] if indices
+                                   else np.empty(0, dtype=np.int32))
+        self.base_instance = (np.concatenate(instances)[order] if instances
+                              else np.empty(0, dtype=np.int32))
+        # Sends of each message per tile (each tile continues the counters)
+        self.sends_per_tile = np.array([len(t) for t in times], dtype=np.int32)
+    
+    def _tile_count(self, tile: int) -> int:
+        """Number of records in a tile (the last tile may be truncated)."""
+        remaining_ns = self.duration_ns - tile * self.hyperperiod_ns
+        if remaining_ns >= self.hyperperiod_ns:
+            return len(self.base_time_ns)
+        return int(np.searchsorted(self.base_time_ns, remaining_ns, side='left'))
+    
+    def __len__(self) -> int:
+        if self.num_tiles == 0:
+            return 0
+        return (self.num_tiles - 1) * len(self.base_time_ns) + self._tile_count(self.num_tiles - 1)
+    
+    def tile(self, tile: int) -> np.ndarray:
+        """
+        Generate the records of one tile.
+        
+        Args:
+            tile: Tile index (0 to num_tiles - 1)
+        
+        Returns:
+            SCHEDULE_DTYPE array (unsorted across tile edges when jittered)
+        """
+        count = self._tile_count(tile)
+        time_ns = self.base_time_ns[:count] + tile * self.hyperperiod_ns
+        message_index = self.base_message_index[:count]
+        instance = self.base_instance[:count] + tile * self.sends_per_tile[message_index]
+        if self.jitter_ms > 0 and count:
+            rng = np.random.default_rng(np.random.SeedSequence(self.entropy, spawn_key=(tile,)))
+            jitter_ns = rng.uniform(-self.jitter_ms * 1e6, self.jitter_ms * 1e6, count)
+            time_ns = np.clip(time_ns + np.rint(jitter_ns).astype(np.int64), 0, self.duration_ns - 1)
+            order = np.argsort(time_ns, kind='stable')
+            time_ns = time_ns[order]
+            message_index = message_index[order]
+            instance = instance[order]
+        
+        entries = np.empty(count, dtype=SCHEDULE_DTYPE)
+        entries['message_index'] = message_index
+        entries['time_ns'] = time_ns
+        entries['major_frame'] = time_ns // self.major_frame_ns
+        entries['minor_frame'] = time_ns // self.minor_frame_ns
+        entries['instance'] = instance
+        return entries
+    
+    def iter_chunks(self) -> Iterator[np.ndarray]:
+        """Yield SCHEDULE_DTYPE arrays in global time order, about one tile each.
+        
+        Jitter can move a record across a tile edge, so records that could
+        still be preceded by the next tile's earliest record are carried over.
+        """
+        jitter_ns = int(math.ceil(self.jitter_ms * 1e6)) if self.jitter_ms > 0 else 0
+        carry = np.empty(0, dtype=SCHEDULE_DTYPE)
+        for tile in range(self.num_tiles):
+            entries = self.tile(tile)
+            if jitter_ns and len(carry):
+                entries = np.concatenate([carry, entries])
+                entries = entries[np.argsort(entries['time_ns'], kind='stable')]
+            if jitter_ns and tile + 1 < self.num_tiles:
+                cut = int(np.searchsorted(entries['time_ns'],
+                                          (tile + 1) * self.hyperperiod_ns - jitter_ns, side='left'))
+                entries, carry = entries[:cut], entries[cut:]
+            if len(entries):
+                yield entries
+    
+    def __iter__(self) -> Iterator[ScheduledMessage]:
+        """Lazily yield ScheduledMessage objects in time order."""
+        for entries in self.iter_chunks():
+            yield from _records_to_messages(self.icd.messages, entries)
+    
+    def to_array_schedule(self) -> ArraySchedule:
+        """Materialize all tiles as an ArraySchedule."""
+        chunks = list(self.iter_chunks())
+        entries = np.concatenate(chunks) if chunks else np.empty(0, dtype=SCHEDULE_DTYPE)
+        return ArraySchedule(self.icd, entries, self.duration_s,
+                             self.major_frame_duration_s, self.minor_frame_duration_s)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about the schedule without tiling it."""
+        total_messages = len(self)
+        if total_messages == 0:
+            return BusSchedule().get_statistics()
+        
+        last_tile = self.num_tiles - 1
+        while self._tile_count(last_tile) == 0:
+            last_tile -= 1
+        total_duration = int(self.tile(last_tile)['time_ns'].max()) / NS_PER_S
+        if self.jitter_ms > 0 and last_tile > 0:
+            # Jitter can push the previous tile's records past this one's
+            total_duration = max(total_duration,
+                                 int(self.tile(last_tile - 1)['time_ns'].max()) / NS_PER_S)
+        
+        if total_duration > 0:
+            average_rate_hz = total_messages / total_duration
+            bus_utilization_percent = (total_messages * 0.001 / total_duration) * 100
+        else:
+            average_rate_hz = 0.0
+            bus_utilization_percent = 0.0
+        
+        return {
+            'total_messages': total_messages,
+            'total_duration_s': total_duration,
+            'major_frames': self.num_major_frames,
+            'minor_frames': self.num_major_frames * self.minor_frames_per_major,
+            'unique_messages': len(np.unique(self.base_message_index[:self._tile_count(0)])),
+            'average_rate_hz': average_rate_hz,
+            'bus_utilization_percent': bus_utilization_percent
+        }
+
+
+def build_periodic_schedule_from_icd(
+    icd: ICDDefinition,
+    duration_s: float,
+    major_frame_s: float = 1.0,
+    minor_frame_s: float = 0.02,
+    jitter_ms: float = 0.0,
+    seed: Optional[int] = None
+) -> PeriodicSchedule:
+    """
+    Build a hyperperiod-tiled schedule from ICD definition.
+    
+    Yields the same transmissions as build_array_schedule_from_icd, but only
+    one hyperperiod is computed up front; the rest is tiled as it is
+    consumed, so 8-hour schedules cost no more to build than one hyperperiod.
+    
+    Args:
+        icd: ICD definition containing message specifications
+        duration_s: Total duration of the schedule (seconds)
+        major_frame_s: Duration of each major frame (default 1.0s)
+        minor_frame_s: Duration of each minor frame (default 0.02s = 20ms)
+        jitter_ms: Uniform random timing jitter (+/- milliseconds)
+        seed: Seed for the per-tile jitter generators
+    
+    Returns:
+        PeriodicSchedule
+    """
+    return PeriodicSchedule(icd, duration_s, major_frame_s, minor_frame_s, jitter_ms, seed)
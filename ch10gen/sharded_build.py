@@ -0,0 +1,304 @@
+"""
+Multiprocess time-sharded Chapter 10 builds.
+
+The schedule is split into fixed-size windows on major-frame boundaries
+(ScheduleStream.split). Each window's time and 1553 packets are generated
+independently in a worker process, written to a temporary shard file, and
+the shards are concatenated in order behind a single TMATS packet and the
+initial time packet.
+
+Determinism:
+- Shard boundaries depend only on shard_major_frames, never on the number
+  of workers
+- Each shard draws scenario data and errors from its own RNGService child
+  of the root seed (and seeds random/np.random the same way, restoring
+  their state afterwards), so a shard's content does not depend on which
+  process ran it
+- Packet packing restarts at each shard boundary
+
+The output is therefore byte-identical for any worker count.
+"""
+
+import random
+import shutil
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+try:
+    from .ch10_writer import Ch10Writer, Ch10WriterConfig
+    from .schedule import ScheduleStream
+    from .flight_profile import FlightProfile
+    from .icd import ICDDefinition
+    from .utils.errors import MessageErrorInjector, ErrorType
+    from .utils.rng import RNGService
+except ImportError:
+    from ch10_writer import Ch10Writer, Ch10WriterConfig
+    from schedule import ScheduleStream
+    from flight_profile import FlightProfile
+    from icd import ICDDefinition
+    from utils.errors import MessageErrorInjector, ErrorType
+    from utils.rng import RNGService
+
+
+DEFAULT_SHARD_MAJOR_FRAMES = 60  # One minute per shard with 1 s major frames
+
+
+def _seed_shard(entropy: int, index: int) -> None:
+    """Seed the global random generators for one shard."""
+    seed_seq = np.random.SeedSequence(entropy, spawn_key=(index,))
+    random.seed(int.from_bytes(seed_seq.generate_state(4).tobytes(), 'little'))
+    np.random.seed(seed_seq.generate_state(4))
+
+
+def _write_shard(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate one shard file (runs in a worker process).
+
+    Args:
+        task: Shard description built by ShardedCh10Writer
+
+    Returns:
+        Shard statistics from Ch10Writer.write_shard plus error counts
+    """
+    # Shards of single-worker builds run in the caller's process
+    random_state = random.getstate()
+    np_random_state = np.random.get_state()
+    try:
+        return _generate_shard(task)
+    finally:
+        random.setstate(random_state)
+        np.random.set_state(np_random_state)
+
+
+def _generate_shard(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate one shard file with the shard's seeded random generators."""
+    _seed_shard(task['entropy'], task['index'])
+    rng_service = RNGService(task['entropy']).child(task['index'])
+
+    error_injector = None
+    if task['error_config'] is not None:
+        error_injector = MessageErrorInjector(task['error_config'],
+                                              rng=rng_service.stream('errors'))
+        error_injector.current_bus = task['initial_bus']
+
+    writer = Ch10Writer(task['config'], writer_backend=task['writer_backend'])
+    writer.rng_service = rng_service
+    with open(task['path'], 'wb') as f:
+        stats = writer.write_shard(
+            f, task['window'], task['flight_profile'], task['icd'],
+            error_injector=error_injector,
+            start_time=task['start_time'],
+            scenario_config=task['scenario_config'],
+            last_message_time_s=task['last_message_time_s'],
+            last_ipts=task.get('last_ipts')
+        )
+
+    stats['index'] = task['index']
+    stats['path'] = task['path']
+    if error_injector:
+        stats['error_counts'] = dict(error_injector.error_count)
+        stats['error_messages'] = error_injector.message_count
+    return stats
+
+
+def _merge_cache_statistics(shard_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum per-shard payload cache statistics."""
+    merged = {key: sum(stats[key] for stats in shard_stats)
+              for key in ('hits', 'misses', 'evictions', 'entries')}
+    lookups = merged['hits'] + merged['misses']
+    merged['hit_rate'] = merged['hits'] / lookups if lookups else 0.0
+    return merged
+
+
+class ShardedCh10Writer(Ch10Writer):
+    """Chapter 10 writer that generates time shards in parallel."""
+
+    def __init__(self, config: Ch10WriterConfig = None, writer_backend: str = 'pyc10',
+                 workers: int = 1,
+                 shard_major_frames: int = DEFAULT_SHARD_MAJOR_FRAMES,
+                 seed: Optional[int] = None):
+        """
+        Initialize sharded writer.
+
+        Args:
+            config: Writer configuration
+            writer_backend: Writer backend name
+            workers: Number of worker processes (1 = generate in-process)
+            shard_major_frames: Major frames per shard
+            seed: Root seed for the per-shard random streams (random if None)
+        """
+        super().__init__(config, writer_backend=writer_backend)
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.workers = workers
+        self.shard_major_frames = shard_major_frames
+        self.entropy = np.random.SeedSequence(seed).entropy
+
+    def write_file(self, filepath: Path, schedule: ScheduleStream,
+                   flight_profile: FlightProfile,
+                   icd: ICDDefinition,
+                   error_injector: Optional[MessageErrorInjector] = None,
+                   start_time: datetime = None,
+                   scenario_name: str = "Demo Mission",
+                   scenario_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Write complete Chapter 10 file from parallel shards.
+
+        Args:
+            filepath: Output file path
+            schedule: Streaming schedule (from stream_schedule_from_icd)
+            flight_profile: Flight profile generator
+            icd: ICD definition
+            error_injector: Optional error injector (collects shard statistics)
+            start_time: Start time (defaults to now)
+            scenario_name: Scenario name for TMATS
+            scenario_config: Scenario configuration for data generation
+
+        Returns:
+            Statistics dictionary
+        """
+        if not isinstance(schedule, ScheduleStream):
+            raise TypeError("Sharded builds require a ScheduleStream (use stream_schedule_from_icd)")
+
+        if start_time is None:
+            start_time = datetime.now(timezone.utc)
+
+        self.start_time = start_time
+        self.message_count = 0
+        self.packet_count = 0
+
+        schedule_stats = schedule.get_statistics()
+        last_time_relative_s = schedule_stats['total_duration_s'] if schedule_stats['total_messages'] else None
+        windows = schedule.split(self.shard_major_frames)
+
+        # Shards starting after the bus failover time start on bus B
+        failover_time_s = None
+        initial_bus = 'A'
+        if error_injector:
+            failover_time_s = error_injector.config.bus_failover_time_s
+            initial_bus = error_injector.current_bus
+
+        def shard_bus(window: ScheduleStream) -> str:
+            if failover_time_s is not None and failover_time_s < window.window_start_s:
+                return 'B'
+            return initial_bus
+
+        filepath = Path(filepath)
+        self.filepath = filepath
+        build_start = time.perf_counter()
+        self.file = self._open_output(filepath)
+
+        try:
+            self._write_tmats_packet(scenario_name, icd, schedule)
+            self._write_time_packet(start_time)
+
+            with tempfile.TemporaryDirectory(dir=filepath.parent, prefix='.ch10gen_shards_') as tmpdir:
+                tasks = (
+                    {
+                        'index': index,
+                        'path': str(Path(tmpdir) / f'shard_{index:06d}.c10'),
+                        'window': window,
+                        'entropy': self.entropy,
+                        'config': self.config,
+                        'writer_backend': self.writer_backend_name,
+                        'flight_profile': flight_profile,
+                        'icd': icd,
+                        'error_config': error_injector.config if error_injector else None,
+                        'initial_bus': shard_bus(window),
+                        'start_time': start_time,
+                        'scenario_config': scenario_config,
+                        'last_message_time_s': last_time_relative_s,
+                    }
+                    for index, window in enumerate(windows)
+                )
+
+                last_ipts = -1
+                cache_stats = []
+                for task, stats in self._run_tasks(tasks):
+                    first_time_s = stats['first_time_s']
+                    if first_time_s is not None and int(first_time_s * 1_000_000_000) <= last_ipts:
+                        # The previous shard's IPTS ran past this shard's first
+                        # message; regenerate it continuing from there
+                        task['last_ipts'] = last_ipts
+                        stats = _write_shard(task)
+
+                    with open(stats['path'], 'rb') as shard_file:
+                        shutil.copyfileobj(shard_file, self.file)
+                    Path(stats['path']).unlink()
+
+                    self.packet_count += stats['total_packets']
+                    self.message_count += stats['total_messages']
+                    last_ipts = stats['last_ipts']
+                    if 'payload_cache' in stats:
+                        cache_stats.append(stats['payload_cache'])
+                    if error_injector and 'error_counts' in stats:
+                        self._merge_error_counts(error_injector, task, stats)
+
+            if last_time_relative_s is not None:
+                last_time_abs = datetime.fromtimestamp(start_time.timestamp() + last_time_relative_s, tz=start_time.tzinfo)
+                self._write_time_packet(last_time_abs)
+
+        finally:
+            if self.file:
+                self.file.close()
+
+        stats = {
+            'total_packets': self.packet_count,
+            'total_messages': self.message_count,
+            'file_size_bytes': self.filepath.stat().st_size if self.filepath.exists() else 0,
+            'duration_s': last_time_relative_s if last_time_relative_s is not None else 0,
+            'workers': self.workers,
+            'shards': len(windows)
+        }
+        if cache_stats:
+            stats['payload_cache'] = _merge_cache_statistics(cache_stats)
+        self._add_io_statistics(stats, time.perf_counter() - build_start)
+        return stats
+
+    @staticmethod
+    def _merge_error_counts(error_injector: MessageErrorInjector, task: Dict[str, Any],
+                            stats: Dict[str, Any]) -> None:
+        """Add one shard's error counts, counting the bus failover only once.
+
+        The failover happens in the first shard that either switched buses
+        itself or started on bus B without an earlier shard having switched
+        (no message between the failover time and its window start).
+        """
+        counts = dict(stats['error_counts'])
+        switched = counts.pop(ErrorType.BUS_FAILOVER, 0) > 0
+        if task['initial_bus'] == 'B' and stats['total_messages']:
+            switched = True
+        if switched and error_injector.current_bus == 'A':
+            error_injector.current_bus = 'B'
+            error_injector.error_count[ErrorType.BUS_FAILOVER] += 1
+        for error_type, count in counts.items():
+            error_injector.error_count[error_type] += count
+        error_injector.message_count += stats['error_messages']
+
+    def _run_tasks(self, tasks):
+        """Yield (task, stats) in shard order.
+
+        At most 2 * workers shards are in flight, so the temporary shard
+        files on disk stay bounded regardless of recording length.
+        """
+        if self.workers == 1:
+            for task in tasks:
+                yield task, _write_shard(task)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for task in tasks:
+                pending.append((task, pool.submit(_write_shard, task)))
+                if len(pending) >= 2 * self.workers:
+                    task, future = pending.popleft()
+                    yield task, future.result()
+            while pending:
+                task, future = pending.popleft()
+                yield task, future.result()
@@ -0,0 +1,166 @@
+"""Batched output stage for Chapter 10 files.
+
+Packets are appended to a large in-memory batch. Full batches are handed
+through a bounded queue to a background thread that performs one large
+write per batch, so packet encoding and disk I/O overlap. A full queue
+blocks the producer (backpressure), which bounds memory to
+(queue_depth + 1) batches.
+
+The stage records how long the producer was blocked on I/O and how long
+the writer thread spent writing and syncing, to tell CPU-bound builds
+from disk-bound ones (e.g. on network storage).
+"""
+
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+FSYNC_POLICIES = ('none', 'batch', 'close')
+
+_SENTINEL = None
+
+
+class BatchedFileWriter:
+    """File-like writer that coalesces packets into large batched writes."""
+
+    def __init__(self, filepath: Union[str, Path], batch_bytes: int = 4 << 20,
+                 queue_depth: int = 2, fsync: str = 'none', threaded: bool = True):
+        """
+        Open the output file.
+
+        Args:
+            filepath: Output file path
+            batch_bytes: Batch size that triggers a hand-off to the writer
+            queue_depth: Batches that may wait for the writer (2 = double
+                buffering); the producer blocks when the queue is full
+            fsync: 'none', 'batch' (after every batch) or 'close'
+            threaded: Write batches from a background thread (False writes
+                them synchronously, still coalesced)
+
+        Raises:
+            ValueError: If the fsync policy or sizes are invalid
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        if batch_bytes < 1 or queue_depth < 1:
+            raise ValueError("batch_bytes and queue_depth must be positive")
+
+        self.batch_bytes = batch_bytes
+        self.fsync = fsync
+        self.threaded = threaded
+        self.file = open(filepath, 'wb')
+        self.closed = False
+
+        self._batch = bytearray()
+        self._error: Optional[BaseException] = None
+        self._error_reported = False
+
+        # Timing counters (seconds)
+        self.blocked_s = 0.0  # Producer waiting on I/O
+        self.write_s = 0.0  # Inside file.write
+        self.fsync_s = 0.0  # Inside os.fsync
+        self.bytes_written = 0
+        self.batches = 0
+
+        if threaded:
+            self._queue = queue.Queue(maxsize=queue_depth)
+            self._thread = threading.Thread(target=self._run, name='ch10-writer', daemon=True)
+            self._thread.start()
+
+    def write(self, data) -> int:
+        """Append data (bytes-like; copied) to the current batch."""
+        self._batch += data
+        if len(self._batch) >= self.batch_bytes:
+            self._hand_off()
+        return len(data)
+
+    def flush(self) -> None:
+        """Hand off the current batch (it is written asynchronously)."""
+        if self._batch:
+            self._hand_off()
+
+    def _hand_off(self) -> None:
+        batch, self._batch = self._batch, bytearray()
+        if not self.threaded:
+            start = time.perf_counter()
+            self._write_batch(batch)
+            self.blocked_s += time.perf_counter() - start
+            return
+
+        self._raise_if_failed()
+        start = time.perf_counter()
+        self._queue.put(batch)
+        self.blocked_s += time.perf_counter() - start
+
+    def _write_batch(self, batch: bytearray) -> None:
+        start = time.perf_counter()
+        self.file.write(batch)
+        self.write_s += time.perf_counter() - start
+        self.bytes_written += len(batch)
+        self.batches += 1
+        if self.fsync == 'batch':
+            self._sync()
+
+    def _sync(self) -> None:
+        start = time.perf_counter()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.fsync_s += time.perf_counter() - start
+
+    def _run(self) -> None:
+        """Writer thread: write batches until the sentinel arrives."""
+        while True:
+            batch = self._queue.get()
+            if batch is _SENTINEL:
+                return
+            if self._error is None:
+                try:
+                    self._write_batch(batch)
+                except BaseException as e:  # Reported to the producer
+                    self._error = e
+
+    def _raise_if_failed(self) -> None:
+        # Each failure is raised once, so close() during cleanup does not
+        # mask the original error
+        if self._error is not None and not self._error_reported:
+            self._error_reported = True
+            raise IOError(f"Background write failed: {self._error}") from self._error
+
+    def close(self) -> None:
+        """Write remaining data, stop the writer thread and close the file."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            if self._batch and self._error is None:
+                self._hand_off()
+            if self.threaded:
+                start = time.perf_counter()
+                self._queue.put(_SENTINEL)
+                self._thread.join()
+                self.blocked_s += time.perf_counter() - start
+                self._raise_if_failed()
+            if self.fsync == 'close':
+                self._sync()
+        finally:
+            self.file.close()
+
+    def __enter__(self) -> 'BatchedFileWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get I/O statistics."""
+        return {
+            'mode': 'thread' if self.threaded else 'sync',
+            'bytes_written': self.bytes_written,
+            'batches': self.batches,
+            'io_blocked_s': self.blocked_s,
+            'io_write_s': self.write_s,
+            'fsync_s': self.fsync_s,
+        }
@@ -9,6 +9,7 @@ Key components:
 - ErrorType: Enumeration of supported error types
 - ErrorInjectionConfig: Configuration for error injection rates
 - MessageErrorInjector: Main class for injecting errors into messages
+  (per message, or per block of messages with NumPy masks)
 
 The error injection system supports:
 - Parity errors: Bit errors in transmitted words
@@ -20,11 +21,26 @@ This is essential for creating comprehensive test data that exercises
 error handling and recovery mechanisms in ground station software.
 """
 
-import random
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 from enum import IntEnum
 
+import numpy as np
+
+from .rng import RNGService, RandomStream
+
+_default_stream: Optional[RandomStream] = None
+
+
+def _error_stream(rng: Optional[RandomStream]) -> RandomStream:
+    """The given stream, or a shared unseeded one."""
+    global _default_stream
+    if rng is not None:
+        return rng
+    if _default_stream is None:
+        _default_stream = RNGService().stream('errors')
+    return _default_stream
+
 
 class ErrorType(IntEnum):
     """
@@ -44,6 +60,43 @@ class ErrorType(IntEnum):
     BUS_FAILOVER = 7  # Bus A/B failover event
 
 
+# Error types in the order they are checked (one error per message)
+ERROR_PRIORITY = (
+    ErrorType.NO_RESPONSE,
+    ErrorType.PARITY_ERROR,
+    ErrorType.LATE_RESPONSE,
+    ErrorType.WORD_COUNT_MISMATCH,
+    ErrorType.MANCHESTER_ERROR,
+    ErrorType.SYNC_ERROR,
+)
+
+_RATE_ATTRIBUTES = {
+    ErrorType.NO_RESPONSE: 'no_response_percent',
+    ErrorType.PARITY_ERROR: 'parity_error_percent',
+    ErrorType.LATE_RESPONSE: 'late_response_percent',
+    ErrorType.WORD_COUNT_MISMATCH: 'word_count_error_percent',
+    ErrorType.MANCHESTER_ERROR: 'manchester_error_percent',
+    ErrorType.SYNC_ERROR: 'sync_error_percent',
+}
+
+# Status word bits set by response and sync errors
+_STATUS_BITS = {
+    ErrorType.NO_RESPONSE: 1 << 3,     # Busy bit
+    ErrorType.LATE_RESPONSE: 1 << 9,   # Instrumentation bit
+    ErrorType.SYNC_ERROR: 1 << 10,     # Message error bit
+}
+
+
+@dataclass
+class ErrorBatch:
+    """Words of a block of messages after error injection."""
+    command_words: np.ndarray  # uint16 (n,)
+    status_words: np.ndarray   # uint16 (n,)
+    data_words: np.ndarray     # uint16 (n, width); row i uses its first word_counts[i] words
+    word_counts: np.ndarray    # int64 (n,)
+    error_types: np.ndarray    # int8 (n,) ErrorType values
+
+
 @dataclass
 class ErrorInjectionConfig:
     """Configuration for error injection."""
@@ -67,31 +120,49 @@ class ErrorInjectionConfig:
             if hasattr(self, key):
                 setattr(self, key, value)
     
-    def should_inject_error(self, error_type: ErrorType) -> bool:
+    def should_inject_error(self, error_type: ErrorType,
+                            rng: Optional[RandomStream] = None) -> bool:
         """Determine if an error should be injected based on probability."""
+        rng = _error_stream(rng)
         if error_type == ErrorType.PARITY_ERROR:
-            return random.random() * 100 < self.parity_error_percent
+            return rng.random() * 100 < self.parity_error_percent
         elif error_type == ErrorType.NO_RESPONSE:
-            return random.random() * 100 < self.no_response_percent
+            return rng.random() * 100 < self.no_response_percent
         elif error_type == ErrorType.LATE_RESPONSE:
-            return random.random() * 100 < self.late_response_percent
+            return rng.random() * 100 < self.late_response_percent
         elif error_type == ErrorType.WORD_COUNT_MISMATCH:
-            return random.random() * 100 < self.word_count_error_percent
+            return rng.random() * 100 < self.word_count_error_percent
         elif error_type == ErrorType.MANCHESTER_ERROR:
-            return random.random() * 100 < self.manchester_error_percent
+            return rng.random() * 100 < self.manchester_error_percent
         elif error_type == ErrorType.SYNC_ERROR:
-            return random.random() * 100 < self.sync_error_percent
+            return rng.random() * 100 < self.sync_error_percent
         return False
     
-    def get_timestamp_jitter_us(self) -> int:
+    def get_timestamp_jitter_us(self, rng: Optional[RandomStream] = None) -> int:
         """Get random timestamp jitter in microseconds."""
         if self.timestamp_jitter_ms <= 0:
             return 0
         
         # Generate random jitter within ± jitter_ms
-        jitter_ms = random.uniform(-self.timestamp_jitter_ms, self.timestamp_jitter_ms)
+        jitter_ms = _error_stream(rng).uniform(-self.timestamp_jitter_ms, self.timestamp_jitter_ms)
         return int(jitter_ms * 1000)
     
+    def error_probabilities(self) -> List[Tuple['ErrorType', float]]:
+        """
+        Probability of each error type for one message.
+        
+        Types are checked in priority order and only the first hit is
+        injected, so each probability is its rate times the chance that
+        no earlier type was hit.
+        """
+        probabilities = []
+        remaining = 1.0
+        for error_type in ERROR_PRIORITY:
+            rate = min(max(getattr(self, _RATE_ATTRIBUTES[error_type]) / 100, 0.0), 1.0)
+            probabilities.append((error_type, remaining * rate))
+            remaining *= 1 - rate
+        return probabilities
+    
     def should_switch_bus(self, current_time_s: float) -> bool:
         """Check if bus should switch at current time."""
         if self.bus_failover_time_s is None:
@@ -115,22 +186,24 @@ class MessageErrorInjector:
     - Bus selection (A/B failover)
     """
     
-    def __init__(self, config: ErrorInjectionConfig, seed: Optional[int] = None):
+    def __init__(self, config: ErrorInjectionConfig, seed: Optional[int] = None,
+                 rng: Optional[RandomStream] = None):
         """
         Initialize with error configuration.
         
         Args:
             config: Error injection configuration with rates and timing
             seed: Random seed for reproducible error injection
+            rng: Random stream to draw from (overrides seed)
         """
         self.config = config
         self.current_bus = 'A'  # Track which bus is currently active
         self.error_count = {error_type: 0 for error_type in ErrorType}  # Error statistics
         self.message_count = 0  # Track total messages processed
         
-        # Set random seed if provided for reproducible error patterns
-        if seed is not None:
-            random.seed(seed)
+        # Own stream, so seeding does not touch the global random module
+        self.rng = rng if rng is not None else RNGService(seed).stream('errors')
+        self._decision_rates = None  # Rates the cached decision table was built for
     
     def inject_errors(self, message_time_s_or_message, command_word=None, 
                      status_word=None, data_words=None) -> Tuple[int, int, List[int], ErrorType]:
@@ -175,7 +248,7 @@ class MessageErrorInjector:
         # Apply error based on type
         if error_type == ErrorType.PARITY_ERROR:
             # Flip a bit in status word to cause parity error
-            status_word ^= (1 << random.randint(0, 15))
+            status_word ^= (1 << self.rng.integers(0, 15))
             self.error_count[ErrorType.PARITY_ERROR] += 1
             
         elif error_type == ErrorType.NO_RESPONSE:
@@ -192,19 +265,19 @@ class MessageErrorInjector:
         elif error_type == ErrorType.WORD_COUNT_MISMATCH:
             # Truncate or extend data words
             if len(data_words) > 1:
-                if random.random() < 0.5:
+                if self.rng.random() < 0.5:
                     # Truncate
                     data_words = data_words[:-1]
                 else:
                     # Extend with garbage
-                    data_words.append(random.randint(0, 0xFFFF))
+                    data_words.append(self.rng.integers(0, 0xFFFF))
             self.error_count[ErrorType.WORD_COUNT_MISMATCH] += 1
             
         elif error_type == ErrorType.MANCHESTER_ERROR:
             # Corrupt a random data word
             if data_words:
-                idx = random.randint(0, len(data_words) - 1)
-                data_words[idx] ^= random.randint(1, 0xFFFF)
+                idx = self.rng.integers(0, len(data_words) - 1)
+                data_words[idx] ^= self.rng.integers(1, 0xFFFF)
             self.error_count[ErrorType.MANCHESTER_ERROR] += 1
             
         elif error_type == ErrorType.SYNC_ERROR:
@@ -214,27 +287,152 @@ class MessageErrorInjector:
         
         return command_word, status_word, data_words, error_type
     
+    def inject_errors_batch(self, times_s, command_words, status_words, data_words,
+                            word_counts=None) -> ErrorBatch:
+        """
+        Inject errors into a block of messages.
+        
+        Same error model as inject_errors, vectorized: select_errors draws
+        the error type of every message at once and apply_errors applies
+        them with NumPy masks.
+        
+        Args:
+            times_s: Message timestamps in seconds (n,)
+            command_words: Original command words (n,)
+            status_words: Original status words (n,)
+            data_words: Original data words (n, width)
+            word_counts: Data words used in each row (default: width)
+        
+        Returns:
+            ErrorBatch with the modified words
+        """
+        error_types = self.select_errors(times_s)
+        return self.apply_errors(error_types, command_words, status_words, data_words, word_counts)
+    
+    def select_errors(self, times_s) -> np.ndarray:
+        """
+        Draw the error type of each message in a block.
+        
+        One uniform value per message is mapped through the cumulative
+        per-type probabilities, which gives the same distribution as the
+        per-type checks of inject_errors. Updates the message count, the
+        per-type statistics and the bus failover state.
+        
+        Args:
+            times_s: Message timestamps in seconds (n,)
+        
+        Returns:
+            int8 array of ErrorType values (n,)
+        """
+        n = len(times_s)
+        self.message_count += n
+        
+        # Bus failover happens at the first message at or after the failover time
+        if (self.current_bus == 'A' and n and self.config.bus_failover_time_s is not None
+                and self.config.should_switch_bus(max(times_s))):
+            self.current_bus = 'B'
+            self.error_count[ErrorType.BUS_FAILOVER] += 1
+        
+        edges, codes = self._decision_table()
+        error_types = codes[np.searchsorted(edges, self.rng.random_array(n), side='right')]
+        
+        if np.count_nonzero(error_types):
+            counts = np.bincount(error_types, minlength=len(ErrorType))
+            for error_type in ERROR_PRIORITY:
+                self.error_count[error_type] += int(counts[error_type])
+        return error_types
+    
+    def _decision_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Cumulative error probabilities and their ErrorType codes (NONE last)."""
+        rates = tuple(getattr(self.config, _RATE_ATTRIBUTES[error_type])
+                      for error_type in ERROR_PRIORITY)
+        if self._decision_rates != rates:
+            types, probabilities = zip(*self.config.error_probabilities())
+            self._decision_edges = np.cumsum(probabilities)
+            self._decision_codes = np.array(types + (ErrorType.NONE,), dtype=np.int8)
+            self._decision_rates = rates
+        return self._decision_edges, self._decision_codes
+    
+    def apply_errors(self, error_types, command_words, status_words, data_words,
+                     word_counts=None) -> ErrorBatch:
+        """
+        Apply selected errors to a block of messages with NumPy masks.
+        
+        Args:
+            error_types: ErrorType value of each message (n,), e.g. from select_errors
+            command_words: Original command words (n,)
+            status_words: Original status words (n,)
+            data_words: Original data words (n, width)
+            word_counts: Data words used in each row (default: width)
+        
+        Returns:
+            ErrorBatch with the modified words; a word count mismatch may
+            add one column for extended messages
+        """
+        error_types = np.asarray(error_types, dtype=np.int8)
+        n = len(error_types)
+        command_words = np.array(command_words, dtype=np.uint16)
+        status_words = np.array(status_words, dtype=np.uint16)
+        data_words = np.array(data_words, dtype=np.uint16).reshape(n, -1)
+        if word_counts is None:
+            word_counts = np.full(n, data_words.shape[1], dtype=np.int64)
+        else:
+            word_counts = np.array(word_counts, dtype=np.int64)
+        
+        counts = np.bincount(error_types, minlength=len(ErrorType))
+        
+        # Parity: flip one random status bit
+        if counts[ErrorType.PARITY_ERROR]:
+            rows = np.flatnonzero(error_types == ErrorType.PARITY_ERROR)
+            bits = self.rng.integers_array(len(rows), 0, 15)
+            status_words[rows] ^= (1 << bits).astype(np.uint16)
+        
+        for error_type, bit in _STATUS_BITS.items():
+            if counts[error_type]:
+                status_words[error_types == error_type] |= bit
+        
+        # Word count mismatch: drop the last word or append a garbage word
+        if counts[ErrorType.WORD_COUNT_MISMATCH]:
+            rows = np.flatnonzero((error_types == ErrorType.WORD_COUNT_MISMATCH) & (word_counts > 1))
+            extend = self.rng.random_array(len(rows)) >= 0.5
+            word_counts[rows[~extend]] -= 1
+            rows = rows[extend]
+            if len(rows):
+                width = word_counts[rows].max() + 1
+                if width > data_words.shape[1]:
+                    data_words = np.pad(data_words, ((0, 0), (0, width - data_words.shape[1])))
+                data_words[rows, word_counts[rows]] = self.rng.integers_array(len(rows), 0, 0xFFFF)
+                word_counts[rows] += 1
+        
+        # Manchester: corrupt one random data word
+        if counts[ErrorType.MANCHESTER_ERROR]:
+            rows = np.flatnonzero((error_types == ErrorType.MANCHESTER_ERROR) & (word_counts > 0))
+            columns = (self.rng.random_array(len(rows)) * word_counts[rows]).astype(np.int64)
+            data_words[rows, columns] ^= self.rng.integers_array(len(rows), 1, 0xFFFF).astype(np.uint16)
+        
+        return ErrorBatch(command_words, status_words, data_words, word_counts, error_types)
+    
     def _select_error_type(self) -> ErrorType:
         """Select which error type to inject (if any)."""
         # Check each error type in order of priority
         # Only inject one error per message
         
-        if self.config.should_inject_error(ErrorType.NO_RESPONSE):
+        if self.config.should_inject_error(ErrorType.NO_RESPONSE, self.rng):
             return ErrorType.NO_RESPONSE
         
-        if self.config.should_inject_error(ErrorType.PARITY_ERROR):
+        if self.config.should_inject_error(ErrorType.PARITY_ERROR, self.rng):
             return ErrorType.PARITY_ERROR
         
-        if self.config.should_inject_error(ErrorType.LATE_RESPONSE):
+        if self.config.should_inject_error(ErrorType.LATE_RESPONSE, self.rng):
             return ErrorType.LATE_RESPONSE
         
-        if self.config.should_inject_error(ErrorType.WORD_COUNT_MISMATCH):
+        if self.config.should_inject_error(ErrorType.WORD_COUNT_MISMATCH, self.rng):
             return ErrorType.WORD_COUNT_MISMATCH
         
-        if self.config.should_inject_error(ErrorType.MANCHESTER_ERROR):
+        if self.config.should_inject_error(ErrorType.MANCHESTER_ERROR, self.rng):
             return ErrorType.MANCHESTER_ERROR
         
-        if self.config.should_inject_error(ErrorType.SYNC_ERROR):
+        if self.config.should_inject_error(ErrorType.SYNC_ERROR, self.rng):
             return ErrorType.SYNC_ERROR
         
         return ErrorType.NONE
@@ -0,0 +1,169 @@
+"""Named random streams with pre-drawn value pools.
+
+An RNGService derives one numpy Generator per stream name from a root
+seed (SeedSequence with the name as spawn key), so streams are
+independent of each other and reproducible regardless of the order in
+which they are used, e.g. by different fields, the error injector or
+parallel shards.
+
+Each RandomStream draws uniform and standard normal values in blocks
+(from two independent Generators, so the refill order of one pool does
+not shift the other) and hands them out one at a time or as arrays.
+Taking N values at once gives exactly the values of N single draws, so
+batched and per-value generation stay interchangeable.
+"""
+
+import hashlib
+import random
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 4096
+
+
+def _name_key(name: str) -> int:
+    """Stable 64-bit spawn key element for a stream name."""
+    return int.from_bytes(hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class RandomStream:
+    """Uniform and normal values drawn in refillable blocks."""
+
+    def __init__(self, seed: Union[int, np.random.SeedSequence],
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        """
+        Args:
+            seed: Seed of the stream
+            block_size: Values drawn per refill of each pool
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        uniform_seed, normal_seed = seed.spawn(2)
+        self._uniform_generator = np.random.Generator(np.random.PCG64(uniform_seed))
+        self._normal_generator = np.random.Generator(np.random.PCG64(normal_seed))
+        self.block_size = block_size
+        self._uniform: list = []
+        self._uniform_pos = 0
+        self._normal: list = []
+        self._normal_pos = 0
+        self.refills = 0
+
+    def random(self) -> float:
+        """Next uniform value in [0, 1)."""
+        if self._uniform_pos >= len(self._uniform):
+            self._uniform = self._uniform_generator.random(self.block_size).tolist()
+            self._uniform_pos = 0
+            self.refills += 1
+        value = self._uniform[self._uniform_pos]
+        self._uniform_pos += 1
+        return value
+
+    def standard_normal(self) -> float:
+        """Next standard normal value."""
+        if self._normal_pos >= len(self._normal):
+            self._normal = self._normal_generator.standard_normal(self.block_size).tolist()
+            self._normal_pos = 0
+            self.refills += 1
+        value = self._normal[self._normal_pos]
+        self._normal_pos += 1
+        return value
+
+    def uniform(self, low: float, high: float) -> float:
+        """Uniform value in [low, high)."""
+        return low + (high - low) * self.random()
+
+    def integers(self, low: int, high: int) -> int:
+        """Integer in [low, high] (both inclusive, like random.randint)."""
+        return min(low + int(self.random() * (high - low + 1)), high)
+
+    def normal(self, mean: float, std_dev: float) -> float:
+        """Normal value with the given mean and standard deviation."""
+        return mean + std_dev * self.standard_normal()
+
+    def choice(self, values: Sequence):
+        """One of values, with equal probability."""
+        return values[self.integers(0, len(values) - 1)]
+
+    def random_array(self, n: int) -> np.ndarray:
+        """Next n uniform values in [0, 1) (the same values as n random() calls)."""
+        values, self._uniform, self._uniform_pos = self._take(
+            n, self._uniform, self._uniform_pos, self._uniform_generator.random
+        )
+        return values
+
+    def standard_normal_array(self, n: int) -> np.ndarray:
+        """Next n standard normal values (the same values as n standard_normal() calls)."""
+        values, self._normal, self._normal_pos = self._take(
+            n, self._normal, self._normal_pos, self._normal_generator.standard_normal
+        )
+        return values
+
+    def uniform_array(self, n: int, low: float, high: float) -> np.ndarray:
+        """Next n uniform values in [low, high)."""
+        return low + (high - low) * self.random_array(n)
+
+    def integers_array(self, n: int, low: int, high: int) -> np.ndarray:
+        """Next n integers in [low, high] (both inclusive)."""
+        values = low + np.floor(self.random_array(n) * (high - low + 1)).astype(np.int64)
+        return np.minimum(values, high)
+
+    def normal_array(self, n: int, mean, std_dev) -> np.ndarray:
+        """Next n normal values (mean and std_dev may be arrays of length n)."""
+        return mean + std_dev * self.standard_normal_array(n)
+
+    def _take(self, n: int, pool: list, pos: int, draw) -> Tuple[np.ndarray, list, int]:
+        """Take n values from a pool, refilling it in whole blocks.
+
+        Consecutive blocks are drawn with one call (the Generator yields
+        the same values either way).
+        """
+        head = np.array(pool[pos:pos + n], dtype=float)
+        rest = n - len(head)
+        if rest <= 0:
+            return head, pool, pos + len(head)
+        blocks = -(-rest // self.block_size)
+        drawn = draw(blocks * self.block_size)
+        self.refills += blocks
+        last = (blocks - 1) * self.block_size
+        return np.concatenate([head, drawn[:rest]]), drawn[last:].tolist(), rest - last
+
+
+class RNGService:
+    """Per-name random streams derived from one root seed."""
+
+    def __init__(self, seed: Optional[int] = None, key: Tuple[int, ...] = (),
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        """
+        Args:
+            seed: Root seed (None: drawn from the global random module, so
+                seeding it keeps unseeded builds reproducible)
+            key: Spawn key prefix of all streams (e.g. a shard index)
+            block_size: Values drawn per pool refill
+        """
+        self.entropy = random.getrandbits(128) if seed is None else seed
+        self.key = tuple(key)
+        self.block_size = block_size
+        self._streams: Dict[str, RandomStream] = {}
+
+    def stream(self, name: str) -> RandomStream:
+        """The stream for a name (created on first use)."""
+        stream = self._streams.get(name)
+        if stream is None:
+            seed_seq = np.random.SeedSequence(self.entropy, spawn_key=self.key + (_name_key(name),))
+            stream = RandomStream(seed_seq, self.block_size)
+            self._streams[name] = stream
+        return stream
+
+    def child(self, index: int) -> 'RNGService':
+        """An independent service for a part of the work (e.g. one shard)."""
+        return RNGService(self.entropy, self.key + (index,), self.block_size)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Number of streams and pool refills so far."""
+        return {
+            'streams': len(self._streams),
+            'refills': sum(stream.refills for stream in self._streams.values()),
+        }
@@ -1,31 +1,101 @@
 """Validation tools for Chapter 10 files."""
 
+import bisect
 import subprocess
 import shutil
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 try:
     from chapter10 import C10, Packet
+    from chapter10.c10 import TYPES
     from chapter10.time import TimeF1
     from chapter10.ms1553 import MS1553F1
     from chapter10.message import MessageF0
 except ImportError:
     raise ImportError("PyChapter10 is required. Install with: pip install pychapter10")
 
+try:
+    from .packet_index import iter_c10_packets, load_index
+    from .wire_reader import WireFile
+    from .integrity import (
+        scan_packets, gather_headers, header_checksum_failures, data_checksum_failures,
+        verify_checksums
+    )
+    from .core.packet_serializer import HEADER_SIZE
+except ImportError:
+    from packet_index import iter_c10_packets, load_index
+    from wire_reader import WireFile
+    from integrity import (
+        scan_packets, gather_headers, header_checksum_failures, data_checksum_failures,
+        verify_checksums
+    )
+    from core.packet_serializer import HEADER_SIZE
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024  # Smallest chunk worth a worker process
+DEFAULT_SAMPLE_INTERVAL = 1000  # Fast mode: deep-decode every Nth packet
+TIME_PACKET_INTERVAL = 1_000_000  # 1 Hz time packets (RTC in microseconds)
+TIME_PACKET_TOLERANCE = 0.1
+
+# Raw primary packet header
+_HEADER_DTYPE = np.dtype([
+    ('sync', '<u2'), ('channel_id', '<u2'), ('packet_len', '<u4'), ('data_len', '<u4'),
+    ('version', 'u1'), ('sequence', 'u1'), ('flags', 'u1'), ('data_type', 'u1'),
+    ('rtc_low', '<u4'), ('rtc_high', '<u2'), ('checksum', '<u2'),
+])
+_SECONDARY_HEADER_FLAG = 0x80
+_SECONDARY_HEADER_SIZE = 12
+
+
+def _validate_chunk(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the packets starting in [start, end) (runs in a worker process)."""
+    validator = Ch10Validator(task['filepath'])
+    result = {'read_error': None}
+    try:
+        validator._validate_packets(validator._chunk_packets(task['start'], task['end']))
+    except Exception as e:
+        result['read_error'] = str(e)
+    result.update(validator._chunk_result())
+    return result
+
 
 class Ch10Validator:
-    """Validate Chapter 10 files."""
+    """Validate Chapter 10 files.
+
+    With workers > 1 the file is split into chunks at packet boundaries
+    (from the packet index, or by scanning for sync patterns), the chunks
+    are validated in worker processes and their statistics are merged in
+    file order into the same report as a serial run.
+    """
     
-    def __init__(self, filepath: Path):
-        """Initialize validator with file path."""
+    def __init__(self, filepath: Path, workers: int = 1,
+                 chunk_bytes: int = DEFAULT_CHUNK_BYTES):
+        """
+        Initialize validator with file path.
+
+        Args:
+            filepath: Path to Chapter 10 file
+            workers: Number of worker processes (1 = validate in-process)
+            chunk_bytes: Minimum chunk size when validating in parallel
+        """
         self.filepath = Path(filepath)
         
         if not self.filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.workers = workers
+        self.chunk_bytes = chunk_bytes
+        
+        self._first_time = None
+        self._last_time = None
+        self._ipts = {}  # channel_id -> [first IPTS, last IPTS, regressions]
         
         self.stats = {
             'file_size_bytes': self.filepath.stat().st_size,
@@ -52,78 +122,78 @@ class Ch10Validator:
             Validation statistics and results
         """
         try:
-            c10 = C10(str(self.filepath))
+            # Located from the raw headers, so damage is reported even if decoding fails
+            checksums = verify_checksums(self.filepath)
+            self._report_scan(checksums['invalid_offsets'], checksums['trailing_bytes'])
+            self._report_checksums(checksums['header_failures'], checksums['data_failures'])
             
-            first_time = None
-            last_time = None
+            chunks = self._plan_chunks()
+            if len(chunks) == 1:
+                self._validate_packets(iter_c10_packets(self.filepath))
+            else:
+                tasks = [{'filepath': str(self.filepath), 'start': start, 'end': end}
+                         for start, end in chunks]
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    for result in pool.map(_validate_chunk, tasks):
+                        self._merge_chunk(result)
+                        if result['read_error']:
+                            # Stop where a serial run would have stopped
+                            raise IOError(result['read_error'])
+            self._set_time_range()
             
-            # Iterate through all packets
-            for packet in c10:
-                self.stats['packet_count'] += 1
-                
-                # Track packet types
-                packet_type = type(packet).__name__
-                self.stats['packet_types'][packet_type] = self.stats['packet_types'].get(packet_type, 0) + 1
-                
-                # Track channel IDs
-                if hasattr(packet, 'channel_id'):
-                    self.stats['channel_ids'].add(packet.channel_id)
-                
-                # Track time range
-                if hasattr(packet, 'rtc'):
-                    rtc = packet.rtc
-                    if rtc:
-                        if first_time is None or rtc < first_time:
-                            first_time = rtc
-                        if last_time is None or rtc > last_time:
-                            last_time = rtc
-                
-                # Check specific packet types
-                if isinstance(packet, MessageF0):
-                    self.stats['tmats_present'] = True
-                    self._validate_tmats(packet)
-                elif hasattr(packet, 'channel_id') and packet.channel_id == 0x000:
-                    # Alternative check for TMATS by channel ID (Channel 0)
-                    self.stats['tmats_present'] = True
-                    if hasattr(packet, 'body'):
-                        self._validate_tmats(packet)
-                    
-                elif isinstance(packet, TimeF1) or (hasattr(packet, 'data_type') and packet.data_type == 0x11):
-                    self.stats['time_packets'] += 1
-                    self._validate_time_packet(packet)
-                elif hasattr(packet, 'data_type') and packet.data_type == 0x02:
-                    print(f"DEBUG: WHY IS THIS NOT WORKING? Packet {self.stats['packet_count']}: {type(packet).__name__}, data_type: 0x{packet.data_type:02X}")
-                    print(f"DEBUG: hasattr(packet, 'data_type'): {hasattr(packet, 'data_type')}")
-                    print(f"DEBUG: packet.data_type: {packet.data_type}")
-                    print(f"DEBUG: packet.data_type == 0x02: {packet.data_type == 0x02}")
-                    print(f"DEBUG: 0x02: {0x02}")
-                    print(f"DEBUG: type(packet.data_type): {type(packet.data_type)}")
-                    
-                elif isinstance(packet, MS1553F1):
-                    self.stats['1553_packets'] += 1
-                    msg_count = self._validate_1553_packet(packet)
-                    self.stats['1553_messages'] += msg_count
+            # Perform additional checks
+            self._check_requirements()
             
-            # PyChapter10 C10 object doesn't have close()
-            # but we need to ensure file handle is released
-            try:
-                if hasattr(c10, 'file'):
-                    c10.file.close()
-                elif hasattr(c10, '_file'):
-                    c10._file.close()
-            except:
-                pass  # Best effort to close
+            if verbose:
+                self._print_summary()
             
-            # Set time range
-            if first_time and last_time:
-                duration_us = last_time - first_time
-                self.stats['time_range'] = {
-                    'first_rtc': first_time,
-                    'last_rtc': last_time,
-                    'duration_s': duration_us / 1_000_000
-                }
+        except Exception as e:
+            self.stats['errors'].append(f"Failed to read file: {e}")
+        
+        return self.stats
+    
+    def validate_fast(self, verbose: bool = False,
+                      sample_interval: int = DEFAULT_SAMPLE_INTERVAL) -> Dict[str, Any]:
+        """
+        Validate from the raw packet headers, decoding only a few packets.
+        
+        All headers are read from the memory-mapped file and checked at
+        once: sync pattern, packet/data lengths, header and data checksums
+        (see integrity.py), RTC order per channel and 1 Hz time packet cadence. Counts come from the
+        headers and the 1553 channel specific data words. Packets failing a
+        check, TMATS packets and every sample_interval-th packet are also
+        decoded with PyChapter10 and validated as in validate().
+        
+        Args:
+            verbose: Print detailed information
+            sample_interval: Deep-decode every Nth packet (0 = none)
+        
+        Returns:
+            Validation statistics and results (same structure as validate())
+        """
+        try:
+            with WireFile(self.filepath, use_index=False) as wire:
+                scan = scan_packets(wire)
+                offsets = scan.offsets
+                raw = np.frombuffer(wire.buffer, dtype=np.uint8)
+                header_words = gather_headers(raw, offsets)
+                csdw_positions = np.minimum(offsets + HEADER_SIZE, len(raw) - 4)
+                csdw = raw[csdw_positions[:, None] + np.arange(4)].view('<u4')[:, 0]
+                data_results = data_checksum_failures(raw, offsets, header_words)
+                del raw
             
-            # Perform additional checks
+            self._report_scan(scan.invalid_offsets, scan.trailing_bytes)
+            header_failures = header_checksum_failures(header_words)
+            data_failures = data_results == 1
+            self._report_checksums(offsets[header_failures].tolist(), offsets[data_failures].tolist())
+            deep = self._check_headers(header_words.view(_HEADER_DTYPE)[:, 0], csdw)
+            deep |= header_failures | data_failures
+            if sample_interval:
+                deep[::sample_interval] = True
+            self._deep_validate(offsets[deep].tolist())
+            self.stats['deep_decoded_packets'] = int(deep.sum())
+            
+            self._set_time_range()
             self._check_requirements()
             
             if verbose:
@@ -134,6 +204,231 @@ class Ch10Validator:
         
         return self.stats
     
+    def _check_headers(self, headers: np.ndarray, csdw: np.ndarray) -> np.ndarray:
+        """Statistics and checks from the raw headers; returns packets to deep-decode."""
+        count = len(headers)
+        data_types = headers['data_type']
+        channels = headers['channel_id']
+        rtc = headers['rtc_low'].astype(np.int64) | (headers['rtc_high'].astype(np.int64) << 32)
+        self.stats['packet_count'] = count
+        
+        for data_type, type_count in zip(*np.unique(data_types, return_counts=True)):
+            handler = TYPES.get(int(data_type))
+            name = handler.__name__ if handler else f"Unknown(0x{int(data_type):02X})"
+            self.stats['packet_types'][name] = int(type_count)
+        self.stats['channel_ids'] = set(np.unique(channels).tolist())
+        nonzero_rtc = rtc[rtc != 0]
+        if len(nonzero_rtc):
+            self._track_time(int(nonzero_rtc.min()))
+            self._track_time(int(nonzero_rtc.max()))
+        
+        # Same packet classification as validate()
+        tmats = (data_types == 0x30) | (channels == 0)
+        time = ~tmats & (data_types == 0x11)
+        ms1553 = ~tmats & (data_types == 0x19)
+        self.stats['tmats_present'] = bool(tmats.any())
+        self.stats['time_packets'] = int(time.sum())
+        self.stats['1553_packets'] = int(ms1553.sum())
+        has_csdw = ms1553 & (headers['data_len'] >= 4)
+        self.stats['1553_messages'] = int((csdw[has_csdw] & 0xFFFFFF).sum())
+        
+        # Lengths
+        secondary = np.where(headers['flags'] & _SECONDARY_HEADER_FLAG, _SECONDARY_HEADER_SIZE, 0)
+        length_ok = headers['data_len'].astype(np.int64) + HEADER_SIZE + secondary \
+            <= headers['packet_len']
+        if not length_ok.all():
+            self.stats['errors'].append(f"Data length exceeds packet length in {int((~length_ok).sum())} packets")
+        
+        # RTC order per channel
+        order = np.argsort(channels, kind='stable')
+        sorted_channels = channels[order]
+        backward = (np.diff(rtc[order]) < 0) & (sorted_channels[1:] == sorted_channels[:-1])
+        for channel_id, steps in zip(*np.unique(sorted_channels[1:][backward], return_counts=True)):
+            self.stats['warnings'].append(
+                f"RTC not monotonic on channel 0x{int(channel_id):03X}: {int(steps)} backward steps"
+            )
+        
+        # Time packet cadence
+        intervals = np.diff(rtc[time])
+        off_cadence = np.abs(intervals - TIME_PACKET_INTERVAL) > TIME_PACKET_INTERVAL * TIME_PACKET_TOLERANCE
+        if off_cadence.any():
+            self.stats['warnings'].append(
+                f"Time packets not at 1 Hz: {int(off_cadence.sum())} of {len(intervals)} intervals "
+                f"off by more than {TIME_PACKET_TOLERANCE:.0%}"
+            )
+        
+        return ~length_ok | tmats
+    
+    def _report_scan(self, invalid_offsets: List[int], trailing_bytes: int) -> None:
+        """Add errors for bad packet headers and bytes after the last packet."""
+        if invalid_offsets:
+            self.stats['errors'].append(
+                f"Invalid packet header at {len(invalid_offsets)} offsets "
+                f"(first at {invalid_offsets[0]})"
+            )
+        if trailing_bytes:
+            self.stats['errors'].append(f"{trailing_bytes} trailing bytes after the last packet")
+    
+    def _report_checksums(self, header_failures: List[int], data_failures: List[int]) -> None:
+        """Add errors for packets failing header or data checksums."""
+        for kind, failures in (('Header', header_failures), ('Data', data_failures)):
+            if failures:
+                shown = ', '.join(str(offset) for offset in failures[:5])
+                more = ', ...' if len(failures) > 5 else ''
+                self.stats['errors'].append(
+                    f"{kind} checksum mismatch in {len(failures)} packets (offsets: {shown}{more})"
+                )
+    
+    def _deep_validate(self, offsets: List[int]) -> None:
+        """Decode the packets at offsets with PyChapter10 and validate their contents."""
+        with open(self.filepath, 'rb') as f:
+            c10 = C10(f)
+            for offset in offsets:
+                c10.file.seek(offset)
+                try:
+                    packet = next(c10, None)
+                except Exception as e:
+                    self.stats['warnings'].append(f"Failed to decode packet at offset {offset}: {e}")
+                    continue
+                if packet is None or c10.file.tell() - packet.packet_length != offset:
+                    self.stats['warnings'].append(f"Failed to decode packet at offset {offset}")
+                    continue
+                
+                if isinstance(packet, MessageF0) or packet.channel_id == 0x000:
+                    if hasattr(packet, 'body'):
+                        self._validate_tmats(packet)
+                elif isinstance(packet, TimeF1) or packet.data_type == 0x11:
+                    self._validate_time_packet(packet)
+                elif isinstance(packet, MS1553F1):
+                    self._validate_1553_packet(packet, track_ipts=False)
+    
+    def _validate_packets(self, packets) -> None:
+        """Validate a sequence of packets, accumulating statistics."""
+        for packet in packets:
+            self._validate_packet(packet)
+    
+    def _validate_packet(self, packet) -> None:
+        """Validate one packet."""
+        self.stats['packet_count'] += 1
+        
+        # Track packet types
+        packet_type = type(packet).__name__
+        self.stats['packet_types'][packet_type] = self.stats['packet_types'].get(packet_type, 0) + 1
+        
+        # Track channel IDs
+        if hasattr(packet, 'channel_id'):
+            self.stats['channel_ids'].add(packet.channel_id)
+        
+        # Track time range
+        if hasattr(packet, 'rtc'):
+            self._track_time(packet.rtc)
+        
+        # Check specific packet types
+        if isinstance(packet, MessageF0):
+            self.stats['tmats_present'] = True
+            self._validate_tmats(packet)
+        elif hasattr(packet, 'channel_id') and packet.channel_id == 0x000:
+            # Alternative check for TMATS by channel ID (Channel 0)
+            self.stats['tmats_present'] = True
+            if hasattr(packet, 'body'):
+                self._validate_tmats(packet)
+            
+        elif isinstance(packet, TimeF1) or (hasattr(packet, 'data_type') and packet.data_type == 0x11):
+            self.stats['time_packets'] += 1
+            self._validate_time_packet(packet)
+        elif isinstance(packet, MS1553F1):
+            self.stats['1553_packets'] += 1
+            msg_count = self._validate_1553_packet(packet)
+            self.stats['1553_messages'] += msg_count
+    
+    def _track_time(self, rtc: Optional[int]) -> None:
+        """Extend the RTC range."""
+        if rtc:
+            if self._first_time is None or rtc < self._first_time:
+                self._first_time = rtc
+            if self._last_time is None or rtc > self._last_time:
+                self._last_time = rtc
+    
+    def _track_ipts(self, channel_id: int, first: int, last: int, regressions: int = 0) -> None:
+        """Append a run of IPTS values on a channel, counting backward steps."""
+        state = self._ipts.get(channel_id)
+        if state is None:
+            self._ipts[channel_id] = [first, last, regressions]
+            return
+        if first < state[1]:
+            regressions += 1
+        state[1] = last
+        state[2] += regressions
+    
+    def _set_time_range(self) -> None:
+        """Set the time range from the tracked RTC values."""
+        if self._first_time and self._last_time:
+            duration_us = self._last_time - self._first_time
+            self.stats['time_range'] = {
+                'first_rtc': self._first_time,
+                'last_rtc': self._last_time,
+                'duration_s': duration_us / 1_000_000
+            }
+    
+    def _plan_chunks(self) -> List[Tuple[int, int]]:
+        """Byte ranges [start, end) starting at packet boundaries."""
+        size = self.stats['file_size_bytes']
+        count = min(self.workers * 4, size // self.chunk_bytes)
+        if self.workers == 1 or count < 2:
+            return [(0, size)]
+        
+        targets = [size * k // count for k in range(1, count)]
+        index = load_index(self.filepath)
+        if index is not None:
+            offsets = index.records['offset'].tolist() + [size]
+            bounds = [offsets[bisect.bisect_left(offsets, target)] for target in targets]
+        else:
+            with WireFile(self.filepath, use_index=False) as wire:
+                bounds = [wire.find_packet(target) for target in targets]
+        bounds = sorted(set([0] + bounds + [size]))
+        return list(zip(bounds[:-1], bounds[1:]))
+    
+    def _chunk_packets(self, start: int, end: int):
+        """PyChapter10 packets whose headers start in [start, end)."""
+        with open(self.filepath, 'rb') as f:
+            c10 = C10(f)
+            c10.file.seek(start)
+            while c10.file.tell() < end:
+                packet = next(c10, None)
+                # A packet found by resynchronizing past the end belongs to the next chunk
+                if packet is None or c10.file.tell() - packet.packet_length >= end:
+                    return
+                yield packet
+    
+    def _chunk_result(self) -> Dict[str, Any]:
+        """Statistics of a validated chunk, for merging."""
+        return {
+            'stats': self.stats,
+            'first_time': self._first_time,
+            'last_time': self._last_time,
+            'ipts': self._ipts,
+        }
+    
+    def _merge_chunk(self, result: Dict[str, Any]) -> None:
+        """Merge the statistics of the next chunk in file order."""
+        stats = result['stats']
+        for key in ('packet_count', 'time_packets', '1553_packets', '1553_messages'):
+            self.stats[key] += stats[key]
+        for packet_type, count in stats['packet_types'].items():
+            self.stats['packet_types'][packet_type] = self.stats['packet_types'].get(packet_type, 0) + count
+        self.stats['channel_ids'] |= stats['channel_ids']
+        if stats['tmats_present']:
+            self.stats['tmats_present'] = True
+        if 'tmats_channels' in stats:
+            self.stats['tmats_channels'] = stats['tmats_channels']
+        self.stats['errors'].extend(stats['errors'])
+        self.stats['warnings'].extend(stats['warnings'])
+        
+        self._track_time(result['first_time'])
+        self._track_time(result['last_time'])
+        for channel_id, (first, last, regressions) in result['ipts'].items():
+            self._track_ipts(channel_id, first, last, regressions)
+    
     def _validate_tmats(self, packet: MessageF0) -> None:
         """Validate TMATS packet."""
         try:
@@ -194,12 +489,13 @@ class Ch10Validator:
         except Exception as e:
             self.stats['warnings'].append(f"Failed to validate time packet: {e}")
     
-    def _validate_1553_packet(self, packet: MS1553F1) -> int:
+    def _validate_1553_packet(self, packet: MS1553F1, track_ipts: bool = True) -> int:
         """
         Validate 1553 packet and return message count.
         
         Args:
             packet: 1553 F1 packet
+            track_ipts: Include the packet in the IPTS order check
         
         Returns:
             Number of messages in packet
@@ -207,10 +503,21 @@ class Ch10Validator:
         try:
             message_count = 0
             
+            previous_ipts = None
+            
             # MS1553F1 packets are directly iterable
             for msg in packet:
                 message_count += 1
                 
+                # Track IPTS order
+                ipts = msg.ipts
+                if previous_ipts is None:
+                    first_ipts = ipts
+                    regressions = 0
+                elif ipts < previous_ipts:
+                    regressions += 1
+                previous_ipts = ipts
+                
                 # Validate message data
                 if hasattr(msg, 'data') and msg.data:
                     # Convert bytes to words (little-endian 16-bit)
@@ -241,6 +548,9 @@ class Ch10Validator:
                             #         f"Data word count mismatch: expected {expected_total}, got {actual_words}"
                             #     )
             
+            if track_ipts and previous_ipts is not None:
+                self._track_ipts(packet.channel_id, first_ipts, previous_ipts, regressions)
+            
             return message_count
             
         except Exception as e:
@@ -261,6 +571,13 @@ class Ch10Validator:
         if self.stats['1553_packets'] == 0:
             self.stats['warnings'].append("No 1553 packets found")
         
+        # Check IPTS order per channel
+        for channel_id, (_, _, regressions) in sorted(self._ipts.items()):
+            if regressions:
+                self.stats['warnings'].append(
+                    f"IPTS not monotonic on channel 0x{channel_id:03X}: {regressions} backward steps"
+                )
+        
         # Check packet count
         if self.stats['packet_count'] == 0:
             self.stats['errors'].append("File contains no packets")
@@ -385,7 +702,8 @@ def validate_with_c10_tools(filepath: Path) -> Optional[Dict[str, Any]]:
 
 
 def validate_file(filepath: Path, verbose: bool = True, 
-                 use_c10_tools: bool = True) -> Dict[str, Any]:
+                 use_c10_tools: bool = True, workers: int = 1,
+                 fast: bool = False) -> Dict[str, Any]:
     """
     Complete file validation.
     
@@ -393,13 +711,18 @@ def validate_file(filepath: Path, verbose: bool = True,
         filepath: Path to Chapter 10 file
         verbose: Print detailed output
         use_c10_tools: Try to use external c10-tools
+        workers: Number of worker processes for internal validation
+        fast: Header-only validation (see Ch10Validator.validate_fast)
     
     Returns:
         Validation results
     """
     # Internal validation
-    validator = Ch10Validator(filepath)
-    results = validator.validate(verbose=verbose)
+    validator = Ch10Validator(filepath, workers=workers)
+    if fast:
+        results = validator.validate_fast(verbose=verbose)
+    else:
+        results = validator.validate(verbose=verbose)
     
     # External validation if requested
     if use_c10_tools:
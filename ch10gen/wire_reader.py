@@ -1,8 +1,280 @@
-"""Wire-level Chapter 10 MS1553F1 packet reader."""
+"""Wire-level Chapter 10 MS1553F1 packet reader.
 
+WireFile maps a recording into memory and walks it with
+struct.unpack_from at offsets: packets and messages are exposed as small
+views whose fields are decoded on access, and payloads as memoryview
+slices of the mapping, so nothing is copied and memory use does not grow
+with the file size. When a fresh .ch10idx sidecar exists (see
+packet_index), packets are located from it instead of by scanning.
+"""
+
+import mmap
 import struct
 from pathlib import Path
-from typing import Generator, Dict, Any, Optional, BinaryIO
+from typing import Generator, Dict, Any, Iterator, Optional, BinaryIO, Tuple
+
+try:
+    from .core.packet_serializer import (
+        SYNC_PATTERN, HEADER_SIZE, DATA_TYPE_MS1553_F1, BLOCK_STATUS_BUS_B
+    )
+except ImportError:
+    from core.packet_serializer import (
+        SYNC_PATTERN, HEADER_SIZE, DATA_TYPE_MS1553_F1, BLOCK_STATUS_BUS_B
+    )
+
+_PACKET_HEADER = struct.Struct('<HHIIBBBBIH')  # Up to the RTC (checksum not needed)
+_MESSAGE_HEADER = struct.Struct('<QHHH')       # IPTS, block status, gap times, length
+_MESSAGE_PREFIX = struct.Struct('<QHHHHH')     # Header plus command and status words
+_WORD = struct.Struct('<H')
+_CSDW = struct.Struct('<I')
+MESSAGE_HEADER_SIZE = 14
+
+
+class MessageView:
+    """One MS1553F1 message of a mapped packet; fields are read on access."""
+
+    __slots__ = ('_buffer', 'offset', 'length')
+
+    def __init__(self, buffer: memoryview, offset: int, length: int):
+        self._buffer = buffer
+        self.offset = offset    # Offset of the intra-packet header in the file
+        self.length = length    # Message bytes (command, status and data words)
+
+    @property
+    def ipts(self) -> int:
+        """Intra-packet time stamp."""
+        return _MESSAGE_HEADER.unpack_from(self._buffer, self.offset)[0]
+
+    @property
+    def block_status(self) -> int:
+        """Block status word."""
+        return _MESSAGE_HEADER.unpack_from(self._buffer, self.offset)[1]
+
+    @property
+    def bus(self) -> str:
+        """Bus the message was recorded on ('A' or 'B')."""
+        return 'B' if self.block_status & BLOCK_STATUS_BUS_B else 'A'
+
+    @property
+    def data(self) -> memoryview:
+        """Message bytes (zero-copy slice of the mapping)."""
+        start = self.offset + MESSAGE_HEADER_SIZE
+        return self._buffer[start:start + self.length]
+
+    @property
+    def command_word(self) -> int:
+        return self.word(0)
+
+    @property
+    def status_word(self) -> int:
+        return self.word(1)
+
+    @property
+    def rt(self) -> int:
+        return (self.command_word >> 11) & 0x1F
+
+    @property
+    def tr(self) -> str:
+        return 'RT2BC' if (self.command_word >> 10) & 0x01 else 'BC2RT'
+
+    @property
+    def sa(self) -> int:
+        return (self.command_word >> 5) & 0x1F
+
+    @property
+    def wc(self) -> int:
+        """Word count from the command word (0 means 32)."""
+        return (self.command_word & 0x1F) or 32
+
+    def word(self, index: int) -> int:
+        """Word of the message (0: command, 1: status, 2...: data); 0 if absent."""
+        if 2 * index + 2 > self.length:
+            return 0
+        return _WORD.unpack_from(self._buffer, self.offset + MESSAGE_HEADER_SIZE + 2 * index)[0]
+
+    def data_words(self) -> Tuple[int, ...]:
+        """Data words after the command and status words."""
+        count = max(self.length // 2 - 2, 0)
+        return struct.unpack_from(f'<{count}H', self._buffer, self.offset + MESSAGE_HEADER_SIZE + 4)
+
+
+class PacketView:
+    """One packet of a mapped file; header fields are decoded up front."""
+
+    __slots__ = ('_buffer', 'offset', 'channel_id', 'packet_len', 'data_len', 'data_type')
+
+    def __init__(self, buffer: memoryview, offset: int, channel_id: int,
+                 packet_len: int, data_len: int, data_type: int):
+        self._buffer = buffer
+        self.offset = offset
+        self.channel_id = channel_id
+        self.packet_len = packet_len
+        self.data_len = data_len
+        self.data_type = data_type
+
+    @property
+    def rtc(self) -> int:
+        """48-bit relative time counter."""
+        fields = _PACKET_HEADER.unpack_from(self._buffer, self.offset)
+        return fields[8] | (fields[9] << 32)
+
+    @property
+    def body(self) -> memoryview:
+        """Packet body (zero-copy slice of the mapping)."""
+        start = self.offset + HEADER_SIZE
+        return self._buffer[start:start + self.data_len]
+
+    @property
+    def message_count(self) -> int:
+        """Message count from the MS1553F1 channel specific data word."""
+        if self.data_len < 4:
+            return 0
+        return _CSDW.unpack_from(self._buffer, self.offset + HEADER_SIZE)[0] & 0xFFFFFF
+
+    def messages(self) -> Iterator[MessageView]:
+        """MS1553F1 messages of the packet (stops at a truncated message)."""
+        offset = self.offset + HEADER_SIZE + 4
+        end = self.offset + HEADER_SIZE + self.data_len
+        for _ in range(self.message_count):
+            if offset + MESSAGE_HEADER_SIZE > end:
+                return
+            length = _MESSAGE_HEADER.unpack_from(self._buffer, offset)[3]
+            if offset + MESSAGE_HEADER_SIZE + length > end:
+                return
+            yield MessageView(self._buffer, offset, length)
+            offset += MESSAGE_HEADER_SIZE + length + (length & 1)
+
+
+class WireFile:
+    """Memory-mapped Chapter 10 file.
+
+    Views and memoryview slices handed out refer to the mapping and are
+    only valid until the file is closed.
+    """
+
+    def __init__(self, filepath: Path, use_index: bool = True):
+        """
+        Args:
+            filepath: Path to the Chapter 10 file
+            use_index: Locate packets from a fresh .ch10idx sidecar if present
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        self._file = open(filepath, 'rb')
+        self.index = None
+        if use_index:
+            try:
+                from .packet_index import load_index
+            except ImportError:
+                from packet_index import load_index
+            self.index = load_index(filepath)
+        self.size = Path(filepath).stat().st_size
+        self._mmap = None
+        if self.size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(self._mmap, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+            self.buffer = memoryview(self._mmap)
+        else:
+            self.buffer = memoryview(b'')
+
+    def packets(self, data_type: Optional[int] = None, channel_id: Optional[int] = None,
+                start_ipts: Optional[int] = None,
+                end_ipts: Optional[int] = None) -> Iterator[PacketView]:
+        """
+        Packets in file order, optionally filtered.
+
+        An IPTS range [start_ipts, end_ipts) keeps the MS1553F1 packets with
+        messages in it. Iteration stops at the first invalid sync pattern
+        or truncated packet.
+        """
+        if self.index is not None:
+            yield from self._indexed_packets(data_type, channel_id, start_ipts, end_ipts)
+            return
+        time_range = start_ipts is not None or end_ipts is not None
+        buffer = self.buffer
+        offset = 0
+        while offset + HEADER_SIZE <= self.size:
+            (sync, packet_channel, packet_len, data_len,
+             _, _, _, packet_type, _, _) = _PACKET_HEADER.unpack_from(buffer, offset)
+            if sync != SYNC_PATTERN or packet_len < HEADER_SIZE or offset + packet_len > self.size:
+                return
+            if packet_type == 0:
+                # Non-standard writers put the data type in the last header byte
+                packet_type = buffer[offset + 23]
+            if ((data_type is None or packet_type == data_type)
+                    and (channel_id is None or packet_channel == channel_id)):
+                packet = PacketView(buffer, offset, packet_channel, packet_len, data_len, packet_type)
+                if not time_range or _in_range(packet, start_ipts, end_ipts):
+                    yield packet
+            offset += packet_len
+
+    def _indexed_packets(self, data_type: Optional[int], channel_id: Optional[int],
+                         start_ipts: Optional[int], end_ipts: Optional[int]) -> Iterator[PacketView]:
+        """Packets selected from the sidecar index."""
+        buffer = self.buffer
+        records = self.index.select(data_type, channel_id, start_ipts, end_ipts)
+        for offset, packet_channel, packet_type in zip(records['offset'].tolist(),
+                                                        records['channel_id'].tolist(),
+                                                        records['data_type'].tolist()):
+            _, _, packet_len, data_len = _PACKET_HEADER.unpack_from(buffer, offset)[:4]
+            yield PacketView(buffer, offset, packet_channel, packet_len, data_len, packet_type)
+
+    def find_packet(self, offset: int) -> int:
+        """
+        Offset of the first packet header at or after offset (file size if none).
+
+        Sync patterns can also occur in packet bodies, so a candidate is
+        accepted only if its lengths fit the file and the next packet
+        (unless the file ends there) starts with a sync pattern as well.
+        """
+        sync = _WORD.pack(SYNC_PATTERN)
+        while self._mmap is not None:
+            offset = self._mmap.find(sync, offset)
+            if offset < 0:
+                break
+            if offset + HEADER_SIZE <= self.size:
+                _, _, packet_len, data_len = _PACKET_HEADER.unpack_from(self.buffer, offset)[:4]
+                following = offset + packet_len
+                if (packet_len >= HEADER_SIZE + data_len and following <= self.size
+                        and (following == self.size or self.buffer[following:following + 2] == sync)):
+                    return offset
+            offset += 1
+        return self.size
+
+    def messages(self, channel_id: Optional[int] = None) -> Iterator[MessageView]:
+        """All MS1553F1 messages in file order."""
+        for packet in self.packets(DATA_TYPE_MS1553_F1, channel_id):
+            yield from packet.messages()
+
+    def close(self) -> None:
+        """Release the mapping (views must no longer be used)."""
+        self.buffer.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Slices are still referenced; the mapping closes when they are freed
+                pass
+        self._file.close()
+
+    def __enter__(self) -> 'WireFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _in_range(packet: PacketView, start_ipts: Optional[int], end_ipts: Optional[int]) -> bool:
+    """Whether an MS1553F1 packet has messages in [start_ipts, end_ipts)."""
+    if packet.data_type != DATA_TYPE_MS1553_F1:
+        return False
+    ipts = [message.ipts for message in packet.messages()]
+    if not ipts:
+        return False
+    return ((start_ipts is None or ipts[-1] >= start_ipts)
+            and (end_ipts is None or ipts[0] < end_ipts))
 
 
 def read_packet_header(f: BinaryIO) -> Optional[Dict[str, Any]]:
@@ -123,7 +395,7 @@ def read_1553_wire(
     sa_filter: Optional[int] = None,
     errors_only: bool = False
 ) -> Generator[Dict[str, Any], None, None]:
-    """Read 1553 messages directly from wire format."""
+    """Read 1553 messages directly from wire format (memory-mapped, see WireFile)."""
     
     # Channel mapping
     channel_map = {
@@ -141,24 +413,12 @@ def read_1553_wire(
     start_time_ns = None
     detected_channels = {}
     
-    with open(filepath, 'rb') as f:
-        packet_num = 0
-        while msg_count < max_messages:
-            packet_num += 1
-            
-            # Read packet header
-            header = read_packet_header(f)
-            if not header:
-                break
-            
-            # Check if MS1553F1 packet (data type 0x19)
-            if header['data_type'] != 0x19:
-                # Skip non-1553 packet
-                f.seek(header['packet_len'] - header['header_size'], 1)
-                continue
-            
+    with WireFile(filepath) as wire:
+        buffer = wire.buffer
+        # An explicit channel lets an index skip the other channel's packets
+        for packet in wire.packets(DATA_TYPE_MS1553_F1, None if channel == 'auto' else target_channel):
             # Track detected channels
-            channel_id = header['channel_id']
+            channel_id = packet.channel_id
             if channel_id in [0x0200, 0x0210]:
                 if channel_id not in detected_channels:
                     detected_channels[channel_id] = 0
@@ -170,74 +430,52 @@ def read_1553_wire(
             
             # Skip if not target channel
             if target_channel and channel_id != target_channel:
-                f.seek(header['packet_len'] - header['header_size'], 1)
                 continue
             
-            # Read packet data
-            data_to_read = header['data_len']
-            packet_data = f.read(data_to_read)
-            
-            if len(packet_data) < data_to_read:
-                break
-            
-            # Parse CSDW
-            csdw_info = parse_1553_csdw(packet_data)
-            msg_count_in_packet = csdw_info['msg_count']
-            
-            # Parse messages using PyChapter10 format
-            offset = csdw_info['csdw_size']
-            parsed_in_packet = 0
-            
-            for i in range(msg_count_in_packet):
+            for message in packet.messages():
                 if msg_count >= max_messages:
                     return
                 
-                msg = parse_1553_message_pyc10(packet_data, offset, msg_count)
-                if not msg:
-                    # Skip this message block (use minimum size)
-                    offset += 18
+                if message.length < 4:
                     continue
+                ipts, block_status, _, _, command_word, status_word = \
+                    _MESSAGE_PREFIX.unpack_from(buffer, message.offset)
+                
+                # Skip messages without a valid RT (1-31)
+                rt = (command_word >> 11) & 0x1F
+                if rt < 1:
+                    continue
+                sa = (command_word >> 5) & 0x1F
                 
                 # Apply filters
-                if rt_filter is not None and msg['rt'] != rt_filter:
-                    offset += msg['size']
+                if rt_filter is not None and rt != rt_filter:
                     continue
-                if sa_filter is not None and msg['sa'] != sa_filter:
-                    offset += msg['size']
+                if sa_filter is not None and sa != sa_filter:
                     continue
-                if errors_only and not msg['errors']:
-                    offset += msg['size']
+                if errors_only:
+                    # Errors are not decoded at the wire level
                     continue
                 
-                # Set start time
                 if start_time_ns is None:
-                    start_time_ns = msg['ipts']
+                    start_time_ns = ipts
                 
                 # Count for this channel
                 if channel_id in detected_channels:
                     detected_channels[channel_id] += 1
                 
-                # Yield message
                 yield {
-                    'ipts_ns': msg['ipts'],
-                    't_rel_ms': (msg['ipts'] - start_time_ns) / 1_000_000,
-                    'bus': msg['bus'],
-                    'rt': msg['rt'],
-                    'sa': msg['sa'],
-                    'tr': msg['tr'],
-                    'wc': msg['wc'],
-                    'status': msg['status'],
-                    'errors': msg['errors']
+                    'ipts_ns': ipts,
+                    't_rel_ms': (ipts - start_time_ns) / 1_000_000,
+                    'bus': 'B' if block_status & BLOCK_STATUS_BUS_B else 'A',
+                    'rt': rt,
+                    'sa': sa,
+                    'tr': 'RT2BC' if (command_word >> 10) & 0x01 else 'BC2RT',
+                    'wc': (command_word & 0x1F) or 32,
+                    'status': status_word,
+                    'errors': []
                 }
                 
                 msg_count += 1
-                parsed_in_packet += 1
-                offset += msg['size']
-            
-            # Skip any padding
-            remaining = header['packet_len'] - header['header_size'] - data_to_read
-            if remaining > 0:
-                f.seek(remaining, 1)
     
     # Print channel detection info if auto mode
     if channel == 'auto' and detected_channels:
@@ -3,6 +3,7 @@
 Supports multiple backends:
 - irig106lib: Spec-compliant (default)
 - pychapter10: Compatibility mode
+- native: Direct struct serialization (same packets as Ch10Writer's PyChapter10 path)
 """
 
 import struct
@@ -15,10 +16,12 @@ try:
     from .schedule import ScheduledMessage
     from .flight_profile import FlightProfileGenerator, FlightState
     from .icd import MessageDefinition
+    from .core.packet_serializer import PacketSerializer
 except ImportError:
     from schedule import ScheduledMessage
     from flight_profile import FlightProfileGenerator, FlightState
     from icd import MessageDefinition
+    from core.packet_serializer import PacketSerializer
 
 
 class Ch10WriterBackend(ABC):
@@ -91,7 +94,8 @@ class PyChapter10Backend(Ch10WriterBackend):
         packet.rtc = rtc
         # Don't set data_type - PyChapter10 ignores it
         
-        # Set time fields
+        # Set time fields (payload is encoded from .time, which defaults to now)
+        packet.time = timestamp
         packet.seconds = timestamp.second
         packet.minutes = timestamp.minute
         packet.hours = timestamp.hour
@@ -302,11 +306,78 @@ class Irig106LibBackend(Ch10WriterBackend):
         return stats
 
 
+class NativeBackend(Ch10WriterBackend):
+    """Native backend - packs packets with struct into a reusable buffer.
+    
+    Time and MS1553F1 packets are byte-identical to the PyChapter10 packets
+    Ch10Writer builds, and so is an empty TMATS packet; a TMATS body is
+    written rather than dropped by MessageF0. Output differs from
+    PyChapter10Backend, which leaves fields at PyChapter10 defaults:
+    
+    - data_type is 0x01/0x11/0x19 instead of 0
+    - the TMATS body is written
+    - the Time F1 CSDW marks an external IRIG-B source instead of 0
+    - MS1553F1 intra-packet headers carry the message length instead of 0
+    """
+    
+    def __init__(self):
+        self.file = None
+        self.filepath = None
+        self.packet_count = 0
+        self.message_count = 0
+        self.serializer = PacketSerializer()
+        
+    def open(self, filepath: Path) -> None:
+        """Open file for writing."""
+        self.filepath = filepath
+        self.file = open(filepath, 'wb')
+        self.packet_count = 0
+        self.message_count = 0
+        
+    def write_tmats(self, content: str, channel_id: int, rtc: int) -> None:
+        """Write TMATS packet (Computer Generated Format 1)."""
+        length = self.serializer.tmats_packet(content.encode('utf-8'), channel_id, rtc)
+        self.serializer.write_to(self.file, length)
+        self.packet_count += 1
+        
+    def write_time(self, timestamp: datetime, channel_id: int, rtc: int) -> None:
+        """Write Time Data Format 1 packet (external source, IRIG-B)."""
+        length = self.serializer.time_packet(timestamp, channel_id, rtc)
+        self.serializer.write_to(self.file, length)
+        self.packet_count += 1
+        
+    def write_1553_messages(self, messages: List[Dict], channel_id: int, rtc: int) -> None:
+        """Write MS1553F1 packet with messages."""
+        length = self.serializer.ms1553_packet(
+            ((msg['ipts'], msg['bus'], msg['data']) for msg in messages),
+            channel_id, rtc
+        )
+        self.serializer.write_to(self.file, length)
+        self.message_count += len(messages)
+        self.packet_count += 1
+        
+    def close(self) -> Dict[str, Any]:
+        """Close file and return statistics."""
+        if self.file:
+            self.file.close()
+            
+        stats = {
+            'packets': self.packet_count,
+            'messages': self.message_count,
+            'backend': 'native'
+        }
+        
+        if self.filepath and self.filepath.exists():
+            stats['file_size'] = self.filepath.stat().st_size
+            
+        return stats
+
+
 def create_writer_backend(backend_name: str = 'irig106') -> Ch10WriterBackend:
     """Factory function to create writer backend.
     
     Args:
-        backend_name: 'irig106' (default) or 'pyc10'
+        backend_name: 'irig106' (default), 'pyc10' or 'native'
         
     Returns:
         Writer backend instance
@@ -315,5 +386,7 @@ def create_writer_backend(backend_name: str = 'irig106') -> Ch10WriterBackend:
         return PyChapter10Backend()
     elif backend_name == 'irig106' or backend_name == 'irig106lib':
         return Irig106LibBackend()
+    elif backend_name == 'native':
+        return NativeBackend()
     else:
-        raise ValueError(f"Unknown backend: '{backend_name}'. Use 'irig106' or 'pyc10'")
+        raise ValueError(f"Unknown backend: '{backend_name}'. Use 'irig106', 'pyc10' or 'native'")
@@ -0,0 +1,29 @@
+"""Shared fixtures for all tests."""
+
+import pytest
+from ch10gen.icd import ICDDefinition, MessageDefinition, WordDefinition
+
+
+@pytest.fixture
+def make_mixed_rate_icd():
+    """Factory of ICDs with one two-word message per rate (awkward rates by default)."""
+    def make(rates=(50, 20, 3, 7.5, 1)):
+        return ICDDefinition(
+            bus='A',
+            messages=[
+                MessageDefinition(
+                    name=f'MSG_{rate}HZ', rate_hz=rate, rt=rt, tr='BC2RT', sa=1, wc=2,
+                    words=[WordDefinition(name=f'w{i}', const=i, encode='u16') for i in range(2)]
+                )
+                for rt, rate in enumerate(rates, start=1)
+            ]
+        )
+    return make
+
+
+@pytest.fixture
+def schedule_key():
+    """Key identifying a scheduled message for sequence comparisons."""
+    def key(msg):
+        return (msg.message.name, msg.time_s, msg.major_frame, msg.minor_frame, msg.instance)
+    return key
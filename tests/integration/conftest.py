@@ -0,0 +1,9 @@
+"""Shared fixtures for integration tests."""
+
+import pytest
+
+
+@pytest.fixture
+def mixed_rate_icd(make_mixed_rate_icd):
+    """ICD with awkward rates that do not divide frame or shard lengths."""
+    return make_mixed_rate_icd()
@@ -1,8 +1,14 @@
 """Error injection tests."""
 
 import pytest
+import struct
+import tempfile
+from pathlib import Path
+from chapter10 import C10
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.icd import load_icd
 from ch10gen.utils.errors import (
-    ErrorInjectionConfig, MessageErrorInjector,
+    ErrorInjectionConfig, ErrorType, MessageErrorInjector,
     create_error_config_from_dict
 )
 
@@ -414,3 +420,44 @@ class TestErrorCombinations:
         assert max(differences) > 0
         # But within bounds (2ms = 2000μs)
         assert max(differences) <= 2000
+
+
+@pytest.mark.integration
+class TestErrorInjectionWriter:
+    """Test errors applied per packet by the writer."""
+    
+    def _write(self, errors, tmpdir):
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        scenario = {
+            'name': 'Errors',
+            'start_time_utc': '2025-01-01T00:00:00Z',
+            'duration_s': 5,
+            'defaults': {'data_mode': 'flight'},
+            'bus': {'errors': errors},
+        }
+        output_path = Path(tmpdir) / 'errors.c10'
+        stats = write_ch10_file(output_path, scenario, icd, seed=3, writer_backend='native')
+        messages = [bytes(msg.data) for packet in C10(str(output_path))
+                    if packet.data_type == 0x19 for msg in packet]
+        return icd, stats, messages
+    
+    def test_errors_in_file_match_statistics(self):
+        """Every message is counted and busy bits match the no-response count."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _, stats, messages = self._write({'no_response_percent': 20, 'parity_percent': 10}, tmpdir)
+        
+        busy = sum(1 for data in messages if struct.unpack_from('<H', data, 2)[0] & (1 << 3))
+        counts = stats['errors']['error_counts']
+        assert stats['errors']['total_errors'] == sum(counts.values())
+        assert counts[ErrorType.NO_RESPONSE] == busy
+        assert 0 < busy < len(messages)
+        assert counts[ErrorType.PARITY_ERROR] > 0
+    
+    def test_word_count_mismatch_in_file(self):
+        """Word count errors change the length of multi-word messages."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            icd, _, messages = self._write({'word_count_percent': 100}, tmpdir)
+        
+        expected = {2 + message.wc for message in icd.messages}
+        lengths = {len(data) // 2 for data in messages}
+        assert lengths - expected
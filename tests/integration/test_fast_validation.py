@@ -0,0 +1,96 @@
+"""Tests for header-only fast validation."""
+
+import pytest
+from datetime import datetime, timezone
+from pathlib import Path
+from click.testing import CliRunner
+from ch10gen.__main__ import cli
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.core.packet_serializer import PacketSerializer
+from ch10gen.icd import load_icd
+from ch10gen.validate import Ch10Validator
+from ch10gen.wire_reader import WireFile
+
+
+@pytest.fixture(scope='module')
+def flight_file(tmp_path_factory):
+    icd = load_icd(Path('icd/test_icd.yaml'))
+    scenario = {'name': 'Fast', 'start_time_utc': '2025-01-01T00:00:00Z', 'duration_s': 10}
+    path = tmp_path_factory.mktemp('fast') / 'flight.c10'
+    write_ch10_file(path, scenario, icd, seed=4, writer_backend='irig106')
+    return path
+
+
+def _packet_offsets(path):
+    with WireFile(path, use_index=False) as wire:
+        return [(packet.offset, packet.data_type) for packet in wire.packets()]
+
+
+@pytest.mark.integration
+class TestFastValidation:
+    """Test fast validation against full decoding and on damaged files."""
+
+    def test_same_report(self, flight_file):
+        """A valid file gives the report of a full validation."""
+        deep = Ch10Validator(flight_file).validate()
+        fast = Ch10Validator(flight_file).validate_fast()
+        assert fast.pop('deep_decoded_packets') >= 1
+        assert fast == deep
+        assert fast['errors'] == [] and fast['warnings'] == []
+
+    def test_checksum_mismatch(self, flight_file, tmp_path):
+        """A damaged header checksum is an error and the packet is decoded."""
+        data = bytearray(flight_file.read_bytes())
+        offset = [o for o, t in _packet_offsets(flight_file) if t == 0x19][2]
+        data[offset + 22] ^= 0xFF
+        path = tmp_path / 'checksum.c10'
+        path.write_bytes(bytes(data))
+
+        stats = Ch10Validator(path).validate_fast(sample_interval=0)
+        assert stats['errors'] == [f'Header checksum mismatch in 1 packets (offsets: {offset})']
+        assert Ch10Validator(path).validate()['errors'][0] == stats['errors'][0]
+        assert stats['deep_decoded_packets'] == 2  # TMATS and the damaged packet
+
+    def test_garbage_resync(self, flight_file, tmp_path):
+        """Bytes between packets are reported and skipped."""
+        data = flight_file.read_bytes()
+        offset = _packet_offsets(flight_file)[5][0]
+        path = tmp_path / 'garbage.c10'
+        path.write_bytes(data[:offset] + b'\x00' * 10 + data[offset:])
+
+        stats = Ch10Validator(path).validate_fast()
+        assert stats['errors'] == [f"Invalid packet header at 1 offsets (first at {offset})"]
+        assert stats['packet_count'] == len(_packet_offsets(flight_file))
+        assert Ch10Validator(path).validate()['errors'][0] == stats['errors'][0]
+
+    def test_trailing_bytes(self, flight_file, tmp_path):
+        """Bytes after the last packet are reported by both validations."""
+        path = tmp_path / 'trailing.c10'
+        path.write_bytes(flight_file.read_bytes() + b'\x00' * 7)
+
+        for stats in (Ch10Validator(path).validate_fast(), Ch10Validator(path).validate()):
+            assert stats['errors'] == ['7 trailing bytes after the last packet']
+
+    def test_rtc_and_time_cadence(self, tmp_path):
+        """Backward RTC steps and time packets off 1 Hz are warnings."""
+        serializer = PacketSerializer()
+        packets = []
+        for rtc in (0, 1_000_000, 2_500_000):
+            length = serializer.time_packet(datetime(2025, 1, 1, tzinfo=timezone.utc), 0x0001, rtc)
+            packets.append(serializer.getvalue(length))
+        for rtc in (10, 30, 20):
+            length = serializer.ms1553_packet([(rtc, 0, [0x0822, 0x0800, 1, 2])], 0x0002, rtc)
+            packets.append(serializer.getvalue(length))
+        path = tmp_path / 'rtc.c10'
+        path.write_bytes(b''.join(packets))
+
+        stats = Ch10Validator(path).validate_fast()
+        assert 'RTC not monotonic on channel 0x002: 1 backward steps' in stats['warnings']
+        assert 'Time packets not at 1 Hz: 1 of 2 intervals off by more than 10%' in stats['warnings']
+        assert stats['1553_messages'] == 3
+
+    def test_cli(self, flight_file):
+        """validate --fast prints the usual summary."""
+        result = CliRunner().invoke(cli, ['validate', '--fast', str(flight_file)])
+        assert result.exit_code == 0
+        assert 'Validation PASSED' in result.output
@@ -0,0 +1,232 @@
+"""Test native struct-based packet serializer against PyChapter10."""
+
+import pytest
+import random
+import tempfile
+import numpy as np
+from pathlib import Path
+from datetime import datetime, timedelta
+from chapter10 import C10
+from chapter10.time import TimeF1
+from chapter10.ms1553 import MS1553F1
+from chapter10.message import MessageF0
+from ch10gen.core.packet_serializer import PacketSerializer
+from ch10gen.writer_backend import NativeBackend, PyChapter10Backend, create_writer_backend
+from ch10gen.icd import load_icd
+from ch10gen.ch10_writer import write_ch10_file
+
+
+@pytest.mark.unit
+class TestPacketSerializer:
+    """Compare serializer output with PyChapter10 packet objects."""
+
+    def test_time_packets_identical(self):
+        """TimeF1 packets match PyChapter10 for random fields."""
+        rng = random.Random(0)
+        serializer = PacketSerializer(64)
+        for _ in range(500):
+            timestamp = datetime(2020, 1, 1) + timedelta(seconds=rng.uniform(0, 2 * 366 * 86400))
+            channel_id = rng.randint(0, 0xFFFF)
+            rtc = rng.randint(0, 2**48 - 1)
+            time_source, time_format = rng.randint(0, 15), rng.randint(0, 15)
+
+            packet = TimeF1()
+            packet.channel_id = channel_id
+            packet.data_type = 0x11
+            packet.rtc = rtc
+            packet.time_source = time_source
+            packet.time_format = time_format
+            packet.time = timestamp
+
+            length = serializer.time_packet(timestamp, channel_id, rtc, time_source, time_format)
+            assert serializer.getvalue(length) == bytes(packet)
+
+    def test_1553_packets_identical(self):
+        """MS1553F1 packets match PyChapter10 for word and byte payloads."""
+        rng = random.Random(1)
+        serializer = PacketSerializer(64)  # Small buffer forces growth
+        for _ in range(300):
+            channel_id = rng.randint(0, 0xFFFF)
+            rtc = rng.randint(0, 2**48 - 1)
+
+            packet = MS1553F1()
+            packet.channel_id = channel_id
+            packet.data_type = 0x19
+            packet.rtc = rtc
+            messages = []
+            for _ in range(rng.randint(0, 20)):
+                words = [rng.randint(0, 0xFFFF) for _ in range(rng.randint(2, 34))]
+                data = b''.join(word.to_bytes(2, 'little') for word in words)
+                ipts = rng.randint(0, 2**64 - 1)
+                bus = rng.randint(0, 1)
+
+                msg = packet.Message()
+                msg.data = data
+                msg.length = len(data)
+                msg.ipts = ipts
+                msg.bus = bus
+                packet.append(msg)
+                messages.append((ipts, bus, words if rng.random() < 0.5 else data))
+            packet.count = len(messages)
+
+            length = serializer.ms1553_packet(messages, channel_id, rtc)
+            assert serializer.getvalue(length) == bytes(packet)
+
+    def test_empty_tmats_identical(self):
+        """Empty TMATS packet matches PyChapter10 MessageF0 output."""
+        packet = MessageF0()
+        packet.channel_id = 0
+        packet.data_type = 0x01
+        packet.rtc = 0
+
+        serializer = PacketSerializer()
+        assert serializer.getvalue(serializer.tmats_packet(b'')) == bytes(packet)
+
+    def test_word_out_of_range(self):
+        """Words that do not fit in 16 bits are rejected like struct.pack."""
+        serializer = PacketSerializer()
+        with pytest.raises(Exception):
+            serializer.ms1553_packet([(0, 0, [0x10000])], 2, 0)
+
+
+@pytest.mark.integration
+class TestNativeBackend:
+    """Test the native backend and writer integration."""
+
+    def test_factory(self):
+        """Native backend is selectable by name."""
+        assert isinstance(create_writer_backend('native'), NativeBackend)
+
+    def test_backend_round_trip(self):
+        """Packets written by the native backend parse with PyChapter10."""
+        content = "G\\DSI\\N:ch10-1553-flightgen;\r\nG\\106:11;\r\n"
+        timestamp = datetime(2025, 3, 4, 5, 6, 7, 890000)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / 'native.c10'
+            backend = NativeBackend()
+            backend.open(test_file)
+            backend.write_tmats(content, 0, 0)
+            backend.write_time(timestamp, 1, 0)
+            backend.write_1553_messages(
+                [{'ipts': 1000, 'bus': 1, 'data': bytes.fromhex('22283412cdab')}], 2, 10
+            )
+            stats = backend.close()
+            assert stats == {'packets': 3, 'messages': 1, 'backend': 'native',
+                             'file_size': test_file.stat().st_size}
+
+            packets = list(C10(str(test_file)))
+
+        assert [p.data_type for p in packets] == [0x01, 0x11, 0x19]
+        assert packets[0].data_length == 4 + len(content)
+        assert packets[1].time.replace(year=timestamp.year) == timestamp
+        messages = list(packets[2])
+        assert len(messages) == 1
+        assert messages[0].ipts == 1000 and messages[0].bus == 1
+        assert messages[0].data == bytes.fromhex('22283412cdab')
+
+    def _write_backend(self, backend, path, tmats):
+        """Make the same write calls on a backend and return the file bytes."""
+        backend.open(path)
+        backend.write_tmats(tmats, 0, 0)
+        backend.write_time(datetime(2025, 3, 4, 5, 6, 7, 890000), 1, 5)
+        backend.write_1553_messages(
+            [{'ipts': 1000, 'bus': 1, 'data': bytes.fromhex('22283412cdab')},
+             {'ipts': 2000, 'bus': 0, 'data': bytes.fromhex('2428ffff')}], 2, 10
+        )
+        backend.close()
+        return path.read_bytes()
+
+    def test_backend_bytes_match_writer_packets(self):
+        """Native backend bytes match the PyChapter10 packets Ch10Writer builds."""
+        tmats = MessageF0()
+        tmats.channel_id = 0
+        tmats.data_type = 0x01
+        tmats.rtc = 0
+
+        time_packet = TimeF1()
+        time_packet.channel_id = 1
+        time_packet.data_type = 0x11
+        time_packet.rtc = 5
+        time_packet.time_source = 1
+        time_packet.time_format = 0
+        time_packet.time = datetime(2025, 3, 4, 5, 6, 7, 890000)
+
+        ms1553 = MS1553F1()
+        ms1553.channel_id = 2
+        ms1553.data_type = 0x19
+        ms1553.rtc = 10
+        for ipts, bus, data in ((1000, 1, '22283412cdab'), (2000, 0, '2428ffff')):
+            msg = ms1553.Message()
+            msg.data = bytes.fromhex(data)
+            msg.length = len(msg.data)
+            msg.ipts = ipts
+            msg.bus = bus
+            ms1553.append(msg)
+        ms1553.count = 2
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            native = self._write_backend(NativeBackend(), Path(tmpdir) / 'native.c10', '')
+
+        assert native == bytes(tmats) + bytes(time_packet) + bytes(ms1553)
+
+    def test_backend_differences_from_pyc10_backend(self):
+        """Native and PyChapter10 backends differ only in the documented fields."""
+        content = "G\\106:11;\r\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            native, pyc10 = [
+                self._write_backend(backend, Path(tmpdir) / f'{name}.c10', content)
+                for name, backend in (('native', NativeBackend()), ('pyc10', PyChapter10Backend()))
+            ]
+
+        def split(data):
+            packets = []
+            while data:
+                length = int.from_bytes(data[4:8], 'little')
+                packets.append(bytearray(data[:length]))
+                data = data[length:]
+            return packets
+
+        native, pyc10 = split(native), split(pyc10)
+        assert [p[15] for p in native] == [0x01, 0x11, 0x19]
+        assert [p[15] for p in pyc10] == [0, 0, 0]
+
+        # TMATS body is written by native, dropped by MessageF0
+        body = content.encode('utf-8')
+        assert native[0][24:28 + len(body)] == b'\0' * 4 + body
+        assert pyc10[0][24:] == b'\0' * 4
+        # Time CSDW source field; BCD time body is identical
+        assert (native[1][24], pyc10[1][24]) == (1, 0)
+        assert native[1][28:] == pyc10[1][28:]
+        # Message length in each intra-packet header
+        assert (native[2][40], native[2][60]) == (6, 4)
+        native[2][40] = native[2][60] = 0
+        assert native[2][24:] == pyc10[2][24:]
+
+        # Remaining header fields match once data type and checksum are excluded
+        for native_packet, pyc10_packet in zip(native[1:], pyc10[1:]):
+            assert native_packet[:15] == pyc10_packet[:15]
+            assert native_packet[16:22] == pyc10_packet[16:22]
+
+    @pytest.mark.parametrize('data_mode', ['flight', 'random'])
+    def test_writer_output_identical(self, data_mode):
+        """Writer output is byte-identical between pyc10 and native backends."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+
+        outputs = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for backend in ('pyc10', 'native'):
+                random.seed(11)
+                np.random.seed(11)
+                scenario = {
+                    'name': 'Native Test',
+                    'start_time_utc': '2025-01-01T00:00:00Z',
+                    'duration_s': 20,
+                    'defaults': {'data_mode': data_mode},
+                    'bus': {'errors': {'parity_percent': 5.0}},
+                }
+                output_path = Path(tmpdir) / f'{backend}.c10'
+                stats = write_ch10_file(output_path, scenario, icd, writer_backend=backend)
+                outputs.append((output_path.read_bytes(), stats['total_packets']))
+
+        assert outputs[0] == outputs[1]
@@ -0,0 +1,78 @@
+"""Tests for chunked multiprocess validation."""
+
+import pytest
+from pathlib import Path
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.core.packet_serializer import PacketSerializer
+from ch10gen.icd import load_icd
+from ch10gen.packet_index import write_index
+from ch10gen.validate import Ch10Validator
+from ch10gen.wire_reader import WireFile
+
+
+@pytest.fixture(scope='module')
+def flight_file(tmp_path_factory):
+    icd = load_icd(Path('icd/test_icd.yaml'))
+    scenario = {'name': 'Parallel', 'start_time_utc': '2025-01-01T00:00:00Z', 'duration_s': 20}
+    path = tmp_path_factory.mktemp('validate') / 'flight.c10'
+    write_ch10_file(path, scenario, icd, seed=11, writer_backend='native')
+    return path
+
+
+def _report(stats):
+    """Report fields compared between serial and parallel runs."""
+    return {key: value for key, value in stats.items() if key != 'file_size_bytes'}
+
+
+@pytest.mark.integration
+class TestParallelValidation:
+    """Test that chunked validation reproduces the serial report."""
+
+    def test_chunks_start_at_packets(self, flight_file):
+        """Chunks cover the file and start on packet headers."""
+        validator = Ch10Validator(flight_file, workers=4, chunk_bytes=1024)
+        chunks = validator._plan_chunks()
+        assert len(chunks) > 4
+        assert chunks[0][0] == 0 and chunks[-1][1] == flight_file.stat().st_size
+        assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+        with WireFile(flight_file, use_index=False) as wire:
+            offsets = {packet.offset for packet in wire.packets()}
+        assert {start for start, _ in chunks} <= offsets
+
+    @pytest.mark.parametrize('indexed', [False, True])
+    def test_same_report(self, flight_file, tmp_path, indexed):
+        """Parallel validation gives the serial report, with or without an index."""
+        path = tmp_path / 'flight.c10'
+        path.write_bytes(flight_file.read_bytes())
+        if indexed:
+            write_index(path)
+
+        serial = Ch10Validator(path).validate()
+        parallel = Ch10Validator(path, workers=3, chunk_bytes=4096).validate()
+
+        assert serial['errors'] == []
+        assert serial['1553_messages'] > 0
+        assert _report(parallel) == _report(serial)
+
+    def test_ipts_regression_across_chunks(self, tmp_path):
+        """Backward IPTS steps are found inside packets and across chunk edges."""
+        serializer = PacketSerializer()
+        packets = []
+        for k, ipts in enumerate([1000, 2000, 1500, 3000]):
+            length = serializer.ms1553_packet([(ipts, 0, [0x0822, 0x0800, 1, 2]),
+                                               (ipts + 10, 0, [0x0822, 0x0800, 1, 2])],
+                                              0x0200, k)
+            packets.append(serializer.getvalue(length))
+        path = tmp_path / 'ipts.c10'
+        path.write_bytes(b''.join(packets))
+
+        expected = 'IPTS not monotonic on channel 0x200: 1 backward steps'
+        serial = Ch10Validator(path).validate()
+        parallel = Ch10Validator(path, workers=2, chunk_bytes=len(packets[0])).validate()
+        assert expected in serial['warnings']
+        assert parallel['warnings'] == serial['warnings']
+
+    def test_invalid_workers(self, flight_file):
+        """Worker counts must be positive."""
+        with pytest.raises(ValueError):
+            Ch10Validator(flight_file, workers=0)
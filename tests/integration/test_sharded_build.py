@@ -0,0 +1,148 @@
+"""Test multiprocess time-sharded builds."""
+
+import random
+import struct
+import pytest
+import tempfile
+from pathlib import Path
+from chapter10 import C10
+from ch10gen.icd import load_icd
+from ch10gen.schedule import stream_schedule_from_icd
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.utils.errors import ErrorType
+
+
+def _scenario(data_mode, **bus):
+    return {
+        'name': 'Sharded Test',
+        'start_time_utc': '2025-01-01T00:00:00Z',
+        'duration_s': 21.7,
+        'defaults': {'data_mode': data_mode},
+        'bus': bus,
+    }
+
+
+@pytest.mark.unit
+class TestScheduleSplit:
+    """Test splitting a schedule stream into windows."""
+
+    @pytest.mark.parametrize('duration_s,shard_major_frames', [
+        (7.3, 1), (7.3, 2), (60.0, 7), (60.0, 60), (3.0, 10)
+    ])
+    def test_windows_concatenate_to_stream(self, duration_s, shard_major_frames,
+                                           mixed_rate_icd, schedule_key):
+        """Windows yield the full stream's messages, in order, with no overlap."""
+        streamed = stream_schedule_from_icd(mixed_rate_icd, duration_s)
+        windows = streamed.split(shard_major_frames)
+
+        assert [schedule_key(m) for w in windows for m in w] == [schedule_key(m) for m in streamed]
+        for window in windows:
+            assert all(window.window_start_s <= m.time_s < window.window_end_s for m in window)
+
+    def test_invalid_shard_size(self, mixed_rate_icd):
+        """Shard size must be positive."""
+        with pytest.raises(ValueError):
+            stream_schedule_from_icd(mixed_rate_icd, 5.0).split(0)
+
+
+@pytest.mark.integration
+class TestShardedBuild:
+    """Test sharded file generation."""
+
+    def _build(self, tmpdir, name, scenario, seed=3):
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        output_path = Path(tmpdir) / f'{name}.c10'
+        stats = write_ch10_file(output_path, scenario, icd, seed=seed, writer_backend='native')
+        return output_path, stats
+
+    @pytest.mark.parametrize('data_mode', ['flight', 'random'])
+    def test_output_independent_of_workers(self, data_mode):
+        """The same seed gives identical bytes for any worker count."""
+        outputs = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for workers in (1, 2, 3):
+                scenario = _scenario(data_mode, workers=workers, shard_major_frames=4,
+                                     errors={'parity_percent': 5.0})
+                output_path, stats = self._build(tmpdir, f'workers_{workers}', scenario)
+                outputs.append((output_path.read_bytes(), stats['total_packets'],
+                                stats['total_messages'], stats['errors']['total_errors']))
+            assert not list(Path(tmpdir).glob('.ch10gen_shards_*'))
+
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_single_shard_matches_streaming(self):
+        """One shard covering the whole duration equals a single-process build."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sharded, _ = self._build(tmpdir, 'sharded',
+                                     _scenario('flight', workers=1, shard_major_frames=1000))
+            single, _ = self._build(tmpdir, 'single', _scenario('flight', streaming=True))
+            assert sharded.read_bytes() == single.read_bytes()
+
+    def test_scenario_data_independent_of_shards(self):
+        """Scenario fields follow schedule time and instance, not generation order."""
+        decoded = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, bus in [('single', {'streaming': True}),
+                              ('sharded', {'workers': 3, 'shard_major_frames': 2})]:
+                scenario = _scenario('increment', **bus)
+                scenario['messages'] = {'NAV_20HZ': {'fields': {
+                    'altitude_ft': {'mode': 'sine', 'center': 10000, 'amplitude': 500, 'frequency': 0.2},
+                    'airspeed_kt': {'mode': 'pattern', 'values': [250, 260, 270]},
+                    'status': {'mode': 'expression', 'formula': 'message_count % 7'},
+                }}}
+                output_path, _ = self._build(tmpdir, name, scenario)
+                # Shards flush packets at their boundaries, so compare messages
+                decoded.append([
+                    (msg.ipts, bytes(msg.data))
+                    for packet in C10(str(output_path)) if packet.data_type == 0x19
+                    for msg in packet
+                ])
+
+        assert decoded[0] == decoded[1]
+        # Data words follow the command and status words; NAV_20HZ is RT 10
+        nav_words = [struct.unpack('<4H', data[4:12]) for _, data in decoded[1]
+                     if struct.unpack('<H', data[:2])[0] >> 11 == 10]
+        assert [words[1] for words in nav_words] == [(250, 260, 270)[k % 3] for k in range(len(nav_words))]
+        assert [words[3] for words in nav_words] == [k % 7 for k in range(len(nav_words))]
+
+    def test_ipts_and_time_cadence(self):
+        """IPTS stays strictly increasing and time packets stay at 1 Hz."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sharded, stats = self._build(tmpdir, 'sharded',
+                                         _scenario('flight', workers=2, shard_major_frames=3))
+            single, _ = self._build(tmpdir, 'single', _scenario('flight', streaming=True))
+
+            last_ipts = -1
+            message_count = 0
+            packets = list(C10(str(sharded)))
+            for packet in packets:
+                if packet.data_type == 0x19:
+                    for msg in packet:
+                        assert msg.ipts > last_ipts
+                        last_ipts = msg.ipts
+                        message_count += 1
+
+            def time_packets(path):
+                return [(p.rtc, p.time) for p in C10(str(path)) if p.data_type == 0x11]
+
+            assert packets[0].data_type == 0x01
+            assert sum(1 for p in packets if p.data_type == 0x01) == 1
+            assert time_packets(sharded) == time_packets(single)
+            assert message_count == stats['total_messages']
+            assert stats['shards'] == 8
+
+    def test_bus_failover_counted_once(self):
+        """The failover is counted in one shard and later shards stay on bus B."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = []
+            for name, bus in [('single', {'streaming': True}),
+                              ('one_worker', {'workers': 1, 'shard_major_frames': 2}),
+                              ('two_workers', {'workers': 2, 'shard_major_frames': 2})]:
+                random.seed(5)
+                _, stats = self._build(tmpdir, name, _scenario(
+                    'flight', errors={'bus_failover_time_s': 2.0}, **bus))
+                results.append((stats['errors']['error_counts'][ErrorType.BUS_FAILOVER],
+                                stats['errors']['current_bus'], random.random()))
+
+        random.seed(5)
+        assert results == [(1, 'B', random.random())] * 3
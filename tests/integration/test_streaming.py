@@ -0,0 +1,108 @@
+"""Test streaming (constant-memory) schedule and writer pipeline."""
+
+import pytest
+import random
+import tempfile
+import numpy as np
+from pathlib import Path
+from datetime import datetime, timezone
+from ch10gen.icd import load_icd
+from ch10gen.schedule import (
+    ScheduledMessage, BusSchedule, ScheduleStream,
+    build_schedule_from_icd, stream_schedule_from_icd
+)
+from ch10gen.ch10_writer import Ch10Writer, Ch10WriterConfig, write_ch10_file
+
+
+@pytest.mark.unit
+class TestScheduleStream:
+    """Test the lazily merged schedule."""
+
+    @pytest.mark.parametrize('duration_s', [0.5, 1.0, 7.3, 60.0])
+    def test_matches_materialized_schedule(self, duration_s, mixed_rate_icd, schedule_key):
+        """Streaming yields the exact sequence build_schedule_from_icd sorts."""
+        built = build_schedule_from_icd(mixed_rate_icd, duration_s)
+        streamed = stream_schedule_from_icd(mixed_rate_icd, duration_s)
+
+        assert isinstance(streamed, ScheduleStream)
+        assert [schedule_key(m) for m in streamed] == [schedule_key(m) for m in built]
+
+    @pytest.mark.parametrize('duration_s', [0.5, 7.3, 60.0])
+    def test_statistics_match(self, duration_s, mixed_rate_icd):
+        """Statistics are computed without materializing the schedule."""
+        built = build_schedule_from_icd(mixed_rate_icd, duration_s)
+        streamed = stream_schedule_from_icd(mixed_rate_icd, duration_s)
+
+        assert streamed.get_statistics() == built.get_statistics()
+
+    def test_stream_is_reiterable(self, mixed_rate_icd, schedule_key):
+        """Each iteration starts a fresh lazy merge."""
+        streamed = stream_schedule_from_icd(mixed_rate_icd, 2.0)
+        assert [schedule_key(m) for m in streamed] == [schedule_key(m) for m in streamed]
+
+    def test_bus_schedule_iterable(self, mixed_rate_icd):
+        """BusSchedule iterates over its messages."""
+        built = build_schedule_from_icd(mixed_rate_icd, 1.0)
+        assert list(built) == built.messages
+
+
+@pytest.mark.integration
+class TestStreamingWriter:
+    """Test that streaming output is byte-identical to the sorted path."""
+
+    def _collect_events(self, messages, interval_s, streaming):
+        writer = Ch10Writer(Ch10WriterConfig(time_packet_interval_s=interval_s,
+                                             streaming=streaming))
+        writer.start_time = datetime(2025, 1, 1, 0, 0, 0, 123457, tzinfo=timezone.utc)
+        events = []
+        writer._write_events = lambda evts, *args: events.extend(evts)
+        last_time_s = writer._write_1553_packets_with_time(
+            BusSchedule(messages=messages), None, None, None
+        )
+        return events, last_time_s
+
+    def test_event_merge_matches_sort(self):
+        """Lazy merge reproduces tie-breaking and the end-of-data cutoff."""
+        class _Msg:
+            name = 'm'
+            wc = 1
+
+        rng = random.Random(1)
+        for _ in range(500):
+            interval_s = rng.choice([1.0, 0.3, 0.1])
+            times = sorted(
+                rng.choice([
+                    round(rng.uniform(0, 5), rng.choice([1, 2, 6])),
+                    rng.randint(0, 5) * interval_s,
+                    rng.randint(0, 5) * interval_s + 1e-7,
+                ])
+                for _ in range(rng.randint(0, 20))
+            )
+            messages = [ScheduledMessage(_Msg, t, 0, 0) for t in times]
+
+            assert (self._collect_events(messages, interval_s, streaming=True) ==
+                    self._collect_events(messages, interval_s, streaming=False))
+
+    @pytest.mark.parametrize('data_mode', ['flight', 'random'])
+    def test_file_byte_identical(self, data_mode):
+        """Streaming and materialized builds write the same bytes."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+
+        outputs = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for streaming in (False, True):
+                random.seed(7)
+                np.random.seed(7)
+                scenario = {
+                    'name': 'Streaming Test',
+                    'start_time_utc': '2025-01-01T00:00:00Z',
+                    'duration_s': 12.5,
+                    'defaults': {'data_mode': data_mode},
+                    'bus': {'streaming': streaming},
+                }
+                output_path = Path(tmpdir) / f'stream_{streaming}.c10'
+                stats = write_ch10_file(output_path, scenario, icd)
+                outputs.append((output_path.read_bytes(), stats['total_packets'],
+                                stats['total_messages'], stats['duration_s']))
+
+        assert outputs[0] == outputs[1]
@@ -0,0 +1,40 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+from pathlib import Path
+from ch10gen.core.encode1553 import build_command_word, build_status_word
+from ch10gen.core.packet_serializer import PacketSerializer
+from ch10gen.icd import MessageDefinition
+
+
+def _payload(payload):
+    """Words of a message: (ICD message, data words) gets its command and status words."""
+    if isinstance(payload, tuple) and isinstance(payload[0], MessageDefinition):
+        message, data = payload
+        command = build_command_word(rt=message.rt, tr=message.is_receive(), sa=message.sa,
+                                     wc=message.wc)
+        return [command, build_status_word(rt=message.rt)] + [int(word) for word in data]
+    return payload
+
+
+@pytest.fixture
+def icd_recording():
+    """
+    Writer of hand-built MS1553 recordings.
+
+    Called with a path and (rtc, messages) per packet, where messages are
+    (ipts, bus, payload) tuples and a payload is either (ICD message,
+    data words) or raw command/status/data words. Returns the path.
+    """
+    def write(path, packets, channel_id=0x0200):
+        serializer = PacketSerializer()
+        chunks = []
+        for rtc, messages in packets:
+            length = serializer.ms1553_packet(
+                [(ipts, bus, _payload(payload)) for ipts, bus, payload in messages],
+                channel_id, rtc)
+            chunks.append(serializer.getvalue(length))
+        path = Path(path)
+        path.write_bytes(b''.join(chunks))
+        return path
+    return write
@@ -0,0 +1,159 @@
+"""Tests for the array-backed integer-nanosecond schedule."""
+
+import pytest
+import tempfile
+import numpy as np
+from pathlib import Path
+from chapter10 import C10
+from ch10gen.icd import load_icd
+from ch10gen.schedule import (
+    BusSchedule, ScheduledMessage, SCHEDULE_DTYPE,
+    build_array_schedule_from_icd, build_schedule_from_icd
+)
+from ch10gen.ch10_writer import write_ch10_file
+
+
+@pytest.mark.unit
+class TestArraySchedule:
+    """Test array schedule construction and adapters."""
+
+    def test_exact_times(self, make_mixed_rate_icd):
+        """Times are exact multiples of each period with no drift."""
+        schedule = build_array_schedule_from_icd(make_mixed_rate_icd((50, 3)), 3600.0)
+        entries = schedule.entries
+        fifty = entries['time_ns'][entries['message_index'] == 0]
+        three = entries['time_ns'][entries['message_index'] == 1]
+
+        assert schedule.entries.dtype == SCHEDULE_DTYPE
+        assert np.array_equal(fifty, np.arange(50 * 3600) * 20_000_000)
+        assert len(three) == 3 * 3600
+        assert three[-1] == (3 * 3600 - 1) * 1_000_000_000 // 3
+
+    def test_matches_object_schedule(self, make_mixed_rate_icd):
+        """Transmissions agree with build_schedule_from_icd up to float drift."""
+        icd = make_mixed_rate_icd()
+        array_schedule = build_array_schedule_from_icd(icd, 7.3)
+        built = build_schedule_from_icd(icd, 7.3)
+
+        def keyed(messages):
+            # Float accumulation lands a hair before exact times (which
+            # reorders ties, shifts frame indices and can add a message at
+            # the very end), so compare rounded times
+            return sorted((round(m.time_s, 6), m.message.name)
+                          for m in messages if m.time_s < 7.3 - 1e-6)
+
+        messages = list(array_schedule)
+        assert all(isinstance(m, ScheduledMessage) for m in messages)
+        assert keyed(messages) == keyed(built.messages)
+        assert len(messages) == len(keyed(messages))
+        assert [(m.major_frame, m.minor_frame) for m in messages] == \
+            [(int(m.time_s), round(m.time_s * 1e9) // 20_000_000) for m in messages]
+
+    def test_ties_keep_icd_order(self, make_mixed_rate_icd):
+        """Simultaneous messages stay in ICD order."""
+        schedule = build_array_schedule_from_icd(make_mixed_rate_icd((10, 10, 5)), 1.0)
+        assert schedule.entries['message_index'][:3].tolist() == [0, 1, 2]
+
+    def test_instances(self, make_mixed_rate_icd):
+        """Each message's transmissions are numbered 0, 1, 2... in time order."""
+        icd = make_mixed_rate_icd()
+        entries = build_array_schedule_from_icd(icd, 7.3, jitter_ms=2.0,
+                                                rng=np.random.default_rng(1)).entries
+        built = build_schedule_from_icd(icd, 7.3)
+        for index, message in enumerate(icd.messages):
+            instances = entries['instance'][entries['message_index'] == index]
+            assert np.array_equal(instances, np.arange(len(instances)))
+            assert [m.instance for m in built.messages if m.message is message] == \
+                list(range(sum(1 for m in built.messages if m.message is message)))
+
+    def test_jitter(self, make_mixed_rate_icd):
+        """Jitter is bounded, keeps times in range and is reproducible."""
+        icd = make_mixed_rate_icd()
+        exact = build_array_schedule_from_icd(icd, 10.0)
+        jittered = build_array_schedule_from_icd(icd, 10.0, jitter_ms=2.0,
+                                                 rng=np.random.default_rng(4))
+        again = build_array_schedule_from_icd(icd, 10.0, jitter_ms=2.0,
+                                              rng=np.random.default_rng(4))
+
+        times = jittered.entries['time_ns']
+        assert np.array_equal(times, again.entries['time_ns'])
+        assert np.all(np.diff(times) >= 0)
+        assert times.min() >= 0 and times.max() < 10_000_000_000
+        assert not np.array_equal(times, exact.entries['time_ns'])
+        assert np.abs(np.sort(times) - np.sort(exact.entries['time_ns'])).max() <= 4_000_000
+        assert np.array_equal(jittered.entries['major_frame'], times // 1_000_000_000)
+
+    def test_window_and_adapter(self, make_mixed_rate_icd):
+        """Window queries and BusSchedule conversion match the records."""
+        schedule = build_array_schedule_from_icd(make_mixed_rate_icd(), 5.0)
+        window = schedule.get_messages_in_window(1.0, 2.0)
+        assert window and all(1.0 <= m.time_s < 2.0 for m in window)
+        assert len(window) == np.count_nonzero((schedule.times_s >= 1.0) & (schedule.times_s < 2.0))
+
+        bus_schedule = schedule.to_bus_schedule()
+        assert isinstance(bus_schedule, BusSchedule)
+        assert len(bus_schedule.messages) == len(schedule)
+
+    def test_statistics(self, make_mixed_rate_icd):
+        """Statistics keys and counts match the object schedule."""
+        icd = make_mixed_rate_icd((50, 20))
+        stats = build_array_schedule_from_icd(icd, 10.0).get_statistics()
+        built = build_schedule_from_icd(icd, 10.0).get_statistics()
+        assert stats.keys() == built.keys()
+        # Exactly rate * duration transmissions (float accumulation adds one)
+        assert stats['total_messages'] == 700
+        assert stats['major_frames'] == built['major_frames']
+        assert stats['minor_frames'] == built['minor_frames']
+
+    def test_compact(self, make_mixed_rate_icd):
+        """Each transmission takes one 24-byte record."""
+        schedule = build_array_schedule_from_icd(make_mixed_rate_icd(), 60.0)
+        assert schedule.nbytes == 24 * len(schedule)
+
+    def test_invalid_rate(self, make_mixed_rate_icd):
+        """Non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            build_array_schedule_from_icd(make_mixed_rate_icd((0,)), 1.0)
+
+
+@pytest.mark.integration
+class TestArrayScheduleWriter:
+    """Test writing files from an array schedule."""
+
+    def test_write_file(self):
+        """The writer accepts an array schedule and keeps IPTS monotonic."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        scenario = {
+            'name': 'Array Schedule',
+            'start_time_utc': '2025-01-01T00:00:00Z',
+            'duration_s': 5,
+            'bus': {'schedule_backend': 'array', 'jitter_ms': 1.0},
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / 'array.c10'
+            stats = write_ch10_file(output_path, scenario, icd, writer_backend='native')
+
+            ipts = [msg.ipts for packet in C10(str(output_path))
+                    if packet.data_type == 0x19 for msg in packet]
+
+        assert len(ipts) == stats['total_messages']
+        assert ipts == sorted(set(ipts))
+
+    def test_jitter_follows_seed(self):
+        """Jittered files depend on the seed only, not on the global RNG."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        scenario = {
+            'name': 'Array Jitter',
+            'start_time_utc': '2025-01-01T00:00:00Z',
+            'duration_s': 2,
+            'bus': {'schedule_backend': 'array', 'jitter_ms': 1.0},
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outputs = []
+            for k, seed in enumerate((7, 7, 8)):
+                np.random.seed(k)
+                output_path = Path(tmpdir) / f'array_{k}.c10'
+                write_ch10_file(output_path, scenario, icd, seed=seed, writer_backend='native')
+                outputs.append(output_path.read_bytes())
+
+        assert outputs[0] == outputs[1] != outputs[2]
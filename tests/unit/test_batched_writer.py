@@ -0,0 +1,118 @@
+"""Tests for the batched background I/O output stage."""
+
+import time
+import random
+import pytest
+import tempfile
+import numpy as np
+from pathlib import Path
+from click.testing import CliRunner
+from ch10gen.__main__ import cli
+from ch10gen.utils.batched_writer import BatchedFileWriter
+from ch10gen.icd import load_icd
+from ch10gen.ch10_writer import write_ch10_file
+
+
+def _chunks(seed=0, count=2000):
+    rng = random.Random(seed)
+    return [bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 300))) for _ in range(count)]
+
+
+@pytest.mark.unit
+class TestBatchedFileWriter:
+    """Test batching, threading and failure handling."""
+
+    @pytest.mark.parametrize('threaded', [True, False])
+    @pytest.mark.parametrize('fsync', ['none', 'batch', 'close'])
+    def test_output_identical(self, threaded, fsync):
+        """Batched output equals the concatenated writes."""
+        chunks = _chunks()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'out.bin'
+            with BatchedFileWriter(path, batch_bytes=4096, fsync=fsync, threaded=threaded) as out:
+                for chunk in chunks:
+                    out.write(chunk)
+                    out.write(memoryview(chunk))
+            assert path.read_bytes() == b''.join(c + c for c in chunks)
+
+        stats = out.get_statistics()
+        assert stats['mode'] == ('thread' if threaded else 'sync')
+        assert stats['bytes_written'] == 2 * sum(len(c) for c in chunks)
+        assert stats['batches'] > 10
+        assert (stats['fsync_s'] > 0) == (fsync != 'none')
+
+    def test_backpressure(self):
+        """A slow disk blocks the producer once the queue is full."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = BatchedFileWriter(Path(tmpdir) / 'out.bin', batch_bytes=10, queue_depth=1)
+            write = out.file.write
+            out.file.write = lambda data: (time.sleep(0.02), write(data))[1]
+            for _ in range(10):
+                out.write(b'x' * 10)
+            out.close()
+            assert (Path(tmpdir) / 'out.bin').read_bytes() == b'x' * 100
+
+        assert out.blocked_s > 0.1
+        assert out.write_s > 0.1
+
+    def test_write_error_reported(self):
+        """Errors in the writer thread surface in the producer."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = BatchedFileWriter(Path(tmpdir) / 'out.bin', batch_bytes=1)
+
+            def fail(data):
+                raise OSError('disk full')
+            out.file.write = fail
+            with pytest.raises(IOError, match='disk full'):
+                for _ in range(100):
+                    out.write(b'x')
+                out.close()
+            out.close()
+            assert out.file.closed
+
+    def test_invalid_arguments(self):
+        """Unknown fsync policies and sizes are rejected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                BatchedFileWriter(Path(tmpdir) / 'a.bin', fsync='always')
+            with pytest.raises(ValueError):
+                BatchedFileWriter(Path(tmpdir) / 'b.bin', queue_depth=0)
+
+
+@pytest.mark.integration
+class TestWriterIOThread:
+    """Test the writer with the I/O thread enabled."""
+
+    def test_same_file_and_timing_stats(self):
+        """The I/O thread does not change the output and reports timing."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        outputs = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for io_thread in (False, True):
+                random.seed(2)
+                np.random.seed(2)
+                scenario = {
+                    'name': 'IO Thread',
+                    'start_time_utc': '2025-01-01T00:00:00Z',
+                    'duration_s': 10,
+                    'bus': {'io_thread': io_thread, 'io_batch_bytes': 8192, 'fsync': 'close'},
+                }
+                output_path = Path(tmpdir) / f'io_{io_thread}.c10'
+                stats = write_ch10_file(output_path, scenario, icd, writer_backend='native')
+                outputs.append(output_path.read_bytes())
+
+        assert outputs[0] == outputs[1]
+        assert stats['io']['mode'] == 'thread'
+        assert stats['io']['bytes_written'] == stats['file_size_bytes']
+        assert stats['io']['encode_s'] + stats['io']['io_blocked_s'] == pytest.approx(stats['io']['elapsed_s'])
+
+    def test_cli_fsync_requires_io_thread(self, tmp_path):
+        """build --fsync without --io-thread is a usage error instead of being ignored."""
+        scenario = tmp_path / 'scenario.yaml'
+        scenario.write_text("name: Fsync\nduration_s: 1\n")
+        output = tmp_path / 'out.c10'
+        result = CliRunner().invoke(cli, ['build', '-s', str(scenario), '-i', 'icd/test_icd.yaml',
+                                          '-o', str(output), '--fsync', 'close'])
+        assert result.exit_code == 2
+        assert '--fsync requires --io-thread' in result.output
+        assert not output.exists()
@@ -0,0 +1,125 @@
+"""Tests for columnar MS1553F1 decoding."""
+
+import pytest
+import tempfile
+import numpy as np
+from pathlib import Path
+from chapter10 import C10
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.columnar import command_keys, concat_tables, decode_1553_file, iter_1553_tables
+from ch10gen.core.packet_serializer import (
+    PacketSerializer, BLOCK_STATUS_BUS_B, BLOCK_STATUS_TIMEOUT
+)
+from ch10gen.icd import load_icd
+from ch10gen.wire_reader import WireFile
+
+
+def _write_recording(path):
+    serializer = PacketSerializer()
+    packets = []
+    length = serializer.ms1553_packet([
+        (1000, 0, [0x0822, 0x0800, 1, 2]),
+        (2000, 1, b'\x43\x08\x00\x08\x05\x00\x06\x00\x07'),  # Odd length
+        (3000, 0, [0x1420]),                                # Command word only, WC 0
+    ], 0x0200, 77)
+    packets.append(serializer.getvalue(length))
+    length = serializer.ms1553_packet([(4000, 0, [0x1021, 0x1000, 0xBEEF])], 0x0210, 78)
+    packets.append(serializer.getvalue(length))
+    path.write_bytes(b''.join(packets))
+
+
+@pytest.mark.unit
+class TestDecode:
+    """Test column values against the packet layout."""
+
+    def test_columns(self, tmp_path):
+        """Header fields, command word fields and data words are decoded per message."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        table = decode_1553_file(path)
+        messages = table.messages
+
+        assert messages['ipts'].tolist() == [1000, 2000, 3000, 4000]
+        assert messages['rtc'].tolist() == [77, 77, 77, 78]
+        assert messages['channel_id'].tolist() == [0x0200, 0x0200, 0x0200, 0x0210]
+        assert messages['bus'].tolist() == [0, 1, 0, 0]
+        assert messages['rt'].tolist() == [1, 1, 2, 2]
+        assert messages['tr'].tolist() == [0, 0, 1, 0]
+        assert messages['sa'].tolist() == [1, 2, 1, 1]
+        assert messages['wc'].tolist() == [2, 3, 0, 1]
+        assert messages['status'].tolist() == [0x0800, 0x0800, 0, 0x1000]
+        assert messages['length'].tolist() == [8, 9, 2, 6]
+        assert messages['data_count'].tolist() == [2, 2, 0, 1]
+        assert table.words.tolist() == [1, 2, 5, 6, 0xBEEF]
+        assert table.data_words(3).tolist() == [0xBEEF]
+
+    def test_error_bits(self, tmp_path):
+        """Error bits are the block status error flags, without the bus bit."""
+        serializer = PacketSerializer()
+        path = tmp_path / 'err.c10'
+        length = serializer.ms1553_packet([(0, 1, [0x0822, 0x0800, 1, 2])], 0x0200, 0)
+        packet = bytearray(serializer.getvalue(length))
+        packet[24 + 4 + 8:24 + 4 + 10] = (BLOCK_STATUS_BUS_B | BLOCK_STATUS_TIMEOUT).to_bytes(2, 'little')
+        path.write_bytes(bytes(packet))
+
+        messages = decode_1553_file(path).messages
+        assert messages['errors'].tolist() == [BLOCK_STATUS_TIMEOUT]
+        assert messages['bus'].tolist() == [1]
+
+    def test_batches_and_selection(self, tmp_path):
+        """Batched tables join into the whole-file table; selections share words."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        whole = decode_1553_file(path)
+        with WireFile(path) as wire:
+            joined = concat_tables(list(iter_1553_tables(wire, batch_packets=1)))
+        assert joined.messages.tobytes() == whole.messages.tobytes()
+        assert np.array_equal(joined.words, whole.words)
+
+        channel_b = whole.select(whole.messages['channel_id'] == 0x0210)
+        assert len(channel_b) == 1
+        assert channel_b.data_words(0).tolist() == [0xBEEF]
+        assert len(decode_1553_file(path, channel_id=0x0300)) == 0
+
+    def test_key_filter(self, tmp_path):
+        """Messages are filtered on their command word keys before decoding."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        keys = np.zeros(1 << 11, dtype=bool)
+        keys[command_keys(0x1420)] = True  # RT 2, T, SA 1
+        with WireFile(path) as wire:
+            table = concat_tables(iter_1553_tables(wire, keys=keys))
+        assert table.messages['ipts'].tolist() == [3000]
+        assert table.words.tolist() == []
+
+        keys[command_keys(0x0822)] = True
+        with WireFile(path) as wire:
+            table = concat_tables(iter_1553_tables(wire, keys=keys))
+        assert table.messages['ipts'].tolist() == [1000, 3000]
+        assert table.data_words(0).tolist() == [1, 2]
+
+
+@pytest.mark.integration
+class TestDecodeRoundtrip:
+    """Test the decoder against PyChapter10 on generated files."""
+
+    @pytest.mark.parametrize('backend', ['native', 'irig106'])
+    def test_matches_pychapter10(self, backend):
+        """IPTS, command and data words match the PyChapter10 decode."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        scenario = {'name': 'Columnar', 'start_time_utc': '2025-01-01T00:00:00Z', 'duration_s': 3,
+                    'bus': {'errors': {'word_count_percent': 10}}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / 'columnar.c10'
+            write_ch10_file(output_path, scenario, icd, seed=5, writer_backend=backend)
+            expected = [(msg.ipts, bytes(msg.data)) for packet in C10(str(output_path))
+                        if packet.data_type == 0x19 for msg in packet]
+            table = decode_1553_file(output_path)
+
+        actual = []
+        for row, message in enumerate(table.messages):
+            words = [int(message['command']), int(message['status'])] + table.data_words(row).tolist()
+            actual.append((int(message['ipts']), words))
+        assert [ipts for ipts, _ in actual] == [ipts for ipts, _ in expected]
+        for (_, words), (_, data) in zip(actual, expected):
+            assert np.frombuffer(data[:len(data) // 2 * 2], dtype='<u2').tolist() == words
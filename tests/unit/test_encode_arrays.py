@@ -0,0 +1,198 @@
+"""Tests for vectorized 1553 word encoders."""
+
+import pytest
+import numpy as np
+from ch10gen.core.encode1553 import (
+    bnr16, u16, i16, bcd, float32_split, float32_combine, add_parity, pack_bitfields,
+    bnr16_array, u16_array, i16_array, bcd_array, float32_split_array,
+    float32_combine_array, encode_bitfield_array, pack_bitfields_array,
+    add_parity_array, encode_array, decode_array, decode_bitfield, decode_bitfield_array
+)
+from ch10gen.ch10_writer import Ch10Writer
+from ch10gen.flight_profile import FlightProfile
+from ch10gen.icd import MessageDefinition, WordDefinition
+
+
+@pytest.fixture
+def values():
+    """Random values plus exact .5 ties and out-of-range values."""
+    rng = np.random.default_rng(0)
+    return np.concatenate([
+        rng.uniform(-50000, 50000, 2000),
+        np.arange(-100, 100) / 2,
+        rng.integers(-70000, 70000, 500).astype(float),
+    ])
+
+
+class TestScalarEquivalence:
+    """Array encoders match their scalar counterparts element-wise."""
+
+    @pytest.mark.parametrize('rounding', ['nearest', 'truncate', 'away_from_zero'])
+    @pytest.mark.parametrize('scale,offset', [(1.0, 0.0), (0.5, 3.0), (0.01, -2.0)])
+    def test_bnr16(self, values, rounding, scale, offset):
+        """BNR rounding, clamping and two's complement match."""
+        for clamp in (True, False):
+            expected = [bnr16(float(v), scale, offset, clamp=clamp, rounding=rounding) for v in values]
+            result = bnr16_array(values, scale, offset, clamp=clamp, rounding=rounding)
+            assert result.dtype == np.uint16
+            assert result.tolist() == expected
+
+    def test_u16_i16(self, values):
+        """Unsigned and signed saturation match."""
+        assert u16_array(values, 0.7, 1.0).tolist() == [u16(float(v), 0.7, 1.0) for v in values]
+        assert i16_array(values, 0.7, 1.0).tolist() == [i16(float(v), 0.7, 1.0) for v in values]
+
+    def test_bcd(self):
+        """BCD digits match for the full 0-9999 range."""
+        digits = np.arange(10000)
+        assert bcd_array(digits).tolist() == [bcd(int(v)) for v in digits]
+
+    def test_bcd_out_of_range(self):
+        """Out-of-range BCD values raise like the scalar encoder."""
+        with pytest.raises(ValueError):
+            bcd_array([5, 10000])
+        with pytest.raises(ValueError):
+            bcd_array([-1])
+
+    @pytest.mark.parametrize('word_order', ['lsw_msw', 'msw_lsw'])
+    def test_float32_split(self, values, word_order):
+        """Float splits match, including specials, and combine back."""
+        floats = np.concatenate([values, [np.nan, np.inf, -0.0, 1e-45, 3.4e38]])
+        expected = [float32_split(float(v), word_order) for v in floats]
+        result = float32_split_array(floats, word_order)
+        assert result.shape == (len(floats), 2)
+        assert [tuple(row) for row in result.tolist()] == expected
+
+        combined = float32_combine_array(result[:, 0], result[:, 1], word_order)
+        assert np.array_equal(
+            combined, [float32_combine(w1, w2, word_order) for w1, w2 in expected], equal_nan=True
+        )
+
+    def test_float32_split_errors(self):
+        """Overflow and bad word order raise like struct/the scalar encoder."""
+        with pytest.raises(OverflowError):
+            float32_split_array([1e39])
+        with pytest.raises(ValueError):
+            float32_split_array([1.0], 'bad_order')
+
+    def test_non_finite_rejected(self):
+        """Integer encoders reject NaN instead of producing garbage."""
+        with pytest.raises(ValueError):
+            bnr16_array([1.0, np.nan])
+
+    def test_pack_bitfields(self):
+        """Packed bitfield words match and range errors are raised."""
+        rng = np.random.default_rng(1)
+        fields = {
+            'mode': (rng.integers(0, 16, 200), 0xF, 0, 1.0, 0.0),
+            'level': (rng.integers(0, 8, 200) * 0.5, 0x7, 4, 0.5, 0.0),
+            'flag': (rng.integers(0, 2, 200), 0x1, 15, 1.0, 0.0),
+        }
+        expected = [
+            pack_bitfields({name: (float(spec[0][i]),) + spec[1:] for name, spec in fields.items()})
+            for i in range(200)
+        ]
+        assert pack_bitfields_array(fields).tolist() == expected
+
+        with pytest.raises(ValueError):
+            encode_bitfield_array([0, 16], 0xF, 0)
+        with pytest.raises(ValueError):
+            pack_bitfields_array({'a': ([1], 0xF, 0, 1.0, 0.0), 'b': ([1], 0xF, 2, 1.0, 0.0)})
+
+    def test_parity(self):
+        """Odd and even parity bits match."""
+        words = np.random.default_rng(2).integers(0, 0x10000, 2000)
+        assert add_parity_array(words).tolist() == [add_parity(int(w)) for w in words]
+        assert add_parity_array(words, odd=False).tolist() == [add_parity(int(w), odd=False) for w in words]
+
+    def test_encode_array_shapes(self):
+        """encode_array returns one column per 16-bit word."""
+        assert encode_array([1.0, 2.0], 'u16').shape == (2, 1)
+        assert encode_array([1.0, 2.0], 'float32_split').shape == (2, 2)
+        assert encode_array([-1.7], 'raw').tolist() == [[0xFFFF]]
+
+
+class TestMessageBlockEncoding:
+    """Writer block encoding matches per-message encoding."""
+
+    def test_block_matches_scalar(self):
+        """Each row of a block equals the scalar encoding of that instance."""
+        msg_def = MessageDefinition(
+            name='NAV', rate_hz=200, rt=5, tr='RT2BC', sa=1, wc=8,
+            words=[
+                WordDefinition(name='alt', src='flight.altitude_ft', encode='bnr16', scale=1.0),
+                WordDefinition(name='ias', src='flight.airspeed_kt', encode='u16', scale=0.1),
+                WordDefinition(name='hdg', src='flight.heading_deg', encode='i16', scale=0.01),
+                WordDefinition(name='mach', src='derived.mach_x1000', encode='bcd'),
+                WordDefinition(name='lat', src='flight.latitude_deg', encode='float32_split',
+                               word_order='msw_lsw'),
+                WordDefinition(name='id', const=0x1234, encode='u16'),
+                WordDefinition(name='spare', encode='u16'),
+            ]
+        )
+        profile = FlightProfile()
+        for i in range(6):
+            profile.add_waypoint(i * 2.0, 1000 + i * 4321.5, 150 + i * 40.25, i * 61,
+                                 37.0 + i * 0.1, -122.0)
+
+        writer = Ch10Writer()
+        states = [profile.get_state_at_time(t) for t in np.arange(0, 10, 0.005)]
+        block = writer._encode_data_words_block(msg_def, states)
+
+        assert block.shape == (len(states), 8)
+        assert block.tolist() == [writer._encode_data_words(msg_def, s) for s in states]
+
+    def test_block_without_states(self):
+        """Instances without flight state encode constants and zeros."""
+        msg_def = MessageDefinition(
+            name='ID', rate_hz=1, rt=1, tr='BC2RT', sa=2, wc=3,
+            words=[
+                WordDefinition(name='id', const=7, encode='u16'),
+                WordDefinition(name='val', src='flight.altitude_ft', encode='float32_split'),
+            ]
+        )
+        writer = Ch10Writer()
+        block = writer._encode_data_words_block(msg_def, [None, None])
+        assert block.tolist() == [writer._encode_data_words(msg_def, None)] * 2
+
+
+class TestArrayDecoding:
+    """Array decoders invert the array encoders."""
+
+    @pytest.mark.parametrize('encode,scale,offset', [
+        ('bnr16', 0.5, 3.0), ('i16', 0.25, -1.0), ('u16', 0.1, 100.0), ('u16', 1.0, 0.0),
+    ])
+    def test_scaled_roundtrip(self, encode, scale, offset):
+        """Decoded values are within half a scale step of the encoded ones."""
+        rng = np.random.default_rng(1)
+        if encode == 'u16':
+            values = rng.uniform(0, 6000, 1000) * scale + offset
+        else:
+            values = rng.uniform(-30000, 30000, 1000) * scale + offset
+        decoded = decode_array(encode_array(values, encode, scale, offset), encode, scale, offset)
+        assert decoded.shape == values.shape
+        assert np.all(np.abs(decoded - values) <= scale / 2 + 1e-9)
+
+    def test_integer_words(self):
+        """BCD, raw words and unscaled u16 decode exactly as integers."""
+        values = np.arange(0, 10000, 7)
+        assert decode_array(encode_array(values, 'bcd'), 'bcd').tolist() == values.tolist()
+        assert decode_array(encode_array(values, 'u16'), 'u16').dtype == np.int64
+        assert decode_array(np.array([0xFFFF]), 'raw').tolist() == [0xFFFF]
+        assert decode_array(np.array([0xFFFF]), 'i16').tolist() == [-1]
+
+    @pytest.mark.parametrize('word_order', ['lsw_msw', 'msw_lsw'])
+    def test_float32(self, word_order):
+        """float32_split pairs decode to the float32 value."""
+        values = np.array([0.0, -1.5, 34.123456, 1e30])
+        words = encode_array(values, 'float32_split', word_order=word_order)
+        decoded = decode_array(words, 'float32_split', word_order=word_order)
+        assert decoded.tolist() == values.astype(np.float32).astype(np.float64).tolist()
+
+    def test_bitfields(self):
+        """Bitfields decode like decode_bitfield and are selected by mask and shift."""
+        words = np.arange(0, 0x10000, 97, dtype=np.uint16)
+        expected = [decode_bitfield(int(w), 0x1F, 4, 0.5, 1.0) for w in words]
+        assert decode_bitfield_array(words, 0x1F, 4, 0.5, 1.0).tolist() == expected
+        assert decode_array(words, 'u16', 0.5, 1.0, mask=0x1F, shift=4).tolist() == expected
+        assert decode_array(np.array([0xA5F0]), 'u16', mask=0xF, shift=12).tolist() == [0xA]
@@ -2,6 +2,7 @@
 
 import pytest
 import random
+import numpy as np
 
 from ch10gen.utils.errors import (
     ErrorType,
@@ -148,3 +149,89 @@ class TestCreateErrorConfig:
         # Others should be default
         assert config.parity_error_percent == 0.0
         assert config.no_response_percent == 0.0
+
+
+class TestBatchInjection:
+    """Test vectorized error injection over message blocks."""
+    
+    def _inject(self, n=1000, seed=1, times=None, **rates):
+        injector = MessageErrorInjector(ErrorInjectionConfig(**rates), seed=seed)
+        data = np.arange(n * 4, dtype=np.uint16).reshape(n, 4)
+        batch = injector.inject_errors_batch(
+            np.zeros(n) if times is None else times,
+            np.full(n, 0x0824), np.full(n, 0x0800), data, np.full(n, 3)
+        )
+        return injector, data, batch
+    
+    def test_probabilities_follow_priority(self):
+        """Later types only apply to messages without an earlier error."""
+        config = ErrorInjectionConfig(no_response_percent=50, parity_error_percent=50,
+                                      sync_error_percent=100)
+        probabilities = dict(config.error_probabilities())
+        assert probabilities[ErrorType.NO_RESPONSE] == 0.5
+        assert probabilities[ErrorType.PARITY_ERROR] == 0.25
+        assert probabilities[ErrorType.LATE_RESPONSE] == 0.0
+        assert probabilities[ErrorType.SYNC_ERROR] == 0.25
+    
+    def test_distribution_and_statistics(self):
+        """Error frequencies match the rates and are counted per type."""
+        injector, _, batch = self._inject(n=200_000, parity_error_percent=10,
+                                          no_response_percent=5, manchester_error_percent=20)
+        types = batch.error_types
+        assert abs(np.mean(types == ErrorType.NO_RESPONSE) - 0.05) < 0.005
+        assert abs(np.mean(types == ErrorType.PARITY_ERROR) - 0.095) < 0.005
+        assert abs(np.mean(types == ErrorType.MANCHESTER_ERROR) - 0.171) < 0.005
+        assert injector.message_count == 200_000
+        for error_type in (ErrorType.NO_RESPONSE, ErrorType.PARITY_ERROR, ErrorType.MANCHESTER_ERROR):
+            assert injector.error_count[error_type] == np.count_nonzero(types == error_type)
+        assert injector.error_count[ErrorType.LATE_RESPONSE] == 0
+    
+    @pytest.mark.parametrize('rate,bit', [
+        ('no_response_percent', 1 << 3),
+        ('late_response_percent', 1 << 9),
+        ('sync_error_percent', 1 << 10),
+    ])
+    def test_status_bits(self, rate, bit):
+        """Response and sync errors set their status bit."""
+        _, data, batch = self._inject(**{rate: 100})
+        assert np.all(batch.status_words == 0x0800 | bit)
+        assert np.array_equal(batch.data_words, data)
+    
+    def test_parity_flips_one_status_bit(self):
+        """Parity errors flip exactly one status word bit."""
+        _, _, batch = self._inject(parity_error_percent=100)
+        flipped = batch.status_words ^ 0x0800
+        assert all(bin(int(value)).count('1') == 1 for value in flipped)
+        assert len(set(flipped.tolist())) == 16
+    
+    def test_word_count_mismatch(self):
+        """Messages lose their last word or gain a garbage word."""
+        _, data, batch = self._inject(word_count_error_percent=100)
+        assert set(batch.word_counts.tolist()) == {2, 4}
+        assert np.array_equal(batch.data_words[:, :2], data[:, :2])
+        assert batch.data_words.shape == (1000, 4)
+    
+    def test_manchester_corrupts_one_word(self):
+        """Manchester errors change exactly one of the used data words."""
+        _, data, batch = self._inject(manchester_error_percent=100)
+        changed = batch.data_words != data
+        assert np.all(changed.sum(axis=1) == 1)
+        assert not changed[:, 3].any()
+    
+    def test_bus_failover(self):
+        """The bus switches once, at the first block reaching the failover time."""
+        injector = MessageErrorInjector(ErrorInjectionConfig(bus_failover_time_s=1.0), seed=1)
+        words = np.zeros((3, 1))
+        injector.inject_errors_batch([0.0, 0.5, 0.9], [0] * 3, [0] * 3, words)
+        assert injector.current_bus == 'A'
+        injector.inject_errors_batch([0.95, 1.0, 1.5], [0] * 3, [0] * 3, words)
+        injector.inject_errors_batch([2.0, 2.5, 3.0], [0] * 3, [0] * 3, words)
+        assert injector.current_bus == 'B'
+        assert injector.error_count[ErrorType.BUS_FAILOVER] == 1
+    
+    def test_reproducible(self):
+        """The same seed injects the same errors."""
+        _, _, first = self._inject(seed=4, parity_error_percent=30, manchester_error_percent=30)
+        _, _, second = self._inject(seed=4, parity_error_percent=30, manchester_error_percent=30)
+        assert np.array_equal(first.status_words, second.status_words)
+        assert np.array_equal(first.data_words, second.data_words)
@@ -0,0 +1,160 @@
+"""Tests for compiled scenario expressions."""
+
+import pytest
+from ch10gen.expressions import compile_expression, expression_namespace
+from ch10gen.data_generators import ExpressionGenerator, GenerationContext
+from ch10gen.icd import ICDDefinition, MessageDefinition, WordDefinition
+from ch10gen.scenario_manager import ScenarioManager
+
+
+def _context(field_values=None, all_values=None):
+    return GenerationContext(
+        time_seconds=2.0, message_count=3, message_name='MSG', field_name='f',
+        field_values=field_values or {}, all_values=all_values or {}, icd=None
+    )
+
+
+def _icd(message_names=('NAV DATA', 'STATUS'), field_names=('alt', 'alt_m', 'flags')):
+    return ICDDefinition(
+        bus='A',
+        messages=[
+            MessageDefinition(
+                name=name, rate_hz=10, rt=rt, tr='BC2RT', sa=1, wc=len(field_names),
+                words=[WordDefinition(name=field, encode='u16') for field in field_names]
+            )
+            for rt, name in enumerate(message_names, start=1)
+        ]
+    )
+
+
+@pytest.mark.unit
+class TestCompileExpression:
+    """Test parsing, whitelisting and caching."""
+
+    @pytest.mark.parametrize('formula,expected', [
+        ('altitude * 0.3048', 3048.0),
+        ('1 if altitude > 100 and altitude < 40000 else 0', 1),
+        ('min(65535, max(0, altitude / 16))', 625.0),
+        ('(altitude ^ 3) & 0xFF', 0x13),
+        ('-altitude % 7 + abs(-2)', 5),
+        ('Nav["alt"] * 2', 20),
+        ('round(sqrt(altitude))', 100),
+    ])
+    def test_evaluates_like_eval(self, formula, expected):
+        """Whitelisted formulas evaluate like Python expressions."""
+        names = {'altitude': 10000, 'Nav': {'alt': 10}}
+        assert eval(compile_expression(formula), expression_namespace(), names) == expected
+
+    def test_cached(self):
+        """Each formula is parsed and compiled once."""
+        assert compile_expression('a + b') is compile_expression('a + b')
+
+    @pytest.mark.parametrize('formula', [
+        '__import__("os")',
+        '(1).__class__',
+        'x.__class__.__bases__',
+        '(lambda: 1)()',
+        '[n for n in range(3)]',
+        'values.get("a")',
+        '(y := 1)',
+    ])
+    def test_rejects_unsafe_syntax(self, formula):
+        """Syntax outside the whitelist is rejected when compiled."""
+        with pytest.raises(ValueError):
+            compile_expression(formula)
+
+    def test_syntax_error(self):
+        """Invalid formulas raise SyntaxError."""
+        with pytest.raises(SyntaxError):
+            compile_expression('altitude *')
+
+    def test_no_builtins(self):
+        """Only the formula functions are available."""
+        with pytest.raises(NameError):
+            eval(compile_expression('open("x")'), expression_namespace(), {})
+
+
+@pytest.mark.unit
+class TestExpressionGenerator:
+    """Test ExpressionGenerator with the persistent namespace."""
+
+    def test_generate(self):
+        """Field values, cross-message values, time and count are visible."""
+        generator = ExpressionGenerator('base * 2 + NAV_DATA["alt"] + time + message_count')
+        context = _context({'base': 5}, {'NAV DATA': {'alt': 100}})
+        assert generator.generate(context) == 115.0
+
+    def test_field_values_shadow_functions(self):
+        """Field names take precedence over function names."""
+        generator = ExpressionGenerator('min + 1')
+        assert generator.generate(_context({'min': 4})) == 5
+
+    def test_errors(self):
+        """Invalid formulas raise ValueError at creation or evaluation."""
+        with pytest.raises(ValueError, match='Invalid expression syntax'):
+            ExpressionGenerator('base +')
+        with pytest.raises(ValueError):
+            ExpressionGenerator('base.__class__')
+        with pytest.raises(ValueError, match='missing'):
+            ExpressionGenerator('missing * 2').generate(_context())
+
+
+@pytest.mark.unit
+class TestScenarioManagerExpressions:
+    """Test expression evaluation in ScenarioManager."""
+
+    def _scenario(self, formula='alt * 0.3048'):
+        return {
+            'messages': {
+                'NAV DATA': {'fields': {
+                    'alt': {'mode': 'constant', 'value': 10000},
+                    'alt_m': {'mode': 'expression', 'formula': formula},
+                    'flags': {'mode': 'increment', 'start': 0, 'increment': 1},
+                }},
+                'STATUS': {'fields': {
+                    'alt': {'mode': 'expression', 'formula': 'NAV_DATA["word1"]["alt_m"] + 1'},
+                    'alt_m': {'mode': 'expression', 'formula': 'word0["alt"] - 1'},
+                    'flags': {'mode': 'constant', 'value': 2},
+                }},
+            }
+        }
+
+    def test_same_message_and_cross_message(self):
+        """Formulas read this message's fields and other messages' values."""
+        icd = _icd()
+        manager = ScenarioManager(self._scenario(), icd)
+        assert manager.generate_message_data('NAV DATA', icd.messages[0])[:2] == [10000, 3048]
+        assert manager.generate_message_data('STATUS', icd.messages[1])[0] == 3049
+
+    def test_matches_merged_context(self):
+        """The persistent namespace gives the same values as a merged context."""
+        icd = _icd()
+        fast = ScenarioManager(self._scenario(), icd)
+        merged = ScenarioManager(self._scenario(), icd)
+        merged._merged_expression_context = True
+        for _ in range(3):
+            for message in icd.messages:
+                assert fast.generate_message_data(message.name, message) == \
+                    merged.generate_message_data(message.name, message)
+
+    def test_message_names_shadow_fields(self):
+        """A message named like a field still takes precedence in formulas."""
+        icd = _icd(message_names=('alt', 'STATUS'))
+        scenario = {'messages': {
+            'alt': {'fields': {'alt': {'mode': 'constant', 'value': 7}}},
+            'STATUS': {'fields': {
+                'alt': {'mode': 'constant', 'value': 1},
+                'alt_m': {'mode': 'expression', 'formula': 'alt["alt"] * 3'},
+            }},
+        }}
+        manager = ScenarioManager(scenario, icd)
+        assert manager._merged_expression_context
+        manager.generate_message_data('alt', icd.messages[0])
+        assert manager.generate_message_data('STATUS', icd.messages[1])[1] == 21
+
+    def test_evaluation_error(self):
+        """Errors during evaluation are reported as ValueError."""
+        icd = _icd()
+        manager = ScenarioManager(self._scenario('alt / 0'), icd)
+        with pytest.raises(ValueError, match='alt / 0'):
+            manager.generate_message_data('NAV DATA', icd.messages[0])
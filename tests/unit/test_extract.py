@@ -0,0 +1,82 @@
+"""Tests for per-parameter time series extraction."""
+
+import pytest
+import numpy as np
+from click.testing import CliRunner
+from ch10gen.__main__ import cli
+from ch10gen.core.encode1553 import build_command_word, encode_array
+from ch10gen.extract import PARAMETER_DTYPE, extract_parameters, load_parameter
+from ch10gen.icd import ICDDefinition, MessageDefinition, WordDefinition
+
+
+def _icd():
+    return ICDDefinition(bus='A', messages=[
+        MessageDefinition(name='NAV', rate_hz=10, rt=1, tr='BC2RT', sa=1, wc=3, words=[
+            WordDefinition(name='alt', src='flight.altitude_ft', encode='bnr16', scale=0.5),
+            WordDefinition(name='lat', src='flight.latitude_deg', encode='float32_split'),
+        ]),
+        MessageDefinition(name='NAV_B', rate_hz=10, rt=3, tr='BC2RT', sa=1, wc=1, words=[
+            WordDefinition(name='alt', src='flight.altitude_ft', encode='u16'),
+        ]),
+    ])
+
+
+@pytest.fixture
+def recording(tmp_path, icd_recording):
+    nav, nav_b = _icd().messages
+    packets = []
+    for k in range(3):
+        nav_data = np.concatenate([encode_array([k * 10.5], 'bnr16', 0.5)[0],
+                                   encode_array([k + 0.25], 'float32_split')[0]])
+        packets.append((k, [
+            (k * 1000 + 100, 0, (nav, nav_data)),
+            (k * 1000 + 200, 0, [build_command_word(rt=7, tr=True, sa=1, wc=1), 0x3800, 9]),
+            (k * 1000 + 300, 0, (nav_b, [k + 100])),
+            (k * 1000 + 400, 0, (nav, nav_data[:1])),  # Too short for lat
+        ]))
+    return icd_recording(tmp_path / 'rec.c10', packets)
+
+
+@pytest.mark.unit
+class TestExtractParameters:
+    """Test extracted time series against the encoded values."""
+
+    def test_series(self, recording, tmp_path):
+        """Samples of every message holding a parameter are kept in file order."""
+        paths = extract_parameters(recording, _icd(), ['alt', 'lat'], tmp_path / 'out')
+
+        alt = load_parameter(paths['alt'])
+        assert isinstance(alt, np.memmap)
+        assert alt.dtype == PARAMETER_DTYPE
+        assert alt['ipts'].tolist() == [100, 300, 400, 1100, 1300, 1400, 2100, 2300, 2400]
+        assert alt['value'].tolist() == [0.0, 100.0, 0.0, 10.5, 101.0, 10.5, 21.0, 102.0, 21.0]
+
+        lat = load_parameter(paths['lat'])
+        assert lat['ipts'].tolist() == [100, 1100, 2100]
+        assert lat['value'].tolist() == [0.25, 1.25, 2.25]
+
+    def test_ipts_range(self, recording, tmp_path):
+        """The IPTS range selects packets."""
+        paths = extract_parameters(recording, _icd(), ['lat'], tmp_path, start_ipts=1000, end_ipts=1999)
+        assert load_parameter(paths['lat'])['ipts'].tolist() == [1100]
+
+    def test_unknown(self, recording, tmp_path):
+        """Names that are not ICD fields are rejected."""
+        with pytest.raises(ValueError, match='Unknown parameters: speed'):
+            extract_parameters(recording, _icd(), ['alt', 'speed'], tmp_path)
+
+    def test_cli(self, recording, tmp_path):
+        """extract writes one .npy per parameter."""
+        icd_path = tmp_path / 'icd.yaml'
+        icd_path.write_text(
+            "bus: A\n"
+            "messages:\n"
+            "  - {name: NAV, rate_hz: 10, rt: 1, tr: BC2RT, sa: 1, wc: 3, words: [\n"
+            "      {name: alt, src: flight.altitude_ft, encode: bnr16, scale: 0.5},\n"
+            "      {name: lat, src: flight.latitude_deg, encode: float32_split, word_order: lsw_msw}]}\n"
+        )
+        result = CliRunner().invoke(cli, ['extract', str(recording), '-i', str(icd_path),
+                                          '-p', 'lat', '-o', str(tmp_path / 'out')])
+        assert result.exit_code == 0, result.output
+        assert 'lat: 3 samples' in result.output
+        assert (tmp_path / 'out' / 'lat.npy').exists()
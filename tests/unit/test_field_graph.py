@@ -0,0 +1,143 @@
+"""Tests for compiled field dependency graphs."""
+
+import pytest
+from ch10gen.data_generators import ConstantGenerator
+from ch10gen.field_graph import compile_field_graph
+from ch10gen.icd import ICDDefinition, MessageDefinition, WordDefinition
+from ch10gen.scenario_manager import ScenarioManager
+
+
+def _icd(fields=('a', 'b', 'c', 'd')):
+    return ICDDefinition(
+        bus='A',
+        messages=[
+            MessageDefinition(
+                name=name, rate_hz=10, rt=rt, tr='BC2RT', sa=1, wc=len(fields),
+                words=[WordDefinition(name=field, encode='u16') for field in fields]
+            )
+            for rt, name in enumerate(('NAV DATA', 'STATUS'), start=1)
+        ]
+    )
+
+
+def _scenario(nav_fields, status_fields=None):
+    return {'messages': {'NAV DATA': {'fields': nav_fields},
+                         'STATUS': {'fields': status_fields or {}}}}
+
+
+class CountingConstant(ConstantGenerator):
+    """Constant generator that counts its calls."""
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.calls = 0
+
+    def generate(self, context):
+        self.calls += 1
+        return super().generate(context)
+
+
+@pytest.mark.unit
+class TestFieldGraph:
+    """Test dependency order, cycle detection and incremental evaluation."""
+
+    def test_expressions_in_dependency_order(self):
+        """Expressions may read expressions in later words."""
+        icd = _icd()
+        manager = ScenarioManager(_scenario({
+            'a': {'mode': 'expression', 'formula': 'b * 2'},
+            'b': {'mode': 'expression', 'formula': 'word3["d"] + c'},
+            'c': {'mode': 'constant', 'value': 5},
+            'd': {'mode': 'increment', 'start': 10},
+        }), icd)
+        graph = manager._field_graphs['NAV DATA']
+        assert [graph.nodes[i].name for i in graph.order] == ['c', 'd', 'b', 'a']
+        assert manager.generate_message_data('NAV DATA', icd.messages[0], 0.0, 0) == [30, 15, 5, 10]
+        assert manager.generate_message_data('NAV DATA', icd.messages[0], 0.1, 1) == [32, 16, 5, 11]
+
+    @pytest.mark.parametrize('fields,cycle', [
+        ({'a': 'b + 1', 'b': 'c + 1', 'c': 'a + 1'}, 'a → b → c → a'),
+        ({'a': 'a + 1'}, 'a → a'),
+        ({'b': 'word2["c"]', 'c': 'word1["b"]'}, 'b → c → b'),
+        ({'b': 'NAV_DATA["c"]', 'c': 'NAV_DATA["b"]'}, 'b → c → b'),
+        ({'b': 'NAV_DATA["b"] + 1'}, 'b → b'),
+    ])
+    def test_cycle_detected_at_load(self, fields, cycle):
+        """Circular references are reported when the scenario is loaded."""
+        scenario = _scenario({name: {'mode': 'expression', 'formula': formula}
+                              for name, formula in fields.items()})
+        with pytest.raises(ValueError, match=f"Circular dependency in message 'NAV DATA': {cycle}"):
+            ScenarioManager(scenario, _icd())
+
+    def test_dependencies(self):
+        """Field, word, message, time and random references are recorded."""
+        icd = _icd()
+        generators = {}
+        manager = ScenarioManager(_scenario({}, {
+            'a': {'mode': 'expression', 'formula': 'NAV_DATA["a"] + time'},
+            'b': {'mode': 'expression', 'formula': 'word0["a"] + random()'},
+            'c': {'mode': 'expression', 'formula': 'word0 + message_count'},
+            'd': {'mode': 'sine'},
+        }), icd)
+        graph = manager._field_graphs['STATUS']
+        a, b, c, d = graph.nodes
+        assert (a.fields, a.messages, a.uses_time, a.volatile) == ((), ('NAV DATA',), True, False)
+        assert (b.fields, b.volatile) == ((0,), True)
+        assert (c.fields, c.uses_instance) == ((0,), True)
+        assert d.uses_time and not d.expression
+        assert compile_field_graph('NAV DATA', icd.messages[0], generators, {}).order == [0, 1, 2, 3]
+        assert len(generators) == 4
+
+    def test_own_message_reference(self):
+        """Subscripted references to the message's own name read only that field or word."""
+        icd = _icd()
+        scenario = _scenario({
+            'a': {'mode': 'increment', 'start': 4},
+            'b': {'mode': 'expression', 'formula': 'NAV_DATA["a"] + 1'},
+            'c': {'mode': 'expression', 'formula': 'NAV_DATA["b"] * 2 + NAV_DATA["word3"]["d"]'},
+            'd': {'mode': 'constant', 'value': 1},
+        })
+        manager = ScenarioManager(scenario, icd)
+        graph = manager._field_graphs['NAV DATA']
+        assert [graph.nodes[i].fields for i in range(4)] == [(), (0,), (1, 3), ()]
+        expected = [manager.generate_message_data('NAV DATA', icd.messages[0], k * 0.1, k)
+                    for k in range(3)]
+        assert expected == [[4, 5, 11, 1], [5, 6, 13, 1], [6, 7, 15, 1]]
+
+        block = ScenarioManager(scenario, icd).generate_message_block(
+            'NAV DATA', icd.messages[0], [0.0, 0.1, 0.2], instances=[0, 1, 2])
+        assert block.tolist() == expected
+
+    def test_unchanged_fields_not_recomputed(self):
+        """Constants are generated once; expressions follow their inputs."""
+        icd = _icd()
+        manager = ScenarioManager(_scenario(
+            {'a': {'mode': 'constant', 'value': 7}, 'b': {'mode': 'ramp', 'start': 0, 'end': 100, 'duration': 1},
+             'c': {'mode': 'constant', 'value': 1}, 'd': {'mode': 'constant', 'value': 2}},
+            {'a': {'mode': 'expression', 'formula': 'NAV_DATA["a"] * 2'},
+             'b': {'mode': 'constant', 'value': 0}, 'c': {'mode': 'constant', 'value': 0},
+             'd': {'mode': 'constant', 'value': 0}},
+        ), icd)
+        counting = CountingConstant(7)
+        manager._field_graphs['NAV DATA'].nodes[0].generator = counting
+        expression = manager._field_graphs['STATUS'].nodes[0].generator
+        evaluations = []
+        original = manager._evaluate_compiled
+        manager._evaluate_compiled = lambda generator, *args: (
+            evaluations.append(generator) or original(generator, *args))
+
+        for k in range(5):
+            nav = manager.generate_message_data('NAV DATA', icd.messages[0], k * 0.25, k)
+            status = manager.generate_message_data('STATUS', icd.messages[1], k * 0.25, k)
+            assert nav[:2] == [7, [0, 25, 50, 75, 100][k]]
+            assert status[0] == 14
+        assert counting.calls == 1
+        # NAV DATA changes every message (ramp), so the expression is re-evaluated
+        assert evaluations.count(expression) == 5
+
+        manager._field_graphs['NAV DATA'].nodes[1].generator = CountingConstant(3)
+        manager.generate_message_data('NAV DATA', icd.messages[0], 2.0, 5)
+        manager.generate_message_data('NAV DATA', icd.messages[0], 2.0, 6)
+        manager.generate_message_data('STATUS', icd.messages[1], 2.0, 5)
+        manager.generate_message_data('STATUS', icd.messages[1], 2.0, 6)
+        assert evaluations.count(expression) == 6
@@ -0,0 +1,149 @@
+"""Tests for the compiled flight-state trajectory table."""
+
+import pytest
+import numpy as np
+from ch10gen.flight_profile import FlightProfile, FlightTrajectory
+
+
+def _hold_reference(waypoints, time_s):
+    """Waypoint lookup as originally written (linear scan, hold previous)."""
+    if time_s <= waypoints[0]['time_s']:
+        return waypoints[0]
+    if time_s >= waypoints[-1]['time_s']:
+        return waypoints[-1]
+    for i, wp in enumerate(waypoints):
+        if wp['time_s'] > time_s:
+            return waypoints[i - 1]
+
+
+@pytest.fixture
+def profile():
+    profile = FlightProfile()
+    for i, t in enumerate([0.0, 5.0, 5.0, 12.5, 30.0]):
+        profile.add_waypoint(t, 1000 + 700 * i, 150 + 20 * i, (340 + 15 * i) % 360,
+                             37.0 + 0.01 * i, -122.0 - 0.02 * i)
+    return profile
+
+
+@pytest.mark.unit
+class TestHoldLookup:
+    """Default lookups reproduce the previous waypoint behaviour."""
+
+    def test_matches_linear_scan(self, profile):
+        """Bisect lookup picks the same waypoint as the linear scan."""
+        times = [-1.0, 0.0, 2.5, 5.0, 5.0 + 1e-9, 12.4999, 12.5, 29.0, 30.0, 45.0]
+        for t in times:
+            wp = _hold_reference(profile.waypoints, t)
+            state = profile.get_state_at_time(t)
+            assert (state.altitude_ft, state.airspeed_kts, state.heading_deg,
+                    state.latitude_deg, state.longitude_deg) == \
+                (wp['altitude_ft'], wp['airspeed_kts'], wp['heading_deg'],
+                 wp['latitude_deg'], wp['longitude_deg'])
+            assert (state.pitch_deg, state.roll_deg, state.g_force) == (0.0, 0.0, 1.0)
+
+    def test_bulk_matches_scalar(self, profile):
+        """states_at and get_states_at_times agree with scalar lookups."""
+        times = np.linspace(-2, 35, 501)
+        columns = profile.states_at(times)
+        states = profile.get_states_at_times(times)
+        for i, t in enumerate(times):
+            scalar = profile.get_state_at_time(t)
+            for name in FlightTrajectory.FIELDS:
+                assert columns[name][i] == getattr(scalar, name)
+                assert getattr(states[i], name) == getattr(scalar, name)
+        assert np.array_equal(columns['time_s'], times)
+
+    def test_no_waypoints(self):
+        """Profiles without waypoints have no state."""
+        profile = FlightProfile()
+        assert profile.get_state_at_time(1.0) is None
+        assert profile.states_at([1.0]) is None
+        assert profile.get_states_at_times([1.0, 2.0]) == [None, None]
+
+    def test_recompiled_after_new_waypoint(self, profile):
+        """Adding a waypoint invalidates the compiled table."""
+        assert profile.get_state_at_time(50.0).altitude_ft == 1000 + 700 * 4
+        profile.add_waypoint(40.0, 99.0, 100.0, 0.0, 37.0, -122.0)
+        assert profile.get_state_at_time(50.0).altitude_ft == 99.0
+
+    def test_recompiled_after_edit(self, profile):
+        """Replacing the waypoint list or invalidating after an in-place edit recompiles."""
+        assert profile.get_state_at_time(50.0).altitude_ft == 1000 + 700 * 4
+        profile.waypoints = [dict(wp, altitude_ft=5.0) for wp in profile.waypoints]
+        assert profile.get_state_at_time(50.0).altitude_ft == 5.0
+
+        profile.waypoints[-1]['altitude_ft'] = 7.0
+        profile.invalidate()
+        assert profile.get_state_at_time(50.0).altitude_ft == 7.0
+
+
+@pytest.mark.unit
+class TestInterpolation:
+    """Linear interpolation and uniform grids."""
+
+    def test_linear_interpolation(self, profile):
+        """Linear mode interpolates every field between waypoints."""
+        profile.interpolation = 'linear'
+        state = profile.get_state_at_time(8.75)
+        assert state.altitude_ft == pytest.approx(1000 + 700 * 2.5)
+        assert state.airspeed_kts == pytest.approx(150 + 20 * 2.5)
+
+    def test_heading_wraps_shortest_way(self):
+        """Heading interpolates through north instead of back around."""
+        trajectory = FlightTrajectory([0.0, 10.0], {'heading_deg': [350.0, 10.0]}, 'linear')
+        headings = trajectory.states_at([0.0, 2.5, 5.0, 7.5])['heading_deg']
+        assert headings == pytest.approx([350.0, 355.0, 0.0, 5.0])
+
+    @pytest.mark.parametrize('interpolation', ['hold', 'linear'])
+    def test_grid_matches_knots(self, profile, interpolation):
+        """A uniform grid reproduces the trajectory at grid points."""
+        exact = FlightTrajectory.from_waypoints(profile.waypoints, interpolation)
+        gridded = FlightTrajectory.from_waypoints(profile.waypoints, interpolation, grid_s=0.5)
+        assert len(gridded) == 61
+
+        grid_times = np.arange(61) * 0.5
+        for name in FlightTrajectory.FIELDS:
+            assert np.allclose(gridded.states_at(grid_times)[name],
+                               exact.states_at(grid_times)[name])
+        assert gridded.values_at(12.75) == tuple(
+            gridded.states_at([12.75])[name][0] for name in FlightTrajectory.FIELDS
+        )
+
+    def test_invalid_interpolation(self):
+        """Unknown interpolation modes are rejected."""
+        with pytest.raises(ValueError):
+            FlightTrajectory([0.0], {}, 'cubic')
+
+
+@pytest.mark.unit
+class TestFlightPlanCache:
+    """Flight plans are generated once per duration and plan settings."""
+
+    def test_plan_cached(self, monkeypatch):
+        """get_flight_state does not regenerate the plan on every call."""
+        profile = FlightProfile(seed=1)
+        calls = []
+        original = profile.generate_flight_plan
+        monkeypatch.setattr(profile, 'generate_flight_plan',
+                            lambda duration_s: calls.append(duration_s) or original(duration_s))
+        for t in range(100):
+            profile.get_flight_state(float(t), 600.0)
+        assert calls == [600.0]
+
+    def test_plan_follows_settings(self):
+        """Changing the plan settings after the first lookup is not served stale."""
+        profile = FlightProfile(seed=1)
+        profile.get_flight_state(100.0, 600.0)
+        original_plan = profile.generate_flight_plan(600.0)
+        profile.climb_rate_fpm = 4000
+        profile.get_flight_state(100.0, 600.0)
+        plan = profile._flight_plan_cache[(600.0, 25000, 4000, -1500)]
+        assert plan == profile.generate_flight_plan(600.0)
+        assert plan != original_plan
+
+    def test_invalidate_clears_plans(self):
+        """invalidate() drops cached flight plans."""
+        profile = FlightProfile(seed=1)
+        profile.get_flight_state(0.0, 600.0)
+        profile.invalidate()
+        assert profile._flight_plan_cache == {}
@@ -0,0 +1,234 @@
+"""Tests for batched field generation."""
+
+import copy
+import pytest
+import numpy as np
+from pathlib import Path
+from ch10gen.ch10_writer import Ch10Writer, write_ch10_file
+from ch10gen.data_generators import (
+    GenerationContext, GeneratorFactory, RandomNormalGenerator, RandomMultimodalGenerator,
+    IncrementGenerator, PatternGenerator, RandomGenerator
+)
+from ch10gen.utils.rng import RNGService
+from ch10gen.icd import ICDDefinition, MessageDefinition, WordDefinition, load_icd
+from ch10gen.scenario_manager import ScenarioManager
+
+
+def _scalar(generator, times, counts=None):
+    counts = [0] * len(times) if counts is None else counts
+    return [
+        generator.generate(GenerationContext(
+            time_seconds=float(t), message_count=int(c), message_name='M', field_name='f',
+            field_values={}, all_values={}, icd=None
+        ))
+        for t, c in zip(times, counts)
+    ]
+
+
+def _stream(seed):
+    # Small blocks, so the batches cross pool refills
+    return RNGService(seed, block_size=64).stream('f')
+
+
+TIMES = np.concatenate([np.linspace(0, 25, 251), [3.0, 3.0, 12.5, 0.0]])
+
+DETERMINISTIC = [
+    {'mode': 'sine', 'center': 100, 'amplitude': 20, 'frequency': 0.3, 'phase': 0.5},
+    {'mode': 'cosine', 'center': -5, 'amplitude': 2, 'frequency': 1.7},
+    {'mode': 'sawtooth', 'min': 10, 'max': 50, 'period': 2.5},
+    {'mode': 'square', 'low': 1, 'high': 9, 'period': 0.7, 'duty_cycle': 0.3},
+    {'mode': 'ramp', 'start': 0, 'end': 100, 'duration': 10},
+    {'mode': 'ramp', 'start': 50, 'end': -50, 'duration': 4, 'repeat': True},
+    {'mode': 'constant', 'value': 42},
+]
+
+
+@pytest.mark.unit
+class TestGenerateBatch:
+    """generate_batch matches N scalar generate() calls."""
+
+    @pytest.mark.parametrize('config', DETERMINISTIC, ids=lambda c: c['mode'])
+    def test_time_based(self, config):
+        """Waveforms and ramps agree with the scalar path."""
+        generator = GeneratorFactory.create(config)
+        batch = generator.generate_batch(TIMES)
+        assert batch.shape == TIMES.shape
+        assert np.allclose(batch, _scalar(generator, TIMES), rtol=0, atol=1e-9)
+
+    @pytest.mark.parametrize('start,increment,wrap', [
+        (0, 1, None), (5, 3, None), (0, 1, 9), (10, 7, 40), (3, 5, 3), (8, 1, 2), (0, -2, 5),
+        (0.5, 0.1, 3.0),
+    ])
+    def test_increment(self, start, increment, wrap):
+        """Counters wrap and continue exactly like scalar calls."""
+        scalar = IncrementGenerator(start, increment, wrap)
+        batched = IncrementGenerator(start, increment, wrap)
+        times = np.zeros(23)
+        expected = _scalar(scalar, times)
+        assert batched.generate_batch(times[:7]).tolist() + \
+            batched.generate_batch(times[7:]).tolist() == expected
+        assert batched.current == scalar.current
+
+    @pytest.mark.parametrize('repeat', [True, False])
+    def test_pattern(self, repeat):
+        """Patterns repeat or stick at the last value like scalar calls."""
+        scalar = PatternGenerator([4, 8, 15, 16, 23], repeat)
+        batched = PatternGenerator([4, 8, 15, 16, 23], repeat)
+        times = np.zeros(12)
+        expected = _scalar(scalar, times)
+        assert batched.generate_batch(times[:3]).tolist() + \
+            batched.generate_batch(times[3:]).tolist() == expected
+        assert batched.index == scalar.index
+
+    def test_random_normal_same_draws(self):
+        """Normal values consume the stream like scalar calls and are clipped."""
+        generator = RandomNormalGenerator(mean=10, std_dev=5, min_val=4, max_val=15)
+        generator.rng = _stream(7)
+        expected = _scalar(generator, TIMES)
+        generator.rng = _stream(7)
+        batch = generator.generate_batch(TIMES)
+        assert batch.tolist() == expected
+        assert batch.min() == 4 and batch.max() == 15
+
+    def test_random_multimodal_same_draws(self):
+        """Peak choice and values match scalar calls."""
+        peaks = [{'mean': 0, 'std_dev': 1, 'weight': 1},
+                 {'mean': 100, 'std_dev': 2, 'weight': 3}]
+        generator = RandomMultimodalGenerator(copy.deepcopy(peaks))
+        generator.rng = _stream(3)
+        expected = _scalar(generator, TIMES)
+        generator.rng = _stream(3)
+        assert generator.generate_batch(TIMES).tolist() == expected
+
+    @pytest.mark.parametrize('min_val,max_val', [(0, 65535), (-1.5, 2.5)])
+    def test_random_uniform_same_draws(self, min_val, max_val):
+        """Uniform values consume the stream like scalar calls."""
+        generator = RandomGenerator(min_val, max_val)
+        generator.rng = _stream(11)
+        expected = _scalar(generator, TIMES)
+        generator.rng = _stream(11)
+        assert generator.generate_batch(TIMES).tolist() == expected
+
+    def test_default_uses_scalar(self):
+        """Generators without a vectorized version fall back to generate()."""
+        generator = GeneratorFactory.create({'mode': 'expression', 'formula': 'time * 2 + message_count'})
+        assert generator.generate_batch([1.0, 2.5], [3, 4]).tolist() == [5.0, 9.0]
+
+
+def _icd():
+    return ICDDefinition(
+        bus='A',
+        messages=[
+            MessageDefinition(
+                name='NAV DATA', rate_hz=10, rt=1, tr='BC2RT', sa=1, wc=6,
+                words=[WordDefinition(name=name, encode='u16') for name in
+                       ('alt', 'alt_m', 'counter', 'wave', 'mode', 'neg')]
+            ),
+        ]
+    )
+
+
+SCENARIO = {
+    'messages': {
+        'NAV DATA': {'fields': {
+            'alt': {'mode': 'ramp', 'start': 1000, 'end': 9000, 'duration': 2},
+            'alt_m': {'mode': 'expression', 'formula': 'alt * 0.3048 + counter + time'},
+            'counter': {'mode': 'increment', 'start': 0, 'increment': 1, 'wrap': 5},
+            'wave': {'mode': 'square', 'low': 3, 'high': 60000, 'period': 0.4},
+            'mode': {'mode': 'pattern', 'values': [1, 2, 3]},
+            'neg': {'mode': 'constant', 'value': -2},
+        }},
+    }
+}
+
+
+@pytest.mark.unit
+class TestGenerateMessageBlock:
+    """ScenarioManager.generate_message_block matches per-message generation."""
+
+    def test_matches_generate_message_data(self):
+        """A block equals repeated generate_message_data calls at the same times."""
+        icd = _icd()
+        message = icd.messages[0]
+        times = np.arange(40) * 0.1
+
+        scalar = ScenarioManager(SCENARIO, icd)
+        expected = [scalar.generate_message_data(message.name, message, float(t)) for t in times]
+
+        block = ScenarioManager(SCENARIO, icd)
+        result = np.vstack([
+            block.generate_message_block(message.name, message, times[:15]),
+            block.generate_message_block(message.name, message, times[15:]),
+        ])
+        assert result.dtype == np.uint16
+        assert result.tolist() == expected
+        assert block.computed_values == scalar.computed_values
+
+    def test_matches_with_instances(self):
+        """With schedule instances, a block equals per-message generation in any split."""
+        icd = _icd()
+        message = icd.messages[0]
+        times = np.arange(40) * 0.1
+        instances = np.arange(40)
+
+        scalar = ScenarioManager(SCENARIO, icd)
+        expected = [scalar.generate_message_data(message.name, message, float(t), int(k))
+                    for t, k in zip(times, instances)]
+
+        block = ScenarioManager(SCENARIO, icd)
+        result = np.vstack([
+            block.generate_message_block(message.name, message, times[25:], instances=instances[25:]),
+            block.generate_message_block(message.name, message, times[:25], instances=instances[:25]),
+        ])
+        assert result[15:].tolist() + result[:15].tolist() == expected
+
+    def test_empty(self):
+        """An empty block generates nothing and keeps state."""
+        icd = _icd()
+        manager = ScenarioManager(SCENARIO, icd)
+        assert manager.generate_message_block('NAV DATA', icd.messages[0], []).shape == (0, 6)
+        assert manager.computed_values == {}
+
+
+@pytest.mark.integration
+class TestWriterMessageBlocks:
+    """The writer generates scenario data per message definition in blocks."""
+
+    @pytest.mark.parametrize('formula', ['message_count % 7 + time',
+                                         'NAV_20HZ["altitude_ft"] % 100'])
+    def test_same_file(self, tmp_path, monkeypatch, formula):
+        """Block generation writes the file of per-message generation."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        scenario = {
+            'name': 'Blocks', 'start_time_utc': '2025-01-01T00:00:00Z', 'duration_s': 3,
+            'defaults': {'data_mode': 'random'},
+            'messages': {
+                'NAV_20HZ': {'fields': {
+                    'altitude_ft': {'mode': 'sine', 'center': 10000, 'amplitude': 500, 'frequency': 0.2},
+                    'airspeed_kt': {'mode': 'pattern', 'values': [250, 260, 270]},
+                }},
+                'GPS_5HZ': {'fields': {
+                    'lat_deg': {'mode': 'expression', 'formula': formula},
+                }},
+            },
+        }
+        blocks = []
+        original = ScenarioManager.generate_message_block
+
+        def counting(manager, *args, **kwargs):
+            blocks.append(args[0])
+            return original(manager, *args, **kwargs)
+
+        monkeypatch.setattr(ScenarioManager, 'generate_message_block', counting)
+        write_ch10_file(tmp_path / 'blocks.c10', scenario, icd, seed=5, writer_backend='native')
+
+        def per_message(writer, messages):
+            return [writer.scenario_manager.generate_message_data(
+                m.message.name, m.message, m.time_s, m.instance) for m in messages]
+
+        monkeypatch.setattr(Ch10Writer, '_generate_scenario_words', per_message)
+        write_ch10_file(tmp_path / 'single.c10', scenario, icd, seed=5, writer_backend='native')
+
+        assert (tmp_path / 'blocks.c10').read_bytes() == (tmp_path / 'single.c10').read_bytes()
+        # Cross-message references fall back to per-message generation
+        assert bool(blocks) == ('NAV_20HZ' not in formula)
@@ -0,0 +1,103 @@
+"""Tests for compiled ICD decoding and the decoded CSV export."""
+
+import csv
+import pytest
+import numpy as np
+from pathlib import Path
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.columnar import decode_1553_file
+from ch10gen.core.encode1553 import build_command_word, encode_array, bcd
+from ch10gen.export import export_decoded_csv
+from ch10gen.icd import ICDDefinition, MessageDefinition, WordDefinition, load_icd
+from ch10gen.icd_decoder import ICDDecoder, MessageDecoder
+
+
+def _icd():
+    return ICDDefinition(bus='A', messages=[
+        MessageDefinition(name='NAV', rate_hz=10, rt=1, tr='BC2RT', sa=1, wc=5, words=[
+            WordDefinition(name='alt', src='flight.altitude_ft', encode='bnr16', scale=0.5),
+            WordDefinition(name='lat', src='flight.latitude_deg', encode='float32_split',
+                           word_order='msw_lsw'),
+            WordDefinition(name='mode', const=0, encode='u16', mask=0x7, shift=0, word_index=3),
+            WordDefinition(name='gain', const=0, encode='u16', mask=0xF, shift=4, word_index=3,
+                           scale=0.5, offset=1.0),
+            WordDefinition(name='code', const=0, encode='bcd', word_index=4),
+        ]),
+        MessageDefinition(name='STAT', rate_hz=1, rt=2, tr='RT2BC', sa=3, wc=1, words=[
+            WordDefinition(name='temp', src='flight.altitude_ft', encode='i16', scale=0.1),
+        ]),
+    ])
+
+
+@pytest.fixture
+def recording(tmp_path, icd_recording):
+    nav, stat = _icd().messages
+    nav_data = np.concatenate([encode_array([-120.5], 'bnr16', 0.5)[0],
+                               encode_array([34.5], 'float32_split', word_order='msw_lsw')[0],
+                               [(9 << 4) | 5, bcd(1234)]])
+    return icd_recording(tmp_path / 'rec.c10', [(55, [
+        (1000, 0, (nav, nav_data)),
+        (2000, 0, [build_command_word(rt=7, tr=True, sa=1, wc=1), 0x3800, 1]),  # Not in ICD
+        (3000, 0, (stat, encode_array([-12.3], 'i16', 0.1)[0])),
+        (4000, 0, (nav, nav_data[:2])),                                          # Short
+    ])])
+
+
+@pytest.mark.unit
+class TestICDDecoder:
+    """Test field layout and decoding of compiled messages."""
+
+    def test_layout(self):
+        """Fields follow ICD order; float32 takes two words, word_index places bitfields."""
+        decoder = MessageDecoder(_icd().messages[0])
+        assert [(f.name, f.position, f.width) for f in decoder.fields] == [
+            ('alt', 0, 1), ('lat', 1, 2), ('mode', 3, 1), ('gain', 3, 1), ('code', 4, 1)]
+        assert decoder.word_count == 5
+
+    def test_decode(self, recording):
+        """Every encoding decodes; unknown messages are skipped, short ones decode partially."""
+        decoded = ICDDecoder(_icd()).decode(decode_1553_file(recording))
+
+        assert decoded.names == ['NAV', 'STAT', 'NAV']
+        assert decoded.messages['ipts'].tolist() == [1000, 3000, 4000]
+        values = decoded.values
+        assert values['alt'].tolist() == [-120.5, None, -120.5]
+        assert values['lat'].tolist() == [34.5, None, None]
+        assert values['mode'].tolist() == [5, None, None]
+        assert values['gain'].tolist() == [5.5, None, None]
+        assert values['code'].tolist() == [1234, None, None]
+        assert values['temp'][1] == pytest.approx(-12.3)
+
+    def test_export(self, recording, tmp_path):
+        """The CSV has one row per matched message with empty absent fields."""
+        output = tmp_path / 'decoded.csv'
+        decoder = ICDDecoder(_icd())
+        assert export_decoded_csv(recording, output, decoder.icd, decoder=decoder) == 3
+
+        with open(output, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0]) == sorted(['time_us', 'message_name', 'rt', 'sa', 'tr', 'alt', 'lat',
+                                        'mode', 'gain', 'code', 'temp'])
+        assert rows[0]['message_name'] == 'NAV' and rows[0]['time_us'] == '55'
+        assert float(rows[0]['alt']) == -120.5 and rows[0]['code'] == '1234'
+        assert rows[1]['alt'] == '' and float(rows[1]['temp']) == pytest.approx(-12.3)
+        assert rows[2]['lat'] == ''
+
+
+@pytest.mark.integration
+class TestDecodedExport:
+    """Test the decoded export on generated files."""
+
+    def test_generated_file(self, tmp_path):
+        """Every message written from the ICD is exported under its name."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        scenario = {'name': 'Decoded', 'start_time_utc': '2025-01-01T00:00:00Z', 'duration_s': 3}
+        path = tmp_path / 'decoded.c10'
+        output = tmp_path / 'decoded.csv'
+        write_ch10_file(path, scenario, icd, seed=3, writer_backend='irig106')
+
+        count = export_decoded_csv(path, output, icd)
+        assert count == len(decode_1553_file(path))
+        with open(output, newline='') as f:
+            names = {row['message_name'] for row in csv.DictReader(f)}
+        assert names == {message.name for message in icd.messages}
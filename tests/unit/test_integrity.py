@@ -0,0 +1,109 @@
+"""Tests for vectorized header and data checksum verification."""
+
+import struct
+import pytest
+import numpy as np
+from ch10gen.integrity import verify_checksums, gather_headers, header_checksum_failures
+from ch10gen.packet_index import write_index
+
+_HEADER = struct.Struct('<HHIIBBBBIHH')
+
+
+def _packet(body: bytes, checksum_type: int = 0, secondary: bool = False, align: int = 4) -> bytes:
+    """Packet with an optional data checksum (width 1, 2 or 4 bytes) over the padded body."""
+    width = {0: 0, 1: 1, 2: 2, 3: 4}[checksum_type]
+    prefix = b'\x00' * 12 if secondary else b''
+    payload = body
+    while (24 + len(prefix) + len(payload) + width) % align:
+        payload += b'\x00'
+    if width:
+        words = np.frombuffer(payload[:len(payload) // width * width], dtype=f'<u{width}')
+        payload += (int(words.sum(dtype=np.uint64)) & ((1 << (8 * width)) - 1)).to_bytes(width, 'little')
+    flags = checksum_type | (0x80 if secondary else 0)
+    packet_len = 24 + len(prefix) + len(payload)
+    fields = [0xEB25, 0x0002, packet_len, len(body), 6, 0, flags, 0x19, 0, 0]
+    checksum = sum(np.frombuffer(_HEADER.pack(*fields, 0)[:22], dtype='<u2').tolist()) & 0xFFFF
+    return _HEADER.pack(*fields, checksum) + prefix + payload
+
+
+def _bodies():
+    return [bytes(range(k, k + 40 + k)) for k in range(6)]
+
+
+@pytest.mark.unit
+class TestHeaderChecksums:
+    """Test the header checksum reduction."""
+
+    def test_detects_damaged_header(self, tmp_path):
+        """Only the packet with the damaged header is reported."""
+        packets = [_packet(body) for body in _bodies()]
+        offsets = np.cumsum([0] + [len(p) for p in packets[:-1]])
+        data = bytearray(b''.join(packets))
+        data[offsets[3] + 16] ^= 0x01
+        path = tmp_path / 'header.c10'
+        path.write_bytes(bytes(data))
+
+        result = verify_checksums(path)
+        assert result['packets'] == 6
+        assert result['header_failures'] == [int(offsets[3])]
+        assert result['data_checked'] == 0
+
+    def test_matrix(self):
+        """Headers are gathered as a packets x 12 uint16 matrix."""
+        packets = [_packet(body) for body in _bodies()[:2]]
+        raw = np.frombuffer(b''.join(packets), dtype=np.uint8)
+        words = gather_headers(raw, np.array([0, len(packets[0])]))
+        assert words.shape == (2, 12)
+        assert words[:, 0].tolist() == [0xEB25, 0xEB25]
+        assert not header_checksum_failures(words).any()
+
+    def test_matrix_chunks(self):
+        """Gathering in chunks gives the same matrix."""
+        packets = [_packet(body) for body in _bodies()]
+        raw = np.frombuffer(b''.join(packets), dtype=np.uint8)
+        offsets = np.cumsum([0] + [len(p) for p in packets[:-1]])
+        assert np.array_equal(gather_headers(raw, offsets, chunk_packets=4), gather_headers(raw, offsets))
+        assert gather_headers(raw, offsets[:0]).shape == (0, 12)
+
+
+@pytest.mark.unit
+class TestDataChecksums:
+    """Test data checksum verification per chunk."""
+
+    @pytest.mark.parametrize('checksum_type', [1, 2, 3])
+    @pytest.mark.parametrize('chunk_bytes', [64, 1 << 20])
+    def test_widths(self, tmp_path, checksum_type, chunk_bytes):
+        """8, 16 and 32-bit sums are verified; damaged bodies are reported."""
+        packets = [_packet(body, checksum_type, secondary=(k % 2 == 1))
+                   for k, body in enumerate(_bodies())]
+        offsets = np.cumsum([0] + [len(p) for p in packets[:-1]])
+        data = bytearray(b''.join(packets))
+        data[offsets[1] + 40] ^= 0x10
+        data[offsets[4] + 30] ^= 0x01
+        path = tmp_path / 'data.c10'
+        path.write_bytes(bytes(data))
+
+        result = verify_checksums(path, chunk_bytes=chunk_bytes)
+        assert result['data_checked'] == 6
+        assert result['data_failures'] == [int(offsets[1]), int(offsets[4])]
+        assert result['header_failures'] == []
+
+    def test_unaligned_and_mixed(self, tmp_path):
+        """Packets not aligned to the checksum width and without checksums are handled."""
+        packets = [_packet(b'\x01\x02\x03', 3, align=1), _packet(b'\x05' * 9, 2, align=1),
+                   _packet(b'\x07' * 8), _packet(b'\x09' * 7, 3, align=1)]
+        path = tmp_path / 'mixed.c10'
+        path.write_bytes(b''.join(packets))
+
+        result = verify_checksums(path)
+        assert result['data_checked'] == 3
+        assert result['data_failures'] == []
+
+    def test_uses_index(self, tmp_path):
+        """A fresh index covering the file provides the packet offsets."""
+        packets = [_packet(body, 2) for body in _bodies()]
+        path = tmp_path / 'indexed.c10'
+        path.write_bytes(b''.join(packets))
+        write_index(path)
+        result = verify_checksums(path)
+        assert result['packets'] == 6 and result['data_failures'] == []
@@ -0,0 +1,250 @@
+"""Tests for compiled per-message encoding plans."""
+
+import struct
+import random
+import pytest
+import tempfile
+import numpy as np
+from pathlib import Path
+from ch10gen.core.encode1553 import (
+    build_command_word, build_status_word, bnr16, u16, i16, bcd, float32_split
+)
+from ch10gen.flight_profile import FlightProfile, FlightState
+from ch10gen.icd import ICDDefinition, MessageDefinition, WordDefinition, load_icd
+from ch10gen.message_plan import MessagePlan, PayloadCache, compile_icd, resolve_source
+from ch10gen.ch10_writer import Ch10Writer, write_ch10_file
+
+
+def _nav_message():
+    return MessageDefinition(
+        name='NAV', rate_hz=50, rt=5, tr='RT2BC', sa=1, wc=9,
+        words=[
+            WordDefinition(name='alt', src='flight.altitude_ft', encode='bnr16', scale=2.0,
+                           rounding='truncate'),
+            WordDefinition(name='ias', src='flight.airspeed_kt', encode='u16', scale=0.1),
+            WordDefinition(name='hdg', src='flight.heading_deg', encode='i16', scale=0.01),
+            WordDefinition(name='mach', src='derived.mach_x1000', encode='bcd'),
+            WordDefinition(name='lat', src='flight.latitude_deg', encode='float32_split',
+                           word_order='msw_lsw'),
+            WordDefinition(name='id', const=0x1234, encode='u16'),
+            WordDefinition(name='unknown', src='flight.no_such_field', encode='u16'),
+            WordDefinition(name='spare', encode='u16'),
+        ]
+    )
+
+
+@pytest.fixture
+def state():
+    return FlightState(altitude_ft=12345.6, airspeed_kts=321.4, heading_deg=-45.5,
+                       latitude_deg=37.6188, longitude_deg=-122.375)
+
+
+@pytest.mark.unit
+class TestMessagePlan:
+    """Test plan compilation and encoding."""
+
+    def test_cached_header_words(self):
+        """Command and status words are built once from the definition."""
+        plan = MessagePlan(_nav_message())
+        assert plan.command_word == build_command_word(rt=5, tr=False, sa=1, wc=9)
+        assert plan.status_word == build_status_word(rt=5)
+
+    def test_encode_dynamic_words(self, state):
+        """Dynamic words are filled into the constant template."""
+        plan = MessagePlan(_nav_message())
+        lat = float32_split(state.latitude_deg, 'msw_lsw')
+        assert plan.encode(state) == [
+            bnr16(state.altitude_ft, 2.0, rounding='truncate'),
+            u16(state.airspeed_kts, 0.1),
+            i16(state.heading_deg, 0.01),
+            bcd(int(state.airspeed_kts / 661.0 * 1000)),
+            lat[0], lat[1], 0x1234, 0, 0
+        ]
+
+    def test_encode_without_state(self):
+        """Without flight state only constants are encoded."""
+        plan = MessagePlan(_nav_message())
+        assert plan.encode(None) == [0, 0, 0, 0, 0, 0, 0x1234, 0, 0]
+        # The template is not modified by encoding
+        assert plan.encode(None) is not plan.template
+
+    def test_static_payload(self):
+        """Messages without dynamic words are packed to bytes once."""
+        msg_def = MessageDefinition(
+            name='ID', rate_hz=1, rt=1, tr='BC2RT', sa=2, wc=3,
+            words=[
+                WordDefinition(name='id', const=7, encode='u16'),
+                WordDefinition(name='ver', const=1.5, encode='float32_split'),
+            ]
+        )
+        plan = MessagePlan(msg_def)
+        words = [plan.command_word, plan.status_word, 7, *float32_split(1.5)]
+        assert plan.is_static
+        assert plan.static_payload == struct.pack('<5H', *words)
+
+    def test_resolve_source(self, state):
+        """Sources resolve to cached accessors with the writer's aliases."""
+        assert resolve_source('flight.airspeed_kt') is resolve_source('flight.airspeed_kt')
+        assert resolve_source('flight.airspeed_kt')(state) == state.airspeed_kts
+        assert resolve_source('derived.status')(state) == 3
+        assert resolve_source('flight.missing')(state) == 0
+        assert resolve_source('bogus')(state) == 0.0
+
+    def test_compile_icd(self):
+        """Every ICD message gets a plan keyed by definition identity."""
+        icd = ICDDefinition(bus='A', messages=[_nav_message(), _nav_message()])
+        plans = compile_icd(icd)
+        assert [plans[id(m)].message for m in icd.messages] == icd.messages
+
+    def test_writer_uses_plan(self, state):
+        """Writer encoding goes through the cached plan."""
+        writer = Ch10Writer()
+        msg_def = _nav_message()
+        assert writer._encode_data_words(msg_def, state) == MessagePlan(msg_def).encode(state)
+        assert writer._get_plan(msg_def) is writer._get_plan(msg_def)
+
+
+def _packed(plan, state):
+    words = [plan.command_word, plan.status_word] + plan.encode(state)
+    return struct.pack(f'<{len(words)}H', *words)
+
+
+@pytest.mark.unit
+class TestPayloadCache:
+    """Test the input-keyed payload cache."""
+
+    def test_hits_on_unchanged_inputs(self, state):
+        """Unchanged inputs reuse the packed payload."""
+        plan = MessagePlan(_nav_message())
+        cache = PayloadCache()
+        first = cache.payload(plan, state)
+        assert first == _packed(plan, state)
+        assert cache.payload(plan, FlightState(**vars(state))) is first
+
+        changed = FlightState(**{**vars(state), 'altitude_ft': 20000.0})
+        assert cache.payload(plan, changed) == _packed(plan, changed)
+        assert cache.get_statistics() == {
+            'hits': 1, 'misses': 2, 'evictions': 0, 'entries': 2, 'hit_rate': 1 / 3
+        }
+
+    def test_static_and_missing_state(self, state):
+        """Static messages and missing states use the prepacked payload."""
+        static_plan = MessagePlan(MessageDefinition(
+            name='CFG', rate_hz=1, rt=2, tr='BC2RT', sa=3, wc=1,
+            words=[WordDefinition(name='mode', const=7, encode='u16')]
+        ))
+        plan = MessagePlan(_nav_message())
+        cache = PayloadCache()
+        assert cache.payload(static_plan, state) is static_plan.static_payload
+        assert cache.payload(plan, None) == _packed(plan, None)
+        assert cache.hits == 2 and cache.misses == 0
+
+    def test_bounded(self, state):
+        """Each message keeps at most max_entries payloads (LRU)."""
+        plan = MessagePlan(_nav_message())
+        cache = PayloadCache(max_entries=3)
+        states = [FlightState(**{**vars(state), 'altitude_ft': 1000.0 * i}) for i in range(5)]
+        for s in states:
+            cache.payload(plan, s)
+        assert cache.payload(plan, states[4]) == _packed(plan, states[4])
+        assert cache.get_statistics()['entries'] == 3
+        assert cache.evictions == 2
+        assert cache.hits == 1
+        # Evicted inputs are re-encoded
+        assert cache.payload(plan, states[0]) == _packed(plan, states[0])
+        assert cache.misses == 6
+
+    def test_signed_zero(self, state):
+        """-0.0 and 0.0 pack to different float words and are cached separately."""
+        plan = MessagePlan(_nav_message())
+        cache = PayloadCache()
+        positive = FlightState(**{**vars(state), 'latitude_deg': 0.0})
+        negative = FlightState(**{**vars(state), 'latitude_deg': -0.0})
+        assert cache.payload(plan, positive) == _packed(plan, positive)
+        assert cache.payload(plan, negative) == _packed(plan, negative)
+        assert _packed(plan, positive) != _packed(plan, negative)
+
+    def test_packed_words(self, state):
+        """Scenario data words are packed once per distinct set of words."""
+        plan = MessagePlan(_nav_message())
+        cache = PayloadCache()
+        cache.payload(plan, None)
+        words = [1, 2, 3, 4, 5, 6, 0x1234, 7, 8]
+        first = cache.packed(plan, words)
+        assert first == struct.pack('<11H', plan.command_word, plan.status_word, *words)
+        assert cache.packed(plan, list(words)) is first
+        assert cache.hits == 2 and cache.misses == 1
+
+        cache.reset_statistics()
+        assert cache.get_statistics()['hits'] == 0
+        assert cache.packed(plan, words) is first
+
+    def test_invalid_size(self):
+        """Cache size must be positive."""
+        with pytest.raises(ValueError):
+            PayloadCache(0)
+
+
+@pytest.mark.integration
+class TestPayloadCacheWriter:
+    """Test builds with and without the payload cache."""
+
+    @pytest.mark.parametrize('backend', ['pyc10', 'native'])
+    def test_same_file(self, backend):
+        """The cache does not change the output and reports hit counts."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        outputs = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for entries in (0, 64):
+                random.seed(3)
+                np.random.seed(3)
+                scenario = {
+                    'name': 'Payload Cache',
+                    'start_time_utc': '2025-01-01T00:00:00Z',
+                    'duration_s': 10,
+                    'defaults': {'data_mode': 'flight'},
+                    'bus': {'payload_cache_entries': entries},
+                }
+                output_path = Path(tmpdir) / f'cache_{entries}.c10'
+                stats = write_ch10_file(output_path, scenario, icd, writer_backend=backend)
+                outputs.append(output_path.read_bytes())
+
+        assert outputs[0] == outputs[1]
+        cache_stats = stats['payload_cache']
+        assert cache_stats['hits'] + cache_stats['misses'] == stats['total_messages']
+        assert cache_stats['hits'] > cache_stats['misses']
+
+    def test_scenario_data(self):
+        """Scenario data is served from the cache without changing the output."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        outputs = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for entries in (0, 64):
+                scenario = {
+                    'name': 'Payload Cache Scenario',
+                    'start_time_utc': '2025-01-01T00:00:00Z',
+                    'duration_s': 5,
+                    'defaults': {'data_mode': 'random'},
+                    'messages': {'GPS_5HZ': {'default_mode': 'constant',
+                                             'default_config': {'value': 3}}},
+                    'bus': {'payload_cache_entries': entries},
+                }
+                output_path = Path(tmpdir) / f'scenario_{entries}.c10'
+                stats = write_ch10_file(output_path, scenario, icd, seed=2, writer_backend='native')
+                outputs.append(output_path.read_bytes())
+
+        assert outputs[0] == outputs[1]
+        cache_stats = stats['payload_cache']
+        assert cache_stats['hits'] + cache_stats['misses'] == stats['total_messages']
+        # Every constant GPS message after the first is a hit
+        assert cache_stats['hits'] >= 5 * 5 - 1
+
+    def test_statistics_per_file(self, tmp_path):
+        """Cache statistics restart with every file written by a writer."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        writer = Ch10Writer()
+        schedule = writer._build_test_schedule(icd, 1.0)
+        for name in ('first', 'second'):
+            stats = writer.write_file(tmp_path / f'{name}.c10', schedule, FlightProfile(), icd)
+            cache_stats = stats['payload_cache']
+            assert cache_stats['hits'] + cache_stats['misses'] == stats['total_messages']
@@ -0,0 +1,172 @@
+"""Tests for the .ch10idx sidecar packet index."""
+
+import os
+import pytest
+from datetime import datetime, timezone
+from pathlib import Path
+from click.testing import CliRunner
+from ch10gen.__main__ import cli
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.core.packet_serializer import PacketSerializer
+from ch10gen.export import export_raw_1553_csv
+from ch10gen.icd import load_icd
+from ch10gen.inspector import inspect_1553_timeline
+from ch10gen.packet_index import (
+    PacketIndex, build_index, index_path, iter_c10_packets, load_index, write_index
+)
+from ch10gen.validate import Ch10Validator
+from ch10gen.wire_reader import WireFile
+
+
+def _write_recording(path):
+    """Time packet, then 1553 packets alternating between channels A and B."""
+    serializer = PacketSerializer()
+    packets = [serializer.getvalue(
+        serializer.time_packet(datetime(2025, 1, 1, tzinfo=timezone.utc), 0x0100, 0))]
+    for k in range(6):
+        ipts = 1000 * k
+        length = serializer.ms1553_packet([
+            (ipts, 0, [0x0822, 0x0800, k, k]),
+            (ipts + 500, 0, [0x1021, 0x1000, k]),
+        ], 0x0200 if k % 2 == 0 else 0x0210, k)
+        packets.append(serializer.getvalue(length))
+    path.write_bytes(b''.join(packets))
+
+
+@pytest.mark.unit
+class TestPacketIndex:
+    """Test building, storing and querying the index."""
+
+    def test_records(self, tmp_path):
+        """One record per packet with offsets, types and message IPTS."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        index = build_index(path)
+
+        with WireFile(path, use_index=False) as wire:
+            offsets = [p.offset for p in wire.packets()]
+        assert index.records['offset'].tolist() == offsets
+        assert index.records['data_type'].tolist() == [0x11] + [0x19] * 6
+        assert index.records['message_count'].tolist() == [0] + [2] * 6
+        assert index.records['first_ipts'][1:].tolist() == [0, 1000, 2000, 3000, 4000, 5000]
+        assert index.records['last_ipts'][1:].tolist() == [500, 1500, 2500, 3500, 4500, 5500]
+        assert index.get_statistics()['channels'] == [0x0100, 0x0200, 0x0210]
+
+    def test_save_load_and_freshness(self, tmp_path):
+        """Sidecars roundtrip and are ignored once the file changes."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        index = write_index(path)
+        assert index_path(path) == tmp_path / 'rec.ch10idx'
+
+        loaded = load_index(path)
+        assert loaded is not None
+        assert loaded.records.tobytes() == index.records.tobytes()
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_index(path) is None
+
+    def test_corrupt_sidecar(self, tmp_path):
+        """Unreadable sidecars are ignored by load_index and rejected by load."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        index_path(path).write_bytes(b'not an index')
+        assert load_index(path) is None
+        with pytest.raises(ValueError):
+            PacketIndex.load(index_path(path))
+
+    def test_damaged_file(self, tmp_path):
+        """Files whose packets do not reach the end are not indexed."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        data = bytearray(path.read_bytes())
+        offset = build_index(path).records['offset'][3]
+        data[offset:offset + 2] = b'\x00\x00'
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match='1 bad headers, 0 trailing bytes'):
+            write_index(path)
+        assert not index_path(path).exists()
+
+    def test_partial_sidecar(self, tmp_path):
+        """Sidecars that stop short of the end of the file are ignored."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        index = build_index(path)
+        PacketIndex(index.records[:3], index.source_size, index.source_mtime_ns).save(index_path(path))
+        assert load_index(path) is None
+
+    def test_select(self, tmp_path):
+        """Records are selected by channel, data type and IPTS range."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        index = build_index(path)
+        assert len(index.select(channel_id=0x0210)) == 3
+        assert len(index.select(data_type=0x11)) == 1
+        assert index.select(start_ipts=1600, end_ipts=3000)['first_ipts'].tolist() == [2000]
+        assert index.select(start_ipts=1500, end_ipts=3001)['first_ipts'].tolist() == [1000, 2000, 3000]
+
+
+@pytest.mark.unit
+class TestIndexedReaders:
+    """Test that readers give the same results with and without an index."""
+
+    def test_wire_packets(self, tmp_path):
+        """Indexed packet iteration matches the scan, including filters."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+        queries = [{}, {'channel_id': 0x0200}, {'data_type': 0x19, 'start_ipts': 2100},
+                   {'end_ipts': 1000}]
+        with WireFile(path) as wire:
+            assert wire.index is None
+            scanned = [[(p.offset, p.data_len) for p in wire.packets(**q)] for q in queries]
+        write_index(path)
+        with WireFile(path) as wire:
+            assert wire.index is not None
+            indexed = [[(p.offset, p.data_len) for p in wire.packets(**q)] for q in queries]
+        assert indexed == scanned
+        assert [len(packets) for packets in scanned] == [7, 3, 4, 1]
+
+    def test_pychapter10_packets(self, tmp_path):
+        """iter_c10_packets yields the same packets with and without an index."""
+        path = tmp_path / 'rec.c10'
+        _write_recording(path)
+
+        def read():
+            return [(p.channel_id, [m.ipts for m in p])
+                    for p in iter_c10_packets(path, data_type=0x19, channel_id=0x0210,
+                                              start_ipts=1000, end_ipts=5000)]
+
+        scanned = read()
+        write_index(path)
+        assert read() == scanned == [(0x0210, [1000, 1500]), (0x0210, [3000, 3500])]
+
+
+@pytest.mark.integration
+class TestIndexCommand:
+    """Test the index command and index use on generated files."""
+
+    def test_generated_file(self, tmp_path):
+        """Inspect, validate and export agree with and without the sidecar."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        scenario = {'name': 'Index', 'start_time_utc': '2025-01-01T00:00:00Z', 'duration_s': 3}
+        path = tmp_path / 'flight.c10'
+        write_ch10_file(path, scenario, icd, seed=3, writer_backend='native')
+
+        def read():
+            results = {}
+            for reader in ('wire', 'pyc10'):
+                results[reader] = list(inspect_1553_timeline(path, reader=reader))
+            stats = Ch10Validator(path).validate()
+            results['validate'] = (stats['packet_count'], stats['1553_messages'])
+            csv_path = tmp_path / 'raw.csv'
+            export_raw_1553_csv(path, csv_path)
+            results['csv'] = csv_path.read_text()
+            return results
+
+        scanned = read()
+        result = CliRunner().invoke(cli, ['index', str(path)])
+        assert result.exit_code == 0
+        assert 'Index written' in result.output
+        assert load_index(path) is not None
+        assert read() == scanned
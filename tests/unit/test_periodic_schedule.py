@@ -0,0 +1,101 @@
+"""Tests for the hyperperiod-tiled schedule."""
+
+import pytest
+import tempfile
+import numpy as np
+from pathlib import Path
+from ch10gen.icd import load_icd
+from ch10gen.schedule import build_array_schedule_from_icd, build_periodic_schedule_from_icd
+from ch10gen.ch10_writer import write_ch10_file
+
+
+@pytest.mark.unit
+class TestPeriodicSchedule:
+    """Test hyperperiod computation and tiling."""
+
+    @pytest.mark.parametrize('rates,hyperperiod_ns', [
+        ((50, 20), 1_000_000_000),
+        ((50, 20, 7.5), 2_000_000_000),
+        ((50, 3, 0.4), 5_000_000_000),
+    ])
+    def test_hyperperiod(self, rates, hyperperiod_ns, make_mixed_rate_icd):
+        """Hyperperiod is the LCM of the periods and the major frame."""
+        schedule = build_periodic_schedule_from_icd(make_mixed_rate_icd(rates), 3600.0)
+        assert schedule.hyperperiod_ns == hyperperiod_ns
+
+    @pytest.mark.parametrize('duration_s', [0.5, 2.0, 7.3, 61.25])
+    def test_matches_array_schedule(self, duration_s, make_mixed_rate_icd, schedule_key):
+        """Tiling reproduces the fully computed schedule exactly."""
+        icd = make_mixed_rate_icd()
+        tiled = build_periodic_schedule_from_icd(icd, duration_s)
+        full = build_array_schedule_from_icd(icd, duration_s)
+
+        assert len(tiled) == len(full)
+        assert np.array_equal(tiled.to_array_schedule().entries, full.entries)
+        assert [schedule_key(m) for m in tiled] == [schedule_key(m) for m in full]
+        assert tiled.get_statistics() == full.get_statistics()
+
+    def test_cost_independent_of_duration(self, make_mixed_rate_icd):
+        """Only one hyperperiod of records is stored."""
+        icd = make_mixed_rate_icd()
+        short = build_periodic_schedule_from_icd(icd, 60.0)
+        soak = build_periodic_schedule_from_icd(icd, 8 * 3600.0)
+
+        assert len(soak.base_time_ns) == len(short.base_time_ns)
+        assert len(soak) == 8 * 60 * len(short)
+        assert soak.get_statistics()['total_messages'] == len(soak)
+
+    def test_irregular_rates(self, make_mixed_rate_icd):
+        """A hyperperiod longer than the recording falls back to one tile."""
+        icd = make_mixed_rate_icd((50, 33.333, 0.7))
+        tiled = build_periodic_schedule_from_icd(icd, 10.0)
+        full = build_array_schedule_from_icd(icd, 10.0)
+        assert tiled.num_tiles == 1
+        assert np.array_equal(tiled.to_array_schedule().entries, full.entries)
+
+    def test_jitter_per_tile(self, make_mixed_rate_icd):
+        """Jittered tiles are reproducible, random-access and globally ordered."""
+        icd = make_mixed_rate_icd()
+        schedule = build_periodic_schedule_from_icd(icd, 20.3, jitter_ms=5.0, seed=9)
+        again = build_periodic_schedule_from_icd(icd, 20.3, jitter_ms=5.0, seed=9)
+
+        entries = schedule.to_array_schedule().entries
+        assert np.array_equal(entries, again.to_array_schedule().entries)
+        assert np.array_equal(schedule.tile(7), again.tile(7))
+        assert len(entries) == len(schedule)
+        assert np.all(np.diff(entries['time_ns']) >= 0)
+        assert entries['time_ns'].min() >= 0 and entries['time_ns'].max() < 20_300_000_000
+
+        exact = build_array_schedule_from_icd(icd, 20.3).entries['time_ns']
+        assert np.abs(np.sort(entries['time_ns']) - exact).max() <= 10_000_000
+        assert schedule.get_statistics()['total_duration_s'] == entries['time_ns'].max() / 1e9
+
+    def test_empty(self, make_mixed_rate_icd):
+        """Zero duration has no transmissions."""
+        schedule = build_periodic_schedule_from_icd(make_mixed_rate_icd(), 0.0)
+        assert len(schedule) == 0
+        assert list(schedule) == []
+        assert schedule.get_statistics()['total_messages'] == 0
+
+
+@pytest.mark.integration
+class TestPeriodicScheduleWriter:
+    """Test writing files from a periodic schedule."""
+
+    def test_same_file_as_array_schedule(self):
+        """Periodic and array backends write identical files."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        outputs = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for backend in ('array', 'periodic'):
+                scenario = {
+                    'name': 'Periodic Schedule',
+                    'start_time_utc': '2025-01-01T00:00:00Z',
+                    'duration_s': 12.5,
+                    'defaults': {'data_mode': 'flight'},
+                    'bus': {'schedule_backend': backend},
+                }
+                output_path = Path(tmpdir) / f'{backend}.c10'
+                write_ch10_file(output_path, scenario, icd, writer_backend='native')
+                outputs.append(output_path.read_bytes())
+        assert outputs[0] == outputs[1]
@@ -0,0 +1,123 @@
+"""Tests for min/max/mean preview pyramids."""
+
+import os
+import pytest
+import numpy as np
+from pathlib import Path
+from click.testing import CliRunner
+from ch10gen.__main__ import cli
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.extract import PARAMETER_DTYPE, extract_parameters, load_parameter
+from ch10gen.icd import load_icd
+from ch10gen.pyramid import (
+    Pyramid, build_levels, build_pyramid, load_pyramid, pyramid_path, _sample_buckets
+)
+
+
+def _samples(values):
+    samples = np.empty(len(values), dtype=PARAMETER_DTYPE)
+    samples['ipts'] = np.arange(len(values)) * 10
+    samples['value'] = values
+    return samples
+
+
+@pytest.fixture(scope='module')
+def flight_file(tmp_path_factory):
+    icd = load_icd(Path('icd/test_icd.yaml'))
+    scenario = {'name': 'Pyramid', 'start_time_utc': '2025-01-01T00:00:00Z', 'duration_s': 20}
+    path = tmp_path_factory.mktemp('pyramid') / 'flight.c10'
+    write_ch10_file(path, scenario, icd, seed=2, writer_backend='irig106')
+    return path
+
+
+@pytest.mark.unit
+class TestLevels:
+    """Test bucket statistics against direct computation."""
+
+    def test_buckets(self):
+        """Level 0 holds min/max/mean of each run of samples; levels merge by fanout."""
+        rng = np.random.default_rng(3)
+        values = rng.normal(size=103)
+        values[[5, 40, 41]] = np.nan
+        levels = build_levels(_sample_buckets(_samples(values), 4), fanout=3)
+
+        assert [len(level) for level in levels] == [26, 9, 3, 1]
+        for level, size in ((levels[0], 4), (levels[1], 12), (levels[2], 36)):
+            for k, bucket in enumerate(level):
+                chunk = values[k * size:(k + 1) * size]
+                finite = chunk[np.isfinite(chunk)]
+                assert bucket['first_ipts'] == k * size * 10
+                assert bucket['last_ipts'] == (k * size + len(chunk) - 1) * 10
+                assert bucket['min'] == finite.min() and bucket['max'] == finite.max()
+                assert bucket['mean'] == pytest.approx(finite.mean())
+                assert bucket['count'] == len(finite)
+        assert levels[-1][0]['count'] == 100
+
+    def test_empty_bucket(self):
+        """A bucket without finite values has count 0 and NaN statistics."""
+        bucket = _sample_buckets(_samples([np.nan, np.inf]), 4)[0]
+        assert bucket['count'] == 0
+        assert np.isnan(bucket['min']) and np.isnan(bucket['mean'])
+
+
+@pytest.mark.unit
+class TestPyramidFile:
+    """Test the sidecar against extracted parameters."""
+
+    def test_roundtrip(self, flight_file, tmp_path):
+        """The top level summarizes the whole series; levels are memory-mapped."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        path = build_pyramid(flight_file, icd, bucket_samples=8, fanout=4)
+        assert path == pyramid_path(flight_file)
+        series = load_parameter(
+            extract_parameters(flight_file, icd, ['altitude_ft'], tmp_path)['altitude_ft'])
+
+        with load_pyramid(flight_file) as pyramid:
+            assert set(pyramid.parameters) == {w.name for m in icd.messages for w in m.words}
+            levels = pyramid.level_count('altitude_ft')
+            level0 = pyramid.level('altitude_ft', 0)
+            assert isinstance(level0, np.memmap)
+            assert len(level0) == -(-len(series) // 8)
+            assert level0[1]['max'] == series['value'][8:16].max()
+            top = pyramid.level('altitude_ft', levels - 1)
+            assert len(top) == 1
+            assert top[0]['min'] == series['value'].min()
+            assert top[0]['mean'] == pytest.approx(series['value'].mean())
+            assert top[0]['last_ipts'] == series['ipts'][-1]
+
+    def test_query(self, flight_file):
+        """Queries use the finest level that fits and only the buckets in range."""
+        build_pyramid(flight_file, load_icd(Path('icd/test_icd.yaml')), ['altitude_ft'],
+                      bucket_samples=4, fanout=2)
+        with load_pyramid(flight_file) as pyramid:
+            level, buckets = pyramid.query('altitude_ft', max_buckets=10)
+            assert len(buckets) <= 10 < len(pyramid.level('altitude_ft', level - 1))
+
+            level0 = pyramid.level('altitude_ft', 0)
+            start, end = int(level0[20]['first_ipts']), int(level0[25]['last_ipts'])
+            level, buckets = pyramid.query('altitude_ft', start, end, max_buckets=100)
+            assert level == 0
+            assert buckets['first_ipts'].tolist() == level0['first_ipts'][20:26].tolist()
+
+    def test_stale_and_corrupt(self, flight_file, tmp_path):
+        """Sidecars of changed files or with bad contents are not used."""
+        path = tmp_path / 'copy.c10'
+        path.write_bytes(flight_file.read_bytes())
+        sidecar = build_pyramid(path, load_icd(Path('icd/test_icd.yaml')), ['status'])
+        assert load_pyramid(path) is not None
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_pyramid(path) is None
+
+        sidecar.write_bytes(b'CH10PYR\x01' + b'\x00' * 4)
+        with pytest.raises(ValueError):
+            Pyramid(sidecar)
+
+    def test_cli(self, flight_file):
+        """pyramid writes the sidecar and lists its parameters."""
+        result = CliRunner().invoke(cli, ['pyramid', str(flight_file), '-i', 'icd/test_icd.yaml',
+                                          '-p', 'heading_deg'])
+        assert result.exit_code == 0, result.output
+        assert 'heading_deg:' in result.output
+        assert load_pyramid(flight_file).parameters == ['heading_deg']
@@ -0,0 +1,179 @@
+"""Tests for named random streams and their pre-drawn pools."""
+
+import random
+import pytest
+import numpy as np
+from ch10gen.data_generators import GenerationContext, GeneratorFactory
+from ch10gen.expressions import EXPRESSION_FUNCTIONS
+from ch10gen.icd import ICDDefinition, MessageDefinition, WordDefinition
+from ch10gen.scenario_manager import ScenarioManager
+from ch10gen.utils.errors import ErrorInjectionConfig, MessageErrorInjector
+from ch10gen.utils.rng import RNGService, RandomStream
+
+
+def _icd():
+    return ICDDefinition(
+        bus='A',
+        messages=[
+            MessageDefinition(
+                name=name, rate_hz=10, rt=rt, tr='BC2RT', sa=1, wc=2,
+                words=[WordDefinition(name=field, encode='u16') for field in ('a', 'b')]
+            )
+            for rt, name in enumerate(('NAV', 'STATUS'), start=1)
+        ]
+    )
+
+
+@pytest.mark.unit
+class TestRandomStream:
+    """Test pooled draws."""
+
+    @pytest.mark.parametrize('block_size', [1, 7, 4096])
+    def test_arrays_match_scalar_draws(self, block_size):
+        """Array draws return the values of the same number of scalar draws."""
+        scalar = RandomStream(5, block_size)
+        pooled = RandomStream(5, block_size)
+        uniform = [scalar.random() for _ in range(3)] + [scalar.standard_normal()]
+        uniform += [scalar.random() for _ in range(20)]
+        normal = [scalar.standard_normal() for _ in range(30)]
+        assert pooled.random_array(3).tolist() + [pooled.standard_normal()] + \
+            pooled.random_array(20).tolist() == uniform
+        assert pooled.standard_normal_array(30).tolist() == normal
+
+    def test_integer_bounds(self):
+        """Integers cover both bounds and nothing else, like random.randint."""
+        stream = RandomStream(1, 256)
+        values = {stream.integers(3, 6) for _ in range(500)}
+        array = stream.integers_array(500, 3, 6)
+        assert values == {3, 4, 5, 6}
+        assert set(array.tolist()) == {3, 4, 5, 6}
+
+    def test_refills_in_blocks(self):
+        """Pools are refilled a whole block at a time."""
+        stream = RandomStream(2, 100)
+        for _ in range(250):
+            stream.random()
+        stream.random_array(1000)
+        assert stream.refills == 13
+
+    def test_invalid_block_size(self):
+        """Block sizes must be positive."""
+        with pytest.raises(ValueError):
+            RandomStream(0, 0)
+
+
+@pytest.mark.unit
+class TestRNGService:
+    """Test per-name stream derivation."""
+
+    def test_reproducible_and_independent(self):
+        """Streams depend on seed and name, not on the order of use."""
+        first = RNGService(42)
+        a = first.stream('a').random_array(5)
+        b = first.stream('b').random_array(5)
+        second = RNGService(42)
+        assert np.array_equal(second.stream('b').random_array(5), b)
+        assert np.array_equal(second.stream('a').random_array(5), a)
+        assert not np.array_equal(a, b)
+        assert not np.array_equal(RNGService(43).stream('a').random_array(5), a)
+
+    def test_children(self):
+        """Children differ from each other and from the parent."""
+        service = RNGService(42)
+        parent = service.stream('x').random_array(5)
+        first = service.child(0).stream('x').random_array(5)
+        second = service.child(1).stream('x').random_array(5)
+        assert not np.array_equal(first, second)
+        assert not np.array_equal(parent, first)
+        assert np.array_equal(RNGService(42).child(1).stream('x').random_array(5), second)
+
+    def test_unseeded_follows_global_random(self):
+        """Unseeded services take their entropy from the random module."""
+        random.seed(9)
+        first = RNGService().stream('x').random()
+        random.seed(9)
+        assert RNGService().stream('x').random() == first
+
+    def test_statistics(self):
+        """Statistics count streams and refills."""
+        service = RNGService(1, block_size=10)
+        service.stream('a').random_array(25)
+        service.stream('b').random()
+        assert service.get_statistics() == {'streams': 2, 'refills': 4}
+
+
+@pytest.mark.unit
+class TestRandomConsumers:
+    """Test scenario and error injection use of the streams."""
+
+    def test_scenario_fields_independent(self):
+        """A field's random values do not depend on other fields being generated."""
+        icd = _icd()
+        scenario = {'seed': 5, 'config': {'default_mode': 'random'}}
+        both = ScenarioManager(scenario, icd)
+        nav_only = ScenarioManager(scenario, icd)
+        expected = []
+        for k in range(10):
+            expected.append(both.generate_message_data('NAV', icd.messages[0], k * 0.1, k))
+            both.generate_message_data('STATUS', icd.messages[1], k * 0.1, k)
+        assert [nav_only.generate_message_data('NAV', icd.messages[0], k * 0.1, k)
+                for k in range(10)] == expected
+
+    def test_expression_random_seeded(self):
+        """random() in formulas draws from the scenario's seed."""
+        icd = _icd()
+        scenario = {'seed': 5, 'messages': {'NAV': {'fields': {
+            'a': {'mode': 'expression', 'formula': 'random_int(0, 1000)'},
+            'b': {'mode': 'expression', 'formula': 'random(0, 1000)'},
+        }}}}
+        first = ScenarioManager(scenario, icd).generate_message_data('NAV', icd.messages[0], 0.0, 0)
+        second = ScenarioManager(scenario, icd).generate_message_data('NAV', icd.messages[0], 0.0, 0)
+        assert first == second
+
+    def test_expression_random_per_field(self):
+        """Formula random values follow the field's stream, not the global RNG or message order."""
+        icd = _icd()
+        scenario = {'seed': 5, 'messages': {name: {'fields': {
+            'a': {'mode': 'expression', 'formula': 'random(0, 1000)'},
+            'b': {'mode': 'expression', 'formula': 'random_int(0, 1000)'},
+        }} for name in ('NAV', 'STATUS')}}
+        interleaved = ScenarioManager(scenario, icd)
+        random.seed(1)
+        expected = []
+        for k in range(5):
+            expected.append(interleaved.generate_message_data('NAV', icd.messages[0], k * 0.1, k))
+            interleaved.generate_message_data('STATUS', icd.messages[1], k * 0.1, k)
+        after = random.random()
+
+        random.seed(1)
+        nav_only = ScenarioManager(scenario, icd)
+        assert [nav_only.generate_message_data('NAV', icd.messages[0], k * 0.1, k)
+                for k in range(5)] == expected
+        assert random.random() == after
+
+    def test_expression_generator_stream(self):
+        """Standalone expression generators draw from their assigned stream."""
+        generator = GeneratorFactory.create({'mode': 'expression', 'formula': 'random(0, 10)'})
+        context = GenerationContext(time_seconds=0.0, message_count=0, message_name='M',
+                                    field_name='f', field_values={}, all_values={}, icd=None)
+        generator.rng = RNGService(3).stream('f')
+        first = [generator.generate(context) for _ in range(3)]
+        generator.rng = RNGService(3).stream('f')
+        random.seed(2)
+        assert [generator.generate(context) for _ in range(3)] == first
+        assert 'random' not in EXPRESSION_FUNCTIONS
+
+    def test_error_injector_leaves_global_random(self):
+        """Seeded injectors are reproducible and do not reseed the random module."""
+        config = ErrorInjectionConfig(parity_error_percent=30, no_response_percent=10)
+        random.seed(123)
+        expected_global = random.random()
+        random.seed(123)
+
+        runs = []
+        for _ in range(2):
+            injector = MessageErrorInjector(config, seed=8)
+            runs.append([injector.inject_errors(k * 0.01, 0x0822, 0x0800, [1, 2])
+                         for k in range(200)])
+        assert runs[0] == runs[1]
+        assert random.random() == expected_global
@@ -0,0 +1,114 @@
+"""Tests for the memory-mapped wire reader."""
+
+import pytest
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from chapter10 import C10
+from ch10gen.ch10_writer import write_ch10_file
+from ch10gen.core.packet_serializer import PacketSerializer
+from ch10gen.icd import load_icd
+from ch10gen.wire_reader import WireFile, read_1553_wire
+
+
+def _packets():
+    serializer = PacketSerializer()
+    packets = []
+    length = serializer.time_packet(datetime(2025, 1, 1, tzinfo=timezone.utc), 0x0100, 0)
+    packets.append(serializer.getvalue(length))
+    length = serializer.ms1553_packet([
+        (1000, 0, [0x0822, 0x0800, 1, 2]),
+        (2000, 1, b'\x43\x08\x00\x08\x05\x00\x06\x00\x07'),  # Odd length is padded
+        (3000, 0, [0x1021, 0x1000, 0xBEEF]),
+    ], 0x0200, 0x123456789A)
+    packets.append(serializer.getvalue(length))
+    return packets
+
+
+@pytest.mark.unit
+class TestWireFile:
+    """Test packet and message views."""
+
+    def test_views(self, tmp_path):
+        """Header fields, messages and payloads are decoded from the mapping."""
+        path = tmp_path / 'views.c10'
+        path.write_bytes(b''.join(_packets()))
+
+        with WireFile(path) as wire:
+            packets = list(wire.packets())
+            assert [p.data_type for p in packets] == [0x11, 0x19]
+            packet = packets[1]
+            assert (packet.channel_id, packet.rtc, packet.message_count) == (0x0200, 0x123456789A, 3)
+            assert isinstance(packet.body, memoryview)
+
+            messages = list(wire.messages())
+            assert [m.ipts for m in messages] == [1000, 2000, 3000]
+            assert [m.bus for m in messages] == ['A', 'B', 'A']
+            assert [(m.rt, m.sa, m.wc, m.tr) for m in messages] == \
+                [(1, 1, 2, 'BC2RT'), (1, 2, 3, 'BC2RT'), (2, 1, 1, 'BC2RT')]
+            assert messages[0].data_words() == (1, 2)
+            assert messages[1].length == 9
+            assert isinstance(messages[1].data, memoryview)
+            assert bytes(messages[2].data) == b'\x21\x10\x00\x10\xef\xbe'
+            assert messages[2].status_word == 0x1000
+            assert len(list(wire.packets(data_type=0x19, channel_id=0x0210))) == 0
+
+    def test_truncated_and_empty(self, tmp_path):
+        """Iteration stops at a truncated packet; empty files have no packets."""
+        first, second = _packets()
+        path = tmp_path / 'truncated.c10'
+        path.write_bytes(first + second[:-10])
+        with WireFile(path) as wire:
+            assert len(list(wire.packets())) == 1
+
+        empty = tmp_path / 'empty.c10'
+        empty.write_bytes(b'')
+        with WireFile(empty) as wire:
+            assert list(wire.packets()) == []
+
+    def test_find_packet(self, tmp_path):
+        """Packet starts are found from any offset; sync words in bodies are skipped."""
+        first, second = _packets()
+        third = second.replace(b'\xef\xbe', b'\x25\xeb')
+        path = tmp_path / 'find.c10'
+        path.write_bytes(first + second + third)
+        body_sync = len(first) + len(second) + third.index(b'\x25\xeb', 2)
+
+        with WireFile(path) as wire:
+            assert wire.find_packet(0) == 0
+            assert wire.find_packet(1) == len(first)
+            assert wire.find_packet(len(first) + 1) == len(first) + len(second)
+            assert wire.find_packet(body_sync) == wire.size
+
+    def test_missing_file(self, tmp_path):
+        """Missing files raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            WireFile(tmp_path / 'missing.c10')
+
+
+@pytest.mark.integration
+class TestWireFileRoundtrip:
+    """Test the reader against PyChapter10 on generated files."""
+
+    @pytest.mark.parametrize('backend', ['native', 'irig106'])
+    def test_matches_pychapter10(self, backend):
+        """Every message's IPTS and words match the PyChapter10 decode."""
+        icd = load_icd(Path('icd/test_icd.yaml'))
+        scenario = {
+            'name': 'Wire',
+            'start_time_utc': '2025-01-01T00:00:00Z',
+            'duration_s': 3,
+            'bus': {'errors': {'word_count_percent': 10}},
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / 'wire.c10'
+            write_ch10_file(output_path, scenario, icd, seed=5, writer_backend=backend)
+
+            expected = [(msg.ipts, bytes(msg.data)) for packet in C10(str(output_path))
+                        if packet.data_type == 0x19 for msg in packet]
+            with WireFile(output_path) as wire:
+                actual = [(m.ipts, bytes(m.data)) for m in wire.messages()]
+            timeline = list(read_1553_wire(output_path, max_messages=len(expected)))
+
+        assert actual == expected
+        assert [entry['ipts_ns'] for entry in timeline] == [ipts for ipts, _ in expected]